@@ -16,6 +16,7 @@ pybabel extract \
     -F babel.cfg \
     -k _ \
     -k ngettext:1,2 \
+    -k N_ \
     -o src/specify_cli/i18n/messages.pot \
     --add-location=file \
     --msgid-bugs-address="https://github.com/github/spec-kit/issues" \
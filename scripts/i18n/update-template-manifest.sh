@@ -0,0 +1,21 @@
+#!/usr/bin/env bash
+#
+# Regenerate templates/i18n/manifest.json from the localized templates on disk
+#
+# Usage: ./scripts/i18n/update-template-manifest.sh
+
+set -e
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$REPO_ROOT"
+
+echo "📝 Updating localized template manifest..."
+
+PYTHONPATH="$REPO_ROOT/src${PYTHONPATH:+:$PYTHONPATH}" python3 -c '
+from pathlib import Path
+from specify_cli.i18n.core import write_template_manifest
+print(write_template_manifest(Path("templates")))
+'
+
+echo ""
+echo "✅ Manifest updated"
@@ -24,6 +24,7 @@ Or install globally:
     specify init --here
 """
 
+import asyncio
 import os
 import subprocess
 import sys
@@ -32,8 +33,12 @@ import tempfile
 import shutil
 import shlex
 import json
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
+
+# Imported first so startup phases can be timed (and profiled when SPECIFY_PROFILE is set)
+from specify_cli import profiling
 
 import typer
 import httpx
@@ -54,82 +59,44 @@ import truststore
 from datetime import datetime, timezone
 
 # Initialize i18n
-from specify_cli.i18n.core import setup_i18n, get_active_locale
-
-# Set up translation functions globally (will be re-initialized with CLI args)
+from specify_cli.i18n.core import N_, SUPPORTED_LANGUAGES, setup_i18n, get_active_locale, get_localized_template_index, get_template_path, get_template_roots
+from specify_cli import git as git_utils
+from specify_cli import github_api
+from specify_cli.github_api import (
+    format_rate_limit_error as _format_rate_limit_error,
+    github_auth_headers as _github_auth_headers,
+    parse_rate_limit_headers as _parse_rate_limit_headers,
+)
+from specify_cli import agent_context
+from specify_cli.feature_paths import get_feature_paths, get_repo_root
+from specify_cli import features
+from specify_cli.feature_index import ARTIFACT_KINDS, FeatureIndex
+from specify_cli.search import SearchIndex, feature_path_prefix
+from specify_cli import task_graph
+from specify_cli import analyzer
+from specify_cli import prerequisites
+from specify_cli import packaging
+from specify_cli import template_assets
+from specify_cli.template_assets import build_localized_overlay
+from specify_cli import cache_manager
+from specify_cli import template_sources
+from specify_cli.template_sources import TemplateSource
+from specify_cli import format_benchmark
+from specify_cli import server as template_server
+
+profiling.mark("imports")
+
+# Set up translation functions globally (will be re-initialized with CLI args).
+# Catalogs are cached and loaded lazily, so this does not read .mo files yet.
 _, ngettext = setup_i18n()
+profiling.mark("i18n setup")
 
 # Global language option - will be used by callback to re-initialize i18n
 _cli_lang: Optional[str] = None
 
 ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 client = httpx.Client(verify=ssl_context)
-
-def _github_token(cli_token: str | None = None) -> str | None:
-    """Return sanitized GitHub token (cli arg takes precedence) or None."""
-    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
-
-def _github_auth_headers(cli_token: str | None = None) -> dict:
-    """Return Authorization header dict only when a non-empty token exists."""
-    token = _github_token(cli_token)
-    return {"Authorization": f"Bearer {token}"} if token else {}
-
-def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
-    """Extract and parse GitHub rate-limit headers."""
-    info = {}
-    
-    # Standard GitHub rate-limit headers
-    if "X-RateLimit-Limit" in headers:
-        info["limit"] = headers.get("X-RateLimit-Limit")
-    if "X-RateLimit-Remaining" in headers:
-        info["remaining"] = headers.get("X-RateLimit-Remaining")
-    if "X-RateLimit-Reset" in headers:
-        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
-        if reset_epoch:
-            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
-            info["reset_epoch"] = reset_epoch
-            info["reset_time"] = reset_time
-            info["reset_local"] = reset_time.astimezone()
-    
-    # Retry-After header (seconds or HTTP-date)
-    if "Retry-After" in headers:
-        retry_after = headers.get("Retry-After")
-        try:
-            info["retry_after_seconds"] = int(retry_after)
-        except ValueError:
-            # HTTP-date format - not implemented, just store as string
-            info["retry_after"] = retry_after
-    
-    return info
-
-def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
-    """Format a user-friendly error message with rate-limit information."""
-    rate_info = _parse_rate_limit_headers(headers)
-    
-    lines = [f"GitHub API returned status {status_code} for {url}"]
-    lines.append("")
-    
-    if rate_info:
-        lines.append("[bold]Rate Limit Information:[/bold]")
-        if "limit" in rate_info:
-            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
-        if "remaining" in rate_info:
-            lines.append(f"  • Remaining: {rate_info['remaining']}")
-        if "reset_local" in rate_info:
-            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
-            lines.append(f"  • Resets at: {reset_str}")
-        if "retry_after_seconds" in rate_info:
-            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
-        lines.append("")
-    
-    # Add troubleshooting guidance
-    lines.append("[bold]Troubleshooting Tips:[/bold]")
-    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
-    lines.append("  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN")
-    lines.append("    environment variable to increase rate limits.")
-    lines.append("  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated.")
-    
-    return "\n".join(lines)
+profiling.mark("TLS context")
 
 # Agent configuration with name, folder, install URL, and CLI tool requirement
 AGENT_CONFIG = {
@@ -250,8 +217,8 @@ BANNER = """
 ╚══════╝╚═╝     ╚══════╝ ╚═════╝╚═╝╚═╝        ╚═╝   
 """
 
-# Note: TAGLINE is translatable
-TAGLINE = _("GitHub Spec Kit - Spec-Driven Development Toolkit")
+# Note: TAGLINE is translatable (translated when displayed, once the language is known)
+TAGLINE = N_("GitHub Spec Kit - Spec-Driven Development Toolkit")
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
     Supports live auto-refresh via an attached refresh callback.
@@ -433,6 +400,8 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     return selected_key
 
 console = Console()
+# Notices that must not end up in a command's stdout (e.g. --json output)
+err_console = Console(stderr=True)
 
 class BannerGroup(TyperGroup):
     """Custom group that shows banner before help."""
@@ -462,7 +431,7 @@ def show_banner():
         styled_banner.append(line + "\n", style=color)
 
     console.print(Align.center(styled_banner))
-    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    console.print(Align.center(Text(_(TAGLINE), style="italic bright_yellow")))
     console.print()
 
 @app.callback()
@@ -474,17 +443,39 @@ def callback(
         help="Language for CLI output (en_US, zh_CN)",
         envvar="SPECIFY_LANG",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile the command with cProfile and write a sorted report plus a .prof file (or set SPECIFY_PROFILE)",
+    ),
 ):
     """
     Show banner when no subcommand is provided.
     
     Global Options:
         --lang: Language for CLI output (default: en_US)
+        --profile: Write a cProfile report for the invoked command
     """
     # Re-initialize i18n with CLI language argument
     global _, ngettext, _cli_lang
     _cli_lang = lang
     _, ngettext = setup_i18n(cli_lang=lang)
+    profiling.mark("i18n reload")
+
+    profile_dir = profiling.env_output_dir()
+    if profile and profile_dir is None:
+        profile_dir = Path.cwd()
+    if profile_dir is not None:
+        profiling.start()
+        command_name = ctx.invoked_subcommand
+
+        def _write_profile():
+            written = profiling.stop_and_write(profile_dir, command=command_name)
+            if written:
+                report_path, prof_path = written
+                err_console.print(_("[dim]Profile report written to {report} ({prof})[/dim]").format(report=report_path, prof=prof_path))
+
+        ctx.call_on_close(_write_profile)
     
     if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
         show_banner()
@@ -541,28 +532,15 @@ def check_tool(tool: str, tracker: StepTracker = None) -> bool:
     return found
 
 def is_git_repo(path: Path = None) -> bool:
-    """Check if the specified path is inside a git repository."""
-    if path is None:
-        path = Path.cwd()
-    
-    if not path.is_dir():
-        return False
-
-    try:
-        # Use git command to check if inside a work tree
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            capture_output=True,
-            cwd=path,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if the specified path is inside a git repository (pure-Python discovery, no subprocess)."""
+    return git_utils.is_git_repo(path)
 
 def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
     """Initialize a git repository in the specified path.
     
+    Runs every git step with ``git -C`` so the working directory of the process is
+    left untouched; safe to call concurrently for different projects.
+    
     Args:
         project_path: Path to initialize git repository in
         quiet: if True suppress console output (tracker handles status)
@@ -570,30 +548,15 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
     """
-    try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
-        if not quiet:
-            console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True, text=True)
-        if not quiet:
+    if not quiet:
+        console.print("[cyan]Initializing git repository...[/cyan]")
+    success, error_msg = git_utils.init_repo(project_path)
+    if not quiet:
+        if success:
             console.print("[green]✓[/green] Git repository initialized")
-        return True, None
-
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
-        if e.stderr:
-            error_msg += f"\nError: {e.stderr.strip()}"
-        elif e.stdout:
-            error_msg += f"\nOutput: {e.stdout.strip()}"
-        
-        if not quiet:
-            console.print(_("[red]Error initializing git repository:[/red] {error}").format(error=str(e)))
-        return False, error_msg
-    finally:
-        os.chdir(original_cwd)
+        else:
+            console.print(_("[red]Error initializing git repository:[/red] {error}").format(error=error_msg))
+    return success, error_msg
 
 def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
     """Handle merging or copying of .vscode/settings.json files."""
@@ -643,66 +606,55 @@ def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = Fal
         # If file doesn't exist or is invalid, just use new content
         return new_content
 
-    def deep_merge(base: dict, update: dict) -> dict:
-        """Recursively merge update dict into base dict."""
-        result = base.copy()
-        for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = deep_merge(result[key], value)
-            else:
-                # Add new key or replace existing value
-                result[key] = value
-        return result
-
-    merged = deep_merge(existing_content, new_content)
+    merged = template_assets.merge_json(existing_content, new_content)
 
     if verbose:
         console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
 
     return merged
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
-    repo_owner = "rothcold"
-    repo_name = "spec-kit"
+def fetch_latest_release(client: httpx.Client, github_token: str = None, debug: bool = False, source: TemplateSource | None = None) -> dict:
+    """Return the latest release JSON from source (default: the GitHub API).
+
+    Raises:
+        RuntimeError: With a rate-limit aware message if the request fails
+    """
+    source = source or template_sources.GitHubSource(token=github_token)
+    try:
+        return source.latest_release(client)
+    except template_sources.TemplateSourceError as e:
+        error_msg = str(e)
+        if debug:
+            error_msg += f"\n\n[dim]Template source:[/dim] {source.name}"
+        raise RuntimeError(error_msg) from e
+
+def select_template_asset(release_data: dict, ai_assistant: str, script_type: str, formats: Iterable[str] = template_assets.PREFERRED_FORMATS) -> dict | None:
+    """Return the release's archive for an agent and script type, in the first available format."""
+    return template_assets.find_variant_asset(release_data, ai_assistant, script_type, formats)
+
+def _answered_by(source: TemplateSource) -> str:
+    """Suffix naming the source that answered, when several sources were raced."""
+    answered_by = getattr(source, "answered_by", None)
+    return f" via {answered_by.name}" if answered_by is not None else ""
+
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, release_data: dict | None = None, source: TemplateSource | None = None) -> Tuple[Path, dict]:
     if client is None:
         client = httpx.Client(verify=ssl_context)
+    source = source or template_sources.GitHubSource(token=github_token)
 
-    if verbose:
-        console.print(_("[cyan]Fetching latest release information...[/cyan]"))
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
-
-    try:
-        response = client.get(
-            api_url,
-            timeout=30,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        )
-        status = response.status_code
-        if status != 200:
-            # Format detailed error message with rate-limit info
-            error_msg = _format_rate_limit_error(status, response.headers, api_url)
-            if debug:
-                error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
-            raise RuntimeError(error_msg)
+    if release_data is None:
+        if verbose:
+            console.print(_("[cyan]Fetching latest release information...[/cyan]"))
         try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
-    except Exception as e:
-        console.print(_("[red]Error fetching release information[/red]"))
-        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
-        raise typer.Exit(1)
+            release_data = fetch_latest_release(client, github_token, debug, source=source)
+        except Exception as e:
+            console.print(_("[red]Error fetching release information[/red]"))
+            console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+            raise typer.Exit(1)
 
     assets = release_data.get("assets", [])
     pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
-
-    asset = matching_assets[0] if matching_assets else None
+    asset = select_template_asset(release_data, ai_assistant, script_type, formats=("zip",))
 
     if asset is None:
         console.print(
@@ -720,30 +672,18 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
     if verbose:
         console.print(f"[cyan]Found template:[/cyan] {filename}")
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}{_answered_by(source)}")
 
     zip_path = download_dir / filename
     if verbose:
         console.print(f"[cyan]Downloading template...[/cyan]")
 
     try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                # Handle rate-limiting on download as well
-                error_msg = _format_rate_limit_error(response.status_code, response.headers, download_url)
-                if debug:
-                    error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
-                raise RuntimeError(error_msg)
-            total_size = int(response.headers.get('content-length', 0))
+        # Rate-limit aware errors for GitHub downloads come from the source
+        with source.stream_asset(asset, client, chunk_size=8192) as chunks:
             with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
+                if not file_size:
+                    for chunk in chunks:
                         f.write(chunk)
                 else:
                     if show_progress:
@@ -753,14 +693,14 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
                             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                             console=console,
                         ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
+                            task = progress.add_task("Downloading...", total=file_size)
                             downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
+                            for chunk in chunks:
                                 f.write(chunk)
                                 downloaded += len(chunk)
                                 progress.update(task, completed=downloaded)
                     else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+                        for chunk in chunks:
                             f.write(chunk)
     except Exception as e:
         console.print(f"[red]Error downloading template[/red]")
@@ -779,14 +719,93 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
     }
     return zip_path, metadata
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
+def extract_with_overlay(zip_ref: zipfile.ZipFile, dest: Path, overlay: dict[str, bytes] | None = None) -> int:
+    """Extract every archive member into dest, writing overlay content in place of matching members.
+
+    Overlay keys are project-relative POSIX paths (e.g. ``.claude/commands/speckit.plan.md``);
+    a single wrapping top-level directory in the archive is ignored when matching.
+    Returns the number of members replaced by overlay content.
+    """
+    if not overlay:
+        zip_ref.extractall(dest)
+        return 0
+
+    names = [n[2:] if n.startswith("./") else n for n in zip_ref.namelist()]
+    top_levels = {n.split("/", 1)[0] for n in names if n}
+    prefix = ""
+    if len(top_levels) == 1 and all("/" in n for n in names if n):
+        prefix = next(iter(top_levels)) + "/"
+
+    replaced = 0
+    for member, name in zip(zip_ref.infolist(), names):
+        key = name[len(prefix):] if prefix and name.startswith(prefix) else name
+        content = overlay.get(key)
+        if content is None or member.is_dir():
+            zip_ref.extract(member, dest)
+            continue
+        if ".." in Path(name).parts:
+            zip_ref.extract(member, dest)
+            continue
+        target = dest / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        replaced += 1
+    return replaced
+
+def localized_overlay(locale: str, ai_assistant: str, script_type: str, release_files: dict[str, bytes], tracker: StepTracker | None = None) -> dict[str, bytes] | None:
+    """Build the localized command overlay for a release, or None if there is nothing to localize.
+
+    Templates come from the release's own ``.specify/templates/i18n`` copy when it has one
+    (see build_localized_overlay); the tracker's ``localize`` step is skipped when no
+    template exists for the locale.
+    """
+    if locale == "en_US":
+        return None
+    overlay = build_localized_overlay(locale, ai_assistant, script_type, release_files)
+    if not overlay:
+        if tracker:
+            tracker.skip("localize", f"no {locale} templates")
+        return None
+    return overlay
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None, overlay: dict[str, bytes] | None = None, locale: str | None = None, release_data: dict | None = None, source: TemplateSource | None = None) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+
+    ``overlay`` maps project-relative paths to content written instead of the archive member
+    (used for localized command templates); when given, the tracker's ``localize`` step is updated.
+    With ``locale`` (and no ``overlay``), the overlay is built from the localized templates
+    in the downloaded archive (see localized_overlay).
+    ``release_data`` skips the release lookup when the caller already fetched it; ``source``
+    is where the release and assets come from (default: GitHub). If the release publishes a tar.xz archive for the variant, it is extracted while it
+    downloads instead (see stream_extract_template).
     """
     current_dir = Path.cwd()
+    if client is None:
+        client = httpx.Client(verify=ssl_context)
+    source = source or template_sources.GitHubSource(token=github_token)
+
+    if release_data is None:
+        if tracker:
+            tracker.start("fetch", f"contacting {source.name}")
+        try:
+            release_data = fetch_latest_release(client, github_token, debug, source=source)
+        except Exception as e:
+            if tracker:
+                tracker.error("fetch", str(e))
+            console.print(_("[red]Error fetching release information[/red]"))
+            console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+            raise typer.Exit(1)
+
+    localize = overlay is None and locale not in (None, "en_US")
+
+    def overlay_for(files: dict[str, bytes]) -> dict[str, bytes] | None:
+        return localized_overlay(locale, ai_assistant, script_type, files, tracker)
+
+    asset = select_template_asset(release_data, ai_assistant, script_type)
+    if asset is not None and asset["name"].endswith(".tar.xz"):
+        return stream_extract_template(project_path, asset, release_data["tag_name"], is_current_dir, verbose=verbose, tracker=tracker, client=client, debug=debug, overlay=overlay, overlay_for=overlay_for if localize else None, source=source)
 
-    if tracker:
-        tracker.start("fetch", "contacting GitHub API")
     try:
         zip_path, meta = download_template_from_github(
             ai_assistant,
@@ -796,7 +815,9 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             show_progress=(tracker is None),
             client=client,
             debug=debug,
-            github_token=github_token
+            github_token=github_token,
+            release_data=release_data,
+            source=source,
         )
         if tracker:
             tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
@@ -816,6 +837,7 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     elif verbose:
         console.print("Extracting template...")
 
+    overlaid = 0
     try:
         if not is_current_dir:
             project_path.mkdir(parents=True)
@@ -827,11 +849,13 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                 tracker.complete("zip-list", f"{len(zip_contents)} entries")
             elif verbose:
                 console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
+            if localize:
+                overlay = overlay_for({name: zip_ref.read(name) for name in zip_contents if "/i18n/" in name})
 
             if is_current_dir:
                 with tempfile.TemporaryDirectory() as temp_dir:
                     temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
+                    overlaid = extract_with_overlay(zip_ref, temp_path, overlay)
 
                     extracted_items = list(temp_path.iterdir())
                     if tracker:
@@ -874,7 +898,7 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                     if verbose and not tracker:
                         console.print(f"[cyan]Template files merged into current directory[/cyan]")
             else:
-                zip_ref.extractall(project_path)
+                overlaid = extract_with_overlay(zip_ref, project_path, overlay)
 
                 extracted_items = list(project_path.iterdir())
                 if tracker:
@@ -915,6 +939,13 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     else:
         if tracker:
             tracker.complete("extract")
+            if overlay is not None:
+                if overlaid:
+                    tracker.complete("localize", f"{overlaid} templates")
+                else:
+                    tracker.skip("localize", "no files replaced")
+        elif verbose and overlaid:
+            console.print(f"[cyan]Applied {overlaid} localized templates[/cyan]")
     finally:
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
@@ -929,38 +960,149 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     return project_path
 
 
+def download_cached_template(release_data: dict, ai_assistant: str, script_type: str, *, client: httpx.Client, source: TemplateSource | None = None, tracker: StepTracker | None = None) -> template_assets.CachedTemplate | None:
+    """Download a release's universal asset, or its base and overlay, into the template cache.
+
+    Returns None when the release publishes neither layout and its per-variant archive
+    has not been cached by ``specify prefetch``, so the caller downloads that archive.
+    Assets already in the cache are not downloaded again.
+    """
+    tag = release_data.get("tag_name", "")
+    assets = template_assets.select_template_assets(release_data, ai_assistant, script_type)
+    if assets is None:
+        return None
+    if "variant" in assets:
+        variant = assets["variant"]
+        path = template_assets.cached_asset_path(tag, variant["name"])
+        if not path.is_file() or (variant.get("size") and path.stat().st_size != variant["size"]):
+            return None
+
+    if tracker:
+        tracker.start("download")
+    paths = {}
+    details = []
+    try:
+        for kind, asset in assets.items():
+            paths[kind], was_cached = template_assets.download_asset(asset, tag, client, source=source)
+            details.append(f"{kind} cached" if was_cached else f"{kind} {asset.get('size', 0):,} bytes")
+    except Exception as e:
+        if tracker:
+            tracker.error("download", str(e))
+        raise
+    if tracker:
+        tracker.complete("download", ", ".join(details))
+    return template_assets.CachedTemplate(tag, **paths)
+
+
+def install_template_files(project_path: Path, files: dict[str, bytes] | Iterable[tuple[str, bytes]], is_current_dir: bool = False, *, tracker: StepTracker | None = None, overlay: dict[str, bytes] | None = None) -> Path:
+    """Write template files (a mapping, or (path, content) pairs as they are produced) to project_path.
+
+    Counterpart of the zip extraction in download_and_extract_template for templates that
+    are rendered from the cache or streamed from a tar.xz asset. ``overlay`` and the
+    ``extract``/``localize`` tracker keys behave the same way; in --here mode an existing
+    .vscode/settings.json is merged rather than overwritten.
+    """
+    vscode_settings = None
+
+    def without_vscode_settings(items):
+        nonlocal vscode_settings
+        for rel_path, content in items:
+            if rel_path == ".vscode/settings.json":
+                vscode_settings = content
+            else:
+                yield rel_path, content
+
+    if tracker:
+        tracker.start("extract")
+    try:
+        items = sorted(files.items()) if isinstance(files, dict) else files
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+        written, overlaid = template_assets.write_project_files(without_vscode_settings(items), project_path, overlay)
+        if vscode_settings is not None:
+            dest_file = project_path / ".vscode" / "settings.json"
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            if is_current_dir and dest_file.exists():
+                merged = merge_json_files(dest_file, json.loads(vscode_settings))
+                with open(dest_file, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, indent=4)
+                    f.write('\n')
+            else:
+                dest_file.write_bytes(vscode_settings)
+            written += 1
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        raise
+
+    if tracker:
+        tracker.complete("extract", f"{written} files")
+        if overlay is not None:
+            if overlaid:
+                tracker.complete("localize", f"{overlaid} templates")
+            else:
+                tracker.skip("localize", "no files replaced")
+    return project_path
+
+
+def stream_extract_template(project_path: Path, asset: dict, release: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, overlay: dict[str, bytes] | None = None, overlay_for: Callable[[dict[str, bytes]], dict[str, bytes] | None] | None = None, source: TemplateSource | None = None) -> Path:
+    """Download a tar.xz template asset and extract it in the same pass.
+
+    The response body is decompressed and each member written as soon as it arrives, so
+    download and extraction overlap and no archive is stored on disk. With --here the
+    members are kept in memory until the whole archive has been read, so a failed
+    download never leaves a half-merged tree in the existing directory. The same applies
+    when ``overlay_for`` is given: it is called with the archive's files to build the
+    overlay from the templates they contain. Uses the same tracker keys as
+    download_and_extract_template.
+    """
+    if client is None:
+        client = httpx.Client(verify=ssl_context)
+    source = source or template_sources.GitHubSource()
+    if tracker:
+        tracker.complete("fetch", f"release {release} ({asset['size']:,} bytes)")
+        tracker.start("download", "streaming")
+    elif verbose:
+        console.print(f"[cyan]Streaming template:[/cyan] {asset['name']} ({asset['size']:,} bytes)")
+
+    try:
+        with source.stream_asset(asset, client) as chunks:
+            members = template_assets.iter_tar_xz(chunks)
+            buffered = is_current_dir or overlay_for is not None
+            if buffered:
+                members = dict(members)
+            else:
+                install_template_files(project_path, members, tracker=tracker, overlay=overlay)
+        if buffered:
+            if overlay_for is not None:
+                overlay = overlay_for(members)
+            install_template_files(project_path, members, is_current_dir, tracker=tracker, overlay=overlay)
+    except Exception as e:
+        if tracker and isinstance(e, template_sources.TemplateSourceError):
+            tracker.error("download", f"HTTP {e.status_code}" if e.status_code else str(e))
+        if verbose and not tracker:
+            console.print(f"[red]Error extracting template:[/red] {e}")
+        if debug:
+            console.print(Panel(str(e), title="Extraction Error", border_style="red"))
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+
+    if tracker:
+        tracker.complete("download", f"{asset['name']} (streamed)")
+        tracker.skip("zip-list", "streamed")
+        tracker.skip("extracted-summary", "streamed")
+        tracker.skip("cleanup", "nothing stored")
+    elif verbose:
+        console.print(f"[cyan]Extracted {asset['name']} while downloading[/cyan]")
+    return project_path
+
+
 def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
     """Ensure POSIX .sh scripts under .specify/scripts (recursively) have execute bits (no-op on Windows)."""
     if os.name == "nt":
         return  # Windows: skip silently
-    scripts_root = project_path / ".specify" / "scripts"
-    if not scripts_root.is_dir():
-        return
-    failures: list[str] = []
-    updated = 0
-    for script in scripts_root.rglob("*.sh"):
-        try:
-            if script.is_symlink() or not script.is_file():
-                continue
-            try:
-                with script.open("rb") as f:
-                    if f.read(2) != b"#!":
-                        continue
-            except Exception:
-                continue
-            st = script.stat(); mode = st.st_mode
-            if mode & 0o111:
-                continue
-            new_mode = mode
-            if mode & 0o400: new_mode |= 0o100
-            if mode & 0o040: new_mode |= 0o010
-            if mode & 0o004: new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
-            updated += 1
-        except Exception as e:
-            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+    updated, failures = template_assets.make_scripts_executable(project_path)
     if tracker:
         detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
         tracker.add("chmod", "Set script permissions recursively")
@@ -976,6 +1118,9 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
 def apply_localized_templates(project_path: Path, locale: str, selected_ai: str, tracker: StepTracker | None = None) -> None:
     """Replace English command templates with localized versions if available.
     
+    Post-extraction fallback for already-extracted projects; ``init`` renders localized
+    commands during extraction instead (see build_localized_overlay).
+    
     Args:
         project_path: Path to the extracted project
         locale: Target locale (e.g., 'zh_CN')
@@ -986,32 +1131,23 @@ def apply_localized_templates(project_path: Path, locale: str, selected_ai: str,
     if locale == "en_US":
         return
     
-    # Strategy 1: Look for templates in the extracted project's .specify directory
-    # (This is where release packages place them)
-    localized_templates_dir = project_path / '.specify' / 'templates' / 'i18n' / locale / 'commands'
+    # Prefer the templates shipped in the extracted project's .specify directory
+    # (this is where release packages place them), then the installed package or
+    # source tree. Indexes come from the i18n manifest (or a single scan) and the
+    # shipped roots are cached for the rest of the process.
+    localized_commands: dict[str, Path] = {}
+    project_templates = project_path / '.specify' / 'templates'
+    candidates = [(project_templates, False)] + [(root, True) for root in get_template_roots()]
+    for templates_root, use_cache in candidates:
+        index = get_localized_template_index(locale, templates_root, use_cache=use_cache)
+        localized_commands = {
+            name: path for name, path in index.items()
+            if name.startswith('commands/') and name.count('/') == 1 and path.suffix in ('.md', '.toml')
+        }
+        if localized_commands:
+            break
     
-    # Strategy 2: If not found in project, try package installation
-    if not localized_templates_dir.exists():
-        try:
-            import importlib.resources
-            if hasattr(importlib.resources, 'files'):
-                # Python 3.9+
-                package_root = importlib.resources.files('specify_cli').parent
-            else:
-                # Fallback for older Python
-                import pkg_resources
-                package_root = Path(pkg_resources.resource_filename('specify_cli', '..'))
-            
-            localized_templates_dir = package_root / 'templates' / 'i18n' / locale / 'commands'
-        except Exception:
-            pass
-    
-    # Strategy 3: If not found in package, try relative to this file (development mode)
-    if not localized_templates_dir.exists():
-        module_dir = Path(__file__).parent
-        localized_templates_dir = module_dir.parent.parent / 'templates' / 'i18n' / locale / 'commands'
-    
-    if not localized_templates_dir.exists():
+    if not localized_commands:
         # No localized templates available
         if tracker:
             tracker.skip("localize", f"no {locale} templates")
@@ -1069,25 +1205,15 @@ def apply_localized_templates(project_path: Path, locale: str, selected_ai: str,
         return
     
     # Copy localized templates, overwriting English versions
+    # Template files in i18n are named like: specify.md, plan.md, etc.
+    # Target files are named like: speckit.specify.md, speckit.plan.md, etc.
+    # (TOML files are matched the same way for Gemini/Qwen)
+    existing = {p.name for p in target_dir.iterdir()}
     replaced_count = 0
-    for template_file in localized_templates_dir.glob('*.md'):
-        # Convert speckit.*.md to match the actual command file names
-        # Template files in i18n are named like: specify.md, plan.md, etc.
-        # Target files are named like: speckit.specify.md, speckit.plan.md, etc.
-        base_name = template_file.stem  # e.g., "specify"
-        target_file = target_dir / f"speckit.{base_name}.md"
-        
-        if target_file.exists():
-            shutil.copy2(template_file, target_file)
-            replaced_count += 1
-    
-    # Also check for TOML files for Gemini/Qwen
-    for template_file in localized_templates_dir.glob('*.toml'):
-        base_name = template_file.stem
-        target_file = target_dir / f"speckit.{base_name}.toml"
-        
-        if target_file.exists():
-            shutil.copy2(template_file, target_file)
+    for template_file in localized_commands.values():
+        target_name = f"speckit.{template_file.stem}{template_file.suffix}"
+        if target_name in existing:
+            shutil.copy2(template_file, target_dir / target_name)
             replaced_count += 1
     
     if tracker:
@@ -1096,8 +1222,6 @@ def apply_localized_templates(project_path: Path, locale: str, selected_ai: str,
         else:
             tracker.skip("localize", "no files replaced")
 
-
-
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
@@ -1110,6 +1234,8 @@ def init(
     skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Use the newest cached template instead of contacting GitHub"),
+    template_source: str = typer.Option(None, "--template-source", help="Where to get templates: github, github:<owner>/<repo>, an http(s) mirror URL, a file:// URL or a local directory/archive (or set SPECIFY_TEMPLATE_SOURCE)"),
 ):
     """
     Initialize a new Specify project from the latest template.
@@ -1134,6 +1260,8 @@ def init(
         specify init --here --ai codebuddy
         specify init --here
         specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --ai claude --offline  # Reuse the cached template
+        specify init my-project --ai claude --template-source https://mirror.example.com/spec-kit/
     """
 
     show_banner()
@@ -1247,6 +1375,19 @@ def init(
     console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
     console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
 
+    try:
+        source = template_sources.resolve_source(template_source, github_token)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    cached_template = None
+    if offline:
+        cached_template = template_assets.latest_cached_template(selected_ai, selected_script)
+        if cached_template is None:
+            console.print(f"[red]Error:[/red] No cached template in {template_assets.templates_dir()}. Run 'specify init' once without --offline first.")
+            raise typer.Exit(1)
+
     tracker = StepTracker("Initialize Specify Project")
 
     sys._specify_tracker_active = True
@@ -1281,13 +1422,44 @@ def init(
             local_ssl_context = ssl_context if verify else False
             local_client = httpx.Client(verify=local_ssl_context)
 
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
-
-            # Apply localized templates if language is not English
+            # Localized command templates are written during extraction (no second copy pass),
+            # taken from the release being installed
             active_locale = get_active_locale(_cli_lang)
-            if active_locale != "en_US":
-                tracker.start("localize")
-                apply_localized_templates(project_path, active_locale, selected_ai, tracker=tracker)
+            if active_locale == "en_US":
+                tracker.skip("localize", "en_US")
+
+            # Releases with a universal asset (or a base plus overlay) are rendered from the template cache
+            release_data = None
+            if cached_template is not None:
+                tracker.skip("fetch", f"offline, cached {cached_template.tag}")
+                tracker.complete("download", "cached")
+            else:
+                tracker.start("fetch", f"contacting {source.name}")
+                try:
+                    release_data = fetch_latest_release(local_client, github_token, debug, source=source)
+                except Exception as e:
+                    # With the host's GitHub budget spent, a cached template beats failing
+                    if isinstance(e.__cause__, template_sources.RateLimitedError):
+                        cached_template = template_assets.latest_cached_template(selected_ai, selected_script)
+                    if cached_template is None:
+                        tracker.error("fetch", str(e))
+                        raise
+                    reset = datetime.fromtimestamp(e.__cause__.reset).strftime("%H:%M")
+                    tracker.skip("fetch", f"rate limited until {reset}, cached {cached_template.tag}")
+                    tracker.complete("download", "cached")
+                else:
+                    tracker.complete("fetch", f"release {release_data.get('tag_name', 'unknown')}{_answered_by(source)}")
+                    cached_template = download_cached_template(release_data, selected_ai, selected_script, client=local_client, source=source, tracker=tracker)
+
+            if cached_template is not None:
+                files = cached_template.render(selected_ai, selected_script)
+                overlay = localized_overlay(active_locale, selected_ai, selected_script, files, tracker)
+                install_template_files(project_path, files, here, tracker=tracker, overlay=overlay)
+                tracker.skip("zip-list", "cached template")
+                tracker.skip("extracted-summary", "cached template")
+                tracker.skip("cleanup", "archives kept in cache")
+            else:
+                download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, locale=active_locale, release_data=release_data, source=source)
 
             ensure_executable_scripts(project_path, tracker=tracker)
 
@@ -1445,6 +1617,152 @@ def check():
     if not any(agent_results.values()):
         console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
 
+@app.command()
+def prefetch(
+    agents: Optional[str] = typer.Option(None, "--agents", help="Comma or space separated agents whose templates are fetched"),
+    scripts: Optional[str] = typer.Option(None, "--scripts", help="Comma or space separated subset of sh, ps (default: both)"),
+    locales: Optional[str] = typer.Option(None, "--locales", help="Comma or space separated locales to check for localized templates (e.g. zh_CN)"),
+    all_variants: bool = typer.Option(False, "--all", help="Every agent, script type and locale"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Parallel downloads"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    template_source: str = typer.Option(None, "--template-source", help="Where to get templates (see 'specify init --help'; or set SPECIFY_TEMPLATE_SOURCE)"),
+):
+    """
+    Download the latest templates into the local cache ahead of time.
+
+    The release is looked up once, every asset 'specify init' would need for the
+    selected agents and script types is downloaded in parallel, and each is checked
+    against the SHA-256 the release publishes. Later 'specify init --offline' runs
+    (e.g. inside containers built from the same image) are then pure cache hits.
+
+    Localized command templates ship with the CLI; --locales only checks they exist.
+
+    Examples:
+        specify prefetch --all
+        specify prefetch --agents claude,copilot --scripts sh --locales zh_CN
+    """
+    if not agents and not all_variants:
+        console.print("[red]Error:[/red] Choose agents with --agents, or use --all")
+        raise typer.Exit(1)
+    try:
+        agent_list = packaging.parse_selection(None if all_variants else agents, packaging.ALL_AGENTS, "agent")
+        script_list = packaging.parse_selection(None if all_variants else scripts, packaging.ALL_SCRIPTS, "script")
+        locale_list = [] if not (locales or all_variants) else packaging.parse_selection(None if all_variants else locales, SUPPORTED_LANGUAGES, "locale")
+        source = template_sources.resolve_source(template_source, github_token)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    with httpx.Client(verify=ssl_context if not skip_tls else False) as client:
+        try:
+            release_data = fetch_latest_release(client, github_token, source=source)
+        except (RuntimeError, httpx.HTTPError) as e:
+            console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+            raise typer.Exit(1)
+        tag = release_data.get("tag_name", "unknown")
+        assets = template_assets.select_prefetch_assets(release_data, agent_list, script_list)
+        if not assets:
+            console.print(f"[red]Error:[/red] Release {tag} has no templates for the selected agents and script types")
+            raise typer.Exit(1)
+        start = time.perf_counter()
+        results = template_assets.prefetch_assets(release_data, assets, client, source=source, jobs=jobs)
+    elapsed = time.perf_counter() - start
+
+    table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+    table.add_column("Asset")
+    table.add_column("Size", justify="right")
+    table.add_column("Status")
+    table.add_column("SHA-256")
+    for result in results:
+        status = "[red]failed[/red]" if result.error else ("cached" if result.cached else "downloaded")
+        digest = {True: "[green]verified[/green]", False: "[red]mismatch[/red]", None: "[dim]not published[/dim]"}[result.verified]
+        table.add_row(result.name, f"{result.size:,} B", status, digest)
+    console.print(table)
+
+    for locale in locale_list:
+        if locale == "en_US":
+            continue
+        count = sum(len(get_localized_template_index(locale, root)) for root in get_template_roots())
+        console.print(f"[cyan]{locale}:[/cyan] {count} localized templates" if count else f"[yellow]{locale}:[/yellow] no localized templates in this CLI")
+
+    failed = [result for result in results if result.error]
+    for result in failed:
+        console.print(f"[red]Error:[/red] {result.name}: {result.error}")
+    downloaded = sum(result.size for result in results if not result.cached and not result.error)
+    console.print(f"[dim]Release {tag}: {len(results) - len(failed)}/{len(results)} asset(s) in {template_assets.templates_dir()}, {downloaded:,} bytes downloaded in {elapsed:.2f}s[/dim]")
+    if failed:
+        raise typer.Exit(1)
+
+@app.command()
+def serve(
+    host: str = typer.Option(template_server.DEFAULT_HOST, "--host", help="Address to listen on (keep it local: requests write to this machine)"),
+    port: int = typer.Option(template_server.DEFAULT_PORT, "--port", help="Port to listen on (0: any free port)"),
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Listen on a Unix socket instead of HTTP on --host/--port"),
+    max_concurrency: int = typer.Option(template_server.DEFAULT_CONCURRENCY, "--max-concurrency", min=1, help="Requests initializing projects at once"),
+    max_queue: int = typer.Option(template_server.DEFAULT_MAX_QUEUE, "--max-queue", min=0, help="Requests that may wait for a slot before the server answers 503"),
+    release_ttl: float = typer.Option(template_server.DEFAULT_RELEASE_TTL, "--release-ttl", min=0, help="Seconds the latest release lookup is reused"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    template_source: str = typer.Option(None, "--template-source", help="Where to get templates (see 'specify init --help'; or set SPECIFY_TEMPLATE_SOURCE)"),
+    token: Optional[str] = typer.Option(None, "--token", envvar=template_server.TOKEN_ENV_VAR, help="Bearer token clients must send (HTTP default: a random token written to the cache directory)"),
+    root: Optional[Path] = typer.Option(None, "--root", help="Only accept project paths inside this directory (relative paths are taken from it)"),
+):
+    """
+    Run a warm server that initializes and upgrades projects on request.
+
+    Keeps pooled HTTP connections, the latest release lookup and rendered templates
+    in memory, so each request skips interpreter startup, imports and the release
+    lookup. Requests are JSON over HTTP (or a Unix socket):
+
+        POST /init     {"project_path": "...", "agent": "claude", "script_type": "sh"}
+        POST /upgrade  {"project_path": "...", "agent": "claude"}
+        GET  /metrics  request counts, latency percentiles, cache hits
+        GET  /health
+
+    Requests must send Content-Type: application/json and, over HTTP,
+    Authorization: Bearer <token>. Browser (Origin) and non-loopback Host requests
+    are refused.
+
+    Examples:
+        specify serve --port 8765 --max-concurrency 16 --root /srv/projects
+        specify serve --socket /run/specify.sock --template-source https://mirror.internal/spec-kit/
+    """
+    try:
+        source = template_sources.resolve_source(template_source, github_token)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if root is not None and not root.is_dir():
+        console.print(f"[red]Error:[/red] --root {root} is not a directory")
+        raise typer.Exit(1)
+    if token is None and socket_path is None:
+        token = template_server.generate_token()
+        console.print(f"[cyan]Token written to[/cyan] {template_server.write_token_file(token)}")
+
+    async def run() -> None:
+        server = template_server.SpecifyServer(
+            source,
+            verify=not skip_tls,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            release_ttl=release_ttl,
+            token=token,
+            root=root,
+        )
+        await template_server.serve(
+            server, host, port, socket_path,
+            on_ready=lambda address: console.print(f"[green]Listening on {address}[/green] [dim](source: {source.name}, max concurrency {max_concurrency}; Ctrl+C to stop)[/dim]"),
+        )
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        console.print("[dim]Stopped.[/dim]")
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot listen on {socket_path or f'{host}:{port}'}: {e}")
+        raise typer.Exit(1)
+
 @app.command()
 def version():
     """Display version and system information."""
@@ -1470,20 +1788,21 @@ def version():
             pass
     
     # Fetch latest template release version
-    repo_owner = "rothcold"
-    repo_name = "spec-kit"
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+    api_url = f"https://api.github.com/repos/{template_sources.DEFAULT_REPO}/releases/latest"
     
     template_version = "unknown"
     release_date = "unknown"
     
     try:
+        # Never wait on the shared rate-limit budget just to show a version
+        budget = github_api.reserve_request(github_api.github_token(), max_wait=0)
         response = client.get(
             api_url,
             timeout=10,
             follow_redirects=True,
             headers=_github_auth_headers(),
         )
+        budget.record(response.headers)
         if response.status_code == 200:
             release_data = response.json()
             template_version = release_data.get("tag_name", "unknown")
@@ -1524,6 +1843,685 @@ def version():
     console.print(panel)
     console.print()
 
+agent_context_app = typer.Typer(
+    name="agent-context",
+    help="Maintain AI agent context files (CLAUDE.md, AGENTS.md, ...) from the current plan.md",
+    add_completion=False,
+)
+app.add_typer(agent_context_app, name="agent-context")
+
+@agent_context_app.command("update")
+def agent_context_update(
+    agent: Optional[str] = typer.Argument(None, help=f"Agent whose context file to update: {', '.join(agent_context.AGENT_CONTEXT_FILES)} (default: all existing files)"),
+    max_changes: int = typer.Option(agent_context.DEFAULT_MAX_RECENT_CHANGES, "--max-changes", min=0, envvar="SPECIFY_CONTEXT_MAX_CHANGES", help="Maximum Recent Changes entries kept (0 = unlimited)"),
+    max_technologies: int = typer.Option(agent_context.DEFAULT_MAX_TECHNOLOGIES, "--max-technologies", min=0, envvar="SPECIFY_CONTEXT_MAX_TECHNOLOGIES", help="Maximum Active Technologies entries kept after de-duplication (0 = unlimited)"),
+    max_bytes: int = typer.Option(agent_context.DEFAULT_MAX_BYTES, "--max-bytes", min=0, envvar="SPECIFY_CONTEXT_MAX_BYTES", help="Size budget per context file; oldest entries are evicted first (0 = unlimited)"),
+):
+    """
+    Update agent context files with information from the current feature's plan.md.
+
+    Parses plan.md once and updates the Active Technologies and Recent Changes sections
+    of every targeted file in a single pass. Without AGENT, all existing agent files are
+    updated (a default CLAUDE.md is created if none exist). Duplicate technologies are
+    dropped and the oldest entries evicted to keep each file within its budget.
+
+    Examples:
+        specify agent-context update
+        specify agent-context update claude
+        specify agent-context update --max-changes 5 --max-bytes 8192
+    """
+    if agent is not None and agent not in agent_context.AGENT_CONTEXT_FILES:
+        console.print(f"[red]Error:[/red] Unknown agent type '{agent}'")
+        console.print(f"Expected: {'|'.join(agent_context.AGENT_CONTEXT_FILES)}")
+        raise typer.Exit(1)
+
+    try:
+        paths = get_feature_paths()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if not paths.impl_plan.is_file():
+        console.print(f"[red]Error:[/red] No plan.md found at {paths.impl_plan}")
+        console.print("Make sure you're working on a feature with a corresponding spec directory")
+        if not paths.has_git:
+            console.print("Use: export SPECIFY_FEATURE=your-feature-name or create a new feature first")
+        raise typer.Exit(1)
+
+    template_path = paths.repo_root / agent_context.TEMPLATE_RELATIVE_PATH
+    if not template_path.is_file():
+        template_path = get_template_path("agent-file-template.md", cli_lang=_cli_lang)
+
+    console.print(f"[cyan]Updating agent context for feature[/cyan] {paths.current_branch}")
+    plan, results = agent_context.update_agent_context(
+        paths.repo_root,
+        paths.impl_plan,
+        paths.current_branch,
+        agent=agent,
+        template_path=template_path,
+        budget=agent_context.ContextBudget(
+            max_recent_changes=max_changes,
+            max_technologies=max_technologies,
+            max_bytes=max_bytes,
+        ),
+    )
+
+    if plan.language:
+        console.print(f"[dim]Language:[/dim] {plan.language}")
+    if plan.framework:
+        console.print(f"[dim]Framework:[/dim] {plan.framework}")
+    if plan.database:
+        console.print(f"[dim]Database:[/dim] {plan.database}")
+
+    failed = False
+    for result in results:
+        names = ", ".join(agent_context.AGENT_CONTEXT_FILES[key][1] for key in result.agents)
+        relative = result.path.relative_to(paths.repo_root).as_posix()
+        if result.action == "error":
+            failed = True
+            console.print(f"[red]✗[/red] {relative} ({names}): {result.error}")
+        else:
+            console.print(f"[green]✓[/green] {result.action.capitalize()} {relative} ({names})")
+
+    if failed:
+        raise typer.Exit(1)
+
+feature_app = typer.Typer(
+    name="feature",
+    help="Create and manage feature branches and spec directories",
+    add_completion=False,
+)
+app.add_typer(feature_app, name="feature")
+
+@feature_app.command("new")
+def feature_new(
+    description: list[str] = typer.Argument(..., help="Feature description"),
+    short_name: Optional[str] = typer.Option(None, "--short-name", help="Custom short name (2-4 words) for the branch"),
+    number: Optional[int] = typer.Option(None, "--number", min=0, help="Branch number to use instead of the next free one"),
+    fetch: Optional[bool] = typer.Option(None, "--fetch/--no-fetch", help=f"Always/never fetch remotes first (default: fetch if the last fetch is older than {features.FETCH_INTERVAL_ENV_VAR} seconds, {features.DEFAULT_FETCH_INTERVAL} by default)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """
+    Create a numbered feature branch and spec directory.
+
+    Drop-in replacement for create-new-feature.sh: reads branch refs directly, caches
+    the highest number until refs change, and reserves the number under a lock so
+    parallel runs never collide.
+
+    Examples:
+        specify feature new "Add user authentication system" --short-name user-auth
+        specify feature new "Implement OAuth2 integration for API" --number 5
+    """
+    feature_description = " ".join(description).strip()
+    if not feature_description:
+        console.print("[red]Error:[/red] A feature description is required")
+        raise typer.Exit(1)
+
+    try:
+        feature = features.create_feature(
+            feature_description,
+            get_repo_root(),
+            short_name=short_name,
+            number=number,
+            fetch=fetch,
+        )
+    except (ValueError, RuntimeError, TimeoutError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if not feature.has_git:
+        print(f"[specify] Warning: Git repository not detected; skipped branch creation for {feature.branch_name}", file=sys.stderr)
+
+    if json_output:
+        print(json.dumps(feature.to_json()))
+    else:
+        console.print(f"BRANCH_NAME: {feature.branch_name}", highlight=False)
+        console.print(f"SPEC_FILE: {feature.spec_file}", highlight=False)
+        console.print(f"FEATURE_NUM: {feature.feature_num}", highlight=False)
+        if not feature.has_git:
+            console.print(f"[dim]Set SPECIFY_FEATURE={feature.branch_name} to work on this feature without git[/dim]")
+
+@app.command("features")
+def list_features(
+    number: Optional[int] = typer.Option(None, "--number", "-n", help="Only the feature with this number (e.g. 4 for 004-*)"),
+    status: Optional[str] = typer.Option(None, "--status", help="Only features whose spec.md Status matches (e.g. Draft)"),
+    has: list[str] = typer.Option([], "--has", help=f"Require an artifact (repeatable): {', '.join(ARTIFACT_KINDS)}"),
+    missing: list[str] = typer.Option([], "--missing", help="Require an artifact to be absent (repeatable)"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Re-index specs/ from scratch"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """
+    List features in specs/ from the .specify/index.db index.
+
+    The index is refreshed by stat-diffing specs/ on every run, so only changed
+    artifacts are re-hashed.
+
+    Examples:
+        specify features
+        specify features --status draft --missing plan
+        specify features --has tasks --has checklists --json
+    """
+    repo_root = get_repo_root()
+    try:
+        with FeatureIndex(repo_root) as index:
+            if rebuild:
+                index.rebuild()
+            else:
+                index.refresh()
+            records = index.query(number=number, status=status, has=has, missing=missing)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps([
+            {
+                "name": r.name,
+                "number": r.number,
+                "status": r.status,
+                "title": r.title,
+                "dir": str(repo_root / "specs" / r.name),
+                "artifacts": r.artifacts,
+            }
+            for r in records
+        ], indent=2))
+        return
+
+    if not records:
+        console.print("[yellow]No matching features found[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+    table.add_column("#", justify="right")
+    table.add_column("Feature")
+    table.add_column("Status")
+    table.add_column("Artifacts", style="dim")
+    for r in records:
+        artifacts = ", ".join(
+            f"{kind} ({len(r.artifacts[kind])})" if kind in ("checklists", "contracts") else kind
+            for kind in ARTIFACT_KINDS
+            if r.has(kind)
+        )
+        table.add_row(f"{r.number:03d}" if r.number is not None else "-", r.name, r.status or "-", artifacts or "-")
+    console.print(table)
+
+@app.command("search")
+def search_specs(
+    query: list[str] = typer.Argument(..., help="Search terms; requirement and task IDs (FR-001, T012) match exactly"),
+    limit: int = typer.Option(10, "--limit", "-l", min=1, help="Maximum number of results"),
+    feature: Optional[str] = typer.Option(None, "--feature", "-f", help="Only search one feature (number or full directory name, e.g. 004 or 004-user-auth)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """
+    Search specs/ for prior decisions, requirements and tasks.
+
+    Results are ranked per section (BM25) from an inverted index in .specify/index.db
+    that is updated incrementally; only files that changed are re-indexed.
+
+    Examples:
+        specify search "session timeout"
+        specify search FR-003 --feature 004
+    """
+    text = " ".join(query)
+    repo_root = get_repo_root()
+    path_prefix = feature_path_prefix(feature) if feature else None
+
+    with SearchIndex(repo_root) as index:
+        index.refresh()
+        hits = index.search(text, limit=limit, path_prefix=path_prefix)
+
+    if json_output:
+        print(json.dumps([
+            {"path": h.path, "line": h.line, "heading": h.heading, "score": h.score, "snippet": h.snippet}
+            for h in hits
+        ], indent=2, ensure_ascii=False))
+        return
+
+    if not hits:
+        console.print(f"[yellow]No results for[/yellow] {text}")
+        return
+
+    for hit in hits:
+        location = Text(f"{hit.path}:{hit.line}", style="cyan")
+        if hit.heading:
+            location.append(f"  § {hit.heading}", style="bold")
+        location.append(f"  ({hit.score:.2f})", style="dim")
+        console.print(location)
+        if hit.snippet:
+            console.print(Text(f"    {hit.snippet}", style="bright_black"))
+
+tasks_app = typer.Typer(
+    name="tasks",
+    help="Work with a feature's tasks.md",
+    add_completion=False,
+)
+app.add_typer(tasks_app, name="tasks")
+
+@tasks_app.command("plan")
+def tasks_plan(
+    tasks_file: Optional[Path] = typer.Argument(None, help="tasks.md to plan (default: the current feature's tasks.md)"),
+    workers: int = typer.Option(1, "--workers", "-w", min=1, help="Number of parallel workers (agents) to schedule for"),
+    json_output: bool = typer.Option(False, "--json", help="Output the full plan as JSON"),
+):
+    """
+    Build a dependency DAG from tasks.md and schedule it for N workers.
+
+    Dependencies come from phase ordering, [P] markers, tasks touching the same file
+    and explicit "depends on T012" notes. Prints the critical path and the tasks each
+    step can run in parallel; --json emits per-task dependencies and worker assignments.
+    The schedule is a heuristic (highest-level-first list scheduling): it is reported as
+    optimal only when it meets the lower bound, otherwise it may take extra steps.
+
+    Examples:
+        specify tasks plan --workers 3
+        specify tasks plan specs/004-user-auth/tasks.md --json
+    """
+    if tasks_file is None:
+        try:
+            tasks_file = get_feature_paths().tasks
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+    if not tasks_file.is_file():
+        console.print(f"[red]Error:[/red] tasks.md not found at {tasks_file}")
+        console.print("Run /speckit.tasks first to create the task list")
+        raise typer.Exit(1)
+
+    try:
+        plan = task_graph.plan_tasks(tasks_file, workers=workers)
+    except task_graph.TaskGraphError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(plan, indent=2, ensure_ascii=False))
+        return
+
+    pending = [t for t in plan["tasks"] if not t["done"]]
+    console.print(f"[cyan]Tasks:[/cyan] {len(pending)} pending, {len(plan['tasks']) - len(pending)} done")
+    console.print(f"[cyan]Critical path ({plan['critical_path_length']}):[/cyan] {' → '.join(plan['critical_path']) or '-'}")
+    schedule_plan = plan["schedule"]
+    if schedule_plan["optimal"]:
+        quality = "optimal"
+    else:
+        quality = f"heuristic, lower bound {schedule_plan['lower_bound']}"
+    console.print(f"[cyan]Steps with {workers} worker(s):[/cyan] {schedule_plan['makespan']} ({quality})")
+    if plan["schedule"]["steps"]:
+        table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+        table.add_column("Step", justify="right")
+        table.add_column("Tasks")
+        for step in plan["schedule"]["steps"]:
+            table.add_row(str(step["step"]), ", ".join(step["tasks"]))
+        console.print(table)
+
+@app.command("analyze")
+def analyze_artifacts(
+    feature_dir: Optional[Path] = typer.Argument(None, help="Feature directory to analyze (default: the current feature)"),
+    json_output: bool = typer.Option(False, "--json", help="Output findings, coverage and metrics as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-parse every artifact instead of using .specify/index.db"),
+    strict: bool = typer.Option(False, "--strict", help="Exit with status 1 when CRITICAL or HIGH findings exist"),
+):
+    """
+    Cross-check spec.md, plan.md and tasks.md without an LLM.
+
+    Reports duplicate requirement and task IDs, near-duplicate requirements, requirements
+    and user stories with no tasks, tasks for stories the spec does not define, references
+    to undefined requirements and unresolved [NEEDS CLARIFICATION] markers. Parsed
+    artifacts are cached by content hash, so only changed files are re-parsed.
+
+    Examples:
+        specify analyze
+        specify analyze specs/004-user-auth --json
+        specify analyze --strict
+    """
+    if feature_dir is None:
+        try:
+            paths = get_feature_paths()
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        feature_dir, repo_root = paths.feature_dir, paths.repo_root
+    else:
+        repo_root = get_repo_root(feature_dir)
+
+    try:
+        if no_cache:
+            report = analyzer.analyze_feature(feature_dir)
+        else:
+            with analyzer.ArtifactCache(repo_root) as cache:
+                report = analyzer.analyze_feature(feature_dir, cache=cache)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        console.print("Run /speckit.specify, /speckit.plan and /speckit.tasks first")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(report.to_json(), indent=2, ensure_ascii=False))
+    else:
+        if report.findings:
+            table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+            table.add_column("ID")
+            table.add_column("Category")
+            table.add_column("Severity")
+            table.add_column("Location", style="dim")
+            table.add_column("Summary")
+            colors = {"CRITICAL": "bold red", "HIGH": "red", "MEDIUM": "yellow", "LOW": "dim"}
+            for f in report.findings:
+                table.add_row(f.id, f.category, Text(f.severity, style=colors[f.severity]), f.location, f.summary)
+            console.print(table)
+        else:
+            console.print("[green]No issues found[/green]")
+
+        metrics = report.metrics
+        console.print()
+        console.print(
+            f"[cyan]Requirements:[/cyan] {metrics['requirements']} "
+            f"({metrics['requirement_coverage_pct']}% with tasks)  "
+            f"[cyan]User stories:[/cyan] {metrics['user_stories']}  "
+            f"[cyan]Tasks:[/cyan] {metrics['tasks']}"
+        )
+        if report.unmapped_tasks:
+            console.print(f"[cyan]Tasks without a requirement or story:[/cyan] {', '.join(report.unmapped_tasks)}")
+        console.print(
+            f"[dim]{report.artifacts_parsed} artifact(s) parsed, {report.artifacts_cached} from cache[/dim]"
+        )
+
+    if strict and report.count("CRITICAL", "HIGH"):
+        raise typer.Exit(1)
+
+@app.command("prereqs")
+def check_prereqs(
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    require_tasks: bool = typer.Option(False, "--require-tasks", help="Require tasks.md to exist (for implementation phase)"),
+    include_tasks: bool = typer.Option(False, "--include-tasks", help="Include tasks.md in AVAILABLE_DOCS"),
+    paths_only: bool = typer.Option(False, "--paths-only", help="Only output path variables (no prerequisite validation)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Resolve the feature from scratch instead of reusing a recent result"),
+):
+    """
+    Check Spec-Driven Development prerequisites for the current feature.
+
+    Drop-in replacement for check-prerequisites.sh with the same output: reads HEAD
+    directly instead of spawning git and caches the resolved feature for
+    SPECIFY_PREREQS_TTL seconds (default 5) while HEAD and specs/ are unchanged.
+
+    Examples:
+        specify prereqs --json
+        specify prereqs --json --require-tasks --include-tasks
+        specify prereqs --paths-only
+    """
+    paths, warnings = prerequisites.resolve_feature_paths(use_cache=not no_cache)
+    for warning in warnings:
+        print(f"ERROR: {warning}", file=sys.stderr)
+    try:
+        warning = prerequisites.check_feature_branch(paths)
+        if warning:
+            print(f"[specify] Warning: {warning}", file=sys.stderr)
+
+        if paths_only:
+            payload = prerequisites.paths_json(paths)
+            if json_output:
+                print(json.dumps(payload, ensure_ascii=False))
+            else:
+                for key, value in payload.items():
+                    print(f"{key}: {value}")
+            return
+
+        result = prerequisites.check_prerequisites(paths, require_tasks=require_tasks, include_tasks=include_tasks)
+    except prerequisites.PrerequisiteError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        if e.hint:
+            print(e.hint, file=sys.stderr)
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(result, ensure_ascii=False))
+        return
+    print(f"FEATURE_DIR:{result['FEATURE_DIR']}")
+    print("AVAILABLE_DOCS:")
+    for name, exists in prerequisites.document_status(paths, include_tasks):
+        print(f"  {'✓' if exists else '✗'} {name}")
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Inspect and manage the local template cache",
+    add_completion=False,
+)
+app.add_typer(cache_app, name="cache")
+
+def _cache_limits(max_size: Optional[str], max_age: Optional[float]) -> cache_manager.CacheLimits:
+    """Configured cache limits with command-line overrides; exits on invalid values."""
+    try:
+        limits = cache_manager.configured_limits()
+        if max_size is not None:
+            limits.max_size = cache_manager.parse_size(max_size)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if max_age is not None:
+        limits.max_age_days = max_age
+    return limits
+
+@cache_app.command("stats")
+def cache_stats(
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """
+    Show cache size, limits, hit rate and bytes saved.
+
+    Examples:
+        specify cache stats
+        specify cache stats --json
+    """
+    limits = _cache_limits(None, None)
+    entries = cache_manager.list_entries()
+    stats = cache_manager.read_stats()
+    size = sum(entry.size for entry in entries)
+
+    if json_output:
+        print(json.dumps({
+            "dir": str(cache_manager.cache_dir()),
+            "entries": len(entries),
+            "size": size,
+            "max_size": limits.max_size,
+            "max_age_days": limits.max_age_days,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_rate": stats.hit_rate,
+            "bytes_saved": stats.bytes_saved,
+            "bytes_downloaded": stats.bytes_downloaded,
+        }, indent=2))
+        return
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column(style="cyan")
+    table.add_column()
+    table.add_row("Location", str(cache_manager.cache_dir()))
+    table.add_row("Entries", str(len(entries)))
+    table.add_row("Size", f"{cache_manager.format_size(size)} of {cache_manager.format_size(limits.max_size) if limits.max_size else 'unlimited'}")
+    table.add_row("Max age", f"{limits.max_age_days:g} days" if limits.max_age_days else "unlimited")
+    table.add_row("Hits / misses", f"{stats.hits} / {stats.misses}")
+    table.add_row("Hit rate", f"{stats.hit_rate:.0%}" if stats.hit_rate is not None else "-")
+    table.add_row("Bytes saved", cache_manager.format_size(stats.bytes_saved))
+    table.add_row("Bytes downloaded", cache_manager.format_size(stats.bytes_downloaded))
+    console.print(table)
+
+@cache_app.command("list")
+def cache_list(
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """
+    List cached release assets, least recently used first.
+
+    Examples:
+        specify cache list
+    """
+    entries = cache_manager.list_entries()
+    if json_output:
+        print(json.dumps([
+            {"tag": e.tag, "name": e.name, "path": str(e.path), "size": e.size, "last_access": e.last_access}
+            for e in entries
+        ], indent=2))
+        return
+
+    if not entries:
+        console.print(f"[yellow]The template cache is empty[/yellow] [dim]({cache_manager.templates_dir()})[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+    table.add_column("Release")
+    table.add_column("Asset")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used")
+    for entry in entries:
+        table.add_row(entry.tag, entry.name, cache_manager.format_size(entry.size), datetime.fromtimestamp(entry.last_access).strftime("%Y-%m-%d %H:%M"))
+    console.print(table)
+
+@cache_app.command("prune")
+def cache_prune(
+    max_size: Optional[str] = typer.Option(None, "--max-size", help=f"Size limit, e.g. 500M or 2G (default: {cache_manager.MAX_SIZE_ENV_VAR}, config or 1G)"),
+    max_age: Optional[float] = typer.Option(None, "--max-age", min=0, help=f"Remove entries unused for this many days (default: {cache_manager.MAX_AGE_ENV_VAR}, config or 90)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only list what would be removed"),
+):
+    """
+    Remove expired and least recently used entries until the cache is within its limits.
+
+    Safe to run while other 'specify' processes use the cache: pruning holds the
+    cache lock and never removes in-progress downloads or entries used in the last
+    few minutes.
+
+    Examples:
+        specify cache prune
+        specify cache prune --max-size 200M --max-age 30 --dry-run
+    """
+    limits = _cache_limits(max_size, max_age)
+    try:
+        removed = cache_manager.prune(limits, dry_run=dry_run)
+    except TimeoutError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    for entry in removed:
+        console.print(f"  {entry.tag}/{entry.name} [dim]({cache_manager.format_size(entry.size)})[/dim]", highlight=False)
+    verb = "Would remove" if dry_run else "Removed"
+    console.print(f"[green]{verb} {len(removed)} entr{'y' if len(removed) == 1 else 'ies'}, {cache_manager.format_size(sum(e.size for e in removed))}[/green]")
+
+@cache_app.command("clear")
+def cache_clear(
+    reset_stats: bool = typer.Option(False, "--reset-stats", help="Also reset the hit/miss counters"),
+):
+    """
+    Remove every cached release asset.
+
+    Examples:
+        specify cache clear
+        specify cache clear --reset-stats
+    """
+    try:
+        removed = cache_manager.clear()
+        if reset_stats:
+            cache_manager.reset_stats()
+    except (OSError, TimeoutError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"[green]Removed {len(removed)} entr{'y' if len(removed) == 1 else 'ies'}, {cache_manager.format_size(sum(e.size for e in removed))}[/green]")
+
+dev_app = typer.Typer(
+    name="dev",
+    help="Maintainer tools for building Spec Kit releases",
+    add_completion=False,
+)
+app.add_typer(dev_app, name="dev")
+
+@dev_app.command("package")
+def dev_package(
+    version: str = typer.Argument(..., help="Release version with a leading 'v' (e.g. v0.1.0)"),
+    agents: Optional[str] = typer.Option(None, "--agents", envvar="AGENTS", help="Comma or space separated subset of agents (default: all)"),
+    scripts: Optional[str] = typer.Option(None, "--scripts", envvar="SCRIPTS", help="Comma or space separated subset of sh, ps (default: both)"),
+    source: Path = typer.Option(Path("."), "--source", help="spec-kit source checkout containing templates/, scripts/ and memory/"),
+    output_dir: Path = typer.Option(Path(packaging.DEFAULT_OUTPUT_DIR), "--output-dir", "-o", help="Directory for the release archives"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count)"),
+    formats: Optional[str] = typer.Option(None, "--formats", envvar="FORMATS", help="Comma or space separated subset of zip, tar.xz (default: zip)"),
+    layered: bool = typer.Option(False, "--layered", help="Also build base and per-agent overlay archives, for mirrors without the universal asset"),
+):
+    """
+    Build the spec-kit-template-<agent>-<script>-<version>.zip release archives.
+
+    Templates are read once, rendered in memory for every agent and script type, and
+    the archives are written in parallel.
+
+    Examples:
+        specify dev package v0.1.0
+        specify dev package v0.1.0 --agents claude,copilot --scripts sh
+        specify dev package v0.1.0 --layered --formats zip,tar.xz
+    """
+    try:
+        agent_list = packaging.parse_selection(agents, packaging.ALL_AGENTS, "agent")
+        script_list = packaging.parse_selection(scripts, packaging.ALL_SCRIPTS, "script")
+        format_list = packaging.parse_selection(formats, packaging.ARCHIVE_FORMATS, "format") if formats and formats.strip() else packaging.DEFAULT_FORMATS
+        tree = packaging.load_source(source)
+        start = time.perf_counter()
+        archives = packaging.build_packages(tree, version, output_dir, agent_list, script_list, jobs=jobs, layered=layered, formats=format_list)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    elapsed = time.perf_counter() - start
+    for archive in archives:
+        console.print(f"  {archive}", highlight=False)
+    console.print(f"[green]Built {len(archives)} archive(s) in {elapsed:.2f}s[/green]")
+
+@dev_app.command("bench-formats")
+def dev_bench_formats(
+    agent: str = typer.Option("claude", "--agent", help="Agent whose template is benchmarked"),
+    script: str = typer.Option("sh", "--script", help="Script type whose template is benchmarked"),
+    source: Path = typer.Option(Path("."), "--source", help="spec-kit source checkout containing templates/, scripts/ and memory/"),
+    bandwidth: int = typer.Option(1000, "--bandwidth", min=0, help="Simulated download speed in KB/s (0: unthrottled)"),
+    rounds: int = typer.Option(5, "--rounds", min=1, help="Timed runs per format"),
+):
+    """
+    Compare release archive formats by download size and init download+extract time.
+
+    The variant archive is built in every format and served from a local HTTP server
+    throttled to --bandwidth; the template download and extraction done by
+    'specify init' is then timed for each format (zip is downloaded, then extracted;
+    tar.xz is extracted while it downloads).
+
+    Examples:
+        specify dev bench-formats
+        specify dev bench-formats --agent copilot --bandwidth 200 --rounds 10
+    """
+    version = "v0.0.0"
+    try:
+        tree = packaging.load_source(source)
+        with tempfile.TemporaryDirectory() as tmp:
+            dist = Path(tmp) / "dist"
+            packaging.build_packages(tree, version, dist, [agent], [script], jobs=1, universal=False, formats=packaging.ARCHIVE_FORMATS)
+            results = []
+            with format_benchmark.serve_directory(dist, bandwidth * 1000 or None) as base_url, httpx.Client() as client:
+                for fmt in packaging.ARCHIVE_FORMATS:
+                    release = format_benchmark.release_for_format(dist, base_url, version, fmt)
+                    result = format_benchmark.FormatResult(fmt, release["assets"][0]["size"])
+                    for run in range(rounds):
+                        tracker = StepTracker("bench")
+                        project = Path(tmp) / f"project-{fmt}-{run}"
+                        start = time.perf_counter()
+                        download_and_extract_template(project, agent, script, verbose=False, tracker=tracker, client=client, release_data=release, source=template_sources.TemplateSource())
+                        result.seconds.append(time.perf_counter() - start)
+                    results.append(result)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(show_header=True, header_style="bold cyan", box=None, padding=(0, 2))
+    table.add_column("Format")
+    table.add_column("Size", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Min", justify="right")
+    for result in results:
+        table.add_row(result.fmt, f"{result.size:,} B", f"{result.median * 1000:.0f} ms", f"{min(result.seconds) * 1000:.0f} ms")
+    console.print(table)
+    console.print(f"[dim]{agent}/{script}, {rounds} round(s), {f'{bandwidth} KB/s' if bandwidth else 'unthrottled'}[/dim]")
+
 def main():
     app()
 
@@ -0,0 +1,425 @@
+"""
+Agent context file maintenance for Specify CLI.
+
+Python engine behind ``specify agent-context update`` (and the thin
+``update-agent-context.sh``/``.ps1`` wrappers): parses ``plan.md`` once and updates the
+``Active Technologies`` and ``Recent Changes`` sections of every agent context file
+(CLAUDE.md, GEMINI.md, AGENTS.md, ...) in a single pass each.
+"""
+
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+# Agent key -> (context file relative to the repo root, display name).
+# Several agents share AGENTS.md; it is only updated once per run.
+AGENT_CONTEXT_FILES: dict[str, tuple[str, str]] = {
+    "claude": ("CLAUDE.md", "Claude Code"),
+    "gemini": ("GEMINI.md", "Gemini CLI"),
+    "copilot": (".github/agents/copilot-instructions.md", "GitHub Copilot"),
+    "cursor-agent": (".cursor/rules/specify-rules.mdc", "Cursor IDE"),
+    "qwen": ("QWEN.md", "Qwen Code"),
+    "opencode": ("AGENTS.md", "opencode"),
+    "codex": ("AGENTS.md", "Codex CLI"),
+    "windsurf": (".windsurf/rules/specify-rules.md", "Windsurf"),
+    "kilocode": (".kilocode/rules/specify-rules.md", "Kilo Code"),
+    "auggie": (".augment/rules/specify-rules.md", "Auggie CLI"),
+    "roo": (".roo/rules/specify-rules.md", "Roo Code"),
+    "codebuddy": ("CODEBUDDY.md", "CodeBuddy CLI"),
+    "qoder": ("QODER.md", "Qoder CLI"),
+    "amp": ("AGENTS.md", "Amp"),
+    "shai": ("SHAI.md", "SHAI"),
+    "q": ("AGENTS.md", "Amazon Q Developer CLI"),
+    "bob": ("AGENTS.md", "IBM Bob"),
+}
+
+DEFAULT_AGENT = "claude"
+TEMPLATE_RELATIVE_PATH = Path(".specify") / "templates" / "agent-file-template.md"
+
+ACTIVE_TECHNOLOGIES_HEADING = "## Active Technologies"
+RECENT_CHANGES_HEADING = "## Recent Changes"
+
+MANUAL_ADDITIONS_START = "<!-- MANUAL ADDITIONS START -->"
+
+# Default size budgets; every agent session loads these files, so they must not grow forever
+DEFAULT_MAX_RECENT_CHANGES = 3
+DEFAULT_MAX_TECHNOLOGIES = 20
+DEFAULT_MAX_BYTES = 16 * 1024
+
+_PLAN_FIELDS = {
+    "Language/Version": "language",
+    "Primary Dependencies": "framework",
+    "Storage": "storage",
+    "Project Type": "project_type",
+}
+_PLAN_FIELD_PATTERN = re.compile(r"^\*\*(Language/Version|Primary Dependencies|Storage|Project Type)\*\*: (.*)$")
+_LAST_UPDATED_PATTERN = re.compile(r"\*\*Last updated\*\*:.*\d{4}-\d{2}-\d{2}")
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+_UNSET_VALUES = {"", "N/A", "NEEDS CLARIFICATION"}
+_ENTRY_SUFFIX_PATTERN = re.compile(r"\s*\([^()]*\)\s*$")
+
+
+@dataclass
+class PlanData:
+    """Technical context fields extracted from a feature's plan.md."""
+
+    language: str = ""
+    framework: str = ""
+    storage: str = ""
+    project_type: str = ""
+
+    @property
+    def tech_stack(self) -> str:
+        """Language and primary dependencies joined with " + " (empty if neither is set)."""
+        return " + ".join(part for part in (self.language, self.framework) if part)
+
+    @property
+    def database(self) -> str:
+        """Storage, or empty when it is not a real value."""
+        return self.storage if self.storage not in _UNSET_VALUES else ""
+
+
+@dataclass(frozen=True)
+class ContextBudget:
+    """Size limits enforced on an agent context file whenever it is written.
+
+    A limit of None (or 0) disables that check. Recent Changes keeps the newest
+    entries (top of the list); Active Technologies keeps the newest entries (bottom of
+    the list) after dropping duplicates.
+    """
+
+    max_recent_changes: Optional[int] = DEFAULT_MAX_RECENT_CHANGES
+    max_technologies: Optional[int] = DEFAULT_MAX_TECHNOLOGIES
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+
+
+@dataclass
+class AgentContextResult:
+    """Outcome of updating one agent context file."""
+
+    path: Path
+    agents: list[str] = field(default_factory=list)
+    action: str = ""  # "created", "updated" or "error"
+    error: Optional[str] = None
+
+
+def parse_plan(plan_path: Path) -> PlanData:
+    """Parse the ``**Field**: value`` lines of plan.md in a single read.
+
+    The first occurrence of each field wins; values containing "NEEDS CLARIFICATION"
+    or equal to "N/A" are treated as unset.
+    """
+    data = PlanData()
+    seen: set[str] = set()
+    with open(plan_path, "r", encoding="utf-8") as f:
+        for line in f:
+            match = _PLAN_FIELD_PATTERN.match(line.rstrip("\r\n"))
+            if not match or match.group(1) in seen:
+                continue
+            seen.add(match.group(1))
+            value = match.group(2).strip()
+            if "NEEDS CLARIFICATION" in value or value == "N/A":
+                value = ""
+            setattr(data, _PLAN_FIELDS[match.group(1)], value)
+            if len(seen) == len(_PLAN_FIELDS):
+                break
+    return data
+
+
+def project_structure(project_type: str) -> str:
+    """Return the directory layout snippet for the project type."""
+    return "backend/\nfrontend/\ntests/" if "web" in project_type else "src/\ntests/"
+
+
+def commands_for_language(language: str) -> str:
+    """Return build/test commands for the primary language."""
+    if "Python" in language:
+        return "cd src && pytest && ruff check ."
+    if "Rust" in language:
+        return "cargo test && cargo clippy"
+    if "JavaScript" in language or "TypeScript" in language:
+        return "npm test && npm run lint"
+    return f"# Add commands for {language}"
+
+
+def render_new_agent_file(template: str, plan: PlanData, project_name: str, branch: str, today: str) -> str:
+    """Fill agent-file-template.md placeholders for a brand new context file."""
+    stack = plan.tech_stack
+    tech_entry = f"- {stack} ({branch})" if stack else f"- ({branch})"
+    change_entry = f"- {branch}: Added {stack}" if stack else f"- {branch}: Added"
+    replacements = [
+        ("[PROJECT NAME]", project_name),
+        ("[DATE]", today),
+        ("[EXTRACTED FROM ALL PLAN.MD FILES]", tech_entry),
+        ("[ACTUAL STRUCTURE FROM PLANS]", project_structure(plan.project_type)),
+        ("[ONLY COMMANDS FOR ACTIVE TECHNOLOGIES]", commands_for_language(plan.language)),
+        ("[LANGUAGE-SPECIFIC, ONLY FOR LANGUAGES IN USE]", f"{plan.language}: Follow standard conventions"),
+        ("[LAST 3 FEATURES AND WHAT THEY ADDED]", change_entry),
+    ]
+    for placeholder, value in replacements:
+        template = template.replace(placeholder, value)
+    return template
+
+
+def new_entries(content: str, plan: PlanData, branch: str) -> tuple[list[str], str]:
+    """Return (technology entries, recent change entry) to add to an existing file."""
+    stack = plan.tech_stack
+    database = plan.database
+    tech_entries = []
+    if stack and stack not in content:
+        tech_entries.append(f"- {stack} ({branch})")
+    if database and database not in content:
+        tech_entries.append(f"- {database} ({branch})")
+
+    change_entry = ""
+    if stack:
+        change_entry = f"- {branch}: Added {stack}"
+    elif database:
+        change_entry = f"- {branch}: Added {database}"
+    return tech_entries, change_entry
+
+
+def _section_bullets(lines: list[str], heading: str) -> list[int]:
+    """Return the indices of the ``- `` entries in a section, in file order.
+
+    The section ends at the next ``##`` heading or the manual additions marker, so
+    user-maintained content is never treated as managed entries.
+    """
+    indices = []
+    in_section = False
+    for i, line in enumerate(lines):
+        if line == heading:
+            in_section = True
+            continue
+        if not in_section:
+            continue
+        if line.startswith("## ") or line.startswith("##\t") or line == MANUAL_ADDITIONS_START:
+            break
+        if line.startswith("- "):
+            indices.append(i)
+    return indices
+
+
+def technology_key(entry: str) -> str:
+    """Normalize an Active Technologies entry for de-duplication.
+
+    ``- Python 3.11 + FastAPI (004-api)`` and ``- python 3.11 + fastapi (007-ui)``
+    share the key ``python 3.11 + fastapi``.
+    """
+    text = _ENTRY_SUFFIX_PATTERN.sub("", entry[2:] if entry.startswith("- ") else entry)
+    return " ".join(text.lower().split())
+
+
+def _content_size(lines: list[str]) -> int:
+    return len(("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def enforce_budget(lines: list[str], budget: ContextBudget) -> list[str]:
+    """Apply a ContextBudget to the lines of an agent context file.
+
+    Duplicate technologies keep their most recent entry. Entry limits then evict the
+    oldest entries (bottom of Recent Changes, top of Active Technologies, since
+    ``update_agent_file_content`` appends new technologies after the last entry). If the
+    file is still over ``max_bytes``, Recent Changes and then Active Technologies are
+    trimmed oldest-first down to one entry each; content outside the two sections is
+    never removed, so a file can remain over budget.
+    """
+    tech = _section_bullets(lines, ACTIVE_TECHNOLOGIES_HEADING)
+    changes = _section_bullets(lines, RECENT_CHANGES_HEADING)
+
+    drop: set[int] = set()
+    seen: set[str] = set()
+    unique_tech = []
+    for i in reversed(tech):
+        key = technology_key(lines[i])
+        if key in seen:
+            drop.add(i)
+        else:
+            seen.add(key)
+            unique_tech.insert(0, i)
+    tech = unique_tech
+
+    if budget.max_technologies and len(tech) > budget.max_technologies:
+        evicted = len(tech) - budget.max_technologies
+        drop.update(tech[:evicted])
+        tech = tech[evicted:]
+    if budget.max_recent_changes and len(changes) > budget.max_recent_changes:
+        drop.update(changes[budget.max_recent_changes:])
+        changes = changes[:budget.max_recent_changes]
+
+    if budget.max_bytes:
+        size = _content_size([line for i, line in enumerate(lines) if i not in drop])
+        while size > budget.max_bytes:
+            if len(changes) > 1:
+                victim = changes.pop()
+            elif len(tech) > 1:
+                victim = tech.pop(0)
+            else:
+                break
+            drop.add(victim)
+            size -= len(lines[victim].encode("utf-8")) + 1
+
+    return [line for i, line in enumerate(lines) if i not in drop] if drop else lines
+
+
+def update_agent_file_content(content: str, plan: PlanData, branch: str, today: str, budget: Optional[ContextBudget] = None) -> str:
+    """Update Active Technologies, Recent Changes and the Last updated date in one pass.
+
+    Args:
+        content: Existing agent context file content
+        plan: Parsed plan data for the current feature
+        branch: Current feature branch (e.g. "004-user-auth")
+        today: Date string (YYYY-MM-DD) for the Last updated line
+        budget: Size limits applied after the update (default: ContextBudget())
+
+    Returns:
+        str: Updated file content (always newline-terminated)
+    """
+    tech_entries, change_entry = new_entries(content, plan, branch)
+    lines = content.splitlines()
+    has_tech_section = ACTIVE_TECHNOLOGIES_HEADING in lines
+    has_changes_section = RECENT_CHANGES_HEADING in lines
+
+    # New technologies go after the section's last entry, so file order stays oldest-first
+    # even when a blank line follows the heading (as in agent-file-template.md)
+    tech_bullets = _section_bullets(lines, ACTIVE_TECHNOLOGIES_HEADING)
+    last_tech = tech_bullets[-1] if tech_bullets else None
+
+    out: list[str] = []
+    in_tech = tech_added = False
+
+    for index, line in enumerate(lines):
+        if line == ACTIVE_TECHNOLOGIES_HEADING:
+            out.append(line)
+            in_tech = True
+            continue
+        if index == last_tech:
+            out.append(line)
+            if tech_entries:
+                out.extend(tech_entries)
+            tech_added = True
+            in_tech = False
+            continue
+        if in_tech and last_tech is None and (not line or line.startswith("## ") or line.startswith("##\t")):
+            # Without entries, new technologies go before the blank line or heading that closes the section
+            if not tech_added and tech_entries:
+                out.extend(tech_entries)
+                tech_added = True
+            if not line:
+                out.append(line)
+                continue
+            # A heading ends the section and is handled below (it may be Recent Changes)
+            in_tech = False
+
+        if line == RECENT_CHANGES_HEADING:
+            out.append(line)
+            if change_entry:
+                out.append(change_entry)
+            continue
+
+        if _LAST_UPDATED_PATTERN.search(line):
+            line = _DATE_PATTERN.sub(today, line, count=1)
+        out.append(line)
+
+    if in_tech and not tech_added and tech_entries:
+        out.extend(tech_entries)
+        tech_added = True
+
+    if not has_tech_section and tech_entries:
+        out.extend(["", ACTIVE_TECHNOLOGIES_HEADING, *tech_entries])
+    if not has_changes_section and change_entry:
+        out.extend(["", RECENT_CHANGES_HEADING, change_entry])
+
+    return "\n".join(enforce_budget(out, budget or ContextBudget())) + "\n"
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Write content to path via a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def resolve_targets(repo_root: Path, agent: Optional[str] = None) -> dict[Path, list[str]]:
+    """Map each context file to update onto the agents that use it.
+
+    With an agent, only that agent's file is returned. Without one, every existing
+    context file is returned, or the default Claude file if none exist yet.
+    Raises KeyError for an unknown agent.
+    """
+    if agent is not None:
+        relative, _name = AGENT_CONTEXT_FILES[agent]
+        return {repo_root / relative: [agent]}
+
+    targets: dict[Path, list[str]] = {}
+    for key, (relative, _name) in AGENT_CONTEXT_FILES.items():
+        path = repo_root / relative
+        if path.is_file():
+            targets.setdefault(path, []).append(key)
+    if not targets:
+        targets[repo_root / AGENT_CONTEXT_FILES[DEFAULT_AGENT][0]] = [DEFAULT_AGENT]
+    return targets
+
+
+def update_agent_context(
+    repo_root: Path,
+    plan_path: Path,
+    branch: str,
+    agent: Optional[str] = None,
+    template_path: Optional[Path] = None,
+    today: Optional[str] = None,
+    budget: Optional[ContextBudget] = None,
+) -> tuple[PlanData, list[AgentContextResult]]:
+    """Parse plan.md once and update every targeted agent context file.
+
+    Args:
+        repo_root: Repository root containing the agent files
+        plan_path: Path to the current feature's plan.md
+        branch: Current feature branch name
+        agent: Update only this agent's file (default: all existing files)
+        template_path: agent-file-template.md used for new files
+            (default: the project's .specify copy)
+        today: Override for the date written to the files (YYYY-MM-DD)
+        budget: Size limits enforced on every file written (default: ContextBudget())
+
+    Returns:
+        Tuple of (parsed plan data, one result per context file)
+    """
+    plan = parse_plan(plan_path)
+    today = today or date.today().isoformat()
+    budget = budget or ContextBudget()
+    template_path = template_path or repo_root / TEMPLATE_RELATIVE_PATH
+    template: Optional[str] = None
+
+    results = []
+    for path, agents in resolve_targets(repo_root, agent).items():
+        result = AgentContextResult(path=path, agents=agents)
+        try:
+            if path.is_file():
+                content = path.read_text(encoding="utf-8")
+                updated = update_agent_file_content(content, plan, branch, today, budget)
+                if updated != content:
+                    _atomic_write(path, updated)
+                result.action = "updated"
+            else:
+                if template is None:
+                    template = template_path.read_text(encoding="utf-8")
+                rendered = render_new_agent_file(template, plan, repo_root.name, branch, today)
+                _atomic_write(path, "\n".join(enforce_budget(rendered.splitlines(), budget)) + "\n")
+                result.action = "created"
+        except OSError as e:
+            result.action = "error"
+            result.error = str(e)
+        results.append(result)
+    return plan, results
@@ -0,0 +1,498 @@
+"""
+Deterministic cross-artifact analysis for Specify CLI.
+
+Backs ``specify analyze``: parses a feature's spec.md, plan.md and tasks.md and reports
+the mechanical half of ``/speckit.analyze`` without an LLM:
+
+- Duplication: requirement or task IDs defined twice, and requirements whose text is
+  identical or nearly identical.
+- Coverage: functional requirements and user stories with no task, and tasks labelled
+  with a story the spec does not define.
+- Inconsistency: tasks or plan referencing requirement IDs that are not in the spec.
+- Ambiguity: unresolved ``[NEEDS CLARIFICATION: ...]`` markers.
+- Underspecification: user stories without acceptance scenarios.
+
+A task covers a requirement when it cites the ID (``FR-001``) or, failing that, when it
+shares most of the requirement's key terms. Parsed artifacts are cached in
+``.specify/index.db`` keyed by content hash, so repeated runs only re-parse files that
+changed.
+
+Usage:
+    with ArtifactCache(repo_root) as cache:
+        report = analyze_feature(feature_dir, cache=cache)
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from specify_cli import task_graph
+from specify_cli.feature_index import INDEX_RELATIVE_PATH, ensure_gitignore
+from specify_cli.search import tokenize
+
+ANALYSIS_SCHEMA_VERSION = 1
+# Bump when a parser's output changes so cached results are re-parsed
+PARSER_VERSION = 1
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+CATEGORIES = ("Duplication", "Coverage", "Inconsistency", "Ambiguity", "Underspecification")
+
+# Requirements whose key terms overlap at least this much (Jaccard) are near-duplicates
+DUPLICATE_SIMILARITY = 0.8
+# A task covers a requirement by inference when it shares this share of its key terms
+INFERRED_COVERAGE = 0.5
+
+_REQUIREMENT_PATTERN = re.compile(r"^\s*[-*]\s+\*\*((?:FR|NFR|SC)-\d+)\*\*:?\s*(.*)$")
+_REQUIREMENT_REF_PATTERN = re.compile(r"\b(?:FR|NFR|SC)-\d+\b")
+_STORY_PATTERN = re.compile(r"^#{2,4}\s+User Story\s+(\d+)\s*(?:[-–—:]\s*(.*?))?\s*(?:\(Priority:\s*(P\d+)\))?\s*$", re.IGNORECASE)
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s")
+_ACCEPTANCE_PATTERN = re.compile(r"Acceptance Scenarios|\*\*Given\*\*", re.IGNORECASE)
+_CLARIFICATION_PATTERN = re.compile(r"\[NEEDS CLARIFICATION:?\s*([^\]]*)\]")
+
+# Words that say nothing about what a requirement is about
+_STOPWORDS = frozenset("""
+    able allow allows also must should shall will would could with without from into that
+    this these those their them they have been being when where which while what system
+    user users ability support supports provide provides feature features data each every
+    other than then only such same more most less least about after before under over
+""".split())
+
+
+@dataclass
+class Finding:
+    """One issue found by the analyzer; ``id`` is the category initial plus a sequence number."""
+
+    id: str
+    category: str
+    severity: str
+    location: str
+    summary: str
+    recommendation: str = ""
+
+
+@dataclass
+class Coverage:
+    """Which tasks cover a requirement or user story, and how the mapping was made."""
+
+    key: str
+    kind: str
+    tasks: list[str] = field(default_factory=list)
+    mapping: str = "none"  # explicit | inferred | none
+
+    @property
+    def covered(self) -> bool:
+        return bool(self.tasks)
+
+
+@dataclass
+class AnalysisReport:
+    """Findings, coverage and metrics for one feature directory."""
+
+    feature_dir: str
+    findings: list[Finding]
+    coverage: list[Coverage]
+    unmapped_tasks: list[str]
+    metrics: dict
+    artifacts_parsed: int = 0
+    artifacts_cached: int = 0
+
+    def count(self, *severities: str) -> int:
+        """Number of findings with any of the given severities."""
+        return sum(1 for f in self.findings if f.severity in severities)
+
+    def to_json(self) -> dict:
+        return {
+            "feature_dir": self.feature_dir,
+            "findings": [asdict(f) for f in self.findings],
+            "coverage": [{**asdict(c), "covered": c.covered} for c in self.coverage],
+            "unmapped_tasks": self.unmapped_tasks,
+            "metrics": self.metrics,
+        }
+
+
+def _content_lines(text: str):
+    """Yield (line number, line) outside code fences and HTML comments."""
+    in_fence = in_comment = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if in_comment:
+            if "-->" in line:
+                in_comment = False
+            continue
+        if "<!--" in line:
+            head, _, tail = line.partition("<!--")
+            if "-->" not in tail:
+                in_comment = True
+            line = head + (tail.split("-->", 1)[1] if "-->" in tail else "")
+        yield number, line
+
+
+def _clarifications(text: str) -> list[dict]:
+    return [
+        {"line": number, "text": match.group(1).strip()}
+        for number, line in _content_lines(text)
+        for match in _CLARIFICATION_PATTERN.finditer(line)
+    ]
+
+
+def parse_spec(text: str) -> dict:
+    """Extract requirements (FR/NFR/SC), user stories and clarification markers from spec.md."""
+    requirements, stories = [], []
+    story: Optional[dict] = None
+    for number, line in _content_lines(text):
+        heading = _STORY_PATTERN.match(line)
+        if heading:
+            story = {
+                "id": f"US{int(heading.group(1))}",
+                "title": (heading.group(2) or "").strip(),
+                "priority": heading.group(3),
+                "line": number,
+                "has_acceptance": False,
+            }
+            stories.append(story)
+            continue
+        if _HEADING_PATTERN.match(line):
+            # Any other heading at story level or above ends the story section
+            if story is not None and len(line) - len(line.lstrip("#")) <= 3:
+                story = None
+        elif story is not None and _ACCEPTANCE_PATTERN.search(line):
+            story["has_acceptance"] = True
+        match = _REQUIREMENT_PATTERN.match(line)
+        if match:
+            requirements.append({"id": match.group(1), "text": match.group(2).strip(), "line": number})
+    return {"requirements": requirements, "stories": stories, "clarifications": _clarifications(text)}
+
+
+def parse_plan(text: str) -> dict:
+    """Extract requirement references and clarification markers from plan.md."""
+    references = [
+        {"id": match.group(0), "line": number}
+        for number, line in _content_lines(text)
+        for match in _REQUIREMENT_REF_PATTERN.finditer(line)
+    ]
+    return {"references": references, "clarifications": _clarifications(text)}
+
+
+def parse_tasks_file(text: str) -> dict:
+    """Extract tasks (keeping duplicate IDs) with their story labels and requirement references."""
+    tasks = []
+    for phase in task_graph.parse_tasks(text, strict=False):
+        for task in phase.tasks:
+            tasks.append({
+                "id": task.id,
+                "description": task.description,
+                "story": task.story,
+                "phase": phase.title,
+                "line": task.line,
+                "references": sorted(set(_REQUIREMENT_REF_PATTERN.findall(task.description))),
+            })
+    return {"tasks": tasks}
+
+
+PARSERS = {
+    "spec": parse_spec,
+    "plan": parse_plan,
+    "tasks": parse_tasks_file,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_artifacts (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    parser_version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (path, kind)
+) WITHOUT ROWID;
+"""
+
+
+class ArtifactCache:
+    """Parsed-artifact cache in ``.specify/index.db``, keyed by path, kind and content hash."""
+
+    def __init__(self, repo_root: Path, db_path: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        self.db_path = Path(db_path) if db_path else self.repo_root / INDEX_RELATIVE_PATH
+        is_new = not self.db_path.exists()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if is_new and db_path is None:
+            ensure_gitignore(self.db_path.parent)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'analysis_schema_version'").fetchone()
+            if row is None or row[0] != str(ANALYSIS_SCHEMA_VERSION):
+                self.conn.execute("DROP TABLE IF EXISTS analysis_artifacts")
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('analysis_schema_version', ?)",
+                (str(ANALYSIS_SCHEMA_VERSION),),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ArtifactCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _key(self, path: Path) -> str:
+        try:
+            return Path(path).resolve().relative_to(self.repo_root.resolve()).as_posix()
+        except ValueError:
+            return str(Path(path).resolve())
+
+    def get(self, path: Path, kind: str, digest: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT data FROM analysis_artifacts WHERE path = ? AND kind = ? AND sha256 = ? AND parser_version = ?",
+            (self._key(path), kind, digest, PARSER_VERSION),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, path: Path, kind: str, digest: str, data: dict) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_artifacts(path, kind, sha256, parser_version, data) VALUES (?, ?, ?, ?, ?)",
+                (self._key(path), kind, digest, PARSER_VERSION, json.dumps(data)),
+            )
+
+
+def load_artifact(path: Path, kind: str, cache: Optional[ArtifactCache] = None) -> tuple[dict, bool]:
+    """Parse an artifact, reusing the cached result when its content hash is unchanged.
+
+    Returns:
+        (parsed data, whether it came from the cache)
+    """
+    raw = Path(path).read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cache is not None:
+        cached = cache.get(path, kind, digest)
+        if cached is not None:
+            return cached, True
+    data = PARSERS[kind](raw.decode("utf-8", errors="replace"))
+    if cache is not None:
+        cache.put(path, kind, digest, data)
+    return data, False
+
+
+def key_terms(text: str) -> set[str]:
+    """Content words of a requirement or task, lightly stemmed, for overlap comparisons."""
+    terms = set()
+    for term in tokenize(text):
+        # Skip short words, stopwords and IDs such as fr-001 or t012
+        if len(term) < 4 or term in _STOPWORDS or any(c.isdigit() for c in term):
+            continue
+        if len(term) > 4 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.add(term)
+    return terms
+
+
+def _similarity(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+def _requirement_findings(spec: dict, add) -> None:
+    seen: dict[str, int] = {}
+    for req in spec["requirements"]:
+        if req["id"] in seen:
+            add("Duplication", "HIGH", f"spec.md:{req['line']}",
+                f"{req['id']} is defined again (first on line {seen[req['id']]})",
+                "Renumber one of the requirements so IDs are unique")
+        else:
+            seen[req["id"]] = req["line"]
+
+    reqs = spec["requirements"]
+    terms = [key_terms(r["text"]) for r in reqs]
+    for i, first in enumerate(reqs):
+        for j in range(i + 1, len(reqs)):
+            second = reqs[j]
+            if first["id"] == second["id"]:
+                continue
+            same_text = _normalize_text(first["text"]) == _normalize_text(second["text"])
+            if same_text or (min(len(terms[i]), len(terms[j])) >= 3 and _similarity(terms[i], terms[j]) >= DUPLICATE_SIMILARITY):
+                add("Duplication", "HIGH", f"spec.md:{first['line']}, spec.md:{second['line']}",
+                    f"{first['id']} and {second['id']} {'are identical' if same_text else 'are near-duplicates'}",
+                    "Merge the requirements and keep the clearer phrasing")
+
+
+def analyze(spec: dict, tasks: dict, plan: Optional[dict] = None, feature_dir: str = "") -> AnalysisReport:
+    """Cross-check parsed artifacts.
+
+    Args:
+        spec: Output of parse_spec
+        tasks: Output of parse_tasks_file
+        plan: Output of parse_plan, if plan.md exists
+        feature_dir: Shown in the report
+
+    Returns:
+        A report whose findings are sorted by severity, then category and location
+    """
+    raw_findings: list[tuple[str, str, str, str, str]] = []
+
+    def add(category: str, severity: str, location: str, summary: str, recommendation: str = "") -> None:
+        raw_findings.append((category, severity, location, summary, recommendation))
+
+    _requirement_findings(spec, add)
+
+    task_list = tasks["tasks"]
+    seen_tasks: dict[str, int] = {}
+    for task in task_list:
+        if task["id"] in seen_tasks:
+            add("Duplication", "HIGH", f"tasks.md:{task['line']}",
+                f"Task {task['id']} is defined again (first on line {seen_tasks[task['id']]})",
+                "Renumber the tasks so IDs are unique")
+        else:
+            seen_tasks[task["id"]] = task["line"]
+
+    defined = {r["id"] for r in spec["requirements"]}
+    story_ids = {s["id"] for s in spec["stories"]}
+
+    # Requirement coverage: explicit references first, then key-term overlap
+    coverage: list[Coverage] = []
+    task_terms = {t["id"]: key_terms(t["description"]) for t in task_list}
+    mapped_tasks: set[str] = set()
+    first_requirement: dict[str, dict] = {}
+    for req in spec["requirements"]:
+        first_requirement.setdefault(req["id"], req)
+    for req_id, req in first_requirement.items():
+        entry = Coverage(key=req_id, kind="requirement")
+        explicit = sorted({t["id"] for t in task_list if req_id in t["references"]})
+        if explicit:
+            entry.tasks, entry.mapping = explicit, "explicit"
+        else:
+            terms = key_terms(req["text"])
+            needed = max(min(2, len(terms)), 1)
+            inferred = sorted({
+                t["id"] for t in task_list
+                if len(terms & task_terms[t["id"]]) >= needed
+                and len(terms & task_terms[t["id"]]) / max(len(terms), 1) >= INFERRED_COVERAGE
+            })
+            if inferred:
+                entry.tasks, entry.mapping = inferred, "inferred"
+        mapped_tasks.update(entry.tasks)
+        coverage.append(entry)
+        # Success criteria are measured, not built, so only FR/NFR need tasks
+        if not entry.covered and not req_id.startswith("SC-"):
+            add("Coverage", "HIGH", f"spec.md:{req['line']}",
+                f"{req_id} has no associated task",
+                f"Add a task for {req_id} (cite the ID in its description)")
+
+    for story in spec["stories"]:
+        story_tasks = sorted({t["id"] for t in task_list if t["story"] == story["id"]})
+        coverage.append(Coverage(key=story["id"], kind="story", tasks=story_tasks, mapping="explicit" if story_tasks else "none"))
+        mapped_tasks.update(story_tasks)
+        if not story_tasks:
+            add("Coverage", "CRITICAL" if story["priority"] == "P1" else "HIGH", f"spec.md:{story['line']}",
+                f"{story['id']} ({story['title'] or 'untitled'}) has no [{story['id']}] tasks",
+                f"Add a phase for {story['id']} in tasks.md")
+        if not story["has_acceptance"]:
+            add("Underspecification", "MEDIUM", f"spec.md:{story['line']}",
+                f"{story['id']} has no acceptance scenarios",
+                "Add Given/When/Then acceptance scenarios")
+
+    for task in task_list:
+        if task["story"] and task["story"] not in story_ids:
+            add("Coverage", "MEDIUM", f"tasks.md:{task['line']}",
+                f"Task {task['id']} is labelled [{task['story']}] but the spec has no {task['story']}",
+                "Relabel the task or add the user story to spec.md")
+        for ref in task["references"]:
+            if ref not in defined:
+                add("Inconsistency", "MEDIUM", f"tasks.md:{task['line']}",
+                    f"Task {task['id']} references {ref}, which is not defined in spec.md",
+                    "Fix the reference or add the requirement")
+        if task["references"] or task["story"]:
+            mapped_tasks.add(task["id"])
+
+    if plan is not None:
+        reported = set()
+        for ref in plan["references"]:
+            if ref["id"] not in defined and ref["id"] not in reported:
+                reported.add(ref["id"])
+                add("Inconsistency", "MEDIUM", f"plan.md:{ref['line']}",
+                    f"plan.md references {ref['id']}, which is not defined in spec.md",
+                    "Fix the reference or add the requirement")
+
+    for name, data in (("spec.md", spec), ("plan.md", plan)):
+        for marker in (data or {}).get("clarifications", []):
+            add("Ambiguity", "MEDIUM", f"{name}:{marker['line']}",
+                f"Unresolved clarification: {marker['text'] or '(no question)'}",
+                "Run /speckit.clarify or resolve the marker")
+
+    def location_key(location: str) -> tuple:
+        name, _, line = location.split(",")[0].partition(":")
+        return (name, int(line) if line.isdigit() else 0)
+
+    raw_findings.sort(key=lambda f: (SEVERITIES.index(f[1]), CATEGORIES.index(f[0]), location_key(f[2]), f[3]))
+    counters: dict[str, int] = {}
+    findings = []
+    for category, severity, location, summary, recommendation in raw_findings:
+        prefix = category[0]
+        counters[prefix] = counters.get(prefix, 0) + 1
+        findings.append(Finding(f"{prefix}{counters[prefix]}", category, severity, location, summary, recommendation))
+
+    unique_tasks = list(dict.fromkeys(t["id"] for t in task_list))
+    requirements = [c for c in coverage if c.kind == "requirement"]
+    covered = sum(1 for c in requirements if c.covered)
+    metrics = {
+        "requirements": len(requirements),
+        "user_stories": len(spec["stories"]),
+        "tasks": len(unique_tasks),
+        "requirement_coverage_pct": round(100 * covered / len(requirements), 1) if requirements else 100.0,
+        "ambiguity_count": sum(1 for f in findings if f.category == "Ambiguity"),
+        "duplication_count": sum(1 for f in findings if f.category == "Duplication"),
+        "critical_issues": sum(1 for f in findings if f.severity == "CRITICAL"),
+    }
+    return AnalysisReport(
+        feature_dir=feature_dir,
+        findings=findings,
+        coverage=coverage,
+        unmapped_tasks=[t for t in unique_tasks if t not in mapped_tasks],
+        metrics=metrics,
+    )
+
+
+def analyze_feature(feature_dir: Path, cache: Optional[ArtifactCache] = None) -> AnalysisReport:
+    """Load (or reuse cached) artifacts from feature_dir and analyze them.
+
+    Raises:
+        FileNotFoundError: If spec.md or tasks.md is missing
+    """
+    feature_dir = Path(feature_dir)
+    for required in ("spec.md", "tasks.md"):
+        if not (feature_dir / required).is_file():
+            raise FileNotFoundError(f"{required} not found in {feature_dir}")
+
+    parsed = cached = 0
+    loaded = {}
+    for kind in ("spec", "plan", "tasks"):
+        path = feature_dir / f"{kind}.md"
+        if not path.is_file():
+            loaded[kind] = None
+            continue
+        loaded[kind], hit = load_artifact(path, kind, cache)
+        cached += hit
+        parsed += not hit
+
+    report = analyze(loaded["spec"], loaded["tasks"], loaded["plan"], feature_dir=str(feature_dir))
+    report.artifacts_parsed, report.artifacts_cached = parsed, cached
+    return report
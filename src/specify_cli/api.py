@@ -0,0 +1,361 @@
+"""
+Async library API for Specify CLI.
+
+Runs the ``specify init`` pipeline (fetch release, download into the template cache,
+render, localize, write, chmod scripts, git init) without console output, prompts or
+process-wide state, and returns a structured result. Any number of projects can be
+initialized concurrently on one event loop, sharing one ``httpx.AsyncClient``:
+
+    async with api.create_client() as client:
+        release = await api.fetch_release(client=client)
+        results = await asyncio.gather(*(
+            api.init_project(path, "claude", client=client, release=release) for path in paths
+        ))
+
+Concurrent initializations that need the same template asset download it once.
+Blocking work (archive rendering, file writes, ``git``) runs in worker threads.
+Long-lived callers can pass a ``RenderCache`` to keep rendered templates in memory.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import ssl
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+import httpx
+import truststore
+
+from specify_cli import git as git_utils
+from specify_cli import packaging, template_assets, template_sources
+from specify_cli.template_assets import CachedTemplate
+from specify_cli.template_sources import RateLimitedError, TemplateSource, TemplateSourceError
+
+# In-flight downloads per event loop, so concurrent inits share one download per asset
+_downloads: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Path, asyncio.Task]]" = weakref.WeakKeyDictionary()
+
+
+class InitError(Exception):
+    """Project initialization failed; ``step`` names the pipeline step that failed."""
+
+    def __init__(self, message: str, step: str):
+        super().__init__(message)
+        self.step = step
+
+
+@dataclass
+class InitResult:
+    """Outcome of init_project."""
+
+    project_path: Path
+    agent: str
+    script_type: str
+    tag: str
+    # "universal", "layered" (base plus overlay) or "variant"
+    template: str
+    # Name of the template source that answered, or None when the cache was used instead
+    source: Optional[str]
+    # Every asset came from the template cache
+    cached: bool
+    files_written: int
+    files_localized: int
+    scripts_updated: int
+    # "initialized", "existing", "failed", "unavailable" (no git) or "skipped"
+    git: str
+    git_error: Optional[str] = None
+    warnings: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        data = dict(self.__dict__)
+        data["project_path"] = str(self.project_path)
+        return data
+
+
+class RenderCache:
+    """Rendered template files kept in memory between init_project calls, least recently
+    used evicted first. Safe to share between threads and concurrent calls."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, dict[str, bytes]] = OrderedDict()
+        self._rendering: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, template: CachedTemplate, agent: str, script_type: str) -> dict[str, bytes]:
+        """template.render(agent, script_type), from memory when already rendered.
+
+        Concurrent calls for the same key wait for one render rather than each rendering.
+        """
+        key = (template.tag, template.universal, template.base, template.overlay, template.variant, agent, script_type)
+        with self._lock:
+            key_lock = self._rendering.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                files = self._entries.get(key)
+                if files is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return files
+                self.misses += 1
+            try:
+                files = template.render(agent, script_type)
+            finally:
+                with self._lock:
+                    self._rendering.pop(key, None)
+            with self._lock:
+                self._entries[key] = files
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return files
+
+
+def create_client(verify: bool = True) -> httpx.AsyncClient:
+    """Async HTTP client using the system trust store (verify=False skips TLS verification)."""
+    return httpx.AsyncClient(verify=truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT) if verify else False)
+
+
+def _resolve(source: Union[TemplateSource, str, None], github_token: Optional[str]) -> TemplateSource:
+    if isinstance(source, TemplateSource):
+        return source
+    return template_sources.resolve_source(source, github_token)
+
+
+async def fetch_release(
+    source: Union[TemplateSource, str, None] = None,
+    *,
+    client: httpx.AsyncClient,
+    github_token: Optional[str] = None,
+) -> dict:
+    """Return the latest release JSON of a template source.
+
+    Args:
+        source: A TemplateSource or source spec (default: SPECIFY_TEMPLATE_SOURCE, the
+            user config, else GitHub)
+        client: HTTP client to use
+        github_token: Token for GitHub API requests (else GH_TOKEN/GITHUB_TOKEN)
+
+    Raises:
+        TemplateSourceError: If the source does not answer (RateLimitedError when the
+            host's GitHub budget is spent)
+        ValueError: If source is not a recognised source spec
+    """
+    return await _resolve(source, github_token).alatest_release(client)
+
+
+async def init_project(
+    project_path: Union[str, Path],
+    agent: str,
+    script_type: str = "sh",
+    *,
+    here: bool = False,
+    locale: str = "en_US",
+    git: bool = True,
+    offline: bool = False,
+    source: Union[TemplateSource, str, None] = None,
+    github_token: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    release: Optional[dict] = None,
+    render_cache: Optional[RenderCache] = None,
+) -> InitResult:
+    """Initialize a Specify project, as ``specify init --ai <agent> --script <script_type>``.
+
+    Args:
+        project_path: Directory to create (or, with here=True, an existing directory
+            to merge the template into, as ``--here --force``)
+        agent: AI assistant key (e.g. "claude")
+        script_type: "sh" or "ps"
+        here: Initialize an existing directory
+        locale: Locale of the command templates (e.g. "zh_CN")
+        git: Initialize a git repository unless the project is already inside one
+        offline: Use the newest cached template instead of contacting a source
+        source: A TemplateSource or source spec (see fetch_release)
+        github_token: Token for GitHub API requests
+        client: HTTP client to share between calls (default: one for this call)
+        release: Release JSON from fetch_release, to skip fetching it again
+        render_cache: Keep the rendered template in memory for later calls
+
+    Returns:
+        InitResult describing what was written
+
+    Raises:
+        ValueError: If the agent, script type or source is invalid
+        InitError: If the project could not be initialized; a directory created by
+            this call is removed again
+    """
+    started = time.monotonic()
+    if agent not in packaging.ALL_AGENTS:
+        raise ValueError(f"Unknown agent '{agent}' (expected one of: {', '.join(packaging.ALL_AGENTS)})")
+    if script_type not in packaging.ALL_SCRIPTS:
+        raise ValueError(f"Unknown script type '{script_type}' (expected one of: {', '.join(packaging.ALL_SCRIPTS)})")
+    project_path = Path(os.path.abspath(project_path))
+    template_source = _resolve(source, github_token)
+    if here and not project_path.is_dir():
+        raise InitError(f"{project_path} is not a directory", "precheck")
+    if not here and project_path.exists():
+        raise InitError(f"{project_path} already exists", "precheck")
+
+    owns_client = client is None
+    if owns_client:
+        client = create_client()
+    created = False
+    step = "fetch"
+    warnings: list[str] = []
+    try:
+        template, answered_by, cached = await _template_for(
+            agent, script_type, offline, template_source, client, release, warnings
+        )
+
+        step = "extract"
+        if not here:
+            await asyncio.to_thread(project_path.mkdir, parents=True)
+            created = True
+        render = render_cache.render if render_cache is not None else CachedTemplate.render
+        files = await asyncio.to_thread(render, template, agent, script_type)
+        overlay = None
+        if locale != "en_US":
+            overlay = await asyncio.to_thread(template_assets.build_localized_overlay, locale, agent, script_type, files)
+            if not overlay:
+                warnings.append(f"no {locale} templates")
+        written, localized = await asyncio.to_thread(_write_files, files, project_path, here, overlay)
+
+        step = "chmod"
+        updated, failures = await asyncio.to_thread(template_assets.make_scripts_executable, project_path)
+        warnings.extend(f"chmod {failure}" for failure in failures)
+
+        step = "git"
+        git_status, git_error = "skipped", None
+        if git:
+            git_status, git_error = await asyncio.to_thread(_init_git, project_path)
+    except BaseException as e:
+        if created:
+            await asyncio.to_thread(shutil.rmtree, project_path, ignore_errors=True)
+        if isinstance(e, InitError) or not isinstance(e, Exception):
+            raise
+        raise InitError(f"{step} failed: {e}", step) from e
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    return InitResult(
+        project_path=project_path,
+        agent=agent,
+        script_type=script_type,
+        tag=template.tag,
+        template=_kind(template),
+        source=answered_by,
+        cached=cached,
+        files_written=written,
+        files_localized=localized,
+        scripts_updated=updated,
+        git=git_status,
+        git_error=git_error,
+        warnings=warnings,
+        seconds=time.monotonic() - started,
+    )
+
+
+async def _template_for(
+    agent: str,
+    script_type: str,
+    offline: bool,
+    source: TemplateSource,
+    client: httpx.AsyncClient,
+    release: Optional[dict],
+    warnings: list[str],
+) -> tuple[CachedTemplate, Optional[str], bool]:
+    """The cached template to render, the name of the source that answered and whether it was all cached."""
+    if offline:
+        template = await asyncio.to_thread(template_assets.latest_cached_template, agent, script_type)
+        if template is None:
+            raise InitError(f"No cached template in {template_assets.templates_dir()}", "fetch")
+        return template, None, True
+
+    if release is None:
+        try:
+            release = await source.alatest_release(client)
+        except RateLimitedError as e:
+            # With the host's GitHub budget spent, a cached template beats failing
+            template = await asyncio.to_thread(template_assets.latest_cached_template, agent, script_type)
+            if template is None:
+                raise InitError(str(e), "fetch") from e
+            warnings.append(f"rate limited until {datetime.fromtimestamp(e.reset):%H:%M}, used cached {template.tag}")
+            return template, None, True
+        except (TemplateSourceError, httpx.HTTPError) as e:
+            raise InitError(str(e), "fetch") from e
+    answered_by = getattr(source, "answered_by", None) or source
+
+    tag = release.get("tag_name", "")
+    assets = template_assets.select_template_assets(release, agent, script_type)
+    if assets is None:
+        raise InitError(f"Release {tag} has no template for {agent}/{script_type}", "download")
+    try:
+        downloads = await asyncio.gather(*(_download(asset, tag, source, client) for asset in assets.values()))
+    except (TemplateSourceError, httpx.HTTPError, OSError) as e:
+        raise InitError(str(e), "download") from e
+    paths = {kind: path for kind, (path, _) in zip(assets, downloads)}
+    return CachedTemplate(tag, **paths), answered_by.name, all(was_cached for _, was_cached in downloads)
+
+
+async def _download(asset: dict, tag: str, source: TemplateSource, client: httpx.AsyncClient) -> tuple[Path, bool]:
+    """adownload_asset, joining a download of the same asset already running on this loop."""
+    inflight = _downloads.setdefault(asyncio.get_running_loop(), {})
+    path = template_assets.cached_asset_path(tag, asset["name"])
+    task = inflight.get(path)
+    joined = task is not None
+    if not joined:
+        task = asyncio.ensure_future(template_assets.adownload_asset(asset, tag, client, source))
+        inflight[path] = task
+        task.add_done_callback(lambda _: inflight.pop(path, None))
+    # Cancelling one caller must not cancel the download the others are waiting for
+    path, was_cached = await asyncio.shield(task)
+    return path, was_cached or joined
+
+
+def _kind(template: CachedTemplate) -> str:
+    if template.universal is not None:
+        return "universal"
+    return "variant" if template.variant is not None else "layered"
+
+
+def _write_files(files: dict[str, bytes], project_path: Path, here: bool, overlay: Optional[dict[str, bytes]]) -> tuple[int, int]:
+    """Write the rendered files; with here=True an existing .vscode/settings.json is merged."""
+    files = dict(files)
+    settings = files.pop(".vscode/settings.json", None)
+    written, localized = template_assets.write_project_files(files, project_path, overlay)
+    if settings is not None:
+        dest = project_path / ".vscode" / "settings.json"
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if here and dest.is_file():
+            try:
+                existing = json.loads(dest.read_text(encoding="utf-8"))
+            except ValueError:
+                existing = {}
+            merged = template_assets.merge_json(existing, json.loads(settings)) if isinstance(existing, dict) else json.loads(settings)
+            dest.write_text(json.dumps(merged, indent=4) + "\n", encoding="utf-8")
+        else:
+            dest.write_bytes(settings)
+        written += 1
+    return written, localized
+
+
+def _init_git(project_path: Path) -> tuple[str, Optional[str]]:
+    if git_utils.is_git_repo(project_path):
+        return "existing", None
+    if shutil.which("git") is None:
+        return "unavailable", None
+    ok, error = git_utils.init_repo(project_path)
+    return ("initialized", None) if ok else ("failed", error)
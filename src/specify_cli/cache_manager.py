@@ -0,0 +1,310 @@
+"""
+Template cache management for Specify CLI.
+
+Keeps the template cache (``templates/`` under the cache directory) bounded on
+long-lived build hosts:
+
+- Every use of a cached asset sets its access time explicitly (``touch``), so least
+  recently used entries are known even on ``noatime`` mounts.
+- ``prune`` removes entries unused for longer than the age limit, then the least
+  recently used entries until the cache fits the size limit. It runs under a lock in
+  the cache directory, skips in-progress downloads and spares entries used in the
+  last few minutes, so concurrent ``specify`` processes can share one cache.
+- Cache hits, misses and the bytes they saved or cost are counted in ``cache-stats.json``.
+
+Limits come from ``SPECIFY_CACHE_MAX_SIZE`` (bytes, or with a K/M/G suffix) and
+``SPECIFY_CACHE_MAX_AGE`` (days), else ``cache_max_size``/``cache_max_age`` in the user
+config file, else 1G and 90 days. ``specify init`` prunes after a download that takes
+the cache over its size limit; ``specify cache prune`` does so on demand.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from platformdirs import user_cache_dir
+
+from specify_cli.locking import FileLock
+from specify_cli.template_sources import config_path
+
+CACHE_DIR_ENV_VAR = "SPECIFY_CACHE_DIR"
+MAX_SIZE_ENV_VAR = "SPECIFY_CACHE_MAX_SIZE"
+MAX_AGE_ENV_VAR = "SPECIFY_CACHE_MAX_AGE"
+DEFAULT_MAX_SIZE = 1024 ** 3
+DEFAULT_MAX_AGE_DAYS = 90.0
+STATS_NAME = "cache-stats.json"
+LOCK_NAME = "cache.lock"
+# Entries used this recently are never evicted: another process may be reading them
+GRACE_SECONDS = 300
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def cache_dir() -> Path:
+    """Root of the template cache (SPECIFY_CACHE_DIR, else the platform user cache directory)."""
+    override = os.getenv(CACHE_DIR_ENV_VAR)
+    return Path(override) if override else Path(user_cache_dir("specify-cli"))
+
+
+def templates_dir() -> Path:
+    return cache_dir() / "templates"
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as ``500M``, ``2G`` or ``1048576`` into bytes.
+
+    Raises:
+        ValueError: If value is not a size
+    """
+    match = _SIZE_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid size '{value}' (expected bytes or a number with K, M, G or T)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size: float) -> str:
+    """Human-readable size (binary units)."""
+    if size < 1024:
+        return f"{int(size):,} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}"
+
+
+@dataclass
+class CacheLimits:
+    """Size (bytes) and age (days) limits of the template cache; 0 disables a limit."""
+
+    max_size: int = DEFAULT_MAX_SIZE
+    max_age_days: float = DEFAULT_MAX_AGE_DAYS
+
+
+def configured_limits() -> CacheLimits:
+    """Limits in effect: environment, then config file, then defaults.
+
+    Raises:
+        ValueError: If a configured limit is invalid
+    """
+    try:
+        config = json.loads(config_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+    size = os.getenv(MAX_SIZE_ENV_VAR) or config.get("cache_max_size")
+    age = os.getenv(MAX_AGE_ENV_VAR) or config.get("cache_max_age")
+    limits = CacheLimits()
+    if size not in (None, ""):
+        limits.max_size = parse_size(size)
+    if age not in (None, ""):
+        try:
+            limits.max_age_days = float(age)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid cache age '{age}' (expected a number of days)") from None
+    return limits
+
+
+@dataclass
+class CacheEntry:
+    """One cached release asset."""
+
+    path: Path
+    tag: str
+    size: int
+    last_access: float
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+def list_entries() -> list[CacheEntry]:
+    """Cached assets, least recently used first. In-progress downloads are not listed."""
+    entries = []
+    try:
+        tag_dirs = [entry for entry in os.scandir(templates_dir()) if entry.is_dir()]
+    except OSError:
+        return []
+    for tag_dir in tag_dirs:
+        try:
+            files = list(os.scandir(tag_dir.path))
+        except OSError:
+            continue
+        for entry in files:
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append(CacheEntry(Path(entry.path), tag_dir.name, st.st_size, max(st.st_atime, st.st_mtime)))
+    return sorted(entries, key=lambda e: (e.last_access, str(e.path)))
+
+
+def touch(path: Path) -> None:
+    """Mark a cached asset as used now (for LRU eviction)."""
+    try:
+        st = os.stat(path)
+        os.utime(path, (time.time(), st.st_mtime))
+    except OSError:
+        pass
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters since the last reset."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    bytes_downloaded: int = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+
+def _stats_path() -> Path:
+    return cache_dir() / STATS_NAME
+
+
+def read_stats() -> CacheStats:
+    try:
+        data = json.loads(_stats_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return CacheStats()
+    if not isinstance(data, dict):
+        return CacheStats()
+    return CacheStats(**{key: int(data.get(key, 0)) for key in ("hits", "misses", "bytes_saved", "bytes_downloaded")})
+
+
+def _write_stats(stats: CacheStats) -> None:
+    path = _stats_path()
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(stats.__dict__, f, indent=2)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _count(hits: int = 0, misses: int = 0, bytes_saved: int = 0, bytes_downloaded: int = 0) -> None:
+    # Counters are advisory: a busy or unwritable cache directory only loses the update
+    try:
+        cache_dir().mkdir(parents=True, exist_ok=True)
+        with FileLock(cache_dir() / (STATS_NAME + ".lock"), timeout=5.0):
+            stats = read_stats()
+            stats.hits += hits
+            stats.misses += misses
+            stats.bytes_saved += bytes_saved
+            stats.bytes_downloaded += bytes_downloaded
+            _write_stats(stats)
+    except (OSError, TimeoutError):
+        pass
+
+
+def record_hit(path: Path) -> None:
+    """Count a use of a cached asset (and mark it used)."""
+    touch(path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    _count(hits=1, bytes_saved=size)
+
+
+def record_miss(path: Path) -> None:
+    """Count an asset that had to be downloaded into the cache."""
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    _count(misses=1, bytes_downloaded=size)
+
+
+def reset_stats() -> None:
+    cache_dir().mkdir(parents=True, exist_ok=True)
+    with FileLock(cache_dir() / (STATS_NAME + ".lock"), timeout=5.0):
+        _write_stats(CacheStats())
+
+
+def _remove(entries: list[CacheEntry]) -> list[CacheEntry]:
+    removed = []
+    for entry in entries:
+        try:
+            entry.path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError:  # e.g. open in another process on Windows
+            continue
+        # Tag directories are left in place: a download may be about to create a file there
+        removed.append(entry)
+    return removed
+
+
+def select_evictions(entries: list[CacheEntry], limits: CacheLimits, now: float, grace: float = GRACE_SECONDS) -> list[CacheEntry]:
+    """Entries prune would remove: expired ones, then least recently used until under max_size.
+
+    entries must be ordered least recently used first (as list_entries returns them).
+    """
+    evict = []
+    total = sum(entry.size for entry in entries)
+    for entry in entries:
+        idle = now - entry.last_access
+        if idle < grace:
+            break
+        expired = limits.max_age_days > 0 and idle > limits.max_age_days * 86400
+        oversize = limits.max_size > 0 and total > limits.max_size
+        if not (expired or oversize):
+            continue
+        evict.append(entry)
+        total -= entry.size
+    return evict
+
+
+def prune(limits: Optional[CacheLimits] = None, *, dry_run: bool = False, lock_timeout: Optional[float] = 30.0) -> list[CacheEntry]:
+    """Remove expired and least recently used entries until the cache is within limits.
+
+    Args:
+        limits: Limits to enforce (default: configured_limits())
+        dry_run: Only report what would be removed
+        lock_timeout: Seconds to wait for another process's prune (0: give up at once)
+
+    Returns:
+        The entries removed (or that would be)
+
+    Raises:
+        TimeoutError: If the cache lock is not acquired within lock_timeout
+        ValueError: If the configured limits are invalid
+    """
+    limits = limits or configured_limits()
+    with FileLock(cache_dir() / LOCK_NAME, timeout=lock_timeout):
+        evict = select_evictions(list_entries(), limits, time.time())
+        return evict if dry_run else _remove(evict)
+
+
+def maybe_prune() -> list[CacheEntry]:
+    """Prune if the cache is over its size limit, unless another process is already pruning."""
+    try:
+        limits = configured_limits()
+        if not limits.max_size or sum(entry.size for entry in list_entries()) <= limits.max_size:
+            return []
+        return prune(limits, lock_timeout=0)
+    except (OSError, TimeoutError, ValueError):
+        return []
+
+
+def clear() -> list[CacheEntry]:
+    """Remove every cached asset (in-progress downloads are left alone)."""
+    with FileLock(cache_dir() / LOCK_NAME, timeout=30.0):
+        return _remove(list_entries())
@@ -0,0 +1,389 @@
+"""
+Persistent feature index for Specify CLI.
+
+Keeps ``.specify/index.db`` (SQLite) in sync with ``specs/``: one row per feature
+directory and one per artifact (spec.md, plan.md, tasks.md, research.md, data-model.md,
+quickstart.md, checklists/*, contracts/*) with size, mtime and SHA-256. Refreshing is a
+stat diff: directory listings are only re-read when a directory's mtime changed, and
+files are only re-hashed when their size or mtime changed.
+
+Usage:
+    with FeatureIndex(repo_root) as index:
+        index.refresh()
+        planned = index.query(status="Draft", has=["plan"])
+"""
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from specify_cli.feature_paths import FEATURE_NUMBER_PATTERN
+from specify_cli.hashing import file_sha256
+
+INDEX_RELATIVE_PATH = Path(".specify") / "index.db"
+SCHEMA_VERSION = 2
+
+# Artifact kind -> file name inside the feature directory
+ARTIFACT_FILES = {
+    "spec": "spec.md",
+    "plan": "plan.md",
+    "tasks": "tasks.md",
+    "research": "research.md",
+    "data-model": "data-model.md",
+    "quickstart": "quickstart.md",
+}
+# Artifact kind -> subdirectory whose files are all artifacts of that kind
+ARTIFACT_DIRS = {
+    "checklists": "checklists",
+    "contracts": "contracts",
+}
+ARTIFACT_KINDS = (*ARTIFACT_FILES, *ARTIFACT_DIRS)
+
+_STATUS_PATTERN = re.compile(r"^\*\*Status\*\*:\s*(.+?)\s*$", re.MULTILINE)
+_TITLE_PATTERN = re.compile(r"^#\s+(?:Feature Specification:\s*)?(.+?)\s*$", re.MULTILINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS features (
+    name TEXT PRIMARY KEY,
+    number INTEGER,
+    dir_mtime_ns INTEGER,
+    status TEXT,
+    title TEXT
+);
+CREATE INDEX IF NOT EXISTS features_number ON features(number);
+CREATE TABLE IF NOT EXISTS artifacts (
+    feature TEXT NOT NULL REFERENCES features(name) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (feature, path)
+);
+CREATE INDEX IF NOT EXISTS artifacts_kind ON artifacts(kind);
+CREATE TABLE IF NOT EXISTS artifact_dirs (
+    feature TEXT NOT NULL REFERENCES features(name) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER,
+    PRIMARY KEY (feature, path)
+);
+"""
+
+
+@dataclass
+class FeatureRecord:
+    """A feature directory as stored in the index."""
+
+    name: str
+    number: Optional[int]
+    status: Optional[str]
+    title: Optional[str]
+    artifacts: dict[str, list[str]] = field(default_factory=dict)  # kind -> relative paths
+
+    def has(self, kind: str) -> bool:
+        return bool(self.artifacts.get(kind))
+
+
+@dataclass
+class RefreshStats:
+    """What a refresh changed."""
+
+    features_added: int = 0
+    features_removed: int = 0
+    artifacts_changed: int = 0
+    artifacts_removed: int = 0
+    files_hashed: int = 0
+
+
+def parse_spec_metadata(text: str) -> tuple[Optional[str], Optional[str]]:
+    """Return (status, title) from spec.md's ``**Status**:`` line and first heading."""
+    status = _STATUS_PATTERN.search(text)
+    title = _TITLE_PATTERN.search(text)
+    return (status.group(1) if status else None, title.group(1) if title else None)
+
+
+def normalize_kind(kind: str) -> str:
+    """Accept singular and file-name spellings ("checklist", "plan.md") for artifact kinds.
+
+    Raises ValueError for unknown kinds.
+    """
+    value = kind.strip().lower()
+    if value.endswith(".md"):
+        value = value[:-3]
+    if value in ARTIFACT_KINDS:
+        return value
+    if f"{value}s" in ARTIFACT_DIRS:
+        return f"{value}s"
+    raise ValueError(f"Unknown artifact '{kind}' (expected one of: {', '.join(ARTIFACT_KINDS)})")
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def ensure_gitignore(specify_dir: Path) -> None:
+    """Keep the index database out of version control."""
+    gitignore = specify_dir / ".gitignore"
+    entry = f"{INDEX_RELATIVE_PATH.name}*"
+    try:
+        lines = gitignore.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+    except OSError:
+        return
+    if entry not in lines:
+        with open(gitignore, "a", encoding="utf-8") as f:
+            if lines and lines[-1]:
+                f.write("\n")
+            f.write(entry + "\n")
+
+
+class FeatureIndex:
+    """SQLite-backed index of ``specs/`` for one repository."""
+
+    def __init__(self, repo_root: Path, db_path: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        self.specs_dir = self.repo_root / "specs"
+        self.db_path = Path(db_path) if db_path else self.repo_root / INDEX_RELATIVE_PATH
+        is_new = not self.db_path.exists()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if is_new and db_path is None:
+            ensure_gitignore(self.db_path.parent)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        row = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.OperationalError:
+            pass
+        if row is not None and row[0] != str(SCHEMA_VERSION):
+            # Derived data only: drop and rebuild on schema changes
+            with self.conn:
+                for table in ("artifacts", "artifact_dirs", "features", "meta"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "FeatureIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+
+    # -- refresh ---------------------------------------------------------------
+
+    def _list_feature_dirs(self) -> dict[str, int]:
+        """Return {feature name: directory mtime_ns} for every directory in specs/."""
+        try:
+            entries = list(os.scandir(self.specs_dir))
+        except OSError:
+            return {}
+        result = {}
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith("."):
+                result[entry.name] = entry.stat().st_mtime_ns
+        return result
+
+    def _sync_feature_list(self, stats: RefreshStats) -> tuple[dict[str, int], dict[str, Optional[int]]]:
+        """Add and remove feature rows to match specs/; return (current dirs, stored dir mtimes)."""
+        stored = dict(self.conn.execute("SELECT name, dir_mtime_ns FROM features"))
+        current = self._list_feature_dirs()
+        removed = [name for name in stored if name not in current]
+        if removed:
+            self.conn.executemany("DELETE FROM features WHERE name = ?", [(n,) for n in removed])
+            stats.features_removed += len(removed)
+        for name in current:
+            if name not in stored:
+                match = FEATURE_NUMBER_PATTERN.match(name)
+                self.conn.execute(
+                    "INSERT INTO features(name, number, dir_mtime_ns) VALUES (?, ?, NULL)",
+                    (name, int(match.group(1)) if match else None),
+                )
+                stored[name] = None
+                stats.features_added += 1
+        self._set_meta("specs_mtime_ns", str(_mtime_ns(self.specs_dir)))
+        return current, stored
+
+    def _candidate_paths(self, feature: str, feature_dir: Path, dir_changed: bool, known: dict[str, tuple]) -> dict[str, str]:
+        """Return {relative path: kind} of artifacts that may exist in the feature."""
+        candidates = {name: kind for kind, name in ARTIFACT_FILES.items()}
+        stored_dirs = dict(self.conn.execute(
+            "SELECT path, mtime_ns FROM artifact_dirs WHERE feature = ?", (feature,)
+        ))
+        for kind, subdir in ARTIFACT_DIRS.items():
+            directory = feature_dir / subdir
+            mtime = _mtime_ns(directory)
+            if mtime is not None and (dir_changed or stored_dirs.get(subdir) != mtime):
+                try:
+                    names = [e.name for e in os.scandir(directory) if e.is_file() and not e.name.startswith(".")]
+                except OSError:
+                    names = []
+                candidates.update({f"{subdir}/{name}": kind for name in names})
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO artifact_dirs(feature, path, mtime_ns) VALUES (?, ?, ?)",
+                    (feature, subdir, mtime),
+                )
+            elif mtime is not None:
+                candidates.update({path: k for path, (k, *_rest) in known.items() if path.startswith(f"{subdir}/")})
+            elif subdir in stored_dirs:
+                self.conn.execute("DELETE FROM artifact_dirs WHERE feature = ? AND path = ?", (feature, subdir))
+        return candidates
+
+    def _refresh_feature(self, feature: str, dir_mtime: int, dir_changed: bool, stats: RefreshStats) -> None:
+        feature_dir = self.specs_dir / feature
+        known = {
+            row[0]: row[1:]
+            for row in self.conn.execute(
+                "SELECT path, kind, size, mtime_ns, sha256 FROM artifacts WHERE feature = ?", (feature,)
+            )
+        }
+        candidates = self._candidate_paths(feature, feature_dir, dir_changed, known)
+
+        for path, kind in candidates.items():
+            full = feature_dir / path
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            previous = known.pop(path, None)
+            if previous is not None and previous[1] == st.st_size and previous[2] == st.st_mtime_ns:
+                continue
+            try:
+                digest = file_sha256(full)
+            except OSError:
+                continue
+            stats.files_hashed += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO artifacts(feature, path, kind, size, mtime_ns, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+                (feature, path, kind, st.st_size, st.st_mtime_ns, digest),
+            )
+            if previous is None or previous[3] != digest:
+                stats.artifacts_changed += 1
+                if path == ARTIFACT_FILES["spec"]:
+                    self._update_spec_metadata(feature, full)
+
+        # Anything left in known no longer exists
+        for path in known:
+            self.conn.execute("DELETE FROM artifacts WHERE feature = ? AND path = ?", (feature, path))
+            stats.artifacts_removed += 1
+            if path == ARTIFACT_FILES["spec"]:
+                self.conn.execute("UPDATE features SET status = NULL, title = NULL WHERE name = ?", (feature,))
+        self.conn.execute("UPDATE features SET dir_mtime_ns = ? WHERE name = ?", (dir_mtime, feature))
+
+    def _update_spec_metadata(self, feature: str, spec_path: Path) -> None:
+        try:
+            text = spec_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return
+        status, title = parse_spec_metadata(text)
+        self.conn.execute("UPDATE features SET status = ?, title = ? WHERE name = ?", (status, title, feature))
+
+    def refresh(self) -> RefreshStats:
+        """Bring the index up to date with specs/ by stat-diffing every feature.
+
+        Returns:
+            RefreshStats describing what changed
+        """
+        stats = RefreshStats()
+        with self.conn:
+            current, stored = self._sync_feature_list(stats)
+            for feature, dir_mtime in current.items():
+                self._refresh_feature(feature, dir_mtime, stored.get(feature) != dir_mtime, stats)
+        return stats
+
+    def rebuild(self) -> RefreshStats:
+        """Drop all indexed data and re-index specs/ from scratch."""
+        with self.conn:
+            self.conn.execute("DELETE FROM features")
+        return self.refresh()
+
+    # -- queries ---------------------------------------------------------------
+
+    def latest_feature(self) -> Optional[str]:
+        """Return the feature directory with the highest number.
+
+        Only re-lists specs/ when its mtime changed since the last refresh, so this is
+        cheap enough to call on every command.
+        """
+        if self._get_meta("specs_mtime_ns") != str(_mtime_ns(self.specs_dir)):
+            with self.conn:
+                self._sync_feature_list(RefreshStats())
+        row = self.conn.execute(
+            "SELECT name FROM features WHERE number IS NOT NULL ORDER BY number DESC, name LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def query(
+        self,
+        number: Optional[int] = None,
+        status: Optional[str] = None,
+        has: Iterable[str] = (),
+        missing: Iterable[str] = (),
+    ) -> list[FeatureRecord]:
+        """Return indexed features matching every given filter, ordered by number.
+
+        Args:
+            number: Feature number (e.g. 4 for ``004-*``)
+            status: Spec status, case-insensitive (e.g. "Draft")
+            has: Artifact kinds that must be present
+            missing: Artifact kinds that must be absent
+
+        Raises:
+            ValueError: If an artifact kind is unknown
+        """
+        clauses, params = [], []
+        if number is not None:
+            clauses.append("f.number = ?")
+            params.append(number)
+        if status is not None:
+            clauses.append("LOWER(f.status) = LOWER(?)")
+            params.append(status)
+        for kind in has:
+            clauses.append("EXISTS (SELECT 1 FROM artifacts a WHERE a.feature = f.name AND a.kind = ?)")
+            params.append(normalize_kind(kind))
+        for kind in missing:
+            clauses.append("NOT EXISTS (SELECT 1 FROM artifacts a WHERE a.feature = f.name AND a.kind = ?)")
+            params.append(normalize_kind(kind))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT f.name, f.number, f.status, f.title FROM features f {where} "
+            "ORDER BY f.number IS NULL, f.number, f.name",
+            params,
+        ).fetchall()
+
+        records = {name: FeatureRecord(name, num, st, title) for name, num, st, title in rows}
+        if records:
+            for feature, kind, path in self.conn.execute(
+                f"SELECT a.feature, a.kind, a.path FROM artifacts a JOIN features f ON f.name = a.feature {where} "
+                "ORDER BY a.path",
+                params,
+            ):
+                records[feature].artifacts.setdefault(kind, []).append(path)
+        return list(records.values())
@@ -0,0 +1,150 @@
+"""
+Feature path resolution for Specify CLI.
+
+Python equivalent of ``get_feature_paths`` in ``scripts/bash/common.sh``: resolves the
+repository root, current feature branch and the per-feature artifact paths without
+spawning ``git``.
+"""
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from specify_cli import git as git_utils
+
+# Feature branches and spec directories are named NNN-*: numbers are zero-padded to
+# 3 digits and grow past 999. Numbering reads any numeric prefix.
+FEATURE_DIR_PATTERN = re.compile(r"^(\d{3,})-")
+FEATURE_NUMBER_PATTERN = re.compile(r"^(\d+)-")
+
+
+@dataclass(frozen=True)
+class FeaturePaths:
+    """Paths for the current feature, mirroring the variables exported by common.sh."""
+
+    repo_root: Path
+    current_branch: str
+    has_git: bool
+    feature_dir: Path
+
+    @property
+    def feature_spec(self) -> Path:
+        return self.feature_dir / "spec.md"
+
+    @property
+    def impl_plan(self) -> Path:
+        return self.feature_dir / "plan.md"
+
+    @property
+    def tasks(self) -> Path:
+        return self.feature_dir / "tasks.md"
+
+    @property
+    def research(self) -> Path:
+        return self.feature_dir / "research.md"
+
+    @property
+    def data_model(self) -> Path:
+        return self.feature_dir / "data-model.md"
+
+    @property
+    def quickstart(self) -> Path:
+        return self.feature_dir / "quickstart.md"
+
+    @property
+    def contracts_dir(self) -> Path:
+        return self.feature_dir / "contracts"
+
+
+def get_repo_root(start: Optional[Path] = None) -> Path:
+    """Return the git work tree root, else the nearest directory containing ``.specify``, else start."""
+    start = Path(os.path.abspath(start or Path.cwd()))
+    root = git_utils.find_repo_root(start)
+    if root is not None:
+        return root
+    for candidate in (start, *start.parents):
+        if (candidate / ".specify").is_dir():
+            return candidate
+    return start
+
+
+def latest_feature_dir(specs_dir: Path) -> Optional[str]:
+    """Return the name of the ``specs/<number>-*`` directory with the highest number, if any."""
+    latest, highest = None, 0
+    try:
+        entries = list(os.scandir(specs_dir))
+    except OSError:
+        return None
+    for entry in entries:
+        match = FEATURE_NUMBER_PATTERN.match(entry.name)
+        if match and entry.is_dir():
+            number = int(match.group(1))
+            if number > highest:
+                highest, latest = number, entry.name
+    return latest
+
+
+def get_current_branch(repo_root: Path) -> str:
+    """Resolve the current feature: SPECIFY_FEATURE, then git HEAD, then latest specs dir, then "main"."""
+    feature = os.getenv("SPECIFY_FEATURE")
+    if feature:
+        return feature
+    git_dir = git_utils.find_git_dir(repo_root)
+    if git_dir is not None:
+        branch = git_utils.read_head_branch(git_dir)
+        if branch:
+            return branch
+    return _latest_indexed_feature(repo_root) or latest_feature_dir(repo_root / "specs") or "main"
+
+
+def _latest_indexed_feature(repo_root: Path) -> Optional[str]:
+    """Use .specify/index.db (if it exists) instead of scanning specs/ for the latest feature."""
+    from specify_cli.feature_index import INDEX_RELATIVE_PATH, FeatureIndex
+
+    if not (repo_root / INDEX_RELATIVE_PATH).is_file():
+        return None
+    try:
+        with FeatureIndex(repo_root) as index:
+            return index.latest_feature()
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def find_feature_dir_by_prefix(repo_root: Path, branch: str) -> Path:
+    """Find ``specs/<NNN>-*`` for the branch's numeric prefix, falling back to ``specs/<branch>``.
+
+    Allows several branches to work on the same spec (e.g. 004-fix-bug and 004-add-feature).
+    Raises ValueError if more than one spec directory shares the prefix.
+    """
+    specs_dir = repo_root / "specs"
+    match = FEATURE_DIR_PATTERN.match(branch)
+    if not match:
+        return specs_dir / branch
+    prefix = f"{match.group(1)}-"
+    try:
+        matches = sorted(e.name for e in os.scandir(specs_dir) if e.name.startswith(prefix) and e.is_dir())
+    except OSError:
+        matches = []
+    if len(matches) == 1:
+        return specs_dir / matches[0]
+    if len(matches) > 1:
+        raise ValueError(
+            f"Multiple spec directories found with prefix '{match.group(1)}': {' '.join(matches)}. "
+            "Please ensure only one spec directory exists per numeric prefix."
+        )
+    return specs_dir / branch
+
+
+def get_feature_paths(start: Optional[Path] = None) -> FeaturePaths:
+    """Resolve all feature paths for the repository containing start (defaults to cwd)."""
+    repo_root = get_repo_root(start)
+    branch = get_current_branch(repo_root)
+    return FeaturePaths(
+        repo_root=repo_root,
+        current_branch=branch,
+        has_git=git_utils.find_git_dir(repo_root) is not None,
+        feature_dir=find_feature_dir_by_prefix(repo_root, branch),
+    )
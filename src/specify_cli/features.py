@@ -0,0 +1,303 @@
+"""
+Feature creation for Specify CLI.
+
+Python equivalent of ``create-new-feature.sh`` behind ``specify feature new``. The next
+feature number is derived from branch refs read directly from disk (packed-refs plus
+loose refs, no ``git branch -a`` pipeline) and the ``specs/`` directory. The highest
+branch number is cached in the git directory and invalidated when refs change, remote
+fetches are throttled, and numbers are reserved under a lock so concurrent
+``specify feature new`` runs never allocate the same number.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from specify_cli import git as git_utils
+from specify_cli.feature_paths import FEATURE_NUMBER_PATTERN
+from specify_cli.locking import FileLock
+
+# GitHub enforces a 244-byte limit on branch names
+MAX_BRANCH_LENGTH = 244
+
+FETCH_INTERVAL_ENV_VAR = "SPECIFY_FETCH_INTERVAL"
+DEFAULT_FETCH_INTERVAL = 600  # seconds
+
+REF_CACHE_NAME = "specify-feature-numbers.json"
+LOCK_NAME = "specify-feature.lock"
+_REF_CACHE_VERSION = 2
+_REF_NAMESPACES = ("refs/heads", "refs/remotes")
+
+_STOP_WORDS = frozenset(
+    "i a an the to for of in on at by with from is are was were be been being have has had "
+    "do does did will would should could can may might must shall this that these those "
+    "my your our their want need add get set".split()
+)
+
+
+@dataclass
+class NewFeature:
+    """A created feature: its branch, number and spec file."""
+
+    branch_name: str
+    feature_num: str
+    feature_dir: Path
+    spec_file: Path
+    has_git: bool
+
+    def to_json(self) -> dict:
+        """Same keys as ``create-new-feature.sh --json``."""
+        return {"BRANCH_NAME": self.branch_name, "SPEC_FILE": str(self.spec_file), "FEATURE_NUM": self.feature_num}
+
+
+def clean_branch_name(name: str) -> str:
+    """Lowercase, replace non-alphanumerics with single hyphens and trim hyphens."""
+    return re.sub(r"-+", "-", re.sub(r"[^a-z0-9]", "-", name.lower())).strip("-")
+
+
+def generate_branch_suffix(description: str) -> str:
+    """Build a short branch suffix from a description, skipping stop words.
+
+    Keeps the first three meaningful words (four if there are exactly four); words
+    shorter than three characters are kept only if they appear uppercased in the
+    description (acronyms).
+    """
+    words = [w for w in re.sub(r"[^a-z0-9]", " ", description.lower()).split() if w not in _STOP_WORDS]
+    meaningful = [w for w in words if len(w) >= 3 or re.search(rf"\b{re.escape(w.upper())}\b", description)]
+    if meaningful:
+        max_words = 4 if len(meaningful) == 4 else 3
+        return "-".join(meaningful[:max_words])
+    return "-".join([part for part in clean_branch_name(description).split("-") if part][:3])
+
+
+def truncate_branch_name(branch_name: str) -> str:
+    """Truncate a branch name to MAX_BRANCH_LENGTH bytes, dropping a trailing hyphen."""
+    if len(branch_name.encode("utf-8")) <= MAX_BRANCH_LENGTH:
+        return branch_name
+    return branch_name.encode("utf-8")[:MAX_BRANCH_LENGTH].decode("utf-8", "ignore").rstrip("-")
+
+
+def _number_of(name: str) -> int:
+    match = FEATURE_NUMBER_PATTERN.match(name)
+    return int(match.group(1)) if match else 0
+
+
+def highest_spec_number(specs_dir: Path) -> int:
+    """Return the highest numeric prefix (``NNN-``, or longer past 999) among directories in specs/ (0 if none)."""
+    try:
+        entries = list(os.scandir(specs_dir))
+    except OSError:
+        return 0
+    return max((_number_of(e.name) for e in entries if e.is_dir()), default=0)
+
+
+def _scan_branch_numbers(git_dir: Path) -> tuple[int, list[str]]:
+    """Return (highest branch number, ref directories scanned) from packed and loose refs."""
+    base = git_utils.common_dir(git_dir)
+    highest = 0
+    for ref in git_utils.read_packed_refs(git_dir):
+        name = git_utils.branch_short_name(ref)
+        if name:
+            highest = max(highest, _number_of(name))
+
+    directories = set()
+    for namespace in _REF_NAMESPACES:
+        if (base / namespace).is_dir():
+            directories.add(namespace)
+        for ref, directory in git_utils.iter_loose_refs(git_dir, namespace):
+            directories.add(directory.relative_to(base).as_posix())
+            name = git_utils.branch_short_name(ref)
+            if name:
+                highest = max(highest, _number_of(name))
+    return highest, sorted(directories)
+
+
+def _ref_signature(base: Path, directories: list[str]) -> list:
+    """Modification times of packed-refs and every known ref directory.
+
+    Creating or deleting a loose ref (or a subdirectory of refs) changes the mtime of
+    its parent directory, and packing refs rewrites packed-refs.
+    """
+    signature = []
+    for relative in ["packed-refs", *directories]:
+        try:
+            signature.append([relative, os.stat(base / relative).st_mtime_ns])
+        except OSError:
+            signature.append([relative, None])
+    return signature
+
+
+def highest_branch_number(git_dir: Path, use_cache: bool = True) -> int:
+    """Return the highest numeric prefix among local and remote-tracking branches.
+
+    The result is cached in the git directory together with a signature of the ref
+    storage; the cache is reused until any ref is created, deleted or packed.
+    """
+    base = git_utils.common_dir(git_dir)
+    cache_path = base / REF_CACHE_NAME
+    if use_cache:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("version") == _REF_CACHE_VERSION and cached["signature"] == _ref_signature(base, cached["directories"]):
+                return int(cached["highest"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    highest, directories = _scan_branch_numbers(git_dir)
+    cache = {
+        "version": _REF_CACHE_VERSION,
+        "highest": highest,
+        "directories": directories,
+        "signature": _ref_signature(base, directories),
+    }
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{REF_CACHE_NAME}.", dir=base)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        pass
+    return highest
+
+
+def fetch_interval() -> float:
+    """Minimum seconds between automatic fetches (SPECIFY_FETCH_INTERVAL, default 600)."""
+    try:
+        return float(os.getenv(FETCH_INTERVAL_ENV_VAR, DEFAULT_FETCH_INTERVAL))
+    except ValueError:
+        return DEFAULT_FETCH_INTERVAL
+
+
+def _has_remotes(git_dir: Path) -> bool:
+    try:
+        config = (git_utils.common_dir(git_dir) / "config").read_text(encoding="utf-8")
+    except OSError:
+        return False
+    return '[remote "' in config
+
+
+def maybe_fetch(repo_root: Path, git_dir: Path, force: bool = False, min_interval: Optional[float] = None) -> bool:
+    """Run ``git fetch --all --prune`` unless remotes were fetched recently.
+
+    Args:
+        repo_root: Work tree to fetch in
+        git_dir: Repository git directory (FETCH_HEAD records the last fetch)
+        force: Fetch regardless of when the last fetch happened
+        min_interval: Seconds since the last fetch before fetching again
+            (default: fetch_interval())
+
+    Returns:
+        bool: True if a fetch was attempted
+    """
+    if not _has_remotes(git_dir):
+        return False
+    if not force:
+        interval = fetch_interval() if min_interval is None else min_interval
+        try:
+            age = time.time() - os.stat(git_utils.common_dir(git_dir) / "FETCH_HEAD").st_mtime
+        except OSError:
+            age = None
+        if age is not None and age < interval:
+            return False
+    subprocess.run(
+        ["git", "-C", str(repo_root), "fetch", "--all", "--prune", "--quiet"],
+        capture_output=True,
+        text=True,
+    )
+    return True
+
+
+def next_feature_number(repo_root: Path, git_dir: Optional[Path] = None) -> int:
+    """Return one past the highest number used by a branch or a specs/ directory."""
+    highest = highest_spec_number(repo_root / "specs")
+    if git_dir is not None:
+        highest = max(highest, highest_branch_number(git_dir))
+    return highest + 1
+
+
+def lock_path(repo_root: Path, git_dir: Optional[Path] = None) -> Path:
+    """Lock file guarding number reservation (shared by all worktrees of a repository)."""
+    if git_dir is not None:
+        return git_utils.common_dir(git_dir) / LOCK_NAME
+    return repo_root / ".specify" / LOCK_NAME
+
+
+def create_feature(
+    description: str,
+    repo_root: Path,
+    short_name: Optional[str] = None,
+    number: Optional[int] = None,
+    fetch: Optional[bool] = None,
+    lock_timeout: Optional[float] = 30.0,
+) -> NewFeature:
+    """Allocate a feature number, create its branch and spec directory.
+
+    The number is chosen and reserved (branch and ``specs/NNN-name`` created) while
+    holding an exclusive lock, so parallel calls get distinct numbers.
+
+    Args:
+        description: Feature description used to derive the branch name
+        repo_root: Repository root (git work tree or directory containing .specify)
+        short_name: Branch suffix to use instead of one derived from the description
+        number: Feature number to use instead of the next free one
+        fetch: True to always fetch remotes first, False to never fetch,
+            None to fetch only if the last fetch is older than fetch_interval()
+        lock_timeout: Seconds to wait for another allocation to finish
+
+    Returns:
+        NewFeature describing the created branch and spec file
+
+    Raises:
+        ValueError: If no branch name can be derived from the input
+        RuntimeError: If the git branch cannot be created
+        TimeoutError: If the allocation lock cannot be acquired
+    """
+    suffix = clean_branch_name(short_name) if short_name else generate_branch_suffix(description)
+    if not suffix:
+        raise ValueError("Could not derive a branch name from the feature description")
+
+    git_dir = git_utils.find_git_dir(repo_root) if git_utils.find_repo_root(repo_root) is not None else None
+    if git_dir is not None and fetch is not False:
+        maybe_fetch(repo_root, git_dir, force=bool(fetch))
+
+    specs_dir = repo_root / "specs"
+    specs_dir.mkdir(parents=True, exist_ok=True)
+
+    with FileLock(lock_path(repo_root, git_dir), timeout=lock_timeout):
+        feature_number = number if number is not None else next_feature_number(repo_root, git_dir)
+        feature_num = f"{feature_number:03d}"
+        branch_name = truncate_branch_name(f"{feature_num}-{suffix}")
+
+        if git_dir is not None:
+            result = subprocess.run(
+                ["git", "-C", str(repo_root), "checkout", "-b", branch_name],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or f"git checkout -b {branch_name} failed")
+
+        feature_dir = specs_dir / branch_name
+        feature_dir.mkdir(parents=True, exist_ok=True)
+
+    spec_file = feature_dir / "spec.md"
+    template = repo_root / ".specify" / "templates" / "spec-template.md"
+    if template.is_file():
+        shutil.copyfile(template, spec_file)
+    else:
+        spec_file.touch()
+
+    return NewFeature(
+        branch_name=branch_name,
+        feature_num=feature_num,
+        feature_dir=feature_dir,
+        spec_file=spec_file,
+        has_git=git_dir is not None,
+    )
@@ -0,0 +1,85 @@
+"""
+Release archive format benchmark for Specify CLI.
+
+Backs ``specify dev bench-formats``: built release archives are served from a local
+HTTP server, optionally throttled to a fixed bandwidth to stand in for a real network,
+and ``specify init``'s download-and-extract step is timed for each archive format.
+
+Usage:
+    with serve_directory(Path(".genreleases"), bandwidth=1_000_000) as base_url:
+        release = release_for_format(Path(".genreleases"), base_url, "v0.1.0", "tar.xz")
+"""
+
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+
+CHUNK_SIZE = 16384
+
+
+class _ThrottledHandler(SimpleHTTPRequestHandler):
+    """Serves files from a directory, at most ``bandwidth`` bytes per second."""
+
+    bandwidth: Optional[int] = None
+
+    def copyfile(self, source, outputfile) -> None:
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            if self.bandwidth:
+                time.sleep(len(chunk) / self.bandwidth)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve_directory(directory: Path, bandwidth: Optional[int] = None) -> Iterator[str]:
+    """Serve directory over HTTP on localhost for the duration of the block.
+
+    Args:
+        directory: Directory whose files are served
+        bandwidth: Bytes per second per response (None: unthrottled)
+
+    Yields:
+        The server's base URL
+    """
+    handler = type("Handler", (_ThrottledHandler,), {"bandwidth": bandwidth})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(directory)))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def release_for_format(directory: Path, base_url: str, version: str, fmt: str) -> dict:
+    """GitHub-style release JSON listing only the variant archives of one format in directory."""
+    assets = [
+        {"name": path.name, "size": path.stat().st_size, "browser_download_url": f"{base_url}/{path.name}"}
+        for path in sorted(Path(directory).glob(f"spec-kit-template-*-{version}.{fmt}"))
+    ]
+    return {"tag_name": version, "assets": assets}
+
+
+@dataclass
+class FormatResult:
+    """Timings of one archive format."""
+
+    fmt: str
+    size: int
+    seconds: list[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.seconds)
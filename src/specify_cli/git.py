@@ -0,0 +1,231 @@
+"""
+Git helpers for Specify CLI.
+
+Provides pure-Python repository discovery (no ``git`` subprocess, honoring GIT_DIR and
+GIT_CEILING_DIRECTORIES) and thread-safe repository initialization that never changes
+the process working directory.
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+INITIAL_COMMIT_MESSAGE = "Initial commit from Specify template"
+
+
+def _resolve_gitfile(gitfile: Path) -> Optional[Path]:
+    """Resolve a ``.git`` file (worktrees, submodules) to the git directory it points to."""
+    try:
+        content = gitfile.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    target = Path(content[len("gitdir:"):].strip())
+    if not target.is_absolute():
+        target = gitfile.parent / target
+    return target if target.is_dir() else None
+
+
+def _looks_like_git_dir(path: Path) -> bool:
+    """Return True if path has the minimal layout of a git directory (HEAD, objects, refs)."""
+    return (path / "HEAD").is_file() and (path / "objects").is_dir() and (path / "refs").is_dir()
+
+
+def _dot_git_at(directory: Path) -> Optional[Path]:
+    """Return the git directory referenced by ``directory/.git``, if it is valid."""
+    dot_git = directory / ".git"
+    if dot_git.is_dir():
+        return dot_git if _looks_like_git_dir(dot_git) else None
+    if dot_git.is_file():
+        return _resolve_gitfile(dot_git)
+    return None
+
+
+def _ceiling_dirs() -> set[Path]:
+    """Directories listed in GIT_CEILING_DIRECTORIES (absolute entries only, as git does)."""
+    ceilings = set()
+    for entry in os.getenv("GIT_CEILING_DIRECTORIES", "").split(os.pathsep):
+        if entry and os.path.isabs(entry):
+            ceilings.add(Path(os.path.abspath(entry)))
+            ceilings.add(Path(os.path.realpath(entry)))
+    return ceilings
+
+
+def _discovery_candidates(path: Path) -> Iterator[Path]:
+    """Yield path and then its parents, never walking up into a ceiling directory."""
+    ceilings = _ceiling_dirs()
+    yield path
+    for parent in path.parents:
+        if parent in ceilings:
+            return
+        yield parent
+
+
+def find_git_dir(path: Optional[Path] = None) -> Optional[Path]:
+    """Walk up from path looking for a git directory, the way ``git rev-parse`` does.
+
+    Args:
+        path: Directory to start from (defaults to the current working directory)
+
+    Returns:
+        Path to the git directory (``.git`` or the target of a gitfile), or None
+    """
+    if path is None:
+        path = Path.cwd()
+    path = Path(os.path.abspath(path))
+
+    for candidate in _discovery_candidates(path):
+        git_dir = _dot_git_at(candidate)
+        if git_dir is not None:
+            return git_dir
+        # Inside a bare repository or the .git directory itself
+        if _looks_like_git_dir(candidate):
+            return candidate
+    return None
+
+
+def find_repo_root(path: Optional[Path] = None) -> Optional[Path]:
+    """Return the top-level work tree directory containing path, or None outside a work tree."""
+    if path is None:
+        path = Path.cwd()
+    path = Path(os.path.abspath(path))
+    for candidate in _discovery_candidates(path):
+        if _dot_git_at(candidate) is not None:
+            return candidate
+    return None
+
+
+def is_git_repo(path: Optional[Path] = None) -> bool:
+    """Check if path is inside a git repository without spawning ``git``.
+
+    GIT_DIR names the repository outright (relative to path) and skips discovery, as it
+    does for git itself.
+    """
+    if path is None:
+        path = Path.cwd()
+    if not path.is_dir():
+        return False
+
+    git_dir = os.getenv("GIT_DIR")
+    if git_dir:
+        git_dir = Path(path, git_dir)
+        return _looks_like_git_dir(git_dir) or (git_dir.is_file() and _resolve_gitfile(git_dir) is not None)
+
+    return find_git_dir(path) is not None
+
+
+def init_repo(project_path: Path, message: str = INITIAL_COMMIT_MESSAGE) -> Tuple[bool, Optional[str]]:
+    """Initialize a repository in project_path and commit everything in it.
+
+    Uses ``git -C`` for every step so the process working directory is never changed,
+    which makes this safe to call from multiple threads at once.
+
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+    """
+    base = ["git", "-C", str(project_path)]
+    steps = [
+        [*base, "init", "--quiet"],
+        [*base, "add", "."],
+        [*base, "commit", "--quiet", "-m", message],
+    ]
+    for cmd in steps:
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
+            if e.stderr:
+                error_msg += f"\nError: {e.stderr.strip()}"
+            elif e.stdout:
+                error_msg += f"\nOutput: {e.stdout.strip()}"
+            return False, error_msg
+        except FileNotFoundError as e:
+            return False, f"Command: {' '.join(cmd)}\nError: {e}"
+    return True, None
+
+
+def init_repos(project_paths: Iterable[Path], max_workers: Optional[int] = None) -> dict[Path, Tuple[bool, Optional[str]]]:
+    """Initialize several repositories concurrently.
+
+    Args:
+        project_paths: Project directories to initialize
+        max_workers: Thread pool size (defaults to ThreadPoolExecutor's default)
+
+    Returns:
+        Mapping of project path to the (success, error_message) result of init_repo
+    """
+    paths = list(project_paths)
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(init_repo, paths)))
+
+
+def read_head_branch(git_dir: Path) -> Optional[str]:
+    """Return the checked-out branch name by reading HEAD directly.
+
+    Matches ``git rev-parse --abbrev-ref HEAD``: returns "HEAD" when detached and None
+    when HEAD cannot be read.
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        ref = head[len("ref:"):].strip()
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
+
+
+def common_dir(git_dir: Path) -> Path:
+    """Return the directory holding shared refs (differs from git_dir inside linked worktrees)."""
+    try:
+        target = Path((git_dir / "commondir").read_text(encoding="utf-8").strip())
+    except OSError:
+        return git_dir
+    return target if target.is_absolute() else git_dir / target
+
+
+def read_packed_refs(git_dir: Path) -> list[str]:
+    """Return the ref names listed in ``packed-refs`` (e.g. "refs/heads/main")."""
+    try:
+        with open(common_dir(git_dir) / "packed-refs", "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    refs = []
+    for line in lines:
+        # Skip the header, peeled tag lines ("^<sha>") and blank lines
+        if not line or line[0] in "#^\n":
+            continue
+        parts = line.split(None, 1)
+        if len(parts) == 2:
+            refs.append(parts[1].strip())
+    return refs
+
+
+def iter_loose_refs(git_dir: Path, namespace: str = "refs") -> Iterable[tuple[str, Path]]:
+    """Yield (ref name, containing directory) for every loose ref file under namespace."""
+    base = common_dir(git_dir)
+    for dirpath, _dirnames, filenames in os.walk(base / namespace):
+        relative = Path(dirpath).relative_to(base).as_posix()
+        for name in filenames:
+            if not name.endswith(".lock"):
+                yield f"{relative}/{name}", Path(dirpath)
+
+
+def branch_short_name(ref: str) -> Optional[str]:
+    """Return the branch name of a local or remote-tracking ref, like ``git branch -a``.
+
+    "refs/heads/004-x" and "refs/remotes/origin/004-x" both give "004-x"; other refs
+    (tags, notes) give None.
+    """
+    if ref.startswith("refs/heads/"):
+        return ref[len("refs/heads/"):]
+    if ref.startswith("refs/remotes/"):
+        _remote, _, name = ref[len("refs/remotes/"):].partition("/")
+        return name or None
+    return None
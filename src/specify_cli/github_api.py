@@ -0,0 +1,252 @@
+"""
+GitHub API helpers for Specify CLI.
+
+Token lookup (``--github-token``, ``GH_TOKEN``, ``GITHUB_TOKEN``) and parsing and
+formatting of GitHub rate-limit headers, shared by the CLI and the template sources.
+
+The rate-limit headers of every API response are also recorded in a state file
+shared by all ``specify`` processes on the host (``RateLimitBudget``), one budget per
+token (or one for unauthenticated requests, which GitHub limits per IP). Before an
+API call a process reserves one request from the budget; once it is spent, callers
+use the template cache, or wait for the reset (up to ``SPECIFY_RATE_LIMIT_WAIT``
+seconds, default 0), instead of being refused with a 403.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from specify_cli.locking import FileLock
+
+RATE_LIMIT_STATE_NAME = "github-rate-limit.json"
+WAIT_ENV_VAR = "SPECIFY_RATE_LIMIT_WAIT"
+
+
+def github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+
+def github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def parse_rate_limit_headers(headers: httpx.Headers) -> dict:
+    """Extract and parse GitHub rate-limit headers."""
+    info = {}
+    
+    # Standard GitHub rate-limit headers
+    if "X-RateLimit-Limit" in headers:
+        info["limit"] = headers.get("X-RateLimit-Limit")
+    if "X-RateLimit-Remaining" in headers:
+        info["remaining"] = headers.get("X-RateLimit-Remaining")
+    if "X-RateLimit-Reset" in headers:
+        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+        if reset_epoch:
+            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
+            info["reset_epoch"] = reset_epoch
+            info["reset_time"] = reset_time
+            info["reset_local"] = reset_time.astimezone()
+    
+    # Retry-After header (seconds or HTTP-date)
+    if "Retry-After" in headers:
+        retry_after = headers.get("Retry-After")
+        try:
+            info["retry_after_seconds"] = int(retry_after)
+        except ValueError:
+            # HTTP-date format - not implemented, just store as string
+            info["retry_after"] = retry_after
+    
+    return info
+
+
+def format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
+    """Format a user-friendly error message with rate-limit information."""
+    rate_info = parse_rate_limit_headers(headers)
+    
+    lines = [f"GitHub API returned status {status_code} for {url}"]
+    lines.append("")
+    
+    if rate_info:
+        lines.append("[bold]Rate Limit Information:[/bold]")
+        if "limit" in rate_info:
+            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
+        if "remaining" in rate_info:
+            lines.append(f"  • Remaining: {rate_info['remaining']}")
+        if "reset_local" in rate_info:
+            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
+            lines.append(f"  • Resets at: {reset_str}")
+        if "retry_after_seconds" in rate_info:
+            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
+        lines.append("")
+    
+    # Add troubleshooting guidance
+    lines.append("[bold]Troubleshooting Tips:[/bold]")
+    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
+    lines.append("  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN")
+    lines.append("    environment variable to increase rate limits.")
+    lines.append("  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated.")
+    
+    return "\n".join(lines)
+
+
+class RateLimitExceeded(Exception):
+    """The shared GitHub rate-limit budget is spent until ``reset`` (epoch seconds)."""
+
+    def __init__(self, reset: float, limit: Optional[int] = None):
+        self.reset = reset
+        self.limit = limit
+        reset_local = datetime.fromtimestamp(reset, tz=timezone.utc).astimezone()
+        super().__init__(
+            f"GitHub API rate limit{f' of {limit} requests/hour' if limit else ''} is used up by "
+            f"specify processes on this host until {reset_local.strftime('%Y-%m-%d %H:%M:%S %Z')}. "
+            f"Use a cached template, a GitHub token, or set {WAIT_ENV_VAR} to wait for the reset."
+        )
+
+    @property
+    def wait_seconds(self) -> float:
+        return max(0.0, self.reset - time.time())
+
+
+def rate_limit_state_path() -> Path:
+    """Shared rate-limit state: github-rate-limit.json in the cache directory."""
+    from specify_cli.cache_manager import cache_dir  # cache_manager imports this module indirectly
+
+    return cache_dir() / RATE_LIMIT_STATE_NAME
+
+
+def configured_max_wait() -> float:
+    """Seconds a process may wait for a rate-limit reset (SPECIFY_RATE_LIMIT_WAIT, default 0)."""
+    try:
+        return max(0.0, float(os.getenv(WAIT_ENV_VAR) or 0))
+    except ValueError:
+        return 0.0
+
+
+class RateLimitBudget:
+    """Remaining GitHub API requests for one token, shared across processes.
+
+    ``acquire`` reserves a request by decrementing the recorded remaining count, so
+    processes starting at the same time do not all spend the last request; ``record``
+    replaces the estimate with what GitHub reports. Budgets are keyed by a hash of the
+    token; the token itself is never written.
+    """
+
+    def __init__(self, token: Optional[str] = None, path: Optional[Path] = None):
+        self.key = "token:" + hashlib.sha256(token.encode()).hexdigest()[:16] if token else "anonymous"
+        self.path = Path(path) if path else rate_limit_state_path()
+
+    def _update(self, change) -> Optional[dict]:
+        """Apply change(entry) to this budget's entry under the state lock; returns the entry."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with FileLock(self.path.with_name(self.path.name + ".lock"), timeout=10.0):
+                try:
+                    state = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    state = {}
+                if not isinstance(state, dict):
+                    state = {}
+                entry = state.get(self.key) if isinstance(state.get(self.key), dict) else {}
+                if not change(entry):
+                    return entry
+                state[self.key] = entry
+                fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(state, f, indent=2, sort_keys=True)
+                    os.replace(tmp_name, self.path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+                return entry
+        except (OSError, TimeoutError):
+            # The budget is advisory: without a usable state file, just make the request
+            return None
+
+    def acquire(self) -> float:
+        """Reserve one API request.
+
+        Returns:
+            0 if the request may be made now, else seconds until the budget resets
+        """
+        wait = 0.0
+
+        def reserve(entry: dict) -> bool:
+            nonlocal wait
+            now = time.time()
+            if entry.get("remaining") is None or entry.get("reset", 0) <= now:
+                return False
+            if entry["remaining"] <= 0:
+                wait = entry["reset"] - now
+                return False
+            entry["remaining"] -= 1
+            return True
+
+        self._update(reserve)
+        return wait
+
+    def record(self, headers: httpx.Headers) -> None:
+        """Store the budget GitHub reported in a response's rate-limit headers."""
+        info = parse_rate_limit_headers(headers)
+        now = time.time()
+        if "retry_after_seconds" in info:
+            remaining, reset = 0, now + info["retry_after_seconds"]
+        elif "remaining" in info and "reset_epoch" in info:
+            try:
+                remaining = int(info["remaining"])
+            except ValueError:
+                return
+            reset = info["reset_epoch"]
+        else:
+            return
+
+        def store(entry: dict) -> bool:
+            entry.update({"remaining": remaining, "reset": reset, "updated": now})
+            try:
+                entry["limit"] = int(info["limit"])
+            except (KeyError, ValueError):
+                pass
+            return True
+
+        self._update(store)
+
+    def limit(self) -> Optional[int]:
+        entry = self._update(lambda entry: False) or {}
+        return entry.get("limit")
+
+
+def reserve_request(token: Optional[str] = None, max_wait: Optional[float] = None, budget: Optional[RateLimitBudget] = None) -> RateLimitBudget:
+    """Reserve a GitHub API request from the shared budget, waiting for a reset if allowed.
+
+    Args:
+        token: Token the request is made with (None: unauthenticated)
+        max_wait: Longest acceptable wait in seconds (default: configured_max_wait())
+        budget: Budget to use (default: the shared budget of token)
+
+    Returns:
+        The budget, for recording the response headers
+
+    Raises:
+        RateLimitExceeded: If the budget is spent and resets later than max_wait
+    """
+    budget = budget or RateLimitBudget(token)
+    max_wait = configured_max_wait() if max_wait is None else max_wait
+    deadline = time.monotonic() + max_wait
+    while True:
+        wait = budget.acquire()
+        if not wait:
+            return budget
+        if time.monotonic() + wait > deadline:
+            raise RateLimitExceeded(time.time() + wait, budget.limit())
+        # Queue behind the reset; the next acquire sees the reset passed and goes ahead
+        time.sleep(wait)
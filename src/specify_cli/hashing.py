@@ -0,0 +1,20 @@
+"""
+File hashing for Specify CLI.
+
+Shared by the feature index, spec search, release packaging and template downloads,
+so none of them depends on another just for a digest.
+"""
+
+import hashlib
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
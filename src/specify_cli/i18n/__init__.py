@@ -20,9 +20,11 @@ Usage:
 """
 
 from .core import (
+    N_,
     setup_i18n,
     get_active_locale,
     get_template_path,
+    get_localized_template_index,
     SUPPORTED_LANGUAGES,
 )
 
@@ -31,9 +33,11 @@ _ = lambda x: x  # Placeholder until setup_i18n() is called
 ngettext = lambda s, p, n: s if n == 1 else p  # Placeholder
 
 __all__ = [
+    "N_",
     "setup_i18n",
     "get_active_locale",
     "get_template_path",
+    "get_localized_template_index",
     "SUPPORTED_LANGUAGES",
     "_",
     "ngettext",
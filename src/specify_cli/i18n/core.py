@@ -5,7 +5,10 @@ Handles language detection, translation catalog loading, and localized template
 """
 
 import gettext
+import json
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -45,6 +48,21 @@ SUPPORTED_LANGUAGES = {
 }
 
 
+def N_(message: str) -> str:
+    """
+    Mark a string for extraction without translating it (translate later with ``_()``).
+    
+    Used for module-level constants so translation happens when the text is displayed,
+    after the active language is known.
+    """
+    return message
+
+
+def _warn(message: str) -> None:
+    """Print a plain warning to stderr (cheap; avoids constructing a rich Console)."""
+    print(f"Warning: {message}", file=sys.stderr)
+
+
 def get_active_locale(cli_lang: Optional[str] = None) -> str:
     """
     Detect active locale from CLI argument or SPECIFY_LANG environment variable.
@@ -68,22 +86,116 @@ def get_active_locale(cli_lang: Optional[str] = None) -> str:
     
     # Validate against supported languages
     if locale not in SUPPORTED_LANGUAGES:
-        # Import console here to avoid circular dependency
+        _warn(
+            f"Unsupported locale '{locale}', using English. "
+            f"Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}"
+        )
+        return "en_US"
+    
+    return locale
+
+
+class Catalog:
+    """
+    Translation catalog for a locale chain, loaded lazily on first lookup.
+    
+    The gettext chain (primary locale plus fallbacks) is flattened once into plain
+    dictionaries so the hot ``gettext``/``ngettext`` path is a single dict lookup.
+    """
+    
+    def __init__(self, languages: tuple[str, ...], localedir: Path):
+        self.languages = languages
+        self.localedir = localedir
+        self._messages: Optional[dict[str, str]] = None
+        self._plurals: dict[str, tuple[Callable[[int], int], dict[int, str]]] = {}
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the .mo files for this chain have been read."""
+        return self._messages is not None
+    
+    def load(self) -> dict[str, str]:
+        """Read the catalogs for the chain and build the lookup tables (idempotent)."""
+        if self._messages is not None:
+            return self._messages
+        
+        messages: dict[str, str] = {}
+        plurals: dict[str, tuple[Callable[[int], int], dict[int, str]]] = {}
         try:
-            from rich.console import Console
-            console = Console()
-            console.print(
-                f"[yellow]Warning:[/yellow] Unsupported locale '{locale}', "
-                "using English. "
-                f"Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}"
+            translation = gettext.translation(
+                "specify",
+                localedir=str(self.localedir),
+                languages=list(self.languages),
+                fallback=True,
             )
-        except ImportError:
-            # Fallback if rich not available
-            print(f"Warning: Unsupported locale '{locale}', using English")
+            # Walk the chain from the last fallback to the primary so earlier locales win
+            chain = []
+            while translation is not None:
+                chain.append(translation)
+                translation = getattr(translation, "_fallback", None)
+            for translation in reversed(chain):
+                catalog = getattr(translation, "_catalog", None)
+                if not catalog:
+                    continue
+                plural = translation.plural
+                for key, value in catalog.items():
+                    if isinstance(key, tuple):
+                        msgid, index = key
+                        if msgid not in plurals or plurals[msgid][0] is not plural:
+                            plurals[msgid] = (plural, {})
+                        plurals[msgid][1][index] = value
+                    elif key:
+                        messages[key] = value
+        except Exception as e:
+            _warn(f"Failed to load translations for '{self.languages[0]}': {e}. Falling back to English")
+            messages, plurals = {}, {}
         
-        return "en_US"
+        self._plurals = plurals
+        self._messages = messages
+        return messages
     
-    return locale
+    def gettext(self, message: str) -> str:
+        """Translate message (identity if untranslated)."""
+        messages = self._messages
+        if messages is None:
+            messages = self.load()
+        return messages.get(message, message)
+    
+    def ngettext(self, singular: str, plural: str, n: int) -> str:
+        """Translate a message with plural forms (English rules if untranslated)."""
+        if self._messages is None:
+            self.load()
+        entry = self._plurals.get(singular)
+        if entry is not None:
+            plural_fn, forms = entry
+            translated = forms.get(plural_fn(n))
+            if translated is not None:
+                return translated
+        return singular if n == 1 else plural
+
+
+# Process-wide catalog cache: locale chain -> lazily loaded Catalog
+_catalog_cache: dict[tuple[str, ...], Catalog] = {}
+
+
+def get_catalog(locale: str) -> Catalog:
+    """
+    Get the shared catalog for a supported locale and its fallback chain.
+    
+    Repeated calls (e.g., at import time and again from the --lang callback) return the
+    same instance, so .mo files are read at most once per process.
+    """
+    lang = SUPPORTED_LANGUAGES[locale]
+    chain = (locale, lang.fallback) if lang.fallback else (locale,)
+    catalog = _catalog_cache.get(chain)
+    if catalog is None:
+        catalog = _catalog_cache[chain] = Catalog(chain, Path(__file__).parent)
+    return catalog
+
+
+def clear_catalog_cache() -> None:
+    """Drop all cached catalogs (e.g., after recompiling translations)."""
+    _catalog_cache.clear()
 
 
 def setup_i18n(cli_lang: Optional[str] = None) -> tuple[Callable[[str], str], Callable[[str, str, int], str]]:
@@ -96,48 +208,145 @@ def setup_i18n(cli_lang: Optional[str] = None) -> tuple[Callable[[str], str], Ca
     Returns:
         tuple: (gettext function, ngettext function)
         
+    Note:
+        Catalogs are shared per locale chain and only read from disk on the first
+        translation lookup, so calling this repeatedly is cheap.
+        
     Example:
         >>> _, ngettext = setup_i18n(cli_lang='zh_CN')
         >>> print(_("Project ready."))
         >>> print(ngettext("{count} file", "{count} files", 2).format(count=2))
     """
-    locale = get_active_locale(cli_lang)
-    lang = SUPPORTED_LANGUAGES[locale]
-    
-    # Get the directory containing all locale catalogs
-    locale_dir = Path(__file__).parent
+    catalog = get_catalog(get_active_locale(cli_lang))
+    return catalog.gettext, catalog.ngettext
+
+
+# Name of the manifest listing localized templates per locale (lives in templates/i18n/)
+TEMPLATE_MANIFEST_NAME = "manifest.json"
+
+# Localized template index cache: (templates root, locale) -> {relative name: path}
+_template_index_cache: dict[tuple[str, str], dict[str, Path]] = {}
+
+# Names confirmed missing on disk after an index miss: (templates root, locale, name)
+_template_miss_cache: set[tuple[str, str, str]] = set()
+
+
+@lru_cache(maxsize=1)
+def get_template_roots() -> tuple[Path, ...]:
+    """
+    Locate the base ``templates`` directories shipped with the CLI.
     
+    Returns:
+        tuple: Existing template roots, installed package first, then the source tree
+        
+    Note:
+        Computed once per process; wheels place ``templates/`` next to the package,
+        while a source checkout keeps it at the repository root.
+    """
+    candidates = []
     try:
-        # Build fallback chain
-        languages = [locale]
-        if lang.fallback:
-            languages.append(lang.fallback)
+        import importlib.resources
+        candidates.append(Path(str(importlib.resources.files("specify_cli"))).parent / "templates")
+    except Exception:
+        pass
+    candidates.append(Path(__file__).parent.parent.parent.parent / "templates")
+    
+    roots: list[Path] = []
+    for candidate in candidates:
+        if candidate.is_dir() and candidate.resolve() not in [r.resolve() for r in roots]:
+            roots.append(candidate)
+    return tuple(roots)
+
+
+def scan_localized_templates(templates_root: Path) -> dict[str, list[str]]:
+    """
+    Scan ``<templates_root>/i18n`` once and list localized templates per locale.
+    
+    Args:
+        templates_root: Base templates directory containing an ``i18n`` subdirectory
         
-        # Load translation catalog with fallback
-        translation = gettext.translation(
-            "specify",
-            localedir=str(locale_dir),
-            languages=languages,
-            fallback=True,
+    Returns:
+        dict: Locale code -> sorted POSIX paths relative to the locale directory
+    """
+    i18n_root = templates_root / "i18n"
+    manifest: dict[str, list[str]] = {}
+    if not i18n_root.is_dir():
+        return manifest
+    for locale_dir in sorted(p for p in i18n_root.iterdir() if p.is_dir()):
+        manifest[locale_dir.name] = sorted(
+            f.relative_to(locale_dir).as_posix() for f in locale_dir.rglob("*") if f.is_file()
         )
+    return manifest
+
+
+def write_template_manifest(templates_root: Path) -> Path:
+    """
+    Regenerate ``templates/i18n/manifest.json`` from the files on disk.
+    
+    Returns:
+        Path: Path to the written manifest
+    """
+    manifest_path = templates_root / "i18n" / TEMPLATE_MANIFEST_NAME
+    manifest = scan_localized_templates(templates_root)
+    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest_path
+
+
+def _load_template_manifest(templates_root: Path) -> Optional[dict[str, list[str]]]:
+    """Read the shipped template manifest, or return None if missing or unreadable."""
+    manifest_path = templates_root / "i18n" / TEMPLATE_MANIFEST_NAME
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data
+
+
+def get_localized_template_index(locale: str, templates_root: Optional[Path] = None, use_cache: bool = True) -> dict[str, Path]:
+    """
+    Get the index of localized templates available for a locale.
+    
+    Args:
+        locale: Language code (e.g., "zh_CN")
+        templates_root: Base templates directory (defaults to the first shipped root)
+        use_cache: Reuse (and store) the in-process index for this root and locale
         
-        return translation.gettext, translation.ngettext
-        
-    except Exception as e:
-        # Import console here to avoid circular dependency
-        try:
-            from rich.console import Console
-            console = Console()
-            console.print(
-                f"[yellow]Warning:[/yellow] Failed to load translations for '{locale}': {e}"
-            )
-            console.print("[yellow]Falling back to English[/yellow]")
-        except ImportError:
-            print(f"Warning: Failed to load translations: {e}")
+    Returns:
+        dict: Relative template name (e.g., "commands/plan.md") -> localized file path
         
-        # Return NullTranslations (identity functions)
-        null_translation = gettext.NullTranslations()
-        return null_translation.gettext, null_translation.ngettext
+    Note:
+        Built from ``templates/i18n/manifest.json`` when present, otherwise from a single
+        directory scan. Subsequent lookups are dictionary hits; ``get_template_path`` checks
+        the disk once per name missing from the index and remembers the answer.
+    """
+    if templates_root is None:
+        roots = get_template_roots()
+        templates_root = roots[0] if roots else Path(__file__).parent.parent.parent.parent / "templates"
+    
+    key = (str(templates_root), locale)
+    if use_cache and key in _template_index_cache:
+        return _template_index_cache[key]
+    
+    manifest = _load_template_manifest(templates_root)
+    if manifest is None:
+        manifest = scan_localized_templates(templates_root)
+    
+    locale_dir = templates_root / "i18n" / locale
+    index = {name: locale_dir / name for name in manifest.get(locale, [])}
+    
+    if use_cache:
+        _template_index_cache[key] = index
+    return index
+
+
+def clear_template_index_cache() -> None:
+    """Drop all cached localized template indexes (e.g., after templates change on disk)."""
+    _template_index_cache.clear()
+    _template_miss_cache.clear()
+    get_template_roots.cache_clear()
 
 
 def get_template_path(template_name: str, locale: Optional[str] = None, cli_lang: Optional[str] = None) -> Path:
@@ -160,19 +369,28 @@ def get_template_path(template_name: str, locale: Optional[str] = None, cli_lang
     if locale is None:
         locale = get_active_locale(cli_lang)
     
+    roots = get_template_roots()
+    base_templates_dir = roots[0] if roots else Path(__file__).parent.parent.parent.parent / "templates"
+    
     # Try localized template first
     if locale in SUPPORTED_LANGUAGES:
-        lang = SUPPORTED_LANGUAGES[locale]
-        if lang.template_dir:
-            localized_path = lang.template_dir / template_name
-            if localized_path.exists():
+        name = Path(template_name).as_posix()
+        index = get_localized_template_index(locale, base_templates_dir)
+        localized_path = index.get(name)
+        if localized_path is not None:
+            return localized_path
+        # A template added without regenerating the manifest is still found; either answer
+        # is remembered so each name costs at most one stat per process
+        miss_key = (str(base_templates_dir), locale, name)
+        if miss_key not in _template_miss_cache:
+            localized_path = base_templates_dir / "i18n" / locale / name
+            if localized_path.is_file():
+                index[name] = localized_path
                 return localized_path
+            _template_miss_cache.add(miss_key)
     
     # Fallback to English template
-    base_templates_dir = Path(__file__).parent.parent.parent.parent / "templates"
-    english_path = base_templates_dir / template_name
-    
-    return english_path
+    return base_templates_dir / template_name
 
 
 def detect_terminal_encoding() -> tuple[str, bool]:
@@ -185,8 +403,6 @@ def detect_terminal_encoding() -> tuple[str, bool]:
     Note:
         Used to warn users if their terminal may not display Chinese characters correctly.
     """
-    import sys
-    
     encoding = sys.stdout.encoding or "utf-8"
     supports_unicode = encoding.lower() in ["utf-8", "utf8", "utf_8"]
     
@@ -0,0 +1,587 @@
+"""
+Release packaging for Spec Kit templates.
+
+Backs ``specify dev package``, the only release packager (it replaced the
+``create-release-packages.sh``/``.ps1`` scripts). The source tree (command templates,
+memory/, templates/ and scripts/) is read once; every agent × script variant is then
+rendered in memory with ``rendering.render_command`` and written as
+``spec-kit-template-<agent>-<script>-<version>.zip`` by a pool of worker processes.
+
+Archives are reproducible: members are sorted and carry a fixed timestamp and
+normalized permissions, so unchanged content yields byte-identical assets. Each archive
+is published with ``<archive name>.manifest.json`` holding the archive's SHA-256 (used
+by ``specify prefetch`` to verify downloads) and every member's SHA-256, size and mode
+(``diff_manifests`` compares two releases of an asset).
+
+Next to the per-variant archives, a single universal asset carries the raw command
+templates plus the agent rendering rules; the CLI renders it locally for any agent and
+script type (see ``load_universal``).
+
+On request (``layered=True``, ``specify dev package --layered``), the same content is
+also split into one ``spec-kit-template-base-<script>-<version>.zip`` per script type (shared templates,
+memory and scripts, identical for every agent) and a small
+``spec-kit-template-overlay-<agent>-<script>-<version>.zip`` per variant holding only
+the agent's commands and extras; base plus overlay equals the variant archive. The CLI
+prefers the universal asset, so official releases do not build this layout; it is for
+mirrors that publish per-variant assets only.
+
+Variant, base and overlay archives can also be written as ``.tar.xz``
+(``ARCHIVE_FORMATS``); xz is smaller and, unlike zip, can be extracted while it is
+still downloading. Only zips are built by default (``DEFAULT_FORMATS``): the CLI takes
+the universal zip whenever a release has one, so official releases skip the tar.xz
+copies; mirrors without the universal asset can opt in.
+
+``build_packages`` also writes an ``index.json`` listing the assets in GitHub release
+JSON form, so the output directory can be served as-is as a template mirror (see
+``template_sources``). Every layout carries the release version in
+``.specify/release-version`` (``RELEASE_VERSION_FILE``); project scripts use it to run
+the matching CLI release through ``uvx``.
+
+Localized command templates are shipped under ``.specify/templates/i18n`` and applied
+by ``specify init --lang``; unlike the shell script they are not rendered into the
+gemini/qwen command directories, where they overwrote the English commands.
+
+Usage:
+    source = load_source(Path("."))
+    paths = build_packages(source, "v0.1.0", Path(".genreleases"))
+"""
+
+import calendar
+import hashlib
+import io
+import json
+import os
+import re
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Iterable, Optional
+
+from specify_cli.hashing import file_sha256
+from specify_cli.rendering import AGENT_COMMAND_FORMATS, AgentCommandFormat, render_command
+
+# Build order of the release archives
+ALL_AGENTS = (
+    "claude", "gemini", "copilot", "cursor-agent", "qwen", "opencode", "windsurf", "codex",
+    "kilocode", "auggie", "roo", "codebuddy", "amp", "shai", "q", "bob", "qoder",
+)
+ALL_SCRIPTS = ("sh", "ps")
+SCRIPT_DIRS = {"sh": "bash", "ps": "powershell"}
+
+VERSION_PATTERN = re.compile(r"^v\d+\.\d+\.\d+$")
+DEFAULT_OUTPUT_DIR = ".genreleases"
+
+# Reproducible archives: fixed member timestamp (overridable with SOURCE_DATE_EPOCH)
+# and compression level; see write_archive()
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+COMPRESS_LEVEL = 9
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# Archive formats by file extension; the universal asset is always a zip (read with random access)
+ARCHIVE_FORMATS = ("zip", "tar.xz")
+DEFAULT_FORMATS = ("zip",)
+XZ_PRESET = 9
+INDEX_NAME = "index.json"
+
+UNIVERSAL_ASSET_PREFIX = "spec-kit-template-universal-"
+UNIVERSAL_FORMAT_VERSION = 1
+
+# Project file recording the release a project was generated from
+RELEASE_VERSION_FILE = ".specify/release-version"
+
+BASE_ASSET_PREFIX = "spec-kit-template-base-"
+OVERLAY_ASSET_PREFIX = "spec-kit-template-overlay-"
+
+# Agent context files copied to the project root when present in the source tree
+AGENT_ROOT_FILES = {
+    "gemini": ("agent_templates/gemini/GEMINI.md", "GEMINI.md"),
+    "qwen": ("agent_templates/qwen/QWEN.md", "QWEN.md"),
+}
+
+
+@dataclass
+class SourceFile:
+    """A file read from the source tree."""
+
+    content: bytes
+
+
+@dataclass
+class SourceTree:
+    """Everything a release package is built from, loaded once."""
+
+    commands: dict[str, str] = field(default_factory=dict)  # template name -> raw text
+    shared: dict[str, SourceFile] = field(default_factory=dict)  # archive path -> file, same in every variant
+    scripts: dict[str, dict[str, SourceFile]] = field(default_factory=dict)  # script type -> archive path -> file
+    extras: dict[str, SourceFile] = field(default_factory=dict)  # source-relative path -> file
+    formats: dict[str, AgentCommandFormat] = field(default_factory=lambda: dict(AGENT_COMMAND_FORMATS))
+
+
+def with_release_version(source: SourceTree, version: str) -> SourceTree:
+    """Return a copy of source whose shared files include RELEASE_VERSION_FILE."""
+    return replace(source, shared={**source.shared, RELEASE_VERSION_FILE: SourceFile(f"{version}\n".encode("utf-8"))})
+
+
+def _read(path: Path) -> SourceFile:
+    return SourceFile(path.read_bytes())
+
+
+def _walk_files(directory: Path) -> Iterable[Path]:
+    """Yield regular files under directory in sorted order."""
+    if not directory.is_dir():
+        return
+    for path in sorted(directory.rglob("*")):
+        if path.is_file():
+            yield path
+
+
+def load_source(root: Path) -> SourceTree:
+    """Read the spec-kit source tree at root, mirroring what build_variant() copies.
+
+    Raises:
+        FileNotFoundError: If root has no templates/commands directory
+    """
+    root = Path(root)
+    commands_dir = root / "templates" / "commands"
+    if not commands_dir.is_dir():
+        raise FileNotFoundError(f"templates/commands not found in {root}")
+
+    source = SourceTree()
+    for path in sorted(commands_dir.glob("*.md")):
+        source.commands[path.stem] = path.read_bytes().decode("utf-8")
+
+    for path in _walk_files(root / "memory"):
+        source.shared[f".specify/{path.relative_to(root).as_posix()}"] = _read(path)
+    for path in _walk_files(root / "templates"):
+        rel = path.relative_to(root).as_posix()
+        if rel.startswith("templates/commands/") or path.name == "vscode-settings.json":
+            continue
+        source.shared[f".specify/{rel}"] = _read(path)
+
+    scripts_dir = root / "scripts"
+    top_level = [p for p in sorted(scripts_dir.glob("*")) if p.is_file()] if scripts_dir.is_dir() else []
+    for script_type, dirname in SCRIPT_DIRS.items():
+        files = {}
+        for path in _walk_files(scripts_dir / dirname):
+            files[f".specify/scripts/{path.relative_to(scripts_dir).as_posix()}"] = _read(path)
+        for path in top_level:
+            files[f".specify/scripts/{path.name}"] = _read(path)
+        source.scripts[script_type] = files
+
+    for rel in ["templates/vscode-settings.json", *(src for src, _ in AGENT_ROOT_FILES.values())]:
+        if (root / rel).is_file():
+            source.extras[rel] = _read(root / rel)
+    return source
+
+
+def variant_files(source: SourceTree, agent: str, script_type: str) -> dict[str, SourceFile]:
+    """Return {archive path: file} for one agent × script variant.
+
+    Raises:
+        ValueError: If the agent or script type is unknown
+    """
+    fmt = source.formats.get(agent)
+    if fmt is None:
+        raise ValueError(f"Unknown agent '{agent}' (allowed: {' '.join(source.formats)})")
+    if script_type not in source.scripts:
+        raise ValueError(f"Unknown script type '{script_type}' (allowed: {' '.join(source.scripts)})")
+
+    files = dict(source.shared)
+    files.update(source.scripts[script_type])
+    for name, text in source.commands.items():
+        rendered = render_command(text, agent, script_type, extension=fmt.extension, arg_format=fmt.arg_format)
+        files[f"{fmt.directory}/speckit.{name}.{fmt.extension}"] = SourceFile(rendered.encode("utf-8"))
+
+    if agent == "copilot":
+        for name in source.commands:
+            files[f".github/prompts/speckit.{name}.prompt.md"] = SourceFile(f"---\nagent: speckit.{name}\n---\n".encode("utf-8"))
+        settings = source.extras.get("templates/vscode-settings.json")
+        if settings:
+            files[".vscode/settings.json"] = settings
+    if agent in AGENT_ROOT_FILES:
+        src, dest = AGENT_ROOT_FILES[agent]
+        if src in source.extras:
+            files[dest] = source.extras[src]
+    return files
+
+
+def asset_name(agent: str, script_type: str, version: str, fmt: str = "zip") -> str:
+    """Release asset file name for a variant."""
+    return f"spec-kit-template-{agent}-{script_type}-{version}.{fmt}"
+
+
+def archive_timestamp() -> tuple[int, int, int, int, int, int]:
+    """Timestamp stored for every archive member: SOURCE_DATE_EPOCH if set, else 1980-01-01."""
+    try:
+        epoch = int(os.environ["SOURCE_DATE_EPOCH"])
+    except (KeyError, ValueError):
+        return ZIP_EPOCH
+    # Zip timestamps cannot predate 1980 and have two-second resolution
+    stamp = time.gmtime(max(epoch, calendar.timegm(ZIP_EPOCH)))
+    return (stamp.tm_year, stamp.tm_mon, stamp.tm_mday, stamp.tm_hour, stamp.tm_min, stamp.tm_sec - stamp.tm_sec % 2)
+
+
+def normalized_mode(name: str) -> int:
+    """0755 for shell scripts, 0644 for everything else, whatever the checkout's permissions."""
+    return 0o755 if name.endswith(".sh") else 0o644
+
+
+def write_archive(files: dict[str, SourceFile], path: Path) -> Path:
+    """Write files to a reproducible archive at path (zip, or tar.xz by extension).
+
+    Members are sorted by name and get a fixed timestamp, normalized permissions and a
+    fixed host system/owner, so identical content always produces identical bytes. The
+    archive is written to a temporary name and then renamed.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if path.name.endswith(".tar.xz"):
+        _write_tar_xz(files, tmp_path)
+    else:
+        _write_zip(files, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_zip(files: dict[str, SourceFile], path: Path) -> None:
+    timestamp = archive_timestamp()
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name in sorted(files):
+            entry = files[name]
+            info = zipfile.ZipInfo(name, date_time=timestamp)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3  # Unix, so permission bits are honoured on extraction
+            info.external_attr = (0o100000 | normalized_mode(name)) << 16
+            archive.writestr(info, entry.content, compresslevel=COMPRESS_LEVEL)
+
+
+def _write_tar_xz(files: dict[str, SourceFile], path: Path) -> None:
+    mtime = calendar.timegm(archive_timestamp())
+    with tarfile.open(path, "w:xz", format=tarfile.USTAR_FORMAT, preset=XZ_PRESET) as archive:
+        for name in sorted(files):
+            content = files[name].content
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = mtime
+            info.mode = normalized_mode(name)
+            archive.addfile(info, io.BytesIO(content))
+
+
+def read_archive(path: Path) -> dict[str, bytes]:
+    """Return {member name: content} of the regular files in a zip or tar.xz archive."""
+    files = {}
+    if Path(path).name.endswith(".tar.xz"):
+        with tarfile.open(path, "r:xz") as archive:
+            for member in archive:
+                if member.isfile():
+                    files[member.name] = archive.extractfile(member).read()
+    else:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    files[info.filename] = archive.read(info)
+    return files
+
+
+def build_manifest(files: dict[str, SourceFile], archive_path: Path, version: str) -> dict:
+    """Describe an archive and every member's SHA-256 so clients can skip unchanged files."""
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "asset": archive_path.name,
+        "version": version,
+        "size": archive_path.stat().st_size,
+        "sha256": file_sha256(archive_path),
+        "members": {
+            name: {
+                "sha256": hashlib.sha256(files[name].content).hexdigest(),
+                "size": len(files[name].content),
+                "mode": f"{normalized_mode(name):o}",
+            }
+            for name in sorted(files)
+        },
+    }
+
+
+def manifest_name(archive_name: str) -> str:
+    """Manifest asset name published next to an archive: the full archive name plus MANIFEST_SUFFIX.
+
+    Keeping the archive's extension gives the zip and tar.xz copies of an asset distinct,
+    predictable manifest names.
+    """
+    return f"{archive_name}{MANIFEST_SUFFIX}"
+
+
+def write_manifest(manifest: dict, path: Path) -> Path:
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def diff_manifests(old: Optional[dict], new: dict) -> tuple[list[str], list[str]]:
+    """Compare two manifests of the same asset.
+
+    Returns:
+        (members that are new or changed in new, members no longer present)
+    """
+    old_members = (old or {}).get("members", {})
+    new_members = new.get("members", {})
+    changed = [name for name, info in new_members.items() if old_members.get(name, {}).get("sha256") != info["sha256"]]
+    removed = [name for name in old_members if name not in new_members]
+    return sorted(changed), sorted(removed)
+
+
+def universal_asset_name(version: str) -> str:
+    """Release asset file name of the universal (agent-independent) template."""
+    return f"{UNIVERSAL_ASSET_PREFIX}{version}.zip"
+
+
+def universal_files(source: SourceTree) -> dict[str, SourceFile]:
+    """Lay out a source tree as the universal asset.
+
+    Layout: ``rules.json`` (agent command formats and script directories),
+    ``commands/<name>.md`` (raw command templates), ``files/<path>`` (members shared by
+    every variant), ``scripts/<sh|ps>/<path>`` and ``extras/<source path>``.
+    """
+    rules = {
+        "format_version": UNIVERSAL_FORMAT_VERSION,
+        "agents": {
+            agent: {"directory": fmt.directory, "extension": fmt.extension, "arg_format": fmt.arg_format}
+            for agent, fmt in sorted(source.formats.items())
+        },
+        "script_types": sorted(source.scripts),
+    }
+    files = {"rules.json": SourceFile((json.dumps(rules, indent=2, sort_keys=True) + "\n").encode("utf-8"))}
+    for name, text in source.commands.items():
+        files[f"commands/{name}.md"] = SourceFile(text.encode("utf-8"))
+    for path, entry in source.shared.items():
+        files[f"files/{path}"] = entry
+    for script_type, scripts in source.scripts.items():
+        for path, entry in scripts.items():
+            files[f"scripts/{script_type}/{path}"] = entry
+    for path, entry in source.extras.items():
+        files[f"extras/{path}"] = entry
+    return files
+
+
+def load_universal(archive_path: Path) -> SourceTree:
+    """Read a universal asset back into a source tree that variant_files() can render.
+
+    Raises:
+        ValueError: If the archive is not a universal asset of a supported format version
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        try:
+            rules = json.loads(archive.read("rules.json"))
+        except KeyError:
+            raise ValueError(f"{Path(archive_path).name} is not a universal template (no rules.json)") from None
+        if rules.get("format_version") != UNIVERSAL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported universal template format {rules.get('format_version')!r}; upgrade specify-cli")
+
+        source = SourceTree(
+            formats={agent: AgentCommandFormat(**fmt) for agent, fmt in rules["agents"].items()},
+            scripts={script_type: {} for script_type in rules["script_types"]},
+        )
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            kind, _, rest = info.filename.partition("/")
+            if kind == "commands" and rest.endswith(".md"):
+                source.commands[rest[:-3]] = archive.read(info).decode("utf-8")
+            elif kind == "files":
+                source.shared[rest] = SourceFile(archive.read(info))
+            elif kind == "scripts":
+                script_type, _, path = rest.partition("/")
+                source.scripts.setdefault(script_type, {})[path] = SourceFile(archive.read(info))
+            elif kind == "extras":
+                source.extras[rest] = SourceFile(archive.read(info))
+    return source
+
+
+def build_universal(source: SourceTree, version: str, output_dir: Path) -> Path:
+    """Write the universal asset and its manifest into output_dir."""
+    files = universal_files(source)
+    archive = write_archive(files, Path(output_dir) / universal_asset_name(version))
+    write_manifest(build_manifest(files, archive, version), archive.with_name(manifest_name(archive.name)))
+    return archive
+
+
+def base_asset_name(script_type: str, version: str, fmt: str = "zip") -> str:
+    """Release asset file name of the agent-independent base for a script type."""
+    return f"{BASE_ASSET_PREFIX}{script_type}-{version}.{fmt}"
+
+
+def overlay_asset_name(agent: str, script_type: str, version: str, fmt: str = "zip") -> str:
+    """Release asset file name of a variant's overlay."""
+    return f"{OVERLAY_ASSET_PREFIX}{agent}-{script_type}-{version}.{fmt}"
+
+
+def base_files(source: SourceTree, script_type: str) -> dict[str, SourceFile]:
+    """Return {archive path: file} shared by every agent for a script type.
+
+    Raises:
+        ValueError: If the script type is unknown
+    """
+    if script_type not in source.scripts:
+        raise ValueError(f"Unknown script type '{script_type}' (allowed: {' '.join(source.scripts)})")
+    files = dict(source.shared)
+    files.update(source.scripts[script_type])
+    return files
+
+
+def overlay_files(source: SourceTree, agent: str, script_type: str) -> dict[str, SourceFile]:
+    """Return the members of a variant that are not in its script type's base."""
+    base = base_files(source, script_type)
+    return {path: entry for path, entry in variant_files(source, agent, script_type).items() if path not in base}
+
+
+def build_base(source: SourceTree, script_type: str, version: str, output_dir: Path, fmt: str = "zip") -> Path:
+    """Write a script type's base archive and its manifest into output_dir."""
+    files = base_files(source, script_type)
+    archive = write_archive(files, Path(output_dir) / base_asset_name(script_type, version, fmt))
+    write_manifest(build_manifest(files, archive, version), archive.with_name(manifest_name(archive.name)))
+    return archive
+
+
+def build_overlay(source: SourceTree, agent: str, script_type: str, version: str, output_dir: Path, fmt: str = "zip") -> Path:
+    """Write a variant's overlay archive and its manifest into output_dir."""
+    files = overlay_files(source, agent, script_type)
+    archive = write_archive(files, Path(output_dir) / overlay_asset_name(agent, script_type, version, fmt))
+    write_manifest(build_manifest(files, archive, version), archive.with_name(manifest_name(archive.name)))
+    return archive
+
+
+def write_index(output_dir: Path, version: str) -> Path:
+    """Write index.json listing version's assets in output_dir, in GitHub release JSON form.
+
+    Each asset carries a GitHub-style ``digest`` (``sha256:<hex>``) so mirror downloads
+    can be verified.
+    """
+    output_dir = Path(output_dir)
+    assets = [
+        {"name": path.name, "size": path.stat().st_size, "digest": f"sha256:{file_sha256(path)}"}
+        for path in sorted(output_dir.glob(f"spec-kit-template-*-{version}*"))
+        if path.is_file()
+    ]
+    path = output_dir / INDEX_NAME
+    path.write_text(json.dumps({"tag_name": version, "assets": assets}, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+_worker_source: Optional[SourceTree] = None
+
+
+def _init_worker(source: SourceTree) -> None:
+    global _worker_source
+    _worker_source = source
+
+
+def _build_in_worker(agent: str, script_type: str, version: str, output_dir: str, layered: bool, formats: tuple[str, ...]) -> list[str]:
+    return [str(p) for p in _build_variant_assets(_worker_source, agent, script_type, version, Path(output_dir), layered, formats)]
+
+
+def _build_variant_assets(source: SourceTree, agent: str, script_type: str, version: str, output_dir: Path, layered: bool, formats: tuple[str, ...]) -> list[Path]:
+    """Build a variant's archive and, when layered, its overlay in every format."""
+    archives = [build_variant(source, agent, script_type, version, output_dir, fmt) for fmt in formats]
+    if layered:
+        archives.extend(build_overlay(source, agent, script_type, version, output_dir, fmt) for fmt in formats)
+    return archives
+
+
+def build_variant(source: SourceTree, agent: str, script_type: str, version: str, output_dir: Path, fmt: str = "zip") -> Path:
+    """Render and write one variant's archive and its manifest into output_dir."""
+    files = variant_files(source, agent, script_type)
+    archive = write_archive(files, Path(output_dir) / asset_name(agent, script_type, version, fmt))
+    write_manifest(build_manifest(files, archive, version), archive.with_name(manifest_name(archive.name)))
+    return archive
+
+
+def parse_selection(value: Optional[str], allowed: Iterable[str], kind: str) -> list[str]:
+    """Parse a comma/space separated subset (like AGENTS/SCRIPTS in the shell script).
+
+    Returns every allowed value when value is empty; duplicates keep their first position.
+
+    Raises:
+        ValueError: If an item is not allowed
+    """
+    allowed = list(allowed)
+    if not value or not value.strip():
+        return allowed
+    items = list(dict.fromkeys(value.replace(",", " ").split()))
+    invalid = [item for item in items if item not in allowed]
+    if invalid:
+        raise ValueError(f"Unknown {kind} {', '.join(repr(i) for i in invalid)} (allowed: {' '.join(allowed)})")
+    return items
+
+
+def build_packages(
+    source: SourceTree,
+    version: str,
+    output_dir: Path,
+    agents: Iterable[str] = ALL_AGENTS,
+    script_types: Iterable[str] = ALL_SCRIPTS,
+    jobs: Optional[int] = None,
+    universal: bool = True,
+    layered: bool = False,
+    formats: Iterable[str] = DEFAULT_FORMATS,
+) -> list[Path]:
+    """Build every requested variant, in parallel when jobs > 1.
+
+    Args:
+        source: Loaded source tree
+        version: Release version, e.g. "v0.1.0"
+        output_dir: Directory receiving the archives and index.json; stale template archives are removed
+        agents: Agents to build
+        script_types: Script types to build
+        jobs: Worker processes (default: CPU count; 1 builds in-process)
+        universal: Also build the universal asset (listed last)
+        layered: Also build the base archive of each script type and every variant's overlay
+            (off by default: clients prefer the universal asset)
+        formats: Archive formats of the variant, base and overlay archives
+
+    Returns:
+        Archive paths in build order: per variant (agent, then script type) its archives and
+        overlays, then the base archives, then the universal asset
+
+    Raises:
+        ValueError: If the version is malformed or an agent/script type is unknown
+    """
+    if not VERSION_PATTERN.match(version):
+        raise ValueError("Version must look like v0.0.0")
+    variants = [(agent, script) for agent in agents for script in script_types]
+    formats = tuple(formats)
+    for fmt in formats:
+        if fmt not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown format '{fmt}' (allowed: {' '.join(ARCHIVE_FORMATS)})")
+    for agent, script in variants:
+        if agent not in AGENT_COMMAND_FORMATS:
+            raise ValueError(f"Unknown agent '{agent}' (allowed: {' '.join(ALL_AGENTS)})")
+        if script not in SCRIPT_DIRS:
+            raise ValueError(f"Unknown script type '{script}' (allowed: {' '.join(ALL_SCRIPTS)})")
+
+    source = with_release_version(source, version)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for pattern in (*(f"spec-kit-template-*.{fmt}" for fmt in ARCHIVE_FORMATS), f"spec-kit-template-*{MANIFEST_SUFFIX}"):
+        for stale in output_dir.glob(pattern):
+            stale.unlink()
+
+    jobs = jobs or os.cpu_count() or 1
+    archives = []
+    if jobs == 1 or len(variants) <= 1:
+        for agent, script in variants:
+            archives.extend(_build_variant_assets(source, agent, script, version, output_dir, layered, formats))
+    else:
+        # The source tree is sent once per worker, not once per variant
+        with ProcessPoolExecutor(max_workers=min(jobs, len(variants)), initializer=_init_worker, initargs=(source,)) as pool:
+            futures = [pool.submit(_build_in_worker, agent, script, version, str(output_dir), layered, formats) for agent, script in variants]
+            for future in futures:
+                archives.extend(Path(p) for p in future.result())
+    if layered:
+        for script in dict.fromkeys(script for _, script in variants):
+            archives.extend(build_base(source, script, version, output_dir, fmt) for fmt in formats)
+    if universal:
+        archives.append(build_universal(source, version, output_dir))
+    write_index(output_dir, version)
+    return archives
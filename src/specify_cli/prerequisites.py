@@ -0,0 +1,207 @@
+"""
+Prerequisite checks for Specify CLI.
+
+Python equivalent of ``scripts/bash/check-prerequisites.sh``, backing
+``specify prereqs``. Produces the same JSON contract:
+
+- ``--paths-only``: ``{"REPO_ROOT", "BRANCH", "FEATURE_DIR", "FEATURE_SPEC", "IMPL_PLAN", "TASKS"}``
+- otherwise: ``{"FEATURE_DIR", "AVAILABLE_DOCS"}`` after validating the feature directory,
+  plan.md and (optionally) tasks.md.
+
+The branch is read from HEAD without spawning ``git``. Slash commands call this several
+times per session, so the resolved branch and feature directory are cached in the git
+directory for a few seconds (``SPECIFY_PREREQS_TTL``) and reused while HEAD, ``specs/``
+and ``SPECIFY_FEATURE`` are unchanged. File checks are never cached.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from specify_cli import git as git_utils
+from specify_cli.feature_paths import (
+    FEATURE_DIR_PATTERN,
+    FeaturePaths,
+    find_feature_dir_by_prefix,
+    get_current_branch,
+    get_repo_root,
+)
+
+CACHE_NAME = "specify-prereqs.json"
+CACHE_TTL_ENV_VAR = "SPECIFY_PREREQS_TTL"
+DEFAULT_CACHE_TTL = 5.0
+_CACHE_VERSION = 1
+
+
+class PrerequisiteError(Exception):
+    """A prerequisite is missing; ``hint`` says which command creates it."""
+
+    def __init__(self, message: str, hint: str = ""):
+        super().__init__(message)
+        self.hint = hint
+
+
+def cache_ttl() -> float:
+    """Seconds a resolved feature stays cached (SPECIFY_PREREQS_TTL, default 5; 0 disables)."""
+    try:
+        return max(float(os.getenv(CACHE_TTL_ENV_VAR, DEFAULT_CACHE_TTL)), 0.0)
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _signature(repo_root: Path, git_dir: Path) -> list:
+    """Everything branch and feature directory resolution depends on."""
+    return [
+        str(repo_root),
+        os.getenv("SPECIFY_FEATURE", ""),
+        _mtime_ns(git_dir / "HEAD"),
+        _mtime_ns(repo_root / "specs"),
+    ]
+
+
+def resolve_feature_paths(start: Optional[Path] = None, use_cache: bool = True) -> tuple[FeaturePaths, list[str]]:
+    """Resolve feature paths like ``get_feature_paths`` in common.sh, with a short-lived cache.
+
+    Unlike ``feature_paths.get_feature_paths``, several spec directories sharing a
+    numeric prefix are not fatal: as in common.sh, a warning is returned and
+    ``specs/<branch>`` is used.
+
+    Args:
+        start: Directory to resolve from (default: cwd)
+        use_cache: Reuse a recent resolution stored in the git directory
+
+    Returns:
+        (paths, warnings)
+    """
+    repo_root = get_repo_root(start)
+    git_dir = git_utils.find_git_dir(repo_root)
+    ttl = cache_ttl()
+    cache_path = git_dir / CACHE_NAME if git_dir is not None else None
+
+    signature = _signature(repo_root, git_dir) if git_dir is not None else None
+    if use_cache and cache_path is not None and ttl > 0:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if (
+                cached.get("version") == _CACHE_VERSION
+                and cached["signature"] == signature
+                and 0 <= time.time() - cached["time"] < ttl
+            ):
+                return FeaturePaths(repo_root, cached["branch"], True, Path(cached["feature_dir"])), []
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    branch = get_current_branch(repo_root)
+    warnings = []
+    try:
+        feature_dir = find_feature_dir_by_prefix(repo_root, branch)
+    except ValueError as e:
+        warnings.append(str(e))
+        feature_dir = repo_root / "specs" / branch
+
+    paths = FeaturePaths(repo_root, branch, git_dir is not None, feature_dir)
+    if cache_path is not None and ttl > 0 and not warnings:
+        record = {
+            "version": _CACHE_VERSION,
+            "signature": signature,
+            "time": time.time(),
+            "branch": branch,
+            "feature_dir": str(feature_dir),
+        }
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{CACHE_NAME}.", dir=git_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            pass
+    return paths, warnings
+
+
+def check_feature_branch(paths: FeaturePaths) -> Optional[str]:
+    """Validate the branch name like ``check_feature_branch`` in common.sh.
+
+    Returns:
+        A warning to print when there is no git repository, else None
+
+    Raises:
+        PrerequisiteError: If a git repository is on a non-feature branch
+    """
+    if not paths.has_git:
+        return "Git repository not detected; skipped branch validation"
+    if not FEATURE_DIR_PATTERN.match(paths.current_branch):
+        raise PrerequisiteError(
+            f"Not on a feature branch. Current branch: {paths.current_branch}",
+            "Feature branches should be named like: 001-feature-name",
+        )
+    return None
+
+
+def paths_json(paths: FeaturePaths) -> dict:
+    """The ``--paths-only`` payload."""
+    return {
+        "REPO_ROOT": str(paths.repo_root),
+        "BRANCH": paths.current_branch,
+        "FEATURE_DIR": str(paths.feature_dir),
+        "FEATURE_SPEC": str(paths.feature_spec),
+        "IMPL_PLAN": str(paths.impl_plan),
+        "TASKS": str(paths.tasks),
+    }
+
+
+def _has_entries(directory: Path) -> bool:
+    try:
+        with os.scandir(directory) as entries:
+            return any(True for _ in entries)
+    except OSError:
+        return False
+
+
+def document_status(paths: FeaturePaths, include_tasks: bool = False) -> list[tuple[str, bool]]:
+    """Return (document, exists) for every optional design document, in script order."""
+    status = [
+        ("research.md", paths.research.is_file()),
+        ("data-model.md", paths.data_model.is_file()),
+        ("contracts/", _has_entries(paths.contracts_dir)),
+        ("quickstart.md", paths.quickstart.is_file()),
+    ]
+    if include_tasks:
+        status.append(("tasks.md", paths.tasks.is_file()))
+    return status
+
+
+def check_prerequisites(paths: FeaturePaths, require_tasks: bool = False, include_tasks: bool = False) -> dict:
+    """Validate the feature directory and return ``{"FEATURE_DIR", "AVAILABLE_DOCS"}``.
+
+    Raises:
+        PrerequisiteError: If the feature directory, plan.md or a required tasks.md is missing
+    """
+    if not paths.feature_dir.is_dir():
+        raise PrerequisiteError(
+            f"Feature directory not found: {paths.feature_dir}",
+            "Run /speckit.specify first to create the feature structure.",
+        )
+    if not paths.impl_plan.is_file():
+        raise PrerequisiteError(
+            f"plan.md not found in {paths.feature_dir}",
+            "Run /speckit.plan first to create the implementation plan.",
+        )
+    if require_tasks and not paths.tasks.is_file():
+        raise PrerequisiteError(
+            f"tasks.md not found in {paths.feature_dir}",
+            "Run /speckit.tasks first to create the task list.",
+        )
+    return {
+        "FEATURE_DIR": str(paths.feature_dir),
+        "AVAILABLE_DOCS": [name for name, exists in document_status(paths, include_tasks) if exists],
+    }
@@ -0,0 +1,154 @@
+"""
+Profiling support for Specify CLI.
+
+Records coarse startup phase timings (imports, i18n setup, TLS context creation)
+and wraps the selected command with cProfile when profiling is requested via the
+global ``--profile`` option or the ``SPECIFY_PROFILE`` environment variable.
+
+When ``SPECIFY_PROFILE`` is set before the process starts, the profiler is enabled
+at import time so module imports show up in the report as well.
+
+Usage:
+    SPECIFY_PROFILE=1 specify init demo --ai claude
+    SPECIFY_PROFILE=/tmp/profiles specify check
+    specify --profile version
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+PROFILE_ENV_VAR = "SPECIFY_PROFILE"
+
+# Values of SPECIFY_PROFILE that enable profiling without naming an output directory
+_TRUTHY = {"1", "true", "yes", "on"}
+_FALSY = {"", "0", "false", "no", "off"}
+
+# Module path fragments used to attribute profiled time to a category.
+# The first matching category wins, so more specific entries come first.
+CATEGORY_PATTERNS = [
+    ("i18n", ("gettext", "babel", "specify_cli/i18n")),
+    ("tls", ("ssl.py", "truststore", "<method 'load_verify_locations'", "<method 'set_default_verify_paths'")),
+    ("network", ("httpx", "httpcore", "h11", "socket.py", "selectors.py", "anyio", "<method 'recv", "<method 'send", "<method 'connect")),
+    ("filesystem", ("zipfile", "shutil.py", "pathlib.py", "tempfile.py", "<built-in method io.open", "<built-in method posix.", "<built-in method nt.", "<method 'read' of '_io", "<method 'write' of '_io")),
+    ("subprocess", ("subprocess.py", "<built-in method _posixsubprocess", "<built-in method _winapi")),
+    ("imports", ("<frozen importlib", "<built-in method _imp.", "<built-in method marshal.loads")),
+]
+
+_process_start = time.perf_counter()
+_last_mark = _process_start
+_phases: list[tuple[str, float]] = []
+_profiler: Optional[cProfile.Profile] = None
+
+
+def env_output_dir() -> Optional[Path]:
+    """Return the output directory requested through SPECIFY_PROFILE, or None if unset.
+
+    A truthy value ("1", "true", ...) selects the current working directory; any other
+    non-empty value is treated as a directory path.
+    """
+    value = os.getenv(PROFILE_ENV_VAR, "").strip()
+    if value.lower() in _FALSY:
+        return None
+    if value.lower() in _TRUTHY:
+        return Path.cwd()
+    return Path(value).expanduser()
+
+
+def mark(phase: str) -> None:
+    """Record the wall time elapsed since the previous mark under the given phase name."""
+    global _last_mark
+    now = time.perf_counter()
+    _phases.append((phase, now - _last_mark))
+    _last_mark = now
+
+
+def phases() -> list[tuple[str, float]]:
+    """Return the recorded (phase, seconds) pairs in the order they were marked."""
+    return list(_phases)
+
+
+def is_active() -> bool:
+    """Return True if the command profiler is currently collecting samples."""
+    return _profiler is not None
+
+
+def start() -> None:
+    """Enable cProfile for the rest of the process (no-op if already running)."""
+    global _profiler
+    if _profiler is not None:
+        return
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+
+def categorize(stats: pstats.Stats) -> dict[str, float]:
+    """Attribute the self time of every profiled function to a coarse category."""
+    totals: dict[str, float] = {name: 0.0 for name, _ in CATEGORY_PATTERNS}
+    totals["other"] = 0.0
+    for (filename, _lineno, funcname), (_cc, _nc, tottime, _ct, _callers) in stats.stats.items():
+        location = f"{filename.replace(os.sep, '/')}:{funcname}" if filename != "~" else funcname
+        for name, patterns in CATEGORY_PATTERNS:
+            if any(p in location for p in patterns):
+                totals[name] += tottime
+                break
+        else:
+            totals["other"] += tottime
+    return totals
+
+
+def stop_and_write(output_dir: Path, command: Optional[str] = None, limit: int = 60) -> Optional[tuple[Path, Path]]:
+    """Stop the profiler and write ``<name>.prof`` plus a sorted ``<name>.txt`` report.
+
+    Args:
+        output_dir: Directory to write the profile files into (created if missing)
+        command: Name of the profiled subcommand, used in the file name
+        limit: Number of functions to list in each sorted section of the report
+
+    Returns:
+        Tuple of (report path, .prof path), or None if profiling was never started
+    """
+    global _profiler
+    if _profiler is None:
+        return None
+    profiler, _profiler = _profiler, None
+    profiler.disable()
+    mark("command")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    base = output_dir / f"specify-{command or 'main'}-{stamp}-{os.getpid()}"
+    prof_path = base.with_suffix(".prof")
+    report_path = base.with_suffix(".txt")
+
+    profiler.dump_stats(prof_path)
+
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    total = time.perf_counter() - _process_start
+
+    buffer.write(f"Specify CLI profile: {command or '(no command)'}\n")
+    buffer.write(f"Total wall time: {total:.3f}s\n\n")
+    buffer.write("Phases (wall time):\n")
+    for name, seconds in _phases:
+        buffer.write(f"  {name:<20} {seconds:8.3f}s\n")
+    buffer.write("\nSelf time by category (profiled code only):\n")
+    for name, seconds in sorted(categorize(stats).items(), key=lambda item: item[1], reverse=True):
+        buffer.write(f"  {name:<20} {seconds:8.3f}s\n")
+    buffer.write("\n")
+
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
+
+    report_path.write_text(buffer.getvalue(), encoding="utf-8")
+    return report_path, prof_path
+
+
+# Profile imports too when the environment variable is already set at startup
+if env_output_dir() is not None:
+    start()
@@ -0,0 +1,172 @@
+"""
+Command template rendering for Specify CLI.
+
+Python equivalent of ``generate_commands`` in the former
+``create-release-packages.sh`` release script: turns a raw template from
+``templates/commands`` (or ``templates/i18n/<locale>/commands``) into the command file
+an agent expects, entirely in memory.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+MARKDOWN_ARGS = "$ARGUMENTS"
+TOML_ARGS = "{{args}}"
+
+
+@dataclass(frozen=True)
+class AgentCommandFormat:
+    """Where and how an agent's command files are written."""
+
+    directory: str
+    extension: str
+    arg_format: str
+
+
+# Agent command directories, extensions and argument placeholders of the release archives
+AGENT_COMMAND_FORMATS: dict[str, AgentCommandFormat] = {
+    "claude": AgentCommandFormat(".claude/commands", "md", MARKDOWN_ARGS),
+    "gemini": AgentCommandFormat(".gemini/commands", "toml", TOML_ARGS),
+    "copilot": AgentCommandFormat(".github/agents", "agent.md", MARKDOWN_ARGS),
+    "cursor-agent": AgentCommandFormat(".cursor/commands", "md", MARKDOWN_ARGS),
+    "qwen": AgentCommandFormat(".qwen/commands", "toml", TOML_ARGS),
+    "opencode": AgentCommandFormat(".opencode/command", "md", MARKDOWN_ARGS),
+    "windsurf": AgentCommandFormat(".windsurf/workflows", "md", MARKDOWN_ARGS),
+    "codex": AgentCommandFormat(".codex/prompts", "md", MARKDOWN_ARGS),
+    "kilocode": AgentCommandFormat(".kilocode/workflows", "md", MARKDOWN_ARGS),
+    "auggie": AgentCommandFormat(".augment/commands", "md", MARKDOWN_ARGS),
+    "roo": AgentCommandFormat(".roo/commands", "md", MARKDOWN_ARGS),
+    "codebuddy": AgentCommandFormat(".codebuddy/commands", "md", MARKDOWN_ARGS),
+    "qoder": AgentCommandFormat(".qoder/commands", "md", MARKDOWN_ARGS),
+    "amp": AgentCommandFormat(".agents/commands", "md", MARKDOWN_ARGS),
+    "shai": AgentCommandFormat(".shai/commands", "md", MARKDOWN_ARGS),
+    "q": AgentCommandFormat(".amazonq/prompts", "md", MARKDOWN_ARGS),
+    "bob": AgentCommandFormat(".bob/commands", "md", MARKDOWN_ARGS),
+}
+
+_PATH_REWRITES = [
+    (re.compile(r"(/?)memory/"), ".specify/memory/"),
+    (re.compile(r"(/?)scripts/"), ".specify/scripts/"),
+    (re.compile(r"(/?)templates/"), ".specify/templates/"),
+]
+
+
+def rewrite_paths(text: str) -> str:
+    """Point repository-relative memory/, scripts/ and templates/ paths at .specify/."""
+    for pattern, replacement in _PATH_REWRITES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _frontmatter_value(lines: list[str], key: str) -> Optional[str]:
+    """Return the value of the first top-level ``key:`` line, like the packaging awk."""
+    prefix = f"{key}:"
+    for line in lines:
+        if line.startswith(prefix):
+            return line[len(prefix):].lstrip()
+    return None
+
+
+def _script_command(lines: list[str], script_type: str) -> Optional[str]:
+    """Return the first ``<script_type>: ...`` entry anywhere in the template."""
+    pattern = re.compile(rf"^\s*{re.escape(script_type)}:\s*")
+    for line in lines:
+        match = pattern.match(line)
+        if match:
+            return line[match.end():]
+    return None
+
+
+def _agent_script_command(lines: list[str], script_type: str) -> Optional[str]:
+    """Return the ``<script_type>:`` entry inside the ``agent_scripts:`` block, if any."""
+    pattern = re.compile(rf"^\s*{re.escape(script_type)}:\s*")
+    in_agent_scripts = False
+    for line in lines:
+        if line == "agent_scripts:":
+            in_agent_scripts = True
+            continue
+        if in_agent_scripts:
+            match = pattern.match(line)
+            if match:
+                return line[match.end():]
+            if re.match(r"^[a-zA-Z]", line):
+                in_agent_scripts = False
+    return None
+
+
+def _strip_script_sections(lines: list[str]) -> list[str]:
+    """Drop the ``scripts:`` and ``agent_scripts:`` blocks from the YAML frontmatter."""
+    result = []
+    dash_count = 0
+    in_frontmatter = False
+    skip_scripts = False
+    for line in lines:
+        if line == "---":
+            result.append(line)
+            dash_count += 1
+            in_frontmatter = dash_count == 1
+            continue
+        if in_frontmatter and line in ("scripts:", "agent_scripts:"):
+            skip_scripts = True
+            continue
+        if in_frontmatter and skip_scripts and re.match(r"^[a-zA-Z].*:", line):
+            skip_scripts = False
+        if in_frontmatter and skip_scripts and re.match(r"^\s", line):
+            continue
+        result.append(line)
+    return result
+
+
+def render_command(content: str, agent: str, script_type: str, extension: Optional[str] = None, arg_format: Optional[str] = None) -> str:
+    """
+    Render a raw command template for an agent and script type.
+
+    Args:
+        content: Raw template text (YAML frontmatter with scripts/agent_scripts)
+        agent: Agent key (e.g., "claude", "gemini")
+        script_type: Script variant, "sh" or "ps"
+        extension: Output format override ("md", "agent.md" or "toml")
+        arg_format: Argument placeholder override (e.g., "$ARGUMENTS")
+
+    Returns:
+        str: The rendered command file content
+    """
+    fmt = AGENT_COMMAND_FORMATS.get(agent)
+    extension = extension or (fmt.extension if fmt else "md")
+    arg_format = arg_format or (fmt.arg_format if fmt else MARKDOWN_ARGS)
+
+    content = content.replace("\r", "")
+    lines = content.split("\n")
+    description = _frontmatter_value(lines, "description") or ""
+    script_command = _script_command(lines, script_type)
+    if not script_command:
+        script_command = f"(Missing script command for {script_type})"
+    agent_script_command = _agent_script_command(lines, script_type)
+
+    body = content.rstrip("\n").replace("{SCRIPT}", script_command)
+    if agent_script_command:
+        body = body.replace("{AGENT_SCRIPT}", agent_script_command)
+    body = "\n".join(_strip_script_sections(body.split("\n")))
+    body = rewrite_paths(body.replace("{ARGS}", arg_format).replace("__AGENT__", agent))
+    body = body.rstrip("\n")
+
+    if extension == "toml":
+        body = body.replace("\\", "\\\\")
+        return f'description = "{description}"\n\nprompt = """\n{body}\n"""\n'
+    return body + "\n"
+
+
+def command_filename(name: str, agent: str) -> str:
+    """Return the file name an agent uses for the command template ``<name>.md``."""
+    fmt = AGENT_COMMAND_FORMATS.get(agent)
+    extension = fmt.extension if fmt else "md"
+    return f"speckit.{name}.{extension}"
+
+
+def command_path(name: str, agent: str) -> Optional[str]:
+    """Return the project-relative POSIX path of an agent's command file, or None if unknown."""
+    fmt = AGENT_COMMAND_FORMATS.get(agent)
+    if fmt is None:
+        return None
+    return f"{fmt.directory}/{command_filename(name, agent)}"
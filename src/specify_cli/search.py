@@ -0,0 +1,309 @@
+"""
+Full-text search over specs for Specify CLI.
+
+Backs ``specify search``: an inverted index of every Markdown file under ``specs/``
+stored next to the feature index in ``.specify/index.db``. Files are split into
+sections at Markdown headings; sections are tokenized (heading terms weighted higher,
+requirement and task IDs such as ``FR-001``, ``SC-002`` and ``T001`` kept as single
+terms) and ranked with BM25. Refreshing only re-tokenizes files whose size/mtime and
+content hash changed.
+
+Usage:
+    with SearchIndex(repo_root) as index:
+        index.refresh()
+        hits = index.search("FR-001 login")
+"""
+
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from specify_cli.feature_index import INDEX_RELATIVE_PATH, ensure_gitignore
+from specify_cli.hashing import file_sha256
+
+SEARCH_SCHEMA_VERSION = 1
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Each occurrence of a term in a section heading counts this many times
+HEADING_BOOST = 3
+
+# IDs like FR-001 / SC-010 first, then single CJK characters, then word runs
+_TOKEN_PATTERN = re.compile(r"[a-z]+-\d+|[\u3400-\u9fff]|[^\W_\u3400-\u9fff]+")
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_sections (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES search_files(path) ON DELETE CASCADE,
+    heading TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_sections_path ON search_sections(path);
+CREATE TABLE IF NOT EXISTS search_postings (
+    term TEXT NOT NULL,
+    section_id INTEGER NOT NULL REFERENCES search_sections(id) ON DELETE CASCADE,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, section_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS search_postings_section ON search_postings(section_id);
+"""
+
+
+@dataclass
+class Section:
+    """A Markdown section: its heading (empty before the first heading), start line and text."""
+
+    heading: str
+    line: int
+    body: str
+
+
+@dataclass
+class SearchHit:
+    """A ranked section matching a query."""
+
+    path: str
+    heading: str
+    line: int
+    score: float
+    snippet: str
+
+
+@dataclass
+class SearchRefreshStats:
+    """What a search index refresh changed."""
+
+    files_indexed: int = 0
+    files_removed: int = 0
+    files_unchanged: int = 0
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase and split text into search terms, keeping IDs like FR-001 whole."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def split_sections(text: str) -> list[Section]:
+    """Split Markdown into sections at headings, ignoring ``#`` lines inside code fences."""
+    sections: list[Section] = []
+    heading, start, body = "", 1, []
+    in_fence = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_PATTERN.match(line)
+        if match:
+            if heading or any(part.strip() for part in body):
+                sections.append(Section(heading, start, "\n".join(body)))
+            heading, start, body = match.group(2), number, []
+        else:
+            body.append(line)
+    if heading or any(part.strip() for part in body):
+        sections.append(Section(heading, start, "\n".join(body)))
+    return sections
+
+
+def section_terms(section: Section) -> Counter:
+    """Term frequencies for a section, with heading terms boosted."""
+    terms = Counter(tokenize(section.body))
+    for term in tokenize(section.heading):
+        terms[term] += HEADING_BOOST
+    return terms
+
+
+def feature_path_prefix(feature: str) -> str:
+    """Return the ``search`` path prefix for one feature, ending at the directory boundary.
+
+    ``4`` becomes ``specs/004-`` (so it never matches ``specs/0040-...``) and a full
+    directory name such as ``004-auth`` becomes ``specs/004-auth/`` (not ``004-auth-v2``).
+    """
+    feature = feature.strip("/")
+    if feature.isdigit():
+        return f"specs/{feature.zfill(3)}-"
+    return f"specs/{feature}/"
+
+
+def make_snippet(body: str, terms: set[str], width: int = 160) -> str:
+    """Return the first line of body containing a query term (or the first non-blank line)."""
+    fallback = ""
+    for line in body.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        fallback = fallback or stripped
+        if terms.intersection(tokenize(stripped)):
+            return stripped if len(stripped) <= width else stripped[: width - 1] + "…"
+    return fallback if len(fallback) <= width else fallback[: width - 1] + "…"
+
+
+class SearchIndex:
+    """Inverted index over ``specs/**/*.md`` stored in ``.specify/index.db``."""
+
+    def __init__(self, repo_root: Path, db_path: Optional[Path] = None):
+        self.repo_root = Path(repo_root)
+        self.specs_dir = self.repo_root / "specs"
+        self.db_path = Path(db_path) if db_path else self.repo_root / INDEX_RELATIVE_PATH
+        is_new = not self.db_path.exists()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if is_new and db_path is None:
+            ensure_gitignore(self.db_path.parent)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'search_schema_version'").fetchone()
+            if row is None or row[0] != str(SEARCH_SCHEMA_VERSION):
+                # Derived data only: drop and rebuild when the schema is missing or changed
+                for table in ("search_postings", "search_sections", "search_files"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('search_schema_version', ?)",
+                (str(SEARCH_SCHEMA_VERSION),),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _markdown_files(self) -> dict[str, os.stat_result]:
+        """Return {repo-relative POSIX path: stat} for every Markdown file under specs/."""
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(self.specs_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.endswith(".md"):
+                    full = Path(dirpath) / name
+                    try:
+                        files[full.relative_to(self.repo_root).as_posix()] = os.stat(full)
+                    except OSError:
+                        continue
+        return files
+
+    def _index_file(self, path: str, text: str) -> None:
+        self.conn.execute("DELETE FROM search_sections WHERE path = ?", (path,))
+        for section in split_sections(text):
+            terms = section_terms(section)
+            cursor = self.conn.execute(
+                "INSERT INTO search_sections(path, heading, line, length, body) VALUES (?, ?, ?, ?, ?)",
+                (path, section.heading, section.line, sum(terms.values()), section.body),
+            )
+            self.conn.executemany(
+                "INSERT INTO search_postings(term, section_id, tf) VALUES (?, ?, ?)",
+                [(term, cursor.lastrowid, tf) for term, tf in terms.items()],
+            )
+
+    def refresh(self) -> SearchRefreshStats:
+        """Re-index Markdown files that changed since the last refresh and drop deleted ones."""
+        stats = SearchRefreshStats()
+        stored = {
+            path: (size, mtime, digest)
+            for path, size, mtime, digest in self.conn.execute("SELECT path, size, mtime_ns, sha256 FROM search_files")
+        }
+        current = self._markdown_files()
+        with self.conn:
+            for path in stored.keys() - current.keys():
+                self.conn.execute("DELETE FROM search_files WHERE path = ?", (path,))
+                stats.files_removed += 1
+            for path, st in current.items():
+                previous = stored.get(path)
+                if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+                    stats.files_unchanged += 1
+                    continue
+                full = self.repo_root / path
+                try:
+                    digest = file_sha256(full)
+                    if previous and previous[2] == digest:
+                        stats.files_unchanged += 1
+                    else:
+                        text = full.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+                self.conn.execute(
+                    "INSERT INTO search_files(path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns, sha256 = excluded.sha256",
+                    (path, st.st_size, st.st_mtime_ns, digest),
+                )
+                if not previous or previous[2] != digest:
+                    self._index_file(path, text)
+                    stats.files_indexed += 1
+        return stats
+
+    def search(self, query: str, limit: int = 10, path_prefix: Optional[str] = None) -> list[SearchHit]:
+        """Rank sections against query with BM25.
+
+        Args:
+            query: Free text; IDs such as FR-001 or T012 match exactly
+            limit: Maximum number of hits
+            path_prefix: Only sections in files under this repo-relative prefix
+
+        Returns:
+            Hits ordered by descending score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        total, avg_length = self.conn.execute("SELECT COUNT(*), AVG(length) FROM search_sections").fetchone()
+        if not total:
+            return []
+        avg_length = avg_length or 1.0
+
+        placeholders = ",".join("?" * len(terms))
+        document_frequency = dict(self.conn.execute(
+            f"SELECT term, COUNT(*) FROM search_postings WHERE term IN ({placeholders}) GROUP BY term", terms
+        ))
+        idf = {
+            term: math.log((total - df + 0.5) / (df + 0.5) + 1.0)
+            for term, df in document_frequency.items()
+        }
+
+        sql = (
+            "SELECT p.term, p.tf, s.id, s.length FROM search_postings p "
+            f"JOIN search_sections s ON s.id = p.section_id WHERE p.term IN ({placeholders})"
+        )
+        params: list = list(terms)
+        if path_prefix:
+            sql += " AND s.path LIKE ? ESCAPE '\\'"
+            params.append(path_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+
+        scores: dict[int, float] = {}
+        for term, tf, section_id, length in self.conn.execute(sql, params):
+            norm = K1 * (1 - B + B * length / avg_length)
+            scores[section_id] = scores.get(section_id, 0.0) + idf[term] * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        term_set = set(terms)
+        for section_id, score in ranked:
+            path, heading, line, body = self.conn.execute(
+                "SELECT path, heading, line, body FROM search_sections WHERE id = ?", (section_id,)
+            ).fetchone()
+            hits.append(SearchHit(path, heading, line, round(score, 4), make_snippet(body, term_set) or heading))
+        return hits
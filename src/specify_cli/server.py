@@ -0,0 +1,479 @@
+"""
+Long-running template server for Specify CLI.
+
+Backs ``specify serve``: one warm process answers project init/upgrade requests, so
+scaffolding services pay for interpreter startup, imports and the TLS context once.
+The server keeps a pooled ``httpx.AsyncClient``, the latest release JSON (refreshed
+after ``release_ttl`` seconds, and reused while the source is unreachable) and a
+``RenderCache`` of rendered templates. Work runs through ``specify_cli.api``.
+
+Requests are JSON over HTTP/1.1 (one request per connection), on 127.0.0.1 or on a
+Unix socket:
+
+    POST /init      {"project_path": "...", "agent": "claude", "script_type": "sh",
+                     "locale": "en_US", "here": false, "git": true, "offline": false}
+    POST /upgrade   {"project_path": "...", "agent": "claude", "script_type": "sh", "locale": "en_US"}
+    GET  /metrics
+    GET  /health
+
+``/upgrade`` refreshes an existing project's template files, as ``specify init --here
+--force`` does (see docs/upgrade.md). At most ``max_concurrency`` requests run at once;
+others wait, and once ``max_queue`` are waiting new ones are refused with 503.
+
+Requests write into the user's directories, so they are checked before anything runs:
+POST bodies must be ``application/json`` (a cross-site form post cannot send that
+without a CORS preflight), requests carrying an ``Origin`` header (i.e. from a browser)
+are refused, and over HTTP the ``Host`` must be a loopback name (against DNS
+rebinding) and ``Authorization: Bearer <token>`` must match the server's token.
+``root`` restricts project paths to one directory tree. The Unix socket is created
+under a 0o077 umask, so only its owner can connect.
+"""
+
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import statistics
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+
+from specify_cli import api
+from specify_cli.api import InitError, RenderCache
+from specify_cli.cache_manager import cache_dir
+from specify_cli.template_sources import TemplateSource, TemplateSourceError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_RELEASE_TTL = 300.0
+TOKEN_ENV_VAR = "SPECIFY_SERVE_TOKEN"
+TOKEN_FILE_NAME = "serve-token"
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "[::1]", "::1")
+MAX_BODY_SIZE = 1024 * 1024
+# Latencies kept for the percentiles in /metrics
+LATENCY_WINDOW = 1000
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 415: "Unsupported Media Type", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+# HTTP status for an InitError, by the step that failed
+_STEP_STATUS = {"precheck": 409, "fetch": 502, "download": 502}
+
+
+class RequestError(Exception):
+    """A request the server rejects, with the HTTP status to answer with."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class ReleaseCache:
+    """The source's latest release JSON, fetched at most once per ttl seconds."""
+
+    def __init__(self, source: TemplateSource, ttl: float = DEFAULT_RELEASE_TTL):
+        self.source = source
+        self.ttl = ttl
+        self.hits = 0
+        self.refreshes = 0
+        self.stale = 0
+        self.release: Optional[dict] = None
+        self._fetched = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self.release is not None and time.monotonic() - self._fetched < self.ttl
+
+    async def get(self, client: httpx.AsyncClient) -> Optional[dict]:
+        """The cached release, refreshed when older than ttl.
+
+        When the refresh fails the previous release is returned; with none cached yet,
+        None, leaving init_project to fetch (or fall back to the template cache) itself.
+        """
+        if self._fresh():
+            self.hits += 1
+            return self.release
+        # Concurrent requests wait for one refresh instead of each calling the source
+        async with self._lock:
+            if self._fresh():
+                self.hits += 1
+                return self.release
+            try:
+                self.release = await self.source.alatest_release(client)
+            except (TemplateSourceError, httpx.HTTPError):
+                if self.release is not None:
+                    self.stale += 1
+                return self.release
+            self._fetched = time.monotonic()
+            self.refreshes += 1
+            return self.release
+
+
+class Metrics:
+    """Request counters and latencies."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests: Counter[tuple[str, int]] = Counter()
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, endpoint: str, status: int, seconds: float) -> None:
+        self.requests[(endpoint, status)] += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self) -> dict:
+        latencies = sorted(self.latencies)
+        by_endpoint: dict[str, dict[str, int]] = {}
+        for (endpoint, status), count in sorted(self.requests.items()):
+            by_endpoint.setdefault(endpoint, {})[str(status)] = count
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "requests": by_endpoint,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "latency_seconds": {
+                "count": len(latencies),
+                "mean": round(statistics.fmean(latencies), 6) if latencies else None,
+                "p50": round(latencies[int(0.5 * (len(latencies) - 1))], 6) if latencies else None,
+                "p95": round(latencies[int(0.95 * (len(latencies) - 1))], 6) if latencies else None,
+                "max": round(latencies[-1], 6) if latencies else None,
+            },
+        }
+
+
+class SpecifyServer:
+    """Answers init/upgrade requests with shared HTTP connections and warm caches.
+
+    Args:
+        source: Template source every request uses
+        client: HTTP client to share (default: one owned and closed by the server)
+        verify: Verify TLS certificates with the client the server creates
+        max_concurrency: Requests initializing projects at once
+        max_queue: Requests allowed to wait for a slot before 503 is returned
+        release_ttl: Seconds the latest release JSON is reused
+        render_cache_size: Rendered templates (agent × script type × release) kept in memory
+        token: Bearer token requests must present (required to listen over HTTP)
+        root: Directory project paths must lie in; relative paths are taken from it
+    """
+
+    def __init__(
+        self,
+        source: TemplateSource,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        verify: bool = True,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        release_ttl: float = DEFAULT_RELEASE_TTL,
+        render_cache_size: int = 32,
+        token: Optional[str] = None,
+        root: Optional[Path] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.source = source
+        self.token = token
+        self.root = Path(os.path.realpath(root)) if root is not None else None
+        # Set by start(): Host headers are only checked on the TCP listener
+        self.http = False
+        self._owns_client = client is None
+        self.client = client if client is not None else api.create_client(verify)
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.releases = ReleaseCache(source, release_ttl)
+        self.render_cache = RenderCache(render_cache_size)
+        self.metrics = Metrics()
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    async def init(self, params: dict, upgrade: bool = False) -> api.InitResult:
+        """Run one init (or upgrade) request.
+
+        Raises:
+            RequestError: If the request is malformed or the server is saturated
+            InitError: If the project could not be initialized
+        """
+        kwargs = _init_arguments(params, upgrade)
+        kwargs["project_path"] = self._project_path(kwargs["project_path"])
+        if self.metrics.queued >= self.max_queue and self._slots.locked():
+            self.metrics.rejected += 1
+            raise RequestError(f"Server busy ({self.max_concurrency} running, {self.metrics.queued} queued)", 503)
+        self.metrics.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.metrics.queued -= 1
+        self.metrics.in_flight += 1
+        try:
+            release = None if kwargs["offline"] else await self.releases.get(self.client)
+            return await api.init_project(
+                **kwargs, source=self.source, client=self.client, release=release, render_cache=self.render_cache
+            )
+        finally:
+            self.metrics.in_flight -= 1
+            self._slots.release()
+
+    def _project_path(self, value: str) -> str:
+        """value resolved against root; outside root is refused with 403."""
+        if self.root is None:
+            return value
+        path = os.path.realpath(self.root / value)
+        if os.path.commonpath([path, self.root]) != str(self.root):
+            raise RequestError(f"{value} is outside {self.root}", 403)
+        return path
+
+    def check_request(self, method: str, headers: dict[str, str]) -> None:
+        """Refuse browser, non-local and unauthenticated requests before anything runs.
+
+        Raises:
+            RequestError: 403, 401 or 415
+        """
+        if "origin" in headers:
+            raise RequestError("Cross-origin requests are not accepted", 403)
+        if self.http:
+            host = headers.get("host", "")
+            name = host.rsplit(":", 1)[0] if not host.endswith("]") else host
+            if host not in LOCAL_HOSTS and name not in LOCAL_HOSTS:
+                raise RequestError(f"Host {host or '(none)'} is not a loopback name", 403)
+        if self.token is not None:
+            scheme, _, presented = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(presented.strip().encode(), self.token.encode()):
+                raise RequestError("Missing or invalid bearer token", 401)
+        if method == "POST" and headers.get("content-type", "").split(";", 1)[0].strip().lower() != "application/json":
+            raise RequestError("POST bodies must be sent as Content-Type: application/json", 415)
+
+    def stats(self) -> dict:
+        """The /metrics document: request metrics plus release and render cache counters."""
+        release = self.releases.release
+        return {
+            **self.metrics.snapshot(),
+            "max_concurrency": self.max_concurrency,
+            "release": {
+                "tag": release.get("tag_name") if release else None,
+                "hits": self.releases.hits,
+                "refreshes": self.releases.refreshes,
+                "stale": self.releases.stale,
+            },
+            "render_cache": {
+                "entries": len(self.render_cache),
+                "hits": self.render_cache.hits,
+                "misses": self.render_cache.misses,
+            },
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes, headers: Optional[dict[str, str]] = None) -> tuple[int, Any]:
+        """Answer one request: (HTTP status, JSON-serializable payload).
+
+        headers are lower-cased names; see check_request.
+        """
+        try:
+            self.check_request(method, headers or {})
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        routes: dict[str, tuple[str, Callable]] = {
+            "/health": ("GET", lambda _: self._health()),
+            "/metrics": ("GET", lambda _: self._metrics()),
+            "/init": ("POST", lambda params: self._init(params, False)),
+            "/upgrade": ("POST", lambda params: self._init(params, True)),
+        }
+        route = routes.get(path.split("?", 1)[0])
+        if route is None:
+            return 404, {"error": f"No such endpoint: {path}"}
+        if method != route[0]:
+            return 405, {"error": f"{path} expects {route[0]}"}
+        params: dict = {}
+        if route[0] == "POST":
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError as e:
+                return 400, {"error": f"Invalid JSON: {e}"}
+            if not isinstance(params, dict):
+                return 400, {"error": "Expected a JSON object"}
+        try:
+            return 200, await route[1](params)
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        except InitError as e:
+            return _STEP_STATUS.get(e.step, 500), {"error": str(e), "step": e.step}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+
+    async def _health(self) -> dict:
+        return {"status": "ok"}
+
+    async def _metrics(self) -> dict:
+        return self.stats()
+
+    async def _init(self, params: dict, upgrade: bool) -> dict:
+        return (await self.init(params, upgrade)).to_dict()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read one HTTP request from a connection, answer it and close the connection."""
+        started = time.monotonic()
+        endpoint = "-"
+        try:
+            try:
+                method, endpoint, headers, body = await _read_request(reader)
+            except RequestError as e:
+                status, payload = e.status, {"error": str(e)}
+            else:
+                status, payload = await self.dispatch(method, endpoint, body, headers)
+        except Exception as e:  # never let one request take the server down
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+        self.metrics.record(endpoint.split("?", 1)[0], status, time.monotonic() - started)
+        data = json.dumps(payload, indent=2).encode("utf-8") + b"\n"
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\nConnection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("ascii") + data)
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path: Optional[Path] = None) -> asyncio.AbstractServer:
+        """Start listening on host:port, or on a Unix socket only its owner can connect to.
+
+        Raises:
+            ValueError: If listening over HTTP without a token
+        """
+        if socket_path is not None:
+            socket_path = Path(socket_path)
+            if socket_path.is_socket():
+                socket_path.unlink()
+            # The socket is created with owner-only permissions, never briefly open to others
+            umask = os.umask(0o077)
+            try:
+                return await asyncio.start_unix_server(self.handle_connection, path=str(socket_path))
+            finally:
+                os.umask(umask)
+        if not self.token:
+            raise ValueError("A token is required to listen over HTTP")
+        self.http = True
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+
+def _init_arguments(params: dict, upgrade: bool) -> dict:
+    """init_project keyword arguments of a request.
+
+    Raises:
+        RequestError: If a field is missing or has the wrong type
+    """
+    fields = {"project_path": str, "agent": str, "script_type": str, "locale": str}
+    if not upgrade:
+        fields.update({"here": bool, "git": bool, "offline": bool})
+    unknown = sorted(set(params) - set(fields))
+    if unknown:
+        raise RequestError(f"Unknown field(s): {', '.join(unknown)}")
+    for name in ("project_path", "agent"):
+        if not params.get(name):
+            raise RequestError(f"Missing field: {name}")
+    for name, kind in fields.items():
+        if name in params and not isinstance(params[name], kind):
+            raise RequestError(f"Field {name} must be a {'string' if kind is str else 'boolean'}")
+    kwargs = {"offline": False, **params}
+    if upgrade:
+        # Refresh an existing project's template files; its git repository is left alone
+        kwargs.update(here=True, git=False)
+    return kwargs
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str], bytes]:
+    """(method, path, headers with lower-cased names, body) of an HTTP/1.1 request.
+
+    Raises:
+        RequestError: If the request is malformed or its body too large
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise RequestError("Request headers too large", 413) from None
+    except asyncio.IncompleteReadError:
+        raise RequestError("Incomplete request") from None
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise RequestError("Malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestError("Invalid Content-Length") from None
+    if length > MAX_BODY_SIZE:
+        raise RequestError("Request body too large", 413)
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise RequestError("Incomplete request body") from None
+    return parts[0].upper(), parts[1], headers, body
+
+
+def token_path() -> Path:
+    """Where ``specify serve`` writes the token it generates."""
+    return cache_dir() / TOKEN_FILE_NAME
+
+
+def write_token_file(token: str, path: Optional[Path] = None) -> Path:
+    """Write token to a file only the owner can read (default: token_path())."""
+    path = Path(path or token_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token + "\n")
+    os.chmod(path, 0o600)
+    return path
+
+
+def generate_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+async def serve(
+    server: SpecifyServer,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Path] = None,
+    on_ready: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Run server until cancelled, warming the release cache first.
+
+    Args:
+        on_ready: Called with the address once the server accepts requests
+    """
+    listener = await server.start(host, port, socket_path)
+    try:
+        await server.releases.get(server.client)
+        if on_ready:
+            if socket_path is not None:
+                on_ready(f"unix:{socket_path}")
+            else:
+                bound = listener.sockets[0].getsockname()
+                on_ready(f"http://{bound[0]}:{bound[1]}")
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        listener.close()
+        await server.aclose()
+        if socket_path is not None:
+            try:
+                Path(socket_path).unlink()
+            except OSError:
+                pass
@@ -0,0 +1,429 @@
+"""
+Task dependency graph and parallel scheduling for Specify CLI.
+
+Backs ``specify tasks plan``: parses a tasks.md written from ``tasks-template.md`` into a
+DAG and schedules it for N workers with a list-scheduling heuristic. Edges come from:
+
+- Phase ordering: user story phases depend on the last shared phase before them
+  (Setup/Foundational) but not on each other; any later shared phase (Polish) depends on
+  everything before it.
+- Ordering within a phase: a task depends on the task before it, except that a run of
+  consecutive ``[P]`` tasks all depend on whatever preceded the run.
+- File conflicts: tasks that name the same file never run at the same time (the later
+  task ID depends on the earlier one).
+- Explicit dependencies: "depends on T012, T013", "after T004", "requires T001",
+  "blocked by T002".
+
+Completed tasks (``- [x]``) are kept in the graph but not scheduled.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+_TASK_PATTERN = re.compile(r"^\s*[-*]\s+\[( |x|X)\]\s+(T\d+)\b\s*(.*)$")
+_MARKER_PATTERN = re.compile(r"^\[(P|US\d+)\]\s*")
+_PHASE_PATTERN = re.compile(r"^##\s+(.+?)\s*$")
+_STORY_HEADING_PATTERN = re.compile(r"User Story\s+(\d+)", re.IGNORECASE)
+_DEPENDENCY_PATTERN = re.compile(
+    r"(?:depends on|after|requires|blocked by)\s+((?:T\d+)(?:\s*(?:,|and|&)\s*T\d+)*)", re.IGNORECASE
+)
+_TASK_ID_PATTERN = re.compile(r"T\d+")
+_FILE_PATTERN = re.compile(r"(?<![\w/])(?:[\w.\[\]-]+/)+(?:[\w.\[\]-]*[\w\]])?")
+
+
+class TaskGraphError(ValueError):
+    """tasks.md cannot be turned into a valid DAG (e.g. a dependency cycle)."""
+
+
+@dataclass
+class Task:
+    """One checklist item from tasks.md."""
+
+    id: str
+    description: str
+    phase: int
+    phase_title: str
+    story: Optional[str] = None
+    parallel: bool = False
+    done: bool = False
+    line: int = 0
+    files: list[str] = field(default_factory=list)
+    explicit_deps: list[str] = field(default_factory=list)
+    depends_on: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Phase:
+    """A ``##`` section of tasks.md that contains tasks."""
+
+    index: int
+    title: str
+    story: Optional[str] = None
+    tasks: list[Task] = field(default_factory=list)
+
+
+@dataclass
+class Schedule:
+    """A parallel schedule: one list of task IDs per step, plus per-worker assignments.
+
+    ``lower_bound`` is the larger of the critical path and pending tasks / workers; a
+    makespan equal to it is provably optimal, otherwise the schedule may not be.
+    """
+
+    workers: int
+    steps: list[list[str]]
+    assignments: dict[int, list[tuple[str, int]]]  # worker -> [(task id, step)]
+    lower_bound: int = 0
+
+    @property
+    def makespan(self) -> int:
+        return len(self.steps)
+
+    @property
+    def optimal(self) -> bool:
+        return self.makespan == self.lower_bound
+
+
+def extract_files(description: str) -> list[str]:
+    """Return paths (``src/models/user.py``, ``docs/``) mentioned in a task.
+
+    A token counts as a path if its last segment has an extension or it ends with "/",
+    so phrases like "authentication/authorization" are not treated as files.
+    """
+    files = []
+    for match in _FILE_PATTERN.findall(description):
+        path = match.rstrip(".,;:)")
+        if not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+            continue
+        if path not in files:
+            files.append(path)
+    return files
+
+
+def parse_tasks(text: str, strict: bool = True) -> list[Phase]:
+    """Parse tasks.md into phases containing tasks, in file order.
+
+    Args:
+        text: tasks.md content
+        strict: Raise on duplicate task IDs (False keeps every occurrence)
+
+    Raises:
+        TaskGraphError: If a task ID appears twice and strict is True
+    """
+    phases: list[Phase] = []
+    current: Optional[Phase] = None
+    seen: set[str] = set()
+    in_fence = False
+
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        heading = _PHASE_PATTERN.match(line)
+        if heading:
+            story = _STORY_HEADING_PATTERN.search(heading.group(1))
+            current = Phase(index=len(phases), title=heading.group(1), story=f"US{story.group(1)}" if story else None)
+            phases.append(current)
+            continue
+        match = _TASK_PATTERN.match(line)
+        if not match:
+            continue
+        if current is None:
+            current = Phase(index=0, title="Tasks")
+            phases.append(current)
+
+        done, task_id, rest = match.group(1) != " ", match.group(2), match.group(3)
+        if task_id in seen and strict:
+            raise TaskGraphError(f"Duplicate task ID {task_id} on line {number}")
+        seen.add(task_id)
+
+        parallel, story = False, None
+        marker = _MARKER_PATTERN.match(rest)
+        while marker:
+            if marker.group(1) == "P":
+                parallel = True
+            else:
+                story = marker.group(1)
+            rest = rest[marker.end():]
+            marker = _MARKER_PATTERN.match(rest)
+
+        deps = []
+        for dep_match in _DEPENDENCY_PATTERN.finditer(rest):
+            deps.extend(d for d in _TASK_ID_PATTERN.findall(dep_match.group(1)) if d != task_id)
+
+        current.tasks.append(Task(
+            id=task_id,
+            description=rest.strip(),
+            phase=current.index,
+            phase_title=current.title,
+            story=story or current.story,
+            parallel=parallel,
+            done=done,
+            line=number,
+            files=extract_files(rest),
+            explicit_deps=deps,
+        ))
+
+    phases = [phase for phase in phases if phase.tasks]
+    for index, phase in enumerate(phases):
+        phase.index = index
+        if phase.story is None:
+            stories = {task.story for task in phase.tasks}
+            if len(stories) == 1 and None not in stories:
+                phase.story = stories.pop()
+        for task in phase.tasks:
+            task.phase = index
+    return phases
+
+
+def _phase_entry_deps(phases: list[Phase]) -> dict[int, list[str]]:
+    """Return, per phase, the tasks its first tasks must wait for."""
+    entry: dict[int, list[str]] = {}
+    barrier: list[str] = []          # tasks of the last shared (non-story) phase
+    since_barrier: list[str] = []    # all tasks in story phases after that barrier
+    for phase in phases:
+        ids = [task.id for task in phase.tasks]
+        if phase.story:
+            entry[phase.index] = list(barrier)
+            since_barrier.extend(ids)
+        else:
+            entry[phase.index] = since_barrier or list(barrier)
+            barrier, since_barrier = ids, []
+    return entry
+
+
+def build_graph(phases: list[Phase]) -> dict[str, Task]:
+    """Fill in ``depends_on`` for every task and return tasks by ID in file order.
+
+    Dependencies are reduced to the tasks that actually gate each task (the exit tasks
+    of the preceding group rather than every earlier task).
+
+    Raises:
+        TaskGraphError: If an explicit dependency names an unknown task or the graph has a cycle
+    """
+    tasks = {task.id: task for phase in phases for task in phase.tasks}
+    deps: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+
+    def add(task_id: str, dep: str) -> None:
+        if dep != task_id and dep not in deps[task_id]:
+            deps[task_id].append(dep)
+
+    entry = _phase_entry_deps(phases)
+    for phase in phases:
+        # Exit tasks of the preceding phase only: nothing in a phase starts before they finish
+        previous_group = _exits(entry[phase.index], tasks)
+        current_group: list[str] = []
+        current_parallel = False
+        for task in phase.tasks:
+            if task.parallel and current_parallel:
+                current_group.append(task.id)
+            else:
+                if current_group:
+                    previous_group = current_group
+                current_group = [task.id]
+                current_parallel = task.parallel
+            for dep in previous_group:
+                add(task.id, dep)
+
+    for task in tasks.values():
+        for dep in task.explicit_deps:
+            if dep not in tasks:
+                raise TaskGraphError(f"{task.id} depends on unknown task {dep}")
+            add(task.id, dep)
+
+    for task_id, task in tasks.items():
+        task.depends_on = deps[task_id]
+    order = topological_order(tasks)  # raises on cycles
+
+    # Serialize tasks that touch the same file in dependency order (file order otherwise),
+    # so an explicit "after T002" on an earlier line is followed rather than contradicted;
+    # edges along one topological order cannot close a cycle
+    last_writer: dict[str, str] = {}
+    for task_id in order:
+        for path in tasks[task_id].files:
+            if path in last_writer:
+                add(task_id, last_writer[path])
+            last_writer[path] = task_id
+    return tasks
+
+
+def _exits(candidates: list[str], tasks: dict[str, Task]) -> list[str]:
+    """Reduce a list of gating tasks to the last group of each phase they belong to."""
+    if not candidates:
+        return []
+    by_phase: dict[int, list[str]] = {}
+    for task_id in candidates:
+        by_phase.setdefault(tasks[task_id].phase, []).append(task_id)
+    exits = []
+    for ids in by_phase.values():
+        # Trailing [P] run (or the single last task) of that phase
+        group = [ids[-1]]
+        if tasks[ids[-1]].parallel:
+            for task_id in reversed(ids[:-1]):
+                if not tasks[task_id].parallel:
+                    break
+                group.insert(0, task_id)
+        exits.extend(group)
+    return exits
+
+
+def topological_order(tasks: dict[str, Task]) -> list[str]:
+    """Return task IDs in dependency order (ties broken by file order).
+
+    Raises:
+        TaskGraphError: If the dependencies contain a cycle
+    """
+    position = {task_id: i for i, task_id in enumerate(tasks)}
+    remaining = {task_id: len(task.depends_on) for task_id, task in tasks.items()}
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+    for task_id, task in tasks.items():
+        for dep in task.depends_on:
+            dependents[dep].append(task_id)
+
+    ready = sorted((t for t, n in remaining.items() if n == 0), key=position.get)
+    order = []
+    while ready:
+        task_id = ready.pop(0)
+        order.append(task_id)
+        for dependent in dependents[task_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+        ready.sort(key=position.get)
+    if len(order) != len(tasks):
+        cyclic = sorted((t for t, n in remaining.items() if n > 0), key=position.get)
+        raise TaskGraphError(f"Dependency cycle among tasks: {', '.join(cyclic)}")
+    return order
+
+
+def _levels(tasks: dict[str, Task], pending: set[str]) -> dict[str, int]:
+    """Length (in tasks) of the longest pending chain starting at each pending task."""
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+    for task_id, task in tasks.items():
+        for dep in task.depends_on:
+            dependents[dep].append(task_id)
+    levels: dict[str, int] = {}
+    for task_id in reversed(topological_order(tasks)):
+        if task_id in pending:
+            levels[task_id] = 1 + max((levels[d] for d in dependents[task_id] if d in pending), default=0)
+    return levels
+
+
+def critical_path(tasks: dict[str, Task]) -> list[str]:
+    """Return the longest chain of pending (not done) tasks, each task counting as one unit."""
+    pending = {task_id for task_id, task in tasks.items() if not task.done}
+    levels = _levels(tasks, pending)
+    if not levels:
+        return []
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+    for task_id, task in tasks.items():
+        for dep in task.depends_on:
+            dependents[dep].append(task_id)
+
+    position = {task_id: i for i, task_id in enumerate(tasks)}
+    current = max(levels, key=lambda t: (levels[t], -position[t]))
+    path = [current]
+    while levels[current] > 1:
+        current = max(
+            (d for d in dependents[current] if d in pending and levels[d] == levels[current] - 1),
+            key=lambda t: -position[t],
+        )
+        path.append(current)
+    return path
+
+
+def schedule(tasks: dict[str, Task], workers: int) -> Schedule:
+    """Schedule pending tasks on ``workers`` workers in unit-time steps.
+
+    A heuristic, not an exact solver: highest-level-first list scheduling (Hu's
+    algorithm) runs the ready tasks with the longest remaining chain first. That is
+    optimal for unit tasks only when dependencies form an in-forest; general task DAGs
+    get within a factor of two. ``Schedule.optimal`` tells whether this plan met the
+    lower bound and is therefore optimal after all.
+
+    Raises:
+        ValueError: If workers < 1
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    pending = {task_id for task_id, task in tasks.items() if not task.done}
+    levels = _levels(tasks, pending)
+    position = {task_id: i for i, task_id in enumerate(tasks)}
+    remaining = {
+        task_id: sum(1 for dep in tasks[task_id].depends_on if dep in pending)
+        for task_id in pending
+    }
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in tasks}
+    for task_id in pending:
+        for dep in tasks[task_id].depends_on:
+            if dep in pending:
+                dependents[dep].append(task_id)
+
+    ready = [task_id for task_id in pending if remaining[task_id] == 0]
+    steps: list[list[str]] = []
+    assignments: dict[int, list[tuple[str, int]]] = {worker: [] for worker in range(1, workers + 1)}
+    while ready:
+        ready.sort(key=lambda t: (-levels[t], position[t]))
+        batch, ready = ready[:workers], ready[workers:]
+        step = len(steps) + 1
+        for worker, task_id in enumerate(batch, start=1):
+            assignments[worker].append((task_id, step))
+        steps.append(batch)
+        for task_id in batch:
+            for dependent in dependents[task_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+    lower_bound = max(max(levels.values(), default=0), -(-len(pending) // workers))
+    return Schedule(workers=workers, steps=steps, assignments=assignments, lower_bound=lower_bound)
+
+
+def plan_tasks(tasks_path: Path, workers: int = 1) -> dict:
+    """Parse tasks.md, build the DAG and return the JSON-ready plan.
+
+    Raises:
+        TaskGraphError: If tasks.md has duplicate IDs, unknown dependencies or cycles
+    """
+    phases = parse_tasks(Path(tasks_path).read_text(encoding="utf-8"))
+    tasks = build_graph(phases)
+    path = critical_path(tasks)
+    plan = schedule(tasks, workers)
+    return {
+        "tasks_file": str(tasks_path),
+        "workers": workers,
+        "phases": [
+            {"index": phase.index, "title": phase.title, "story": phase.story, "tasks": [t.id for t in phase.tasks]}
+            for phase in phases
+        ],
+        "tasks": [
+            {
+                "id": task.id,
+                "description": task.description,
+                "phase": task.phase,
+                "story": task.story,
+                "parallel": task.parallel,
+                "done": task.done,
+                "line": task.line,
+                "files": task.files,
+                "depends_on": task.depends_on,
+            }
+            for task in tasks.values()
+        ],
+        "critical_path": path,
+        "critical_path_length": len(path),
+        "schedule": {
+            "method": "highest-level-first list scheduling (heuristic)",
+            "makespan": plan.makespan,
+            "lower_bound": plan.lower_bound,
+            "optimal": plan.optimal,
+            "steps": [{"step": i, "tasks": batch} for i, batch in enumerate(plan.steps, start=1)],
+            "workers": [
+                {"worker": worker, "tasks": [{"id": task_id, "step": step} for task_id, step in assigned]}
+                for worker, assigned in plan.assignments.items()
+            ],
+        },
+    }
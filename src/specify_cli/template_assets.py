@@ -0,0 +1,584 @@
+"""
+Client-side template assets for Specify CLI.
+
+Releases may publish a universal asset (``spec-kit-template-universal-<version>.zip``)
+holding the raw command templates and agent rendering rules instead of one archive per
+agent × script type. ``specify init`` downloads it once into the user cache
+(``SPECIFY_CACHE_DIR``, default: the platform cache directory) and renders the
+project files locally, so any agent and script type is served from the same download
+and ``specify init --offline`` needs no network at all.
+
+Releases may instead (or additionally) publish a base-plus-overlay layout: one
+``spec-kit-template-base-<script>-<version>.zip`` per script type, shared by every
+agent and cached once, and a small ``spec-kit-template-overlay-<agent>-<script>-...``
+per variant. The two are merged in memory and written in a single pass.
+
+Where a release publishes ``.tar.xz`` archives they are preferred over zips; a tar.xz
+variant archive is decompressed and extracted while it downloads (``iter_tar_xz``).
+
+``specify prefetch`` fills the cache ahead of time (``prefetch_assets``), including
+per-variant archives, which ``specify init`` then uses in place of a download.
+
+The pipeline steps that do not print anything (asset selection, async downloads,
+localized command overlays, script permissions) live here so both the CLI and the
+library API (``specify_cli.api``) use them.
+"""
+
+import asyncio
+import io
+import json
+import lzma
+import os
+import re
+import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Union
+
+import httpx
+
+from specify_cli import cache_manager, packaging
+from specify_cli.cache_manager import CACHE_DIR_ENV_VAR, cache_dir, templates_dir
+from specify_cli.hashing import file_sha256
+from specify_cli.i18n.core import get_localized_template_index, get_template_roots
+from specify_cli.rendering import AGENT_COMMAND_FORMATS, command_path, render_command
+from specify_cli.template_sources import TemplateSource, TemplateSourceError
+
+# Archive formats in order of preference when a release publishes several
+PREFERRED_FORMATS = ("tar.xz", "zip")
+_TAG_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+# Localized command templates inside a release, optionally below a wrapping directory
+_RELEASE_COMMAND_PATTERN = re.compile(r"^(?:[^/]+/)?\.specify/templates/i18n/(?P<locale>[^/]+)/commands/(?P<name>[^/]+)\.md$")
+
+
+def _find_asset(release_data: dict, name: str) -> Optional[dict]:
+    for asset in release_data.get("assets", []):
+        if asset.get("name") == name:
+            return asset
+    return None
+
+
+def find_universal_asset(release_data: dict) -> Optional[dict]:
+    """Return the universal asset of a GitHub release, if it publishes one."""
+    return _find_asset(release_data, packaging.universal_asset_name(release_data.get("tag_name", "")))
+
+
+def find_layered_assets(release_data: dict, agent: str, script_type: str) -> Optional[tuple[dict, dict]]:
+    """Return the (base, overlay) assets of a release for a variant, if it publishes both.
+
+    tar.xz archives are preferred over zips.
+    """
+    tag = release_data.get("tag_name", "")
+    for fmt in PREFERRED_FORMATS:
+        base = _find_asset(release_data, packaging.base_asset_name(script_type, tag, fmt))
+        overlay = _find_asset(release_data, packaging.overlay_asset_name(agent, script_type, tag, fmt))
+        if base is not None and overlay is not None:
+            return base, overlay
+    return None
+
+
+def find_variant_asset(release_data: dict, agent: str, script_type: str, formats: Iterable[str] = PREFERRED_FORMATS) -> Optional[dict]:
+    """Return a release's per-variant archive for an agent and script type, in the first available format."""
+    pattern = f"spec-kit-template-{agent}-{script_type}"
+    assets = release_data.get("assets", [])
+    for fmt in formats:
+        for asset in assets:
+            if pattern in asset["name"] and asset["name"].endswith(f".{fmt}"):
+                return asset
+    return None
+
+
+def select_template_assets(release_data: dict, agent: str, script_type: str) -> Optional[dict[str, dict]]:
+    """Assets a project for the agent and script type is built from, keyed by CachedTemplate field.
+
+    Returns ``{"universal": ...}``, ``{"base": ..., "overlay": ...}`` or ``{"variant": ...}``,
+    in that order of preference, or None if the release serves neither.
+    """
+    universal = find_universal_asset(release_data)
+    if universal is not None:
+        return {"universal": universal}
+    layers = find_layered_assets(release_data, agent, script_type)
+    if layers is not None:
+        return {"base": layers[0], "overlay": layers[1]}
+    variant = find_variant_asset(release_data, agent, script_type)
+    return {"variant": variant} if variant is not None else None
+
+
+def cached_asset_path(tag: str, name: str) -> Path:
+    """Where release asset name of tag is cached."""
+    return templates_dir() / tag / name
+
+
+def cached_universal_path(tag: str) -> Path:
+    """Where the universal asset of release tag is cached."""
+    return cached_asset_path(tag, packaging.universal_asset_name(tag))
+
+
+@dataclass
+class CachedTemplate:
+    """A release's template in the local cache: a universal asset, a base plus overlay,
+    or one variant's archive."""
+
+    tag: str
+    universal: Optional[Path] = None
+    base: Optional[Path] = None
+    overlay: Optional[Path] = None
+    variant: Optional[Path] = None
+
+    def render(self, agent: str, script_type: str) -> dict[str, bytes]:
+        """Return {project path: content} for the agent and script type."""
+        if self.universal is not None:
+            return render_project_files(self.universal, agent, script_type)
+        if self.variant is not None:
+            return packaging.read_archive(self.variant)
+        return merge_layers(self.base, self.overlay)
+
+
+def latest_cached_template(agent: str, script_type: str) -> Optional[CachedTemplate]:
+    """Return the newest cached release usable for the agent and script type, if any.
+
+    A cached universal asset serves every variant; otherwise both the script type's base
+    and the variant's overlay, or the variant's own archive, must be cached. The files
+    returned are counted as cache hits.
+    """
+    try:
+        tags = [entry.name for entry in os.scandir(templates_dir()) if _TAG_PATTERN.match(entry.name)]
+    except OSError:
+        return None
+    for tag in sorted(tags, key=lambda t: tuple(int(n) for n in _TAG_PATTERN.match(t).groups()), reverse=True):
+        template = _cached_template(tag, agent, script_type)
+        if template is not None:
+            for path in (template.universal, template.base, template.overlay, template.variant):
+                if path is not None:
+                    cache_manager.record_hit(path)
+            return template
+    return None
+
+
+def _cached_template(tag: str, agent: str, script_type: str) -> Optional[CachedTemplate]:
+    universal = cached_universal_path(tag)
+    if universal.is_file():
+        return CachedTemplate(tag, universal=universal)
+    for fmt in PREFERRED_FORMATS:
+        base = cached_asset_path(tag, packaging.base_asset_name(script_type, tag, fmt))
+        overlay = cached_asset_path(tag, packaging.overlay_asset_name(agent, script_type, tag, fmt))
+        if base.is_file() and overlay.is_file():
+            return CachedTemplate(tag, base=base, overlay=overlay)
+    for fmt in PREFERRED_FORMATS:
+        variant = cached_asset_path(tag, packaging.asset_name(agent, script_type, tag, fmt))
+        if variant.is_file():
+            return CachedTemplate(tag, variant=variant)
+    return None
+
+
+def download_asset(
+    asset: dict,
+    tag: str,
+    client: httpx.Client,
+    source: Optional[TemplateSource] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> tuple[Path, bool]:
+    """Return the cached copy of a release asset, downloading it first if needed.
+
+    The download is written to a temporary file and renamed into place, so an
+    interrupted download never leaves a truncated archive in the cache. Hits and
+    misses are counted, and a download that takes the cache over its size limit
+    prunes it (see cache_manager).
+
+    Args:
+        asset: Release asset entry (``name``, ``size``, ``browser_download_url``)
+        tag: Release tag the asset belongs to
+        client: HTTP client to download with
+        source: Template source the asset comes from (default: plain HTTP/file URLs)
+        on_progress: Called with (bytes downloaded, total bytes or 0)
+
+    Returns:
+        (path, whether it was already cached)
+
+    Raises:
+        TemplateSourceError: If the download fails
+    """
+    path = cached_asset_path(tag, asset["name"])
+    if _is_cached(path, asset):
+        cache_manager.record_hit(path)
+        return path, True
+
+    source = source or TemplateSource()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with source.stream_asset(asset, client) as chunks:
+                total = asset.get("size") or 0
+                downloaded = 0
+                for chunk in chunks:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if on_progress:
+                        on_progress(downloaded, total)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    cache_manager.record_miss(path)
+    cache_manager.maybe_prune()
+    return path, False
+
+
+async def adownload_asset(
+    asset: dict,
+    tag: str,
+    client: httpx.AsyncClient,
+    source: Optional[TemplateSource] = None,
+) -> tuple[Path, bool]:
+    """Async download_asset: the body is streamed with client, file writes and cache
+    bookkeeping run in worker threads so the event loop is never blocked on disk.
+
+    Returns:
+        (path, whether it was already cached)
+
+    Raises:
+        TemplateSourceError: If the download fails
+    """
+    path = cached_asset_path(tag, asset["name"])
+    if await asyncio.to_thread(_is_cached, path, asset):
+        await asyncio.to_thread(cache_manager.record_hit, path)
+        return path, True
+
+    source = source or TemplateSource()
+    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            async with source.astream_asset(asset, client) as chunks:
+                async for chunk in chunks:
+                    await asyncio.to_thread(f.write, chunk)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    await asyncio.to_thread(cache_manager.record_miss, path)
+    await asyncio.to_thread(cache_manager.maybe_prune)
+    return path, False
+
+
+def _is_cached(path: Path, asset: dict) -> bool:
+    return path.is_file() and (not asset.get("size") or path.stat().st_size == asset["size"])
+
+
+def select_prefetch_assets(release_data: dict, agents: Iterable[str], script_types: Iterable[str]) -> list[dict]:
+    """Assets ``specify init`` needs for every agent and script type, each listed once.
+
+    A universal asset covers every variant; otherwise each variant needs its base and
+    overlay, or else its own archive. Variants the release does not publish are skipped.
+    """
+    universal = find_universal_asset(release_data)
+    if universal is not None:
+        return [universal]
+    selected: dict[str, dict] = {}
+    for agent in agents:
+        for script_type in script_types:
+            layers = find_layered_assets(release_data, agent, script_type)
+            variant_assets = layers if layers is not None else [find_variant_asset(release_data, agent, script_type)]
+            for asset in variant_assets:
+                if asset is not None:
+                    selected.setdefault(asset["name"], asset)
+    return list(selected.values())
+
+
+def expected_sha256(release_data: dict, asset: dict, client: httpx.Client, source: Optional[TemplateSource] = None) -> Optional[str]:
+    """The SHA-256 a release publishes for an asset, if any.
+
+    GitHub's ``digest`` field (``sha256:<hex>``) is used when present, else the
+    ``sha256`` of the asset's manifest (``<asset name>.manifest.json``) in the same release.
+
+    Raises:
+        TemplateSourceError: If the manifest cannot be read
+    """
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:"):]
+    manifest = _find_asset(release_data, packaging.manifest_name(asset["name"]))
+    if manifest is None:
+        return None
+    with (source or TemplateSource()).stream_asset(manifest, client) as chunks:
+        data = b"".join(chunks)
+    try:
+        return json.loads(data)["sha256"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise TemplateSourceError(f"Unreadable manifest {manifest['name']}: {e}") from e
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of prefetching one asset; ``verified`` is None when no digest is published."""
+
+    name: str
+    size: int
+    path: Optional[Path] = None
+    cached: bool = False
+    verified: Optional[bool] = None
+    error: Optional[str] = None
+
+
+def prefetch_assets(
+    release_data: dict,
+    assets: list[dict],
+    client: httpx.Client,
+    source: Optional[TemplateSource] = None,
+    jobs: int = 8,
+) -> list[PrefetchResult]:
+    """Download assets into the cache in parallel and check them against published digests.
+
+    Assets already cached are verified too; one that does not match its digest is
+    removed from the cache and reported as an error.
+    """
+    tag = release_data.get("tag_name", "")
+
+    def fetch(asset: dict) -> PrefetchResult:
+        result = PrefetchResult(asset["name"], asset.get("size") or 0)
+        try:
+            result.path, result.cached = download_asset(asset, tag, client, source=source)
+            expected = expected_sha256(release_data, asset, client, source)
+            if expected is not None:
+                result.verified = file_sha256(result.path) == expected
+                if not result.verified:
+                    result.path.unlink(missing_ok=True)
+                    result.error = f"SHA-256 mismatch (expected {expected}); removed from the cache"
+        except (TemplateSourceError, httpx.HTTPError, OSError) as e:
+            result.error = str(e)
+        return result
+
+    if not assets:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(assets)))) as pool:
+        return list(pool.map(fetch, assets))
+
+
+def merge_layers(base_path: Path, overlay_path: Path) -> dict[str, bytes]:
+    """Return {project path: content} of a base archive with an overlay archive on top."""
+    files = packaging.read_archive(base_path)
+    files.update(packaging.read_archive(overlay_path))
+    return files
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (e.g. an HTTP response body)."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _decompress_xz(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress an xz stream chunk by chunk.
+
+    Raises:
+        tarfile.ReadError: If the stream ends before the xz end marker; tarfile alone
+            accepts an archive cut off at a block boundary as complete
+    """
+    decompressor = lzma.LZMADecompressor(lzma.FORMAT_XZ)
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    if not decompressor.eof:
+        raise tarfile.ReadError("unexpected end of data")
+
+
+def iter_tar_xz(chunks: Iterable[bytes]) -> Iterator[tuple[str, bytes]]:
+    """Yield (path, content) for each regular file of a tar.xz stream as it is decompressed.
+
+    chunks is consumed lazily, so with an HTTP response body the download, xz
+    decompression and whatever the caller does with each member overlap. A truncated
+    stream raises tarfile.ReadError once it is exhausted.
+    """
+    decompressed = _decompress_xz(chunks)
+    with tarfile.open(fileobj=io.BufferedReader(_ChunkReader(decompressed), 65536), mode="r|") as archive:
+        for member in archive:
+            if member.isfile():
+                yield member.name, archive.extractfile(member).read()
+    # tarfile stops at the end-of-archive blocks; the rest of the stream must still arrive
+    for _ in decompressed:
+        pass
+
+
+def render_project_files(archive_path: Path, agent: str, script_type: str) -> dict[str, bytes]:
+    """Render the project files for an agent and script type from a universal asset.
+
+    Raises:
+        ValueError: If the archive is not a supported universal asset, or the agent or
+            script type is not defined by it
+    """
+    source = packaging.load_universal(archive_path)
+    return {path: entry.content for path, entry in packaging.variant_files(source, agent, script_type).items()}
+
+
+def write_project_files(
+    files: Union[Mapping[str, bytes], Iterable[tuple[str, bytes]]],
+    dest: Path,
+    overlay: Optional[dict[str, bytes]] = None,
+) -> tuple[int, int]:
+    """Write files under dest, using overlay content in place of matching paths.
+
+    Args:
+        files: {path: content}, or (path, content) pairs written as they are produced
+        dest: Project directory
+        overlay: Replacement content by path (e.g. localized commands)
+
+    Returns:
+        (files written, files whose content came from overlay)
+
+    Raises:
+        ValueError: If a path would escape dest
+    """
+    dest = Path(dest)
+    items = sorted(files.items()) if isinstance(files, Mapping) else files
+    written = replaced = 0
+    for rel_path, content in items:
+        parts = Path(rel_path).parts
+        if Path(rel_path).is_absolute() or ".." in parts:
+            raise ValueError(f"Refusing to write outside the project: {rel_path}")
+        if overlay and rel_path in overlay:
+            content = overlay[rel_path]
+            replaced += 1
+        target = dest / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        written += 1
+    return written, replaced
+
+
+def merge_json(base: dict, update: dict) -> dict:
+    """Deep-merge update into a copy of base: nested dicts are merged, other values replaced."""
+    result = base.copy()
+    for key, value in update.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = merge_json(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def release_localized_commands(release_files: Mapping[str, bytes], locale: str) -> dict[str, str]:
+    """Localized command templates shipped in a release, keyed by command name.
+
+    Args:
+        release_files: Archive member paths (project-relative, or below a single
+            wrapping directory) to their content; other members are ignored
+        locale: Target locale (e.g., 'zh_CN')
+    """
+    commands: dict[str, str] = {}
+    for path, content in release_files.items():
+        match = _RELEASE_COMMAND_PATTERN.match(path[2:] if path.startswith("./") else path)
+        if match and match["locale"] == locale:
+            commands[match["name"]] = content.decode("utf-8")
+    return commands
+
+
+def shipped_localized_commands(locale: str) -> dict[str, str]:
+    """Localized command templates shipped with the CLI, keyed by command name."""
+    for templates_root in get_template_roots():
+        commands = {
+            template_file.stem: template_file.read_text(encoding="utf-8")
+            for name, template_file in get_localized_template_index(locale, templates_root).items()
+            if name.startswith("commands/") and name.count("/") == 1 and template_file.suffix == ".md"
+        }
+        if commands:
+            return commands
+    return {}
+
+
+def build_localized_overlay(locale: str, agent: str, script_type: str, release_files: Optional[Mapping[str, bytes]] = None) -> dict[str, bytes]:
+    """Render localized command templates for an agent, keyed by project-relative path.
+
+    The result is passed to the extractor so localized commands are written in place of
+    the English archive members in a single pass (including TOML agents such as Gemini/Qwen).
+
+    The templates come from the release being installed (its ``.specify/templates/i18n``
+    copy) so they match its English commands; the copies shipped with the CLI are only
+    used when the release has none for the locale.
+
+    Args:
+        locale: Target locale (e.g., 'zh_CN')
+        agent: Selected AI assistant (e.g., 'claude', 'gemini')
+        script_type: Script variant the commands should reference ('sh' or 'ps')
+        release_files: Files of the downloaded release (see release_localized_commands)
+
+    Returns:
+        Mapping of command file path (e.g. '.claude/commands/speckit.plan.md') to rendered bytes
+    """
+    if locale == "en_US" or agent not in AGENT_COMMAND_FORMATS:
+        return {}
+
+    commands = release_localized_commands(release_files, locale) if release_files else {}
+    if not commands:
+        commands = shipped_localized_commands(locale)
+    return {
+        command_path(name, agent): render_command(template, agent, script_type).encode("utf-8")
+        for name, template in sorted(commands.items())
+    }
+
+
+def make_scripts_executable(project_path: Path) -> tuple[int, list[str]]:
+    """Add execute bits to the POSIX .sh scripts (with a shebang) under .specify/scripts.
+
+    Execute bits follow the read bits, as ``chmod +x`` would. A no-op on Windows.
+
+    Returns:
+        (scripts updated, "<path>: <error>" for each script that could not be updated)
+    """
+    scripts_root = Path(project_path) / ".specify" / "scripts"
+    if os.name == "nt" or not scripts_root.is_dir():
+        return 0, []
+    failures: list[str] = []
+    updated = 0
+    for script in scripts_root.rglob("*.sh"):
+        try:
+            if script.is_symlink() or not script.is_file():
+                continue
+            try:
+                with script.open("rb") as f:
+                    if f.read(2) != b"#!":
+                        continue
+            except Exception:
+                continue
+            mode = script.stat().st_mode
+            if mode & 0o111:
+                continue
+            new_mode = mode
+            if mode & 0o400:
+                new_mode |= 0o100
+            if mode & 0o040:
+                new_mode |= 0o010
+            if mode & 0o004:
+                new_mode |= 0o001
+            if not (new_mode & 0o100):
+                new_mode |= 0o100
+            os.chmod(script, new_mode)
+            updated += 1
+        except Exception as e:
+            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+    return updated, failures
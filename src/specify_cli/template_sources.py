@@ -0,0 +1,750 @@
+"""
+Template sources for Specify CLI.
+
+``specify init`` reads release metadata and downloads template assets through a
+``TemplateSource``. Every source answers with GitHub-style release JSON
+(``{"tag_name", "assets": [{"name", "size", "browser_download_url"}]}``), so asset
+selection, caching and extraction do not depend on where templates come from.
+
+A source is chosen with ``specify init --template-source``, else the
+``SPECIFY_TEMPLATE_SOURCE`` environment variable, else ``template_source`` in the
+user config file (``config.json`` in the platform config directory, or
+``SPECIFY_CONFIG``), else GitHub. Accepted values:
+
+- ``github`` or ``github:<owner>/<repo>``: the GitHub releases API (default)
+- ``http(s)://host/path``: a mirror serving ``index.json`` (written by
+  ``specify dev package``) next to the assets
+- ``file:///path/to/dir`` or a directory path: release assets in a local directory
+- ``file:///path/to/asset.zip`` or a path to a ``.zip``/``.tar.xz``: one local archive
+
+Several comma-separated specs (or a list in the config file) are raced against each
+other by ``MultiSource``, with per-source latency kept in ``source-stats.json`` in the
+template cache so the fastest mirrors are tried first next time.
+
+Every source also has async counterparts (``alatest_release``, ``astream_asset``)
+taking an ``httpx.AsyncClient``, used by the library API (``specify_cli.api``).
+"""
+
+import asyncio
+import json
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator, Optional
+from urllib.parse import unquote, urljoin, urlparse
+
+import httpx
+from platformdirs import user_config_dir
+
+from specify_cli import github_api
+from specify_cli.locking import FileLock
+
+SOURCE_ENV_VAR = "SPECIFY_TEMPLATE_SOURCE"
+CONFIG_ENV_VAR = "SPECIFY_CONFIG"
+CONFIG_KEY = "template_source"
+INDEX_NAME = "index.json"
+DEFAULT_REPO = "rothcold/spec-kit"
+CHUNK_SIZE = 65536
+FALLBACK_ENV_VAR = "SPECIFY_SOURCE_FALLBACK"
+STATS_NAME = "source-stats.json"
+# How many candidate sources a download is raced across at once
+RACE_WIDTH = 2
+# Weight of the newest observation in a source's moving-average latency
+LATENCY_WEIGHT = 0.3
+# Seconds added to a source's score per consecutive failure
+FAILURE_PENALTY = 10.0
+# Seconds the other sources get to answer after the first release answer
+RELEASE_WINDOW = 0.25
+
+_ASSET_PATTERN = re.compile(r"^spec-kit-template-.+-(v\d+\.\d+\.\d+)\.(zip|tar\.xz)$")
+
+
+class TemplateSourceError(Exception):
+    """A template source could not be read; ``status_code`` is set for HTTP errors."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimitedError(TemplateSourceError):
+    """The shared GitHub API budget is spent until ``reset`` (epoch seconds)."""
+
+    def __init__(self, message: str, reset: float):
+        super().__init__(message, 429)
+        self.reset = reset
+
+
+class TemplateSource:
+    """Where release metadata and template assets come from.
+
+    Subclasses implement ``latest_release``; assets with ``file://`` or HTTP(S) URLs are
+    streamed by ``stream_asset`` with the source's request headers.
+    """
+
+    name = "generic"
+
+    def headers(self) -> dict:
+        return {}
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        """Return GitHub-style release JSON for the latest templates.
+
+        Raises:
+            TemplateSourceError: If the metadata cannot be read
+        """
+        raise NotImplementedError
+
+    def error_message(self, status_code: int, headers: httpx.Headers, url: str) -> str:
+        return f"{self.name} returned HTTP {status_code} for {url}"
+
+    @contextmanager
+    def stream_asset(
+        self, asset: dict, client: httpx.Client, chunk_size: int = CHUNK_SIZE, offset: int = 0
+    ) -> Iterator[Iterator[bytes]]:
+        """Open an asset and yield an iterator over its bytes, starting at byte offset.
+
+        HTTP downloads from an offset ask for a range; a server that ignores it is
+        read from the start and the first offset bytes are dropped.
+
+        Raises:
+            TemplateSourceError: If the asset cannot be read
+        """
+        url = asset["browser_download_url"]
+        if url.startswith("file:"):
+            path = file_url_path(url)
+            try:
+                f = open(path, "rb")
+            except OSError as e:
+                raise TemplateSourceError(f"Cannot read {path}: {e}") from e
+            with f:
+                f.seek(offset)
+                yield iter(partial(f.read, chunk_size), b"")
+            return
+
+        headers = dict(self.headers())
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        with client.stream("GET", url, timeout=60, follow_redirects=True, headers=headers) as response:
+            if response.status_code == 206 and offset:
+                yield response.iter_bytes(chunk_size)
+            elif response.status_code == 200:
+                chunks = response.iter_bytes(chunk_size)
+                yield _skip_bytes(chunks, offset) if offset else chunks
+            else:
+                raise TemplateSourceError(self.error_message(response.status_code, response.headers, url), response.status_code)
+
+    async def alatest_release(self, client: httpx.AsyncClient) -> dict:
+        """Async latest_release. Local sources are read in a worker thread; HTTP sources override this."""
+        return await asyncio.to_thread(self.latest_release, None)
+
+    @asynccontextmanager
+    async def astream_asset(
+        self, asset: dict, client: httpx.AsyncClient, chunk_size: int = CHUNK_SIZE, offset: int = 0
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Async stream_asset: yields an async iterator over the asset's bytes.
+
+        Raises:
+            TemplateSourceError: If the asset cannot be read
+        """
+        url = asset["browser_download_url"]
+        if url.startswith("file:"):
+            path = file_url_path(url)
+            try:
+                f = open(path, "rb")
+            except OSError as e:
+                raise TemplateSourceError(f"Cannot read {path}: {e}") from e
+
+            async def read() -> AsyncIterator[bytes]:
+                while chunk := await asyncio.to_thread(f.read, chunk_size):
+                    yield chunk
+
+            with f:
+                f.seek(offset)
+                yield read()
+            return
+
+        headers = dict(self.headers())
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        async with client.stream("GET", url, timeout=60, follow_redirects=True, headers=headers) as response:
+            if response.status_code == 206 and offset:
+                yield response.aiter_bytes(chunk_size)
+            elif response.status_code == 200:
+                chunks = response.aiter_bytes(chunk_size)
+                yield _askip_bytes(chunks, offset) if offset else chunks
+            else:
+                raise TemplateSourceError(self.error_message(response.status_code, response.headers, url), response.status_code)
+
+    def _release_from(self, response: httpx.Response, url: str) -> dict:
+        if response.status_code != 200:
+            raise TemplateSourceError(self.error_message(response.status_code, response.headers, url), response.status_code)
+        return _parse_release(response.text, url)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class GitHubSource(TemplateSource):
+    """The GitHub releases API."""
+
+    def __init__(self, repo: str = DEFAULT_REPO, token: Optional[str] = None):
+        self.repo = repo
+        self.token = token
+        self.name = f"github:{repo}"
+
+    def headers(self) -> dict:
+        return github_api.github_auth_headers(self.token)
+
+    def error_message(self, status_code: int, headers: httpx.Headers, url: str) -> str:
+        return github_api.format_rate_limit_error(status_code, headers, url)
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        """Release JSON from the API, within the host's shared rate-limit budget.
+
+        Raises:
+            RateLimitedError: If the budget is spent and does not reset in time
+            TemplateSourceError: If the request fails
+        """
+        budget = self._reserve()
+        response = client.get(self.url, timeout=30, follow_redirects=True, headers=self.headers())
+        budget.record(response.headers)
+        return self._release_from(response, self.url)
+
+    async def alatest_release(self, client: httpx.AsyncClient) -> dict:
+        budget = await asyncio.to_thread(self._reserve)
+        response = await client.get(self.url, timeout=30, follow_redirects=True, headers=self.headers())
+        await asyncio.to_thread(budget.record, response.headers)
+        return self._release_from(response, self.url)
+
+    @property
+    def url(self) -> str:
+        return f"https://api.github.com/repos/{self.repo}/releases/latest"
+
+    def _reserve(self) -> github_api.RateLimitBudget:
+        try:
+            return github_api.reserve_request(github_api.github_token(self.token))
+        except github_api.RateLimitExceeded as e:
+            raise RateLimitedError(str(e), e.reset) from e
+
+
+class MirrorSource(TemplateSource):
+    """An HTTP(S) server with ``index.json`` and the assets under one base URL."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.name = self.base_url
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        url = urljoin(self.base_url, INDEX_NAME)
+        response = client.get(url, timeout=30, follow_redirects=True, headers=self.headers())
+        return _resolve_urls(self._release_from(response, url), self.base_url)
+
+    async def alatest_release(self, client: httpx.AsyncClient) -> dict:
+        url = urljoin(self.base_url, INDEX_NAME)
+        response = await client.get(url, timeout=30, follow_redirects=True, headers=self.headers())
+        return _resolve_urls(self._release_from(response, url), self.base_url)
+
+
+class DirectorySource(TemplateSource):
+    """Release assets in a local directory (e.g. the ``specify dev package`` output).
+
+    ``index.json`` is used when present; otherwise the newest version among the
+    ``spec-kit-template-*`` archives is offered.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.name = str(self.path)
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        index = self.path / INDEX_NAME
+        if index.is_file():
+            return _resolve_urls(_parse_release(index.read_text(encoding="utf-8"), str(index)), self.path.resolve().as_uri() + "/")
+        if not self.path.is_dir():
+            raise TemplateSourceError(f"Template directory not found: {self.path}")
+
+        by_tag: dict[str, list[Path]] = {}
+        for path in sorted(self.path.iterdir()):
+            match = _ASSET_PATTERN.match(path.name)
+            if match and path.is_file():
+                by_tag.setdefault(match.group(1), []).append(path)
+        if not by_tag:
+            raise TemplateSourceError(f"No spec-kit-template-* archives in {self.path}")
+        tag = max(by_tag, key=_version_key)
+        return {"tag_name": tag, "assets": [_local_asset(path) for path in by_tag[tag]]}
+
+
+class FileSource(TemplateSource):
+    """A single local template archive."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.name = str(self.path)
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        if not self.path.is_file():
+            raise TemplateSourceError(f"Template archive not found: {self.path}")
+        match = _ASSET_PATTERN.match(self.path.name)
+        return {"tag_name": match.group(1) if match else "local", "assets": [_local_asset(self.path)]}
+
+
+class SourceStats:
+    """Per-source latency and failure counts, persisted between runs.
+
+    Latency is a moving average of the time to release metadata or to the first byte
+    of an asset. Each observation is merged into the stats file under a lock, so
+    concurrent runs do not lose each other's updates; the file is advisory and
+    failures to read or write it are ignored.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.sources: dict[str, dict] = self._read() if self.path else {}
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        sources = data.get("sources") if isinstance(data, dict) else None
+        return sources if isinstance(sources, dict) else {}
+
+    @staticmethod
+    def _apply(sources: dict, name: str, seconds: Optional[float]) -> None:
+        entry = sources.setdefault(name, {"latency": None, "successes": 0, "failures": 0, "consecutive_failures": 0})
+        if seconds is None:
+            entry["failures"] = entry.get("failures", 0) + 1
+            entry["consecutive_failures"] = entry.get("consecutive_failures", 0) + 1
+        else:
+            previous = entry.get("latency")
+            entry["latency"] = seconds if previous is None else LATENCY_WEIGHT * seconds + (1 - LATENCY_WEIGHT) * previous
+            entry["successes"] = entry.get("successes", 0) + 1
+            entry["consecutive_failures"] = 0
+        entry["updated"] = time.time()
+
+    def record(self, name: str, seconds: Optional[float]) -> None:
+        """Record a request to source name that succeeded in seconds, or failed (None)."""
+        with self._lock:
+            self._apply(self.sources, name, seconds)
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with FileLock(self.path.with_name(self.path.name + ".lock"), timeout=5.0):
+                    sources = self._read()
+                    self._apply(sources, name, seconds)
+                    fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+                    try:
+                        with os.fdopen(fd, "w", encoding="utf-8") as f:
+                            json.dump({"sources": sources}, f, indent=2, sort_keys=True)
+                        os.replace(tmp_name, self.path)
+                    except BaseException:
+                        os.unlink(tmp_name)
+                        raise
+                self.sources = sources
+            except (OSError, TimeoutError):
+                pass
+
+    def score(self, name: str) -> float:
+        """Lower is better. Sources never tried score 0 so they get measured."""
+        entry = self.sources.get(name)
+        if not entry:
+            return 0.0
+        latency = entry.get("latency")
+        return (FAILURE_PENALTY if latency is None else latency) + FAILURE_PENALTY * entry.get("consecutive_failures", 0)
+
+
+class MultiSource(TemplateSource):
+    """Several sources raced against each other.
+
+    Release metadata is requested from every source at once. Once the first valid answer
+    arrives, the others get ``release_window`` seconds more and the highest tag among the
+    answers wins (the earliest answer on a tie), so a fast but stale mirror cannot pin an
+    old release. Sources still answering after that keep going in the background, and
+    each that reports the same tag becomes a download candidate. A download races the ``race_width`` candidates
+    with the best recorded latency and keeps whichever delivers its first byte first.
+    If that stream fails part-way, the next candidate resumes it from the same byte
+    offset, unless ``fallback`` is off.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[TemplateSource],
+        stats: Optional[SourceStats] = None,
+        race_width: int = RACE_WIDTH,
+        fallback: bool = True,
+        release_window: float = RELEASE_WINDOW,
+    ):
+        self.sources = list(sources)
+        self.stats = stats if stats is not None else SourceStats(stats_path())
+        self.race_width = max(1, race_width)
+        self.fallback = fallback
+        self.release_window = release_window
+        self.name = ", ".join(source.name for source in self.sources)
+        # The source whose metadata was used, and the one the last download came from
+        self.answered_by: Optional[TemplateSource] = None
+        self.downloaded_from: Optional[TemplateSource] = None
+        self._releases: dict[int, dict] = {}
+        self._tag: Optional[str] = None
+        self._pending: list = []
+        self._lock = threading.Lock()
+
+    def latest_release(self, client: httpx.Client) -> dict:
+        results: queue.Queue = queue.Queue()
+        with self._lock:
+            self._releases = {}
+        # Daemon threads: a source still answering must not keep the process alive
+        for index, source in enumerate(self.sources):
+            threading.Thread(target=self._fetch_release, args=(index, source, client, results), daemon=True).start()
+
+        answers, errors = [], []
+        deadline = None
+        for _ in self.sources:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                index, release, error = results.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if release is None:
+                errors.append(f"{self.sources[index].name}: {error}")
+                continue
+            answers.append((index, release))
+            if deadline is None:
+                deadline = time.monotonic() + self.release_window
+        return self._pick_release(answers, errors)
+
+    def _pick_release(self, answers: list[tuple[int, dict]], errors: list[str]) -> dict:
+        """Use the answer with the highest tag, the earliest one on a tie."""
+        if not answers:
+            raise TemplateSourceError("No template source answered:\n" + "\n".join(errors))
+        index, release = max(answers, key=lambda answer: _tag_key(answer[1].get("tag_name")))
+        self.answered_by = self.sources[index]
+        self._tag = release.get("tag_name")
+        return release
+
+    def _fetch_release(self, index: int, source: TemplateSource, client: httpx.Client, results: queue.Queue) -> None:
+        started = time.monotonic()
+        try:
+            release = source.latest_release(client)
+        except RateLimitedError as e:  # not the source's fault: keep its stats clean
+            results.put((index, None, e))
+            return
+        except (TemplateSourceError, httpx.HTTPError) as e:
+            self.stats.record(source.name, None)
+            results.put((index, None, e))
+            return
+        except Exception as e:  # e.g. the client was closed after another source won
+            results.put((index, None, e))
+            return
+        self.stats.record(source.name, time.monotonic() - started)
+        with self._lock:
+            self._releases[index] = release
+        results.put((index, release, None))
+
+    def candidates(self, asset: dict) -> list[tuple[TemplateSource, dict]]:
+        """(source, asset entry) for every source that has answered with the asset, best first."""
+        with self._lock:
+            releases = dict(self._releases)
+        found = []
+        for index, release in sorted(releases.items()):
+            if release.get("tag_name") != self._tag:
+                continue
+            match = next((a for a in release.get("assets", []) if a.get("name") == asset.get("name")), None)
+            if match is not None:
+                found.append((self.sources[index], match))
+        if not found:
+            found = [(self.answered_by or TemplateSource(), asset)]
+        return sorted(found, key=lambda candidate: self.stats.score(candidate[0].name))
+
+    def _open_first(self, candidates: list, client: httpx.Client, chunk_size: int, offset: int) -> tuple:
+        """Race candidates race_width at a time; return (source, stack, chunks, first chunk) of the first to deliver."""
+        errors = []
+        for start in range(0, len(candidates), self.race_width):
+            batch = candidates[start:start + self.race_width]
+            results: queue.Queue = queue.Queue()
+            claim = threading.Lock()
+            winner: list[TemplateSource] = []
+
+            def attempt(source: TemplateSource, asset: dict) -> None:
+                stack = ExitStack()
+                started = time.monotonic()
+                try:
+                    chunks = stack.enter_context(source.stream_asset(asset, client, chunk_size, offset))
+                    first = next(chunks, b"")
+                except Exception as e:
+                    stack.close()
+                    if isinstance(e, (TemplateSourceError, httpx.HTTPError, OSError)):
+                        self.stats.record(source.name, None)
+                    results.put((source, None, e))
+                    return
+                self.stats.record(source.name, time.monotonic() - started)
+                with claim:
+                    won = not winner
+                    if won:
+                        winner.append(source)
+                if won:
+                    results.put((source, (stack, chunks, first), None))
+                else:
+                    stack.close()
+
+            for source, asset in batch:
+                threading.Thread(target=attempt, args=(source, asset), daemon=True).start()
+            for _ in batch:
+                source, opened, error = results.get()
+                if opened is not None:
+                    return (source, *opened)
+                errors.append(f"{source.name}: {error}")
+        raise TemplateSourceError("No template source could serve the asset:\n" + "\n".join(errors))
+
+    @contextmanager
+    def stream_asset(
+        self, asset: dict, client: httpx.Client, chunk_size: int = CHUNK_SIZE, offset: int = 0
+    ) -> Iterator[Iterator[bytes]]:
+        candidates = self.candidates(asset)
+        opened = list(self._open_first(candidates, client, chunk_size, offset))
+        self.downloaded_from = opened[0]
+
+        def generate() -> Iterator[bytes]:
+            source, stack, chunks, first = opened
+            remaining = [candidate for candidate in candidates if candidate[0] is not source]
+            position = offset
+            while True:
+                try:
+                    if first:
+                        position += len(first)
+                        yield first
+                    for chunk in chunks:
+                        position += len(chunk)
+                        yield chunk
+                    return
+                except (TemplateSourceError, httpx.HTTPError, OSError) as e:
+                    self.stats.record(source.name, None)
+                    stack.close()
+                    if not (self.fallback and remaining):
+                        raise TemplateSourceError(f"Download of {asset.get('name')} from {source.name} failed: {e}") from e
+                    opened[:] = self._open_first(remaining, client, chunk_size, position)
+                    source, stack, chunks, first = opened
+                    self.downloaded_from = source
+                    remaining = [candidate for candidate in remaining if candidate[0] is not source]
+
+        try:
+            yield generate()
+        finally:
+            opened[1].close()
+
+    async def alatest_release(self, client: httpx.AsyncClient) -> dict:
+        with self._lock:
+            self._releases = {}
+        # Tasks still answering after the release window keep running and add candidates
+        self._pending = [asyncio.ensure_future(self._afetch_release(i, s, client)) for i, s in enumerate(self.sources)]
+        loop = asyncio.get_running_loop()
+        answers, errors = [], []
+        deadline = None
+        pending = set(self._pending)
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for index, release, error in sorted((task.result() for task in done), key=lambda result: result[0]):
+                if release is None:
+                    errors.append(f"{self.sources[index].name}: {error}")
+                    continue
+                answers.append((index, release))
+                if deadline is None:
+                    deadline = loop.time() + self.release_window
+        return self._pick_release(answers, errors)
+
+    async def _afetch_release(self, index: int, source: TemplateSource, client: httpx.AsyncClient) -> tuple:
+        started = time.monotonic()
+        try:
+            release = await source.alatest_release(client)
+        except RateLimitedError as e:
+            return index, None, e
+        except (TemplateSourceError, httpx.HTTPError) as e:
+            await asyncio.to_thread(self.stats.record, source.name, None)
+            return index, None, e
+        except Exception as e:  # e.g. the client was closed after another source won
+            return index, None, e
+        await asyncio.to_thread(self.stats.record, source.name, time.monotonic() - started)
+        with self._lock:
+            self._releases[index] = release
+        return index, release, None
+
+    @asynccontextmanager
+    async def astream_asset(
+        self, asset: dict, client: httpx.AsyncClient, chunk_size: int = CHUNK_SIZE, offset: int = 0
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Async stream_asset. Candidates are tried one at a time, best recorded latency first,
+        rather than raced; with ``fallback`` a failed stream resumes from the next one."""
+        candidates = self.candidates(asset)
+        stacks = [AsyncExitStack()]
+
+        async def generate() -> AsyncIterator[bytes]:
+            position = offset
+            errors = []
+            for source, candidate in candidates:
+                started = time.monotonic()
+                try:
+                    chunks = await stacks[-1].enter_async_context(source.astream_asset(candidate, client, chunk_size, position))
+                    async for chunk in chunks:
+                        if self.downloaded_from is not source:
+                            self.downloaded_from = source
+                            await asyncio.to_thread(self.stats.record, source.name, time.monotonic() - started)
+                        position += len(chunk)
+                        yield chunk
+                    return
+                except (TemplateSourceError, httpx.HTTPError, OSError) as e:
+                    await asyncio.to_thread(self.stats.record, source.name, None)
+                    await stacks[-1].aclose()
+                    stacks.append(AsyncExitStack())
+                    errors.append(f"{source.name}: {e}")
+                    if position > offset and not self.fallback:
+                        raise TemplateSourceError(f"Download of {asset.get('name')} from {source.name} failed: {e}") from e
+            raise TemplateSourceError("No template source could serve the asset:\n" + "\n".join(errors))
+
+        self.downloaded_from = None
+        try:
+            yield generate()
+        finally:
+            await stacks[-1].aclose()
+
+
+def _skip_bytes(chunks: Iterator[bytes], count: int) -> Iterator[bytes]:
+    for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:]
+        count = 0
+
+
+async def _askip_bytes(chunks: AsyncIterator[bytes], count: int) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:]
+        count = 0
+
+
+def _version_key(tag: str) -> tuple[int, ...]:
+    return tuple(int(n) for n in tag[1:].split("."))
+
+
+def _tag_key(tag: Optional[str]) -> tuple[int, ...]:
+    """Version order of a release tag; tags that are not vX.Y.Z sort first."""
+    try:
+        return _version_key(tag)
+    except (TypeError, ValueError):
+        return ()
+
+
+def _local_asset(path: Path) -> dict:
+    return {"name": path.name, "size": path.stat().st_size, "browser_download_url": path.resolve().as_uri()}
+
+
+def _parse_release(text: str, origin: str) -> dict:
+    try:
+        release = json.loads(text)
+    except ValueError as e:
+        raise TemplateSourceError(f"Failed to parse release JSON from {origin}: {e}\nRaw (truncated 400): {text[:400]}") from e
+    if not isinstance(release, dict) or "tag_name" not in release:
+        raise TemplateSourceError(f"Release JSON from {origin} has no tag_name")
+    return release
+
+
+def _resolve_urls(release: dict, base_url: str) -> dict:
+    """Fill in browser_download_url of index assets, relative to the index location."""
+    assets = []
+    for asset in release.get("assets", []):
+        asset = dict(asset)
+        asset["browser_download_url"] = urljoin(base_url, asset.get("browser_download_url") or asset["name"])
+        assets.append(asset)
+    return {**release, "assets": assets}
+
+
+def file_url_path(url: str) -> Path:
+    """Local path of a ``file://`` URL."""
+    parsed = urlparse(url)
+    path = unquote(parsed.path)
+    if os.name == "nt" and re.match(r"^/[A-Za-z]:", path):
+        path = path[1:]
+    return Path(path)
+
+
+def stats_path() -> Path:
+    """Where per-source latency stats are kept: source-stats.json in the template cache."""
+    from specify_cli.cache_manager import cache_dir  # cache_manager imports this module
+
+    return cache_dir() / STATS_NAME
+
+
+def config_path() -> Path:
+    """User config file (SPECIFY_CONFIG, else config.json in the platform config directory)."""
+    override = os.getenv(CONFIG_ENV_VAR)
+    return Path(override) if override else Path(user_config_dir("specify-cli")) / "config.json"
+
+
+def configured_source_spec(cli_value: Optional[str] = None) -> str:
+    """The source spec in effect: CLI option, environment, config file, then "github"."""
+    if cli_value:
+        return cli_value
+    if os.getenv(SOURCE_ENV_VAR):
+        return os.environ[SOURCE_ENV_VAR]
+    try:
+        config = json.loads(config_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        config = {}
+    value = config.get(CONFIG_KEY) if isinstance(config, dict) else None
+    if isinstance(value, list):
+        value = ",".join(item for item in value if isinstance(item, str))
+    return value if isinstance(value, str) and value else "github"
+
+
+def make_source(spec: str, github_token: Optional[str] = None) -> TemplateSource:
+    """Build a source from a spec string (see the module docstring).
+
+    Comma-separated specs give a ``MultiSource``; mid-stream fallback between its
+    sources is on unless ``SPECIFY_SOURCE_FALLBACK`` is ``0``, ``false`` or ``no``.
+
+    Raises:
+        ValueError: If the spec is not a recognised source
+    """
+    specs = [part.strip() for part in spec.split(",") if part.strip()]
+    if len(specs) > 1:
+        fallback = os.getenv(FALLBACK_ENV_VAR, "1").strip().lower() not in ("0", "false", "no")
+        return MultiSource([make_source(part, github_token) for part in specs], fallback=fallback)
+    spec = specs[0] if specs else "github"
+    if spec == "github":
+        return GitHubSource(token=github_token)
+    if spec.startswith("github:"):
+        repo = spec[len("github:"):]
+        if not re.match(r"^[\w.-]+/[\w.-]+$", repo):
+            raise ValueError(f"Invalid GitHub repository '{repo}' (expected github:<owner>/<repo>)")
+        return GitHubSource(repo, token=github_token)
+    if spec.startswith(("http://", "https://")):
+        return MirrorSource(spec)
+    path = file_url_path(spec) if spec.startswith("file:") else Path(spec).expanduser()
+    if path.name.endswith((".zip", ".tar.xz")):
+        return FileSource(path)
+    if path.is_dir() or spec.startswith("file:"):
+        return DirectorySource(path)
+    raise ValueError(f"Unknown template source '{spec}' (use github, github:<owner>/<repo>, an http(s) URL, a file:// URL or a local path)")
+
+
+def resolve_source(cli_value: Optional[str] = None, github_token: Optional[str] = None) -> TemplateSource:
+    """The configured source (see configured_source_spec).
+
+    Raises:
+        ValueError: If the configured spec is not a recognised source
+    """
+    return make_source(configured_source_spec(cli_value), github_token)
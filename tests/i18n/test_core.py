@@ -13,6 +13,10 @@ from specify_cli.i18n.core import (
     get_template_path,
     SUPPORTED_LANGUAGES,
     detect_terminal_encoding,
+    Catalog,
+    get_catalog,
+    clear_catalog_cache,
+    N_,
 )
 
 
@@ -185,3 +189,57 @@ class TestSupportedLanguages:
             assert len(lang.display_name) > 0
             assert isinstance(lang.plural_forms, str)
             assert "nplurals" in lang.plural_forms
+
+
+class TestCatalogCache:
+    """Test the shared, lazily loaded translation catalogs."""
+    
+    @pytest.fixture
+    def localedir(self, tmp_path):
+        """Compile a small zh_CN catalog into a temporary locale directory."""
+        from babel.messages.catalog import Catalog as BabelCatalog
+        from babel.messages.mofile import write_mo
+        
+        catalog = BabelCatalog(locale="zh_CN")
+        catalog.add("Project ready.", "项目已就绪。")
+        catalog.add(("{count} file", "{count} files"), ("{count} 个文件",))
+        mo_dir = tmp_path / "zh_CN" / "LC_MESSAGES"
+        mo_dir.mkdir(parents=True)
+        with open(mo_dir / "specify.mo", "wb") as f:
+            write_mo(f, catalog)
+        return tmp_path
+    
+    def test_catalog_is_shared_per_locale_chain(self):
+        clear_catalog_cache()
+        assert get_catalog("zh_CN") is get_catalog("zh_CN")
+        assert get_catalog("zh_CN").languages == ("zh_CN", "en_US")
+        assert get_catalog("en_US") is not get_catalog("zh_CN")
+    
+    def test_setup_does_not_load_catalog(self):
+        clear_catalog_cache()
+        setup_i18n(cli_lang="zh_CN")
+        assert not get_catalog("zh_CN").loaded
+    
+    def test_catalog_loads_on_first_lookup(self, localedir):
+        catalog = Catalog(("zh_CN", "en_US"), localedir)
+        assert not catalog.loaded
+        
+        assert catalog.gettext("Project ready.") == "项目已就绪。"
+        assert catalog.loaded
+        assert catalog.gettext("Untranslated") == "Untranslated"
+    
+    def test_catalog_plural_lookup(self, localedir):
+        catalog = Catalog(("zh_CN", "en_US"), localedir)
+        
+        assert catalog.ngettext("{count} file", "{count} files", 1) == "{count} 个文件"
+        assert catalog.ngettext("{count} file", "{count} files", 5) == "{count} 个文件"
+        assert catalog.ngettext("dir", "dirs", 1) == "dir"
+        assert catalog.ngettext("dir", "dirs", 2) == "dirs"
+    
+    def test_missing_catalog_is_identity(self, tmp_path):
+        catalog = Catalog(("zh_CN",), tmp_path)
+        assert catalog.gettext("Project ready.") == "Project ready."
+        assert catalog.ngettext("file", "files", 2) == "files"
+    
+    def test_n_marker_is_identity(self):
+        assert N_("GitHub Spec Kit") == "GitHub Spec Kit"
@@ -4,10 +4,20 @@ Tests for template localization.
 Tests that templates can be localized and placeholders are preserved.
 """
 
+import json
 import os
 import pytest
 from pathlib import Path
-from specify_cli.i18n.core import get_template_path, get_active_locale
+from specify_cli.i18n.core import (
+    get_template_path,
+    get_active_locale,
+    get_localized_template_index,
+    get_template_roots,
+    clear_template_index_cache,
+    scan_localized_templates,
+    write_template_manifest,
+    TEMPLATE_MANIFEST_NAME,
+)
 
 
 class TestTemplateSelection:
@@ -155,3 +165,102 @@ class TestLocaleEnvironment:
         # Warning might be in stdout or stderr depending on implementation
         output = captured.out + captured.err
         assert len(output) > 0  # Some output was produced
+
+
+class TestLocalizedTemplateIndex:
+    """Test the memoized localized template index."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        clear_template_index_cache()
+        yield
+        clear_template_index_cache()
+    
+    def make_templates(self, root: Path) -> Path:
+        commands = root / "i18n" / "zh_CN" / "commands"
+        commands.mkdir(parents=True)
+        (commands / "plan.md").write_text("计划", encoding="utf-8")
+        (root / "i18n" / "zh_CN" / "spec-template.md").write_text("规格", encoding="utf-8")
+        return root
+    
+    def test_shipped_manifest_is_up_to_date(self):
+        """The shipped manifest must list exactly the localized files on disk."""
+        checked = 0
+        for root in get_template_roots():
+            manifest_path = root / "i18n" / TEMPLATE_MANIFEST_NAME
+            if manifest_path.exists():
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                assert manifest == scan_localized_templates(root), "run scripts/i18n/update-template-manifest.sh"
+                checked += 1
+        assert checked, "no shipped templates/i18n/manifest.json found"
+    
+    def test_index_falls_back_to_scan(self, tmp_path):
+        """Without a manifest, the index should come from a directory scan."""
+        root = self.make_templates(tmp_path / "templates")
+        
+        index = get_localized_template_index("zh_CN", root)
+        
+        assert index == {
+            "commands/plan.md": root / "i18n" / "zh_CN" / "commands" / "plan.md",
+            "spec-template.md": root / "i18n" / "zh_CN" / "spec-template.md",
+        }
+        assert get_localized_template_index("en_US", root) == {}
+    
+    def test_index_uses_manifest(self, tmp_path):
+        """The manifest should be trusted over the directory contents."""
+        root = self.make_templates(tmp_path / "templates")
+        (root / "i18n" / TEMPLATE_MANIFEST_NAME).write_text(
+            json.dumps({"zh_CN": ["spec-template.md"]}), encoding="utf-8"
+        )
+        
+        assert list(get_localized_template_index("zh_CN", root)) == ["spec-template.md"]
+    
+    def test_template_missing_from_manifest_is_still_found(self, tmp_path, monkeypatch):
+        """A lookup miss should fall back to the file on disk."""
+        root = self.make_templates(tmp_path / "templates")
+        (root / "i18n" / TEMPLATE_MANIFEST_NAME).write_text(
+            json.dumps({"zh_CN": ["spec-template.md"]}), encoding="utf-8"
+        )
+        monkeypatch.setattr("specify_cli.i18n.core.get_template_roots", lambda: (root,))
+        
+        path = get_template_path("commands/plan.md", locale="zh_CN")
+        
+        assert path == root / "i18n" / "zh_CN" / "commands" / "plan.md"
+        assert "commands/plan.md" in get_localized_template_index("zh_CN", root)
+        assert get_template_path("tasks-template.md", locale="zh_CN") == root / "tasks-template.md"
+    
+    def test_missing_template_is_probed_once(self, tmp_path, monkeypatch):
+        """Repeated misses should be answered from memory, not the filesystem."""
+        root = self.make_templates(tmp_path / "templates")
+        monkeypatch.setattr("specify_cli.i18n.core.get_template_roots", lambda: (root,))
+        get_template_path("tasks-template.md", locale="zh_CN")
+        
+        def no_stat(self):
+            raise AssertionError("filesystem probed again")
+        
+        monkeypatch.setattr(Path, "is_file", no_stat)
+        assert get_template_path("tasks-template.md", locale="zh_CN") == root / "tasks-template.md"
+        assert get_template_path("spec-template.md", locale="zh_CN") == root / "i18n" / "zh_CN" / "spec-template.md"
+    
+    def test_write_manifest_round_trips(self, tmp_path):
+        root = self.make_templates(tmp_path / "templates")
+        
+        manifest_path = write_template_manifest(root)
+        
+        assert json.loads(manifest_path.read_text(encoding="utf-8")) == {
+            "zh_CN": ["commands/plan.md", "spec-template.md"]
+        }
+    
+    def test_index_is_cached(self, tmp_path):
+        """Repeated lookups should not rescan the filesystem."""
+        root = self.make_templates(tmp_path / "templates")
+        first = get_localized_template_index("zh_CN", root)
+        (root / "i18n" / "zh_CN" / "new.md").write_text("新", encoding="utf-8")
+        
+        assert get_localized_template_index("zh_CN", root) is first
+        assert "new.md" in get_localized_template_index("zh_CN", root, use_cache=False)
+    
+    def test_template_path_uses_index(self):
+        """Localized templates listed in the index should be returned for zh_CN."""
+        path = get_template_path("commands/plan.md", locale="zh_CN")
+        assert path.parts[-4:] == ("i18n", "zh_CN", "commands", "plan.md")
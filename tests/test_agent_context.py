@@ -0,0 +1,272 @@
+"""
+Tests for agent context file maintenance.
+
+Tests plan.md parsing, single-pass section updates, target resolution and the
+pure-Python feature path helpers used by ``specify agent-context update``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from specify_cli import agent_context, feature_paths
+
+TEMPLATE = """# [PROJECT NAME] Development Guidelines
+
+Auto-generated from all feature plans. Last updated: [DATE]
+
+## Active Technologies
+
+[EXTRACTED FROM ALL PLAN.MD FILES]
+
+## Project Structure
+
+```text
+[ACTUAL STRUCTURE FROM PLANS]
+```
+
+## Commands
+
+[ONLY COMMANDS FOR ACTIVE TECHNOLOGIES]
+
+## Recent Changes
+
+[LAST 3 FEATURES AND WHAT THEY ADDED]
+"""
+
+EXISTING = """# proj Development Guidelines
+
+**Last updated**: 2024-01-01
+
+## Active Technologies
+- Rust 1.75 (001-a)
+
+## Recent Changes
+- 003-c: Added Go
+- 002-b: Added Rust
+- 001-a: Added Rust 1.75
+
+<!-- MANUAL ADDITIONS START -->
+keep me
+<!-- MANUAL ADDITIONS END -->
+"""
+
+PLAN = """# Implementation Plan
+
+**Language/Version**: Python 3.11
+**Primary Dependencies**: FastAPI
+**Storage**: PostgreSQL
+**Project Type**: web
+**Language/Version**: ignored duplicate
+"""
+
+
+def write_plan(path: Path, content: str = PLAN) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv("SPECIFY_FEATURE", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+
+class TestParsePlan:
+    """Test plan.md field extraction."""
+
+    def test_first_occurrence_wins(self, tmp_path):
+        plan = agent_context.parse_plan(write_plan(tmp_path / "plan.md"))
+        assert plan.language == "Python 3.11"
+        assert plan.framework == "FastAPI"
+        assert plan.database == "PostgreSQL"
+        assert plan.project_type == "web"
+        assert plan.tech_stack == "Python 3.11 + FastAPI"
+
+    def test_unset_values_are_dropped(self, tmp_path):
+        plan = agent_context.parse_plan(write_plan(tmp_path / "plan.md", (
+            "**Language/Version**: NEEDS CLARIFICATION\n"
+            "**Primary Dependencies**: Click\n"
+            "**Storage**: N/A\n"
+        )))
+        assert plan.language == ""
+        assert plan.tech_stack == "Click"
+        assert plan.database == ""
+
+
+class TestUpdateContent:
+    """Test single-pass updates of an existing context file."""
+
+    def test_adds_entries_and_trims_recent_changes(self):
+        plan = agent_context.PlanData(language="Python 3.11", framework="FastAPI", storage="PostgreSQL")
+        updated = agent_context.update_agent_file_content(EXISTING, plan, "005-x", "2025-06-01")
+
+        assert "- Rust 1.75 (001-a)\n- Python 3.11 + FastAPI (005-x)\n- PostgreSQL (005-x)\n" in updated
+        assert "## Recent Changes\n- 005-x: Added Python 3.11 + FastAPI\n- 003-c: Added Go\n- 002-b: Added Rust\n\n" in updated
+        assert "001-a: Added" not in updated
+        assert "**Last updated**: 2025-06-01" in updated
+        assert "keep me" in updated
+
+    def test_existing_technology_is_not_duplicated(self):
+        plan = agent_context.PlanData(language="Rust 1.75")
+        updated = agent_context.update_agent_file_content(EXISTING, plan, "004-d", "2025-06-01")
+        assert updated.count("Rust 1.75 (") == 1
+
+    def test_missing_sections_are_appended(self):
+        plan = agent_context.PlanData(language="Go 1.22")
+        updated = agent_context.update_agent_file_content("# Notes\n", plan, "006-e", "2025-06-01")
+        assert updated.endswith("## Active Technologies\n- Go 1.22 (006-e)\n\n## Recent Changes\n- 006-e: Added Go 1.22\n")
+
+    def test_heading_directly_after_technologies(self):
+        content = "## Active Technologies\n- Rust (001-a)\n## Recent Changes\n- 001-a: Added Rust\n"
+        plan = agent_context.PlanData(language="Go")
+        updated = agent_context.update_agent_file_content(content, plan, "002-b", "2025-06-01")
+        assert updated == (
+            "## Active Technologies\n- Rust (001-a)\n- Go (002-b)\n"
+            "## Recent Changes\n- 002-b: Added Go\n- 001-a: Added Rust\n"
+        )
+
+
+class TestContextBudget:
+    """Test size budgets enforced on every update."""
+
+    def test_duplicate_technologies_keep_newest(self):
+        lines = [
+            "## Active Technologies",
+            "- Python 3.11 (001-a)",
+            "- Rust (002-b)",
+            "- python 3.11 (003-c)",
+        ]
+        assert agent_context.enforce_budget(lines, agent_context.ContextBudget()) == [
+            "## Active Technologies",
+            "- Rust (002-b)",
+            "- python 3.11 (003-c)",
+        ]
+
+    def test_entry_limits_evict_oldest(self):
+        content = (
+            "## Active Technologies\n- A (001)\n- B (002)\n- C (003)\n\n"
+            "## Recent Changes\n- 003: Added C\n- 002: Added B\n"
+        )
+        budget = agent_context.ContextBudget(max_recent_changes=2, max_technologies=2, max_bytes=None)
+        updated = agent_context.update_agent_file_content(content, agent_context.PlanData(language="D"), "004", "2025-06-01", budget)
+        assert updated == (
+            "## Active Technologies\n- C (003)\n- D (004)\n\n"
+            "## Recent Changes\n- 004: Added D\n- 003: Added C\n"
+        )
+
+    def test_entry_limits_evict_oldest_from_the_shipped_template(self):
+        template = (Path(__file__).parent.parent / "templates" / "agent-file-template.md").read_text(encoding="utf-8")
+        content = agent_context.render_new_agent_file(template, agent_context.PlanData(language="Python 3.11"), "proj", "001-a", "2025-06-01")
+        budget = agent_context.ContextBudget(max_technologies=3)
+        for minor in range(2, 7):
+            plan = agent_context.PlanData(language=f"Go 1.{minor}")
+            content = agent_context.update_agent_file_content(content, plan, f"00{minor}-go", "2025-06-01", budget)
+        assert "## Active Technologies\n\n- Go 1.4 (004-go)\n- Go 1.5 (005-go)\n- Go 1.6 (006-go)\n\n## Project Structure" in content
+
+    def test_zero_disables_limits(self):
+        content = "## Recent Changes\n" + "".join(f"- {i:03d}: Added X{i}\n" for i in range(10, 0, -1))
+        budget = agent_context.ContextBudget(max_recent_changes=0, max_technologies=0, max_bytes=0)
+        updated = agent_context.update_agent_file_content(content, agent_context.PlanData(language="Y"), "011", "2025-06-01", budget)
+        assert updated.count("\n- ") == 12  # 10 old changes, the new change and the new technology
+
+    def test_byte_budget_trims_changes_then_technologies(self):
+        lines = ["# Title", "## Active Technologies", *[f"- Tech{i} (00{i})" for i in range(5)],
+                 "## Recent Changes", *[f"- 00{i}: Added Tech{i}" for i in range(4, -1, -1)]]
+        budget = agent_context.ContextBudget(max_recent_changes=None, max_technologies=None, max_bytes=60)
+        trimmed = agent_context.enforce_budget(lines, budget)
+        assert trimmed == ["# Title", "## Active Technologies", "- Tech4 (004)", "## Recent Changes", "- 004: Added Tech4"]
+
+    def test_manual_additions_are_never_evicted(self):
+        lines = [
+            "## Recent Changes", "- 002: Added B", "- 001: Added A",
+            agent_context.MANUAL_ADDITIONS_START, "- my own note", "<!-- MANUAL ADDITIONS END -->",
+        ]
+        trimmed = agent_context.enforce_budget(lines, agent_context.ContextBudget(max_recent_changes=1))
+        assert "- 001: Added A" not in trimmed
+        assert "- my own note" in trimmed
+
+
+class TestUpdateAgentContext:
+    """Test updating context files on disk."""
+
+    def test_creates_default_claude_file_from_template(self, tmp_path):
+        plan_path = write_plan(tmp_path / "specs" / "005-x" / "plan.md")
+        template = tmp_path / "template.md"
+        template.write_text(TEMPLATE, encoding="utf-8")
+
+        plan, results = agent_context.update_agent_context(
+            tmp_path, plan_path, "005-x", template_path=template, today="2025-06-01"
+        )
+
+        assert [(r.path.name, r.action) for r in results] == [("CLAUDE.md", "created")]
+        content = (tmp_path / "CLAUDE.md").read_text(encoding="utf-8")
+        assert content.startswith(f"# {tmp_path.name} Development Guidelines")
+        assert "Last updated: 2025-06-01" in content
+        assert "- Python 3.11 + FastAPI (005-x)" in content
+        assert "backend/\nfrontend/\ntests/" in content
+        assert "cd src && pytest && ruff check ." in content
+        assert "- 005-x: Added Python 3.11 + FastAPI" in content
+
+    def test_shared_agents_file_updated_once(self, tmp_path):
+        plan_path = write_plan(tmp_path / "plan.md")
+        (tmp_path / "AGENTS.md").write_text(EXISTING, encoding="utf-8")
+        (tmp_path / "GEMINI.md").write_text(EXISTING, encoding="utf-8")
+
+        _plan, results = agent_context.update_agent_context(tmp_path, plan_path, "005-x", today="2025-06-01")
+
+        by_name = {r.path.name: r for r in results}
+        assert set(by_name) == {"AGENTS.md", "GEMINI.md"}
+        assert set(by_name["AGENTS.md"].agents) == {"opencode", "codex", "amp", "q", "bob"}
+        assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8").count("005-x: Added") == 1
+
+    def test_unknown_agent_raises(self, tmp_path):
+        with pytest.raises(KeyError):
+            agent_context.resolve_targets(tmp_path, "unknown")
+
+    def test_missing_template_reports_error(self, tmp_path):
+        plan_path = write_plan(tmp_path / "plan.md")
+        _plan, results = agent_context.update_agent_context(tmp_path, plan_path, "005-x", agent="gemini")
+        assert results[0].action == "error"
+        assert not (tmp_path / "GEMINI.md").exists()
+
+
+class TestFeaturePaths:
+    """Test feature resolution without git subprocesses."""
+
+    def test_git_branch_and_prefix_lookup(self, tmp_path):
+        git_dir = tmp_path / ".git"
+        (git_dir / "objects").mkdir(parents=True)
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/004-fix-bug\n", encoding="utf-8")
+        (tmp_path / "specs" / "004-user-auth").mkdir(parents=True)
+
+        paths = feature_paths.get_feature_paths(tmp_path / "specs")
+
+        assert paths.repo_root == tmp_path
+        assert paths.has_git
+        assert paths.current_branch == "004-fix-bug"
+        assert paths.impl_plan == tmp_path / "specs" / "004-user-auth" / "plan.md"
+
+    def test_non_git_uses_latest_spec_dir(self, tmp_path):
+        (tmp_path / ".specify").mkdir()
+        for name in ("001-first", "010-tenth", "002-second"):
+            (tmp_path / "specs" / name).mkdir(parents=True)
+
+        paths = feature_paths.get_feature_paths(tmp_path)
+
+        assert not paths.has_git
+        assert paths.current_branch == "010-tenth"
+
+    def test_specify_feature_env_wins(self, tmp_path, monkeypatch):
+        (tmp_path / ".specify").mkdir()
+        monkeypatch.setenv("SPECIFY_FEATURE", "007-custom")
+        assert feature_paths.get_feature_paths(tmp_path).feature_dir == tmp_path / "specs" / "007-custom"
+
+    def test_ambiguous_prefix_raises(self, tmp_path):
+        for name in ("004-a", "004-b"):
+            (tmp_path / "specs" / name).mkdir(parents=True)
+        with pytest.raises(ValueError):
+            feature_paths.find_feature_dir_by_prefix(tmp_path, "004-c")
@@ -0,0 +1,209 @@
+"""
+Tests for the deterministic cross-artifact analyzer.
+
+Tests spec/plan/tasks parsing, the findings and coverage behind ``specify analyze``
+and the content-hash cache of parsed artifacts.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import analyzer, app
+from specify_cli.analyzer import ArtifactCache
+
+SPEC = """# Feature Specification: Login
+
+### User Story 1 - Sign in (Priority: P1)
+
+Users sign in with email.
+
+**Acceptance Scenarios**:
+
+1. **Given** a registered user, **When** they sign in, **Then** they see the dashboard
+
+### User Story 2 - Reset password (Priority: P2)
+
+Users reset a forgotten password.
+
+### User Story 3 - Audit trail (Priority: P3)
+
+**Acceptance Scenarios**:
+
+1. **Given** an admin, **When** they open the audit log, **Then** sign-ins are listed
+
+## Requirements
+
+<!--
+  - **FR-900**: Example inside a comment, ignored
+-->
+
+- **FR-001**: System MUST authenticate users with email and password
+- **FR-002**: System MUST send password reset emails [NEEDS CLARIFICATION: expiry of reset links?]
+- **FR-003**: System MUST lock accounts after five failed attempts
+- **FR-004**: System MUST lock accounts after five failed attempts
+- **FR-002**: System MUST record an audit entry for each sign-in
+
+## Success Criteria
+
+- **SC-001**: Users complete sign in under 10 seconds
+"""
+
+TASKS = """# Tasks: Login
+
+## Phase 1: Setup
+
+- [ ] T001 Create project structure
+
+## Phase 3: User Story 1 - Sign in (Priority: P1)
+
+- [ ] T002 [US1] Implement sign in for FR-001 in src/auth.py
+- [ ] T003 [US1] Lock accounts after failed sign-in attempts in src/lockout.py
+- [ ] T004 [US1] Handle FR-099 legacy tokens
+
+## Phase 4: User Story 3 - Audit trail (Priority: P3)
+
+- [ ] T005 [US3] Write audit entries in src/audit.py
+- [ ] T005 [US3] Show the audit log
+- [ ] T006 [US7] Export audit log to CSV
+"""
+
+PLAN = """# Implementation Plan
+
+Covers FR-001 and FR-042.
+"""
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def feature(tmp_path):
+    feature_dir = tmp_path / "specs" / "001-login"
+    write(feature_dir / "spec.md", SPEC)
+    write(feature_dir / "tasks.md", TASKS)
+    write(feature_dir / "plan.md", PLAN)
+    return feature_dir
+
+
+@pytest.fixture
+def report(feature):
+    return analyzer.analyze_feature(feature)
+
+
+def summaries(report, category):
+    return [f.summary for f in report.findings if f.category == category]
+
+
+class TestParse:
+    """Test artifact extraction."""
+
+    def test_spec_requirements_stories_and_markers(self):
+        spec = analyzer.parse_spec(SPEC)
+        assert [r["id"] for r in spec["requirements"]] == ["FR-001", "FR-002", "FR-003", "FR-004", "FR-002", "SC-001"]
+        assert [(s["id"], s["priority"], s["has_acceptance"]) for s in spec["stories"]] == [
+            ("US1", "P1", True), ("US2", "P2", False), ("US3", "P3", True),
+        ]
+        assert spec["stories"][1]["title"] == "Reset password"
+        assert [m["text"] for m in spec["clarifications"]] == ["expiry of reset links?"]
+
+    def test_tasks_keep_duplicates_and_references(self):
+        tasks = analyzer.parse_tasks_file(TASKS)["tasks"]
+        assert [t["id"] for t in tasks].count("T005") == 2
+        assert tasks[1]["references"] == ["FR-001"]
+        assert tasks[1]["story"] == "US1"
+
+
+class TestFindings:
+    """Test the reported issues."""
+
+    def test_duplicates(self, report):
+        found = summaries(report, "Duplication")
+        assert "FR-002 is defined again (first on line 28)" in found
+        assert "FR-003 and FR-004 are identical" in found
+        assert "Task T005 is defined again (first on line 15)" in found
+
+    def test_coverage_gaps(self, report):
+        found = summaries(report, "Coverage")
+        assert "FR-002 has no associated task" in found
+        assert "US2 (Reset password) has no [US2] tasks" in found
+        assert "Task T006 is labelled [US7] but the spec has no US7" in found
+        # SC-* are not expected to have tasks; FR-003 is covered by inference
+        assert not any(s.startswith(("SC-001", "FR-001", "FR-003")) for s in found)
+
+    def test_severity_and_ids_are_deterministic(self, report, feature):
+        assert [f.severity for f in report.findings] == sorted(
+            (f.severity for f in report.findings), key=analyzer.SEVERITIES.index
+        )
+        first = report.findings[0]
+        assert (first.severity, first.category) == ("HIGH", "Duplication")
+        assert [f.id for f in report.findings if f.category == "Duplication"] == ["D1", "D2", "D3"]
+        assert analyzer.analyze_feature(feature).to_json() == report.to_json()
+
+    def test_inconsistencies_and_ambiguities(self, report):
+        assert summaries(report, "Inconsistency") == [
+            "plan.md references FR-042, which is not defined in spec.md",
+            "Task T004 references FR-099, which is not defined in spec.md",
+        ]
+        assert summaries(report, "Ambiguity") == ["Unresolved clarification: expiry of reset links?"]
+        assert summaries(report, "Underspecification") == ["US2 has no acceptance scenarios"]
+
+    def test_p1_story_without_tasks_is_critical(self, feature):
+        write(feature / "tasks.md", "## Phase 4: User Story 3\n\n- [ ] T001 [US3] Audit\n")
+        report = analyzer.analyze_feature(feature)
+        critical = [f.summary for f in report.findings if f.severity == "CRITICAL"]
+        assert critical == ["US1 (Sign in) has no [US1] tasks"]
+        assert report.metrics["critical_issues"] == 1
+
+    def test_coverage_mapping_and_metrics(self, report):
+        coverage = {c.key: c for c in report.coverage}
+        assert (coverage["FR-001"].mapping, coverage["FR-001"].tasks) == ("explicit", ["T002"])
+        assert (coverage["FR-003"].mapping, coverage["FR-003"].tasks) == ("inferred", ["T003"])
+        assert not coverage["US2"].covered
+        assert report.unmapped_tasks == ["T001"]
+        assert report.metrics["requirements"] == 5
+        assert report.metrics["tasks"] == 6
+
+    def test_missing_tasks_raises(self, feature):
+        (feature / "tasks.md").unlink()
+        with pytest.raises(FileNotFoundError):
+            analyzer.analyze_feature(feature)
+
+
+class TestCache:
+    """Test content-hash caching of parsed artifacts."""
+
+    def test_only_changed_artifacts_are_reparsed(self, feature, tmp_path):
+        with ArtifactCache(tmp_path) as cache:
+            first = analyzer.analyze_feature(feature, cache=cache)
+            assert (first.artifacts_parsed, first.artifacts_cached) == (3, 0)
+
+            second = analyzer.analyze_feature(feature, cache=cache)
+            assert (second.artifacts_parsed, second.artifacts_cached) == (0, 3)
+            assert second.to_json() == first.to_json()
+
+            write(feature / "plan.md", "# Implementation Plan\n")
+            third = analyzer.analyze_feature(feature, cache=cache)
+            assert (third.artifacts_parsed, third.artifacts_cached) == (1, 2)
+            assert "plan.md references FR-042, which is not defined in spec.md" not in summaries(third, "Inconsistency")
+        assert (tmp_path / ".specify" / ".gitignore").is_file()
+
+
+class TestCommand:
+    """Test ``specify analyze``."""
+
+    def test_json_output_and_strict_exit(self, feature):
+        runner = CliRunner()
+        result = runner.invoke(app, ["analyze", str(feature), "--json", "--no-cache"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["metrics"]["user_stories"] == 3
+        assert {"id", "category", "severity", "location", "summary", "recommendation"} <= set(data["findings"][0])
+
+        result = runner.invoke(app, ["analyze", str(feature), "--strict", "--no-cache"])
+        assert result.exit_code == 1
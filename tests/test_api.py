@@ -0,0 +1,238 @@
+"""
+Tests for the async library API.
+
+Tests ``init_project`` from local and HTTP sources, concurrent initializations sharing
+one client and one download per asset, offline and rate-limited fallbacks to the cache,
+localization, git initialization and cleanup after a failure.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import time
+
+import httpx
+import pytest
+
+from specify_cli import api, cache_manager, format_benchmark, github_api, packaging, template_assets, template_sources
+from specify_cli.api import InitError
+from specify_cli.template_sources import DirectorySource, GitHubSource
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+---
+
+Run `{SCRIPT}` with {ARGS}.
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_env(tmp_path, monkeypatch):
+    monkeypatch.delenv(template_sources.SOURCE_ENV_VAR, raising=False)
+    monkeypatch.setenv(template_sources.CONFIG_ENV_VAR, str(tmp_path / "config.json"))
+    monkeypatch.setenv(cache_manager.CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    for name in ("GH_TOKEN", "GITHUB_TOKEN", github_api.WAIT_ENV_VAR):
+        monkeypatch.delenv(name, raising=False)
+
+
+def build_dist(tmp_path, extra_files=None, **kwargs):
+    root = tmp_path / "spec-kit"
+    for rel, content in {
+        "templates/commands/plan.md": COMMAND,
+        "templates/vscode-settings.json": '{"chat.promptFiles": true}\n',
+        "memory/constitution.md": "# Constitution\n",
+        "scripts/bash/setup-plan.sh": "#!/usr/bin/env bash\n",
+        "scripts/powershell/setup-plan.ps1": "# ps\n",
+        **(extra_files or {}),
+    }.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content, encoding="utf-8")
+    (root / "scripts/bash/setup-plan.sh").chmod(0o644)
+    dist = tmp_path / "dist"
+    packaging.build_packages(packaging.load_source(root), "v1.2.0", dist, ["claude", "gemini"], ["sh", "ps"], jobs=1, **kwargs)
+    return dist
+
+
+@pytest.fixture
+def dist(tmp_path):
+    return build_dist(tmp_path)
+
+
+class CountingSource(DirectorySource):
+    """A directory source counting how often each asset is streamed."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.streamed = []
+
+    def astream_asset(self, asset, client, chunk_size=template_sources.CHUNK_SIZE, offset=0):
+        self.streamed.append(asset["name"])
+        return super().astream_asset(asset, client, chunk_size, offset)
+
+
+class TestInitProject:
+    """Test a single initialization."""
+
+    def test_local_source(self, dist, tmp_path):
+        result = asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist), git=False))
+        plan = tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md"
+        assert plan.is_file()
+        assert (result.tag, result.template, result.cached, result.git) == ("v1.2.0", "universal", False, "skipped")
+        assert result.files_written > 0
+        if os.name != "nt":
+            assert result.scripts_updated == 1
+            assert os.access(tmp_path / "demo" / ".specify" / "scripts" / "bash" / "setup-plan.sh", os.X_OK)
+        assert json.loads(json.dumps(result.to_dict()))["project_path"] == str(tmp_path / "demo")
+
+    @pytest.mark.parametrize("layout, expected", [({"universal": False, "layered": True}, "layered"), ({"universal": False}, "variant")])
+    def test_other_layouts_over_http(self, tmp_path, layout, expected):
+        dist = build_dist(tmp_path, **layout)
+        with format_benchmark.serve_directory(dist) as base_url:
+            result = asyncio.run(api.init_project(tmp_path / "demo", "gemini", "ps", source=base_url, git=False))
+        assert result.template == expected
+        assert result.source == f"{base_url}/"
+        assert (tmp_path / "demo" / ".gemini" / "commands" / "speckit.plan.toml").is_file()
+
+    def test_offline_uses_the_cache(self, dist, tmp_path):
+        asyncio.run(api.init_project(tmp_path / "first", "claude", source=str(dist), git=False))
+        shutil.rmtree(dist)
+        result = asyncio.run(api.init_project(tmp_path / "second", "claude", offline=True, git=False))
+        assert (result.tag, result.cached, result.source) == ("v1.2.0", True, None)
+
+    def test_rate_limited_falls_back_to_the_cache(self, dist, tmp_path):
+        asyncio.run(api.init_project(tmp_path / "first", "claude", source=str(dist), git=False))
+        github_api.RateLimitBudget().record(httpx.Headers({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time() + 600))}))
+        result = asyncio.run(api.init_project(tmp_path / "second", "claude", source=GitHubSource(), git=False))
+        assert result.cached
+        assert "rate limited" in result.warnings[0]
+
+    def test_localized_commands(self, dist, tmp_path):
+        result = asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist), locale="zh_CN", git=False))
+        # Only the plan command is in the template, so only it is replaced
+        assert result.files_localized == 1
+        plan = (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").read_bytes()
+        assert plan == template_assets.build_localized_overlay("zh_CN", "claude", "sh")[".claude/commands/speckit.plan.md"]
+
+    def test_localized_commands_come_from_the_release(self, tmp_path):
+        dist = build_dist(tmp_path, {"templates/i18n/zh_CN/commands/plan.md": COMMAND.replace("Run", "发布版")})
+        result = asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist), locale="zh_CN", git=False))
+        assert result.files_localized == 1
+        plan = (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").read_text(encoding="utf-8")
+        assert "发布版 `.specify/scripts/bash/setup-plan.sh --json`" in plan
+
+    def test_here_merges_vscode_settings(self, tmp_path):
+        dist = build_dist(tmp_path)
+        project = tmp_path / "existing"
+        (project / ".vscode").mkdir(parents=True)
+        (project / ".vscode" / "settings.json").write_text('{"editor.tabSize": 2}', encoding="utf-8")
+        result = asyncio.run(api.init_project(project, "claude", here=True, source=str(dist), git=False))
+        assert result.files_written > 0
+        settings = json.loads((project / ".vscode" / "settings.json").read_text(encoding="utf-8"))
+        assert settings["editor.tabSize"] == 2
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git(self, dist, tmp_path, monkeypatch):
+        for name, value in {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com", "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com"}.items():
+            monkeypatch.setenv(name, value)
+        result = asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist)))
+        assert result.git == "initialized", result.git_error
+        assert (tmp_path / "demo" / ".git").is_dir()
+
+
+class TestRenderCache:
+    """Test keeping rendered templates in memory."""
+
+    def test_hits_and_eviction(self, dist, tmp_path):
+        cache = api.RenderCache(max_entries=1)
+
+        async def init(name, agent):
+            return await api.init_project(tmp_path / name, agent, source=str(dist), git=False, render_cache=cache)
+
+        asyncio.run(init("a", "claude"))
+        asyncio.run(init("b", "claude"))
+        assert (cache.hits, cache.misses) == (1, 1)
+        asyncio.run(init("c", "gemini"))
+        asyncio.run(init("d", "claude"))
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 1)
+        assert (tmp_path / "d" / ".claude" / "commands" / "speckit.plan.md").is_file()
+
+
+class TestErrors:
+    """Test argument validation and failed initializations."""
+
+    def test_invalid_arguments(self, dist, tmp_path):
+        with pytest.raises(ValueError, match="Unknown agent"):
+            asyncio.run(api.init_project(tmp_path / "demo", "nope", source=str(dist)))
+        with pytest.raises(ValueError, match="Unknown script type"):
+            asyncio.run(api.init_project(tmp_path / "demo", "claude", "bat", source=str(dist)))
+        with pytest.raises(ValueError):
+            asyncio.run(api.init_project(tmp_path / "demo", "claude", source="ftp://example.test"))
+
+    def test_existing_directory(self, dist, tmp_path):
+        (tmp_path / "demo").mkdir()
+        with pytest.raises(InitError, match="already exists") as excinfo:
+            asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist)))
+        assert excinfo.value.step == "precheck"
+
+    def test_fetch_failure(self, tmp_path):
+        with format_benchmark.serve_directory(tmp_path) as base_url:
+            with pytest.raises(InitError) as excinfo:
+                asyncio.run(api.init_project(tmp_path / "demo", "claude", source=base_url))
+        assert excinfo.value.step == "fetch"
+        assert not (tmp_path / "demo").exists()
+
+    def test_offline_without_cache(self, tmp_path):
+        with pytest.raises(InitError, match="No cached template"):
+            asyncio.run(api.init_project(tmp_path / "demo", "claude", offline=True))
+
+    def test_failed_write_removes_the_project(self, dist, tmp_path, monkeypatch):
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(template_assets, "write_project_files", fail)
+        with pytest.raises(InitError, match="disk full") as excinfo:
+            asyncio.run(api.init_project(tmp_path / "demo", "claude", source=str(dist), git=False))
+        assert excinfo.value.step == "extract"
+        assert not (tmp_path / "demo").exists()
+
+
+class TestConcurrency:
+    """Test many initializations on one event loop."""
+
+    def test_shared_client_and_single_download(self, dist, tmp_path):
+        source = CountingSource(dist)
+        paths = [tmp_path / f"project-{i}" for i in range(8)]
+
+        async def main():
+            async with api.create_client() as client:
+                release = await api.fetch_release(source, client=client)
+                return await asyncio.gather(*(
+                    api.init_project(path, agent, source=source, client=client, release=release, git=False)
+                    for path, agent in zip(paths, ["claude", "gemini"] * 4)
+                ))
+
+        results = asyncio.run(main())
+        assert [r.project_path for r in results] == paths
+        assert source.streamed == [packaging.universal_asset_name("v1.2.0")]
+        assert sum(not r.cached for r in results) == 1
+        assert (tmp_path / "project-1" / ".gemini" / "commands" / "speckit.plan.toml").is_file()
+        assert cache_manager.read_stats().misses == 1
+
+    def test_one_failure_does_not_affect_the_others(self, dist, tmp_path):
+        (tmp_path / "taken").mkdir()
+
+        async def main():
+            async with api.create_client() as client:
+                return await asyncio.gather(
+                    api.init_project(tmp_path / "ok", "claude", source=str(dist), client=client, git=False),
+                    api.init_project(tmp_path / "taken", "claude", source=str(dist), client=client, git=False),
+                    return_exceptions=True,
+                )
+
+        ok, failed = asyncio.run(main())
+        assert ok.files_written > 0
+        assert isinstance(failed, InitError)
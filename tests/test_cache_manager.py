@@ -0,0 +1,156 @@
+"""
+Tests for template cache management.
+
+Tests size/age limits, LRU eviction, the cache lock, hit/miss accounting through
+template downloads and the ``specify cache`` commands.
+"""
+
+import json
+import os
+import time
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, cache_manager, template_assets
+from specify_cli.cache_manager import CacheEntry, CacheLimits
+from specify_cli.locking import FileLock
+
+DAY = 86400
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(cache_manager.CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    monkeypatch.setenv("SPECIFY_CONFIG", str(tmp_path / "config.json"))
+    monkeypatch.delenv(cache_manager.MAX_SIZE_ENV_VAR, raising=False)
+    monkeypatch.delenv(cache_manager.MAX_AGE_ENV_VAR, raising=False)
+    return tmp_path / "cache"
+
+
+def cached(name, size, days_ago, tag="v1.0.0"):
+    path = template_assets.cached_asset_path(tag, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    when = time.time() - days_ago * DAY
+    os.utime(path, (when, when))
+    return path
+
+
+class TestLimits:
+    """Test limit parsing and configuration."""
+
+    @pytest.mark.parametrize("value, expected", [("1048576", 1048576), ("500M", 500 * 1024 ** 2), ("2g", 2 * 1024 ** 3), ("1.5 KiB", 1536)])
+    def test_parse_size(self, value, expected):
+        assert cache_manager.parse_size(value) == expected
+
+    def test_parse_size_rejects_garbage(self):
+        with pytest.raises(ValueError, match="Invalid size"):
+            cache_manager.parse_size("lots")
+
+    def test_precedence(self, tmp_path, monkeypatch):
+        assert cache_manager.configured_limits() == CacheLimits()
+        (tmp_path / "config.json").write_text(json.dumps({"cache_max_size": "10M", "cache_max_age": 7}), encoding="utf-8")
+        assert cache_manager.configured_limits() == CacheLimits(10 * 1024 ** 2, 7.0)
+        monkeypatch.setenv(cache_manager.MAX_SIZE_ENV_VAR, "1K")
+        assert cache_manager.configured_limits().max_size == 1024
+
+
+class TestEviction:
+    """Test LRU listing and pruning."""
+
+    def test_entries_are_least_recently_used_first(self):
+        cached("b.zip", 10, days_ago=1)
+        cached("a.zip", 10, days_ago=3)
+        (template_assets.cached_asset_path("v1.0.0", ".c.zip.partial")).write_bytes(b"in progress")
+        assert [e.name for e in cache_manager.list_entries()] == ["a.zip", "b.zip"]
+
+    def test_touch_moves_an_entry_to_the_back(self):
+        old = cached("old.zip", 10, days_ago=5)
+        cached("new.zip", 10, days_ago=1)
+        cache_manager.touch(old)
+        assert [e.name for e in cache_manager.list_entries()] == ["new.zip", "old.zip"]
+
+    def test_select_evictions(self):
+        now = time.time()
+        entries = [
+            CacheEntry(template_assets.cached_asset_path("v1", "expired"), "v1", 10, now - 100 * DAY),
+            CacheEntry(template_assets.cached_asset_path("v1", "lru"), "v1", 50, now - 2 * DAY),
+            CacheEntry(template_assets.cached_asset_path("v1", "kept"), "v1", 50, now - DAY),
+            CacheEntry(template_assets.cached_asset_path("v1", "in-use"), "v1", 500, now - 10),
+        ]
+
+        def names(limits):
+            return [e.name for e in cache_manager.select_evictions(entries, limits, now)]
+
+        assert names(CacheLimits(max_size=0, max_age_days=90)) == ["expired"]
+        assert names(CacheLimits(max_size=560, max_age_days=0)) == ["expired", "lru"]
+        # Entries used within the grace period are never evicted, even over the limit
+        assert names(CacheLimits(max_size=1, max_age_days=0)) == ["expired", "lru", "kept"]
+
+    def test_prune_and_dry_run(self):
+        cached("old.zip", 100, days_ago=3)
+        new = cached("new.zip", 100, days_ago=1)
+        limits = CacheLimits(max_size=150, max_age_days=0)
+        assert [e.name for e in cache_manager.prune(limits, dry_run=True)] == ["old.zip"]
+        assert len(cache_manager.list_entries()) == 2
+        assert [e.name for e in cache_manager.prune(limits)] == ["old.zip"]
+        assert [e.path for e in cache_manager.list_entries()] == [new]
+
+    def test_prune_waits_for_the_lock(self, cache):
+        cached("old.zip", 100, days_ago=3)
+        with FileLock(cache / cache_manager.LOCK_NAME):
+            with pytest.raises(TimeoutError):
+                cache_manager.prune(CacheLimits(max_size=1), lock_timeout=0)
+            assert cache_manager.maybe_prune() == []
+        assert len(cache_manager.list_entries()) == 1
+
+
+class TestAccounting:
+    """Test hit/miss counters and automatic pruning on download."""
+
+    def test_download_counts_miss_then_hit(self, monkeypatch):
+        monkeypatch.setenv(cache_manager.MAX_SIZE_ENV_VAR, "150")
+        cached("old.zip", 100, days_ago=3)
+        asset = {"name": "new.zip", "size": 100, "browser_download_url": "https://example.test/new.zip"}
+        with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"y" * 100))) as client:
+            template_assets.download_asset(asset, "v1.0.0", client)
+            template_assets.download_asset(asset, "v1.0.0", client)
+        stats = cache_manager.read_stats()
+        assert (stats.hits, stats.misses, stats.bytes_saved, stats.bytes_downloaded) == (1, 1, 100, 100)
+        assert stats.hit_rate == 0.5
+        # The download took the cache over 150 bytes, so the older entry was evicted
+        assert [e.name for e in cache_manager.list_entries()] == ["new.zip"]
+
+
+class TestCommands:
+    """Test ``specify cache``."""
+
+    def test_stats_list_prune_clear(self):
+        cached("a.zip", 2048, days_ago=200)
+        cached("b.zip", 1024, days_ago=1, tag="v1.1.0")
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["cache", "stats", "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert (data["entries"], data["size"], data["hit_rate"]) == (2, 3072, None)
+
+        result = runner.invoke(app, ["cache", "list", "--json"])
+        assert [(e["tag"], e["name"]) for e in json.loads(result.output)] == [("v1.0.0", "a.zip"), ("v1.1.0", "b.zip")]
+
+        result = runner.invoke(app, ["cache", "prune"])
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 entry" in result.output
+        assert [e.name for e in cache_manager.list_entries()] == ["b.zip"]
+
+        result = runner.invoke(app, ["cache", "clear", "--reset-stats"])
+        assert result.exit_code == 0, result.output
+        assert cache_manager.list_entries() == []
+        assert "empty" in runner.invoke(app, ["cache", "list"]).output
+
+    def test_invalid_size(self):
+        result = CliRunner().invoke(app, ["cache", "prune", "--max-size", "huge"])
+        assert result.exit_code == 1
+        assert "Invalid size" in result.output
@@ -0,0 +1,99 @@
+"""
+Tests for template extraction with localized overlays.
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from specify_cli import build_localized_overlay, extract_with_overlay
+
+
+def make_zip(path: Path, members: dict[str, str]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return path
+
+
+class TestExtractWithOverlay:
+    """Test single-pass extraction with overlay content."""
+
+    def test_overlay_replaces_matching_members(self, tmp_path):
+        archive = make_zip(tmp_path / "t.zip", {
+            ".claude/commands/speckit.plan.md": "english plan",
+            ".claude/commands/speckit.tasks.md": "english tasks",
+            ".specify/memory/constitution.md": "constitution",
+        })
+        dest = tmp_path / "out"
+
+        with zipfile.ZipFile(archive) as zf:
+            replaced = extract_with_overlay(zf, dest, {
+                ".claude/commands/speckit.plan.md": "本地化".encode("utf-8"),
+                ".claude/commands/speckit.missing.md": b"ignored",
+            })
+
+        assert replaced == 1
+        assert (dest / ".claude/commands/speckit.plan.md").read_text(encoding="utf-8") == "本地化"
+        assert (dest / ".claude/commands/speckit.tasks.md").read_text() == "english tasks"
+        assert not (dest / ".claude/commands/speckit.missing.md").exists()
+
+    def test_overlay_matches_inside_wrapping_directory(self, tmp_path):
+        archive = make_zip(tmp_path / "t.zip", {"pkg/.gemini/commands/speckit.plan.toml": "en"})
+        dest = tmp_path / "out"
+
+        with zipfile.ZipFile(archive) as zf:
+            replaced = extract_with_overlay(zf, dest, {".gemini/commands/speckit.plan.toml": b"zh"})
+
+        assert replaced == 1
+        assert (dest / "pkg/.gemini/commands/speckit.plan.toml").read_bytes() == b"zh"
+
+    def test_no_overlay_extracts_everything(self, tmp_path):
+        archive = make_zip(tmp_path / "t.zip", {"a.md": "a"})
+        with zipfile.ZipFile(archive) as zf:
+            assert extract_with_overlay(zf, tmp_path / "out", None) == 0
+        assert (tmp_path / "out/a.md").read_text() == "a"
+
+
+class TestLocalizedOverlay:
+    """Test rendering of localized command overlays."""
+
+    def test_english_has_no_overlay(self):
+        assert build_localized_overlay("en_US", "claude", "sh") == {}
+
+    def test_unknown_agent_has_no_overlay(self):
+        assert build_localized_overlay("zh_CN", "unknown", "sh") == {}
+
+    def test_release_templates_are_preferred(self):
+        template = "---\ndescription: 发布版\nscripts:\n  sh: scripts/bash/setup-plan.sh --json\n---\n\n运行 `{SCRIPT}`。\n"
+        release = {
+            "pkg/.specify/templates/i18n/zh_CN/commands/plan.md": template.encode("utf-8"),
+            "pkg/.specify/templates/i18n/ja_JP/commands/tasks.md": b"ignored",
+            "pkg/.claude/commands/speckit.plan.md": b"english",
+        }
+        overlay = build_localized_overlay("zh_CN", "claude", "sh", release)
+        assert list(overlay) == [".claude/commands/speckit.plan.md"]
+        assert "运行 `.specify/scripts/bash/setup-plan.sh --json`" in overlay[".claude/commands/speckit.plan.md"].decode("utf-8")
+
+    def test_shipped_templates_when_the_release_has_none(self):
+        release = {".claude/commands/speckit.plan.md": b"english"}
+        assert build_localized_overlay("zh_CN", "claude", "sh", release) == build_localized_overlay("zh_CN", "claude", "sh")
+
+    def test_chinese_overlay_is_rendered(self):
+        overlay = build_localized_overlay("zh_CN", "claude", "sh")
+        if not overlay:
+            pytest.skip("localized templates not available")
+
+        plan = overlay[".claude/commands/speckit.plan.md"].decode("utf-8")
+        assert "{SCRIPT}" not in plan
+        assert ".specify/scripts/bash/setup-plan.sh --json" in plan
+
+    def test_chinese_overlay_for_toml_agent(self):
+        overlay = build_localized_overlay("zh_CN", "gemini", "ps")
+        if not overlay:
+            pytest.skip("localized templates not available")
+
+        plan = overlay[".gemini/commands/speckit.plan.toml"].decode("utf-8")
+        assert plan.startswith('description = "')
+        assert "\nprompt = \"\"\"\n" in plan
@@ -0,0 +1,131 @@
+"""
+Tests for the persistent feature index.
+
+Tests stat-diff refreshes of .specify/index.db, spec metadata extraction and the
+filters behind ``specify features``.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from specify_cli import feature_index, feature_paths
+from specify_cli.feature_index import FeatureIndex
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def bump_mtime(path: Path) -> None:
+    """Move mtime forward so changes are visible on coarse-grained filesystems."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    write(tmp_path / "specs" / "001-login" / "spec.md", "# Feature Specification: Login\n\n**Status**: Draft\n")
+    write(tmp_path / "specs" / "001-login" / "plan.md", "# Plan\n")
+    write(tmp_path / "specs" / "001-login" / "checklists" / "ux.md", "- [ ] item\n")
+    write(tmp_path / "specs" / "002-search" / "spec.md", "# Feature Specification: Search\n\n**Status**: Approved\n")
+    write(tmp_path / "specs" / "002-search" / "tasks.md", "- [ ] T001 do it\n")
+    return tmp_path
+
+
+class TestRefresh:
+    """Test incremental index refreshes."""
+
+    def test_initial_refresh_indexes_everything(self, repo):
+        with FeatureIndex(repo) as index:
+            stats = index.refresh()
+            records = {r.name: r for r in index.query()}
+
+        assert stats.features_added == 2
+        assert stats.files_hashed == 5
+        assert records["001-login"].number == 1
+        assert records["001-login"].status == "Draft"
+        assert records["001-login"].title == "Login"
+        assert records["001-login"].artifacts == {"checklists": ["checklists/ux.md"], "plan": ["plan.md"], "spec": ["spec.md"]}
+        assert (repo / ".specify" / ".gitignore").read_text(encoding="utf-8") == "index.db*\n"
+
+    def test_unchanged_files_are_not_rehashed(self, repo):
+        with FeatureIndex(repo) as index:
+            index.refresh()
+        with FeatureIndex(repo) as index:
+            stats = index.refresh()
+        assert stats == feature_index.RefreshStats()
+
+    def test_changed_added_and_removed_artifacts(self, repo):
+        with FeatureIndex(repo) as index:
+            index.refresh()
+
+            spec = write(repo / "specs" / "001-login" / "spec.md", "# Feature Specification: Login v2\n\n**Status**: Approved\n")
+            bump_mtime(spec)
+            (repo / "specs" / "001-login" / "plan.md").unlink()
+            bump_mtime(repo / "specs" / "001-login")
+            write(repo / "specs" / "001-login" / "checklists" / "security.md", "- [ ] item\n")
+            bump_mtime(repo / "specs" / "001-login" / "checklists")
+
+            stats = index.refresh()
+            record = index.query(number=1)[0]
+
+        assert stats.artifacts_changed == 2
+        assert stats.artifacts_removed == 1
+        assert record.title == "Login v2"
+        assert record.status == "Approved"
+        assert not record.has("plan")
+        assert record.artifacts["checklists"] == ["checklists/security.md", "checklists/ux.md"]
+
+    def test_removed_feature_is_dropped(self, repo):
+        with FeatureIndex(repo) as index:
+            index.refresh()
+            for path in sorted((repo / "specs" / "002-search").iterdir(), reverse=True):
+                path.unlink()
+            (repo / "specs" / "002-search").rmdir()
+            stats = index.refresh()
+            assert stats.features_removed == 1
+            assert [r.name for r in index.query()] == ["001-login"]
+
+
+class TestQuery:
+    """Test feature filters."""
+
+    @pytest.fixture
+    def index(self, repo):
+        with FeatureIndex(repo) as index:
+            index.refresh()
+            yield index
+
+    def test_filter_by_status_is_case_insensitive(self, index):
+        assert [r.name for r in index.query(status="approved")] == ["002-search"]
+
+    def test_filter_by_artifact_presence(self, index):
+        assert [r.name for r in index.query(has=["checklist"])] == ["001-login"]
+        assert [r.name for r in index.query(missing=["tasks.md"])] == ["001-login"]
+        assert [r.name for r in index.query(has=["spec"], missing=["plan"])] == ["002-search"]
+
+    def test_unknown_artifact_raises(self, index):
+        with pytest.raises(ValueError):
+            index.query(has=["diagram"])
+
+    def test_latest_feature_tracks_new_directories(self, index, repo):
+        assert index.latest_feature() == "002-search"
+        (repo / "specs" / "010-later").mkdir()
+        bump_mtime(repo / "specs")
+        assert index.latest_feature() == "010-later"
+
+
+class TestCurrentBranchFallback:
+    """Test that feature resolution uses the index when it exists."""
+
+    def test_uses_index_for_latest_feature(self, repo, monkeypatch):
+        monkeypatch.delenv("SPECIFY_FEATURE", raising=False)
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        with FeatureIndex(repo) as index:
+            index.refresh()
+        monkeypatch.setattr(feature_paths, "latest_feature_dir", lambda specs_dir: pytest.fail("specs/ was scanned"))
+        assert feature_paths.get_current_branch(repo) == "002-search"
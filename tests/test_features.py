@@ -0,0 +1,180 @@
+"""
+Tests for feature creation.
+
+Tests branch naming, ref-based number allocation and its cache, fetch throttling and
+lock-protected reservation used by ``specify feature new``.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from specify_cli import features
+from specify_cli.locking import FileLock
+
+
+def make_git_dir(path: Path) -> Path:
+    (path / "objects").mkdir(parents=True)
+    (path / "refs" / "heads").mkdir(parents=True)
+    (path / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    return path
+
+
+def add_loose_ref(git_dir: Path, ref: str) -> None:
+    path = git_dir / ref
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("0" * 40 + "\n", encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def clean_git_env(monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+
+class TestBranchNames:
+    """Test branch suffix generation (mirrors create-new-feature.sh)."""
+
+    @pytest.mark.parametrize("description,expected", [
+        ("Add user authentication to the API", "user-authentication-api"),
+        ("I want to build a photo album organizer with tags", "build-photo-album"),
+        ("Support OAuth in UI", "support-oauth-ui"),
+        ("Support oauth in ui", "support-oauth"),
+        ("fix the big login bug", "fix-big-login-bug"),
+        ("a an the", "a-an-the"),
+    ])
+    def test_generate_branch_suffix(self, description, expected):
+        assert features.generate_branch_suffix(description) == expected
+
+    def test_clean_branch_name(self):
+        assert features.clean_branch_name("  User_Auth -- Flow!! ") == "user-auth-flow"
+
+    def test_truncate_branch_name(self):
+        name = "001-" + "word-" * 60
+        truncated = features.truncate_branch_name(name)
+        assert len(truncated.encode("utf-8")) <= features.MAX_BRANCH_LENGTH
+        assert not truncated.endswith("-")
+        assert features.truncate_branch_name("001-short") == "001-short"
+
+
+class TestBranchNumbers:
+    """Test reading branch numbers from packed and loose refs."""
+
+    def test_packed_and_loose_refs(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{'1' * 40} refs/heads/012-packed\n"
+            f"{'2' * 40} refs/tags/099-tag-is-ignored\n"
+            f"^{'3' * 40}\n",
+            encoding="utf-8",
+        )
+        add_loose_ref(git_dir, "refs/heads/004-local")
+        add_loose_ref(git_dir, "refs/remotes/origin/015-remote")
+        add_loose_ref(git_dir, "refs/heads/team/020-nested")  # not a NNN- branch name
+
+        assert features.highest_branch_number(git_dir, use_cache=False) == 15
+
+    def test_cache_is_invalidated_by_new_refs(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        add_loose_ref(git_dir, "refs/heads/003-first")
+        assert features.highest_branch_number(git_dir) == 3
+        assert (git_dir / features.REF_CACHE_NAME).is_file()
+
+        # Ensure the directory mtime visibly changes on coarse-grained filesystems
+        heads = git_dir / "refs" / "heads"
+        add_loose_ref(git_dir, "refs/heads/008-second")
+        os.utime(heads, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        assert features.highest_branch_number(git_dir) == 8
+
+    def test_cached_value_is_reused(self, tmp_path, monkeypatch):
+        git_dir = make_git_dir(tmp_path / ".git")
+        add_loose_ref(git_dir, "refs/heads/005-x")
+        assert features.highest_branch_number(git_dir) == 5
+
+        def fail(_git_dir):
+            raise AssertionError("refs should not be rescanned")
+
+        monkeypatch.setattr(features, "_scan_branch_numbers", fail)
+        assert features.highest_branch_number(git_dir) == 5
+
+    def test_next_number_considers_specs(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        add_loose_ref(git_dir, "refs/heads/002-x")
+        (tmp_path / "specs" / "010-spec-only").mkdir(parents=True)
+        assert features.next_feature_number(tmp_path, git_dir) == 11
+        assert features.next_feature_number(tmp_path) == 11
+
+
+    def test_numbers_past_999(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        add_loose_ref(git_dir, "refs/heads/1000-branch")
+        (tmp_path / "specs" / "999-spec").mkdir(parents=True)
+        (tmp_path / "specs" / "1001-spec").mkdir()
+        assert features.highest_branch_number(git_dir, use_cache=False) == 1000
+        assert features.highest_spec_number(tmp_path / "specs") == 1001
+        feature = features.create_feature("anything", tmp_path, short_name="next")
+        assert feature.branch_name == "1002-next"
+
+
+class TestFetchThrottle:
+    """Test remote fetch throttling."""
+
+    def test_no_remotes_skips_fetch(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        assert features.maybe_fetch(tmp_path, git_dir, force=True) is False
+
+    def test_recent_fetch_is_skipped(self, tmp_path, monkeypatch):
+        git_dir = make_git_dir(tmp_path / ".git")
+        (git_dir / "config").write_text('[remote "origin"]\n\turl = https://example.com/x.git\n', encoding="utf-8")
+        (git_dir / "FETCH_HEAD").write_text("", encoding="utf-8")
+        calls = []
+        monkeypatch.setattr(features.subprocess, "run", lambda *a, **k: calls.append(a))
+
+        assert features.maybe_fetch(tmp_path, git_dir, min_interval=3600) is False
+        assert features.maybe_fetch(tmp_path, git_dir, min_interval=0) is True
+        assert len(calls) == 1
+
+
+class TestCreateFeature:
+    """Test feature creation without git."""
+
+    def test_creates_spec_from_template(self, tmp_path):
+        templates = tmp_path / ".specify" / "templates"
+        templates.mkdir(parents=True)
+        (templates / "spec-template.md").write_text("# Spec\n", encoding="utf-8")
+
+        feature = features.create_feature("Add photo albums", tmp_path)
+
+        assert feature.branch_name == "001-photo-albums"
+        assert feature.has_git is False
+        assert feature.spec_file.read_text(encoding="utf-8") == "# Spec\n"
+        assert feature.to_json()["FEATURE_NUM"] == "001"
+
+    def test_explicit_number_and_short_name(self, tmp_path):
+        feature = features.create_feature("anything", tmp_path, short_name="User Auth", number=42)
+        assert feature.branch_name == "042-user-auth"
+        assert feature.spec_file.exists()
+
+    def test_parallel_creation_never_collides(self, tmp_path):
+        (tmp_path / ".specify").mkdir()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            created = list(pool.map(lambda i: features.create_feature(f"feature number {i}", tmp_path), range(8)))
+        assert sorted(f.feature_num for f in created) == [f"{i:03d}" for i in range(1, 9)]
+
+
+class TestFileLock:
+    """Test the cross-process lock used for reservations."""
+
+    def test_lock_times_out_while_held(self, tmp_path):
+        path = tmp_path / "x.lock"
+        with FileLock(path) as held:
+            assert held.locked
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.1).acquire()
+        with FileLock(path, timeout=0.1):
+            pass
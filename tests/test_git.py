@@ -0,0 +1,141 @@
+"""
+Tests for git helpers.
+
+Tests pure-Python repository discovery and chdir-free repository initialization.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from specify_cli import git as git_utils
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def make_git_dir(path: Path) -> Path:
+    """Create the minimal on-disk layout discovery looks for."""
+    (path / "objects").mkdir(parents=True)
+    (path / "refs" / "heads").mkdir(parents=True)
+    (path / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clean_git_env(monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    monkeypatch.delenv("GIT_CEILING_DIRECTORIES", raising=False)
+
+
+class TestDiscovery:
+    """Test .git discovery walk."""
+
+    def test_not_a_repo(self, tmp_path):
+        assert git_utils.find_git_dir(tmp_path) is None
+        assert git_utils.find_repo_root(tmp_path) is None
+        assert git_utils.is_git_repo(tmp_path) is False
+
+    def test_repo_root_and_subdirectory(self, tmp_path):
+        git_dir = make_git_dir(tmp_path / ".git")
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert git_utils.find_git_dir(nested) == git_dir
+        assert git_utils.find_repo_root(nested) == tmp_path
+        assert git_utils.is_git_repo(nested)
+
+    def test_gitfile_is_followed(self, tmp_path):
+        real = make_git_dir(tmp_path / "storage" / "wt")
+        work = tmp_path / "work"
+        work.mkdir()
+        (work / ".git").write_text("gitdir: ../storage/wt\n", encoding="utf-8")
+
+        assert git_utils.find_git_dir(work).resolve() == real.resolve()
+        assert git_utils.find_repo_root(work) == work
+
+    def test_incomplete_dot_git_is_ignored(self, tmp_path):
+        (tmp_path / "proj" / ".git").mkdir(parents=True)
+        assert git_utils._dot_git_at(tmp_path / "proj") is None
+
+    def test_ceiling_directories_stop_the_walk(self, tmp_path, monkeypatch):
+        make_git_dir(tmp_path / ".git")
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", os.pathsep.join(["relative/ignored", str(tmp_path / "a")]))
+
+        assert git_utils.find_git_dir(nested) is None
+        assert git_utils.find_repo_root(nested) is None
+        assert git_utils.is_git_repo(nested) is False
+        # The starting directory itself is always checked
+        assert git_utils.find_repo_root(tmp_path / "a") == tmp_path
+
+    def test_git_dir_env_skips_discovery_without_spawning_git(self, tmp_path, monkeypatch):
+        git_dir = make_git_dir(tmp_path / "elsewhere.git")
+        work = tmp_path / "work"
+        work.mkdir()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be spawned")
+
+        monkeypatch.setattr(git_utils.subprocess, "run", fail)
+        monkeypatch.setenv("GIT_DIR", str(git_dir))
+        assert git_utils.is_git_repo(work)
+        monkeypatch.setenv("GIT_DIR", "missing.git")
+        assert git_utils.is_git_repo(work) is False
+
+    def test_file_path_is_not_a_repo(self, tmp_path):
+        make_git_dir(tmp_path / ".git")
+        f = tmp_path / "file.txt"
+        f.write_text("x", encoding="utf-8")
+        assert git_utils.is_git_repo(f) is False
+
+
+@requires_git
+class TestInitRepo:
+    """Test repository initialization without chdir."""
+
+    @pytest.fixture(autouse=True)
+    def git_identity(self, monkeypatch):
+        monkeypatch.setenv("GIT_AUTHOR_NAME", "Test")
+        monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+        monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+        monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+    def test_init_does_not_change_cwd(self, tmp_path):
+        project = tmp_path / "proj"
+        project.mkdir()
+        (project / "README.md").write_text("hello\n", encoding="utf-8")
+        cwd = os.getcwd()
+
+        success, error = git_utils.init_repo(project)
+
+        assert success, error
+        assert os.getcwd() == cwd
+        assert git_utils.find_repo_root(project) == project
+        log = subprocess.run(["git", "-C", str(project), "log", "--format=%s"], capture_output=True, text=True)
+        assert log.stdout.strip() == git_utils.INITIAL_COMMIT_MESSAGE
+
+    def test_init_repos_runs_concurrently(self, tmp_path):
+        projects = []
+        for i in range(4):
+            project = tmp_path / f"proj{i}"
+            project.mkdir()
+            (project / "file.txt").write_text(str(i), encoding="utf-8")
+            projects.append(project)
+
+        results = git_utils.init_repos(projects, max_workers=4)
+
+        assert set(results) == set(projects)
+        assert all(success for success, _ in results.values())
+
+    def test_failure_returns_error_message(self, tmp_path):
+        # Nothing to commit in an empty directory
+        project = tmp_path / "empty"
+        project.mkdir()
+        success, error = git_utils.init_repo(project)
+        assert success is False
+        assert "commit" in error
@@ -0,0 +1,139 @@
+"""
+Tests for the GitHub API helpers.
+
+Tests the cross-process rate-limit budget: recording response headers, reserving
+requests, waiting for a reset, and ``specify init`` falling back to the template cache
+once the budget is spent.
+"""
+
+import json
+import time
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, github_api, packaging, template_assets
+from specify_cli.github_api import RateLimitBudget, RateLimitExceeded
+from specify_cli.template_sources import GitHubSource, RateLimitedError
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+---
+
+Run `{SCRIPT}` with {ARGS}.
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(template_assets.CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    monkeypatch.setenv("SPECIFY_CONFIG", str(tmp_path / "config.json"))
+    for name in ("GH_TOKEN", "GITHUB_TOKEN", github_api.WAIT_ENV_VAR, "SPECIFY_TEMPLATE_SOURCE"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path / "cache"
+
+
+def headers(remaining, reset, limit=60):
+    return httpx.Headers({"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(reset))})
+
+
+def release_json(tag="v1.0.0"):
+    return {"tag_name": tag, "assets": []}
+
+
+class TestBudget:
+    """Test the shared rate-limit budget."""
+
+    def test_unknown_budget_allows_requests(self):
+        assert RateLimitBudget().acquire() == 0
+
+    def test_reservations_spend_the_recorded_budget(self):
+        budget = RateLimitBudget()
+        budget.record(headers(2, time.time() + 600))
+        # Another process sees the same state file
+        other = RateLimitBudget()
+        assert budget.acquire() == 0
+        assert other.acquire() == 0
+        wait = budget.acquire()
+        assert 590 < wait <= 600
+        assert budget.limit() == 60
+
+    def test_reset_refills_the_budget(self):
+        budget = RateLimitBudget()
+        budget.record(headers(0, time.time() - 1))
+        assert budget.acquire() == 0
+
+    def test_retry_after_blocks_until_it_passes(self):
+        budget = RateLimitBudget()
+        budget.record(httpx.Headers({"Retry-After": "30"}))
+        assert 25 < budget.acquire() <= 30
+
+    def test_budgets_are_per_token_and_do_not_store_it(self, cache):
+        RateLimitBudget("secret-token").record(headers(0, time.time() + 600, limit=5000))
+        assert RateLimitBudget().acquire() == 0
+        assert RateLimitBudget("secret-token").acquire() > 0
+        assert "secret-token" not in (cache / github_api.RATE_LIMIT_STATE_NAME).read_text(encoding="utf-8")
+
+    def test_reserve_request_waits_or_refuses(self):
+        budget = RateLimitBudget()
+        budget.record(headers(0, time.time() + 600))
+        with pytest.raises(RateLimitExceeded, match="60 requests/hour"):
+            github_api.reserve_request(max_wait=5)
+        # The reset header has whole seconds: this one is 0.2-1.2s away
+        budget.record(headers(0, time.time() + 1.2))
+        start = time.monotonic()
+        github_api.reserve_request(max_wait=5)
+        assert time.monotonic() - start >= 0.15
+
+
+class TestGitHubSource:
+    """Test API calls made through the budget."""
+
+    def test_responses_are_recorded_and_spent_budget_is_not_called(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, json=release_json(), headers=headers(0, time.time() + 600))
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            assert GitHubSource().latest_release(client)["tag_name"] == "v1.0.0"
+            with pytest.raises(RateLimitedError) as excinfo:
+                GitHubSource().latest_release(client)
+        assert len(requests) == 1
+        assert excinfo.value.reset > time.time()
+
+    def test_init_uses_the_cache_when_the_budget_is_spent(self, tmp_path, monkeypatch):
+        root = tmp_path / "spec-kit"
+        for rel, content in {
+            "templates/commands/plan.md": COMMAND,
+            "memory/constitution.md": "# Constitution\n",
+            "scripts/bash/setup-plan.sh": "#!/usr/bin/env bash\n",
+            "scripts/powershell/setup-plan.ps1": "# ps\n",
+        }.items():
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text(content, encoding="utf-8")
+        universal = packaging.build_universal(packaging.load_source(root), "v1.0.0", tmp_path)
+        cached = template_assets.cached_universal_path("v1.0.0")
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(universal.read_bytes())
+        RateLimitBudget().record(headers(0, time.time() + 600))
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools"])
+        assert result.exit_code == 0, result.output
+        assert "rate limited" in result.output
+        assert (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").is_file()
+
+    def test_init_without_cache_fails_before_calling_github(self, tmp_path, monkeypatch):
+        RateLimitBudget().record(headers(0, time.time() + 600))
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools"])
+        assert result.exit_code == 1
+        assert "rate limit" in result.output
+        state = json.loads((tmp_path / "cache" / github_api.RATE_LIMIT_STATE_NAME).read_text(encoding="utf-8"))
+        assert state["anonymous"]["remaining"] == 0
@@ -0,0 +1,273 @@
+"""
+Tests for release packaging.
+
+Tests source loading, per-variant archive layout, agent-specific extras, parallel
+builds and reproducible archives/manifests behind ``specify dev package``.
+"""
+
+import hashlib
+import json
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from specify_cli import packaging
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+agent_scripts:
+  sh: scripts/bash/update-agent-context.sh __AGENT__
+  ps: scripts/powershell/update-agent-context.ps1 -AgentType __AGENT__
+---
+
+Run `{SCRIPT}` with {ARGS}, then `{AGENT_SCRIPT}`. See templates/plan-template.md.
+"""
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def source_root(tmp_path):
+    root = tmp_path / "spec-kit"
+    write(root / "templates" / "commands" / "plan.md", COMMAND)
+    write(root / "templates" / "plan-template.md", "# Plan\n")
+    write(root / "templates" / "vscode-settings.json", "{}\n")
+    write(root / "templates" / "i18n" / "zh_CN" / "commands" / "plan.md", COMMAND.replace("Create a plan.", "创建计划。"))
+    write(root / "memory" / "constitution.md", "# Constitution\n")
+    write(root / "scripts" / "bash" / "setup-plan.sh", "#!/usr/bin/env bash\n")
+    write(root / "scripts" / "powershell" / "setup-plan.ps1", "# ps\n")
+    write(root / "scripts" / "i18n" / "extract-messages.sh", "#!/usr/bin/env bash\n")
+    return root
+
+
+@pytest.fixture
+def source(source_root):
+    return packaging.load_source(source_root)
+
+
+class TestVariantFiles:
+    """Test what goes into each variant."""
+
+    def test_claude_sh_layout(self, source):
+        files = packaging.variant_files(source, "claude", "sh")
+        assert sorted(files) == [
+            ".claude/commands/speckit.plan.md",
+            ".specify/memory/constitution.md",
+            ".specify/scripts/bash/setup-plan.sh",
+            ".specify/templates/i18n/zh_CN/commands/plan.md",
+            ".specify/templates/plan-template.md",
+        ]
+        command = files[".claude/commands/speckit.plan.md"].content.decode("utf-8")
+        assert "Run `.specify/scripts/bash/setup-plan.sh --json` with $ARGUMENTS" in command
+        assert "update-agent-context.sh claude" in command
+        assert "See .specify/templates/plan-template.md." in command
+        assert "scripts:" not in command
+
+    def test_copilot_extras(self, source):
+        files = packaging.variant_files(source, "copilot", "ps")
+        assert ".github/agents/speckit.plan.agent.md" in files
+        assert files[".github/prompts/speckit.plan.prompt.md"].content == b"---\nagent: speckit.plan\n---\n"
+        assert files[".vscode/settings.json"].content == b"{}\n"
+        assert ".specify/scripts/powershell/setup-plan.ps1" in files
+
+    def test_toml_agents_keep_english_commands(self, source):
+        command = packaging.variant_files(source, "gemini", "sh")[".gemini/commands/speckit.plan.toml"]
+        assert command.content.decode("utf-8").startswith('description = "Create a plan."')
+
+    def test_unknown_agent(self, source):
+        with pytest.raises(ValueError):
+            packaging.variant_files(source, "vim", "sh")
+
+
+class TestSelection:
+    """Test AGENTS/SCRIPTS parsing."""
+
+    def test_subset_keeps_order_and_drops_duplicates(self):
+        assert packaging.parse_selection("copilot, gemini copilot", packaging.ALL_AGENTS, "agent") == ["copilot", "gemini"]
+        assert packaging.parse_selection(None, packaging.ALL_SCRIPTS, "script") == ["sh", "ps"]
+
+    def test_unknown_item(self):
+        with pytest.raises(ValueError, match="Unknown script 'zsh'"):
+            packaging.parse_selection("sh,zsh", packaging.ALL_SCRIPTS, "script")
+
+
+class TestBuild:
+    """Test archive builds."""
+
+    def test_parallel_build_matches_serial(self, source, tmp_path):
+        serial = packaging.build_packages(source, "v1.2.3", tmp_path / "serial", ["claude", "gemini"], jobs=1, universal=False, layered=False, formats=["zip"])
+        parallel = packaging.build_packages(source, "v1.2.3", tmp_path / "parallel", ["claude", "gemini"], jobs=2, universal=False, layered=False, formats=["zip"])
+        assert [p.name for p in parallel] == [
+            "spec-kit-template-claude-sh-v1.2.3.zip",
+            "spec-kit-template-claude-ps-v1.2.3.zip",
+            "spec-kit-template-gemini-sh-v1.2.3.zip",
+            "spec-kit-template-gemini-ps-v1.2.3.zip",
+        ]
+        for a, b in zip(serial, parallel):
+            with zipfile.ZipFile(a) as za, zipfile.ZipFile(b) as zb:
+                assert za.namelist() == zb.namelist()
+                assert all(za.read(n) == zb.read(n) for n in za.namelist())
+
+    def test_archives_record_the_release_version(self, source, tmp_path):
+        variant, universal = packaging.build_packages(source, "v1.2.3", tmp_path, ["claude"], ["sh"], jobs=1)
+        assert packaging.read_archive(variant)[packaging.RELEASE_VERSION_FILE] == b"v1.2.3\n"
+        rendered = packaging.variant_files(packaging.load_universal(universal), "claude", "sh")
+        assert rendered[packaging.RELEASE_VERSION_FILE].content == b"v1.2.3\n"
+
+    def test_stale_archives_are_removed(self, source, tmp_path):
+        out = tmp_path / "out"
+        write(out / "spec-kit-template-claude-sh-v0.0.1.zip", "old")
+        write(out / "spec-kit-template-claude-sh-v0.0.1.tar.xz", "old")
+        packaging.build_packages(source, "v0.0.2", out, ["claude"], ["sh"])
+        assert sorted(p.name for p in out.iterdir() if p.name != "index.json") == [
+            "spec-kit-template-claude-sh-v0.0.2.zip",
+            "spec-kit-template-claude-sh-v0.0.2.zip.manifest.json",
+            "spec-kit-template-universal-v0.0.2.zip",
+            "spec-kit-template-universal-v0.0.2.zip.manifest.json",
+        ]
+
+    def test_index_lists_the_assets(self, source, tmp_path):
+        packaging.build_packages(source, "v0.0.2", tmp_path, ["claude"], ["sh"], universal=False, layered=False, formats=["zip"])
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert index["tag_name"] == "v0.0.2"
+        assert [a["name"] for a in index["assets"]] == [
+            "spec-kit-template-claude-sh-v0.0.2.zip",
+            "spec-kit-template-claude-sh-v0.0.2.zip.manifest.json",
+        ]
+        archive = tmp_path / "spec-kit-template-claude-sh-v0.0.2.zip"
+        assert index["assets"][0]["digest"] == f"sha256:{hashlib.sha256(archive.read_bytes()).hexdigest()}"
+
+    def test_version_must_have_v_prefix(self, source, tmp_path):
+        with pytest.raises(ValueError, match="v0.0.0"):
+            packaging.build_packages(source, "1.2.3", tmp_path)
+
+    def test_missing_commands_dir(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            packaging.load_source(tmp_path)
+
+
+class TestReproducibility:
+    """Test deterministic archives and manifests."""
+
+    def build(self, source, out):
+        return packaging.build_packages(source, "v1.0.0", out, ["claude"], ["sh"], jobs=1, universal=False, layered=False, formats=["zip"])[0]
+
+    def test_identical_content_gives_identical_bytes(self, source_root, tmp_path):
+        first = self.build(packaging.load_source(source_root), tmp_path / "a")
+        for path in source_root.rglob("*"):
+            if path.is_file():
+                os.utime(path, (1_700_000_000, 1_700_000_000))
+                path.chmod(0o755)
+        second = self.build(packaging.load_source(source_root), tmp_path / "b")
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_members_are_sorted_with_fixed_metadata(self, source, tmp_path):
+        with zipfile.ZipFile(self.build(source, tmp_path)) as archive:
+            infos = archive.infolist()
+        assert [i.filename for i in infos] == sorted(i.filename for i in infos)
+        assert {i.date_time for i in infos} == {packaging.ZIP_EPOCH}
+        modes = {i.filename: (i.external_attr >> 16) & 0o777 for i in infos}
+        assert modes[".specify/scripts/bash/setup-plan.sh"] == 0o755
+        assert modes[".specify/memory/constitution.md"] == 0o644
+
+    def test_source_date_epoch(self, source, tmp_path, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000001")
+        with zipfile.ZipFile(self.build(source, tmp_path)) as archive:
+            assert archive.infolist()[0].date_time == (2023, 11, 14, 22, 13, 20)
+
+    def test_manifest_lists_member_hashes(self, source, tmp_path):
+        archive = self.build(source, tmp_path)
+        manifest = json.loads((tmp_path / "spec-kit-template-claude-sh-v1.0.0.zip.manifest.json").read_text(encoding="utf-8"))
+        assert manifest["asset"] == archive.name
+        assert manifest["sha256"] == hashlib.sha256(archive.read_bytes()).hexdigest()
+        member = manifest["members"][".specify/memory/constitution.md"]
+        assert member == {"sha256": hashlib.sha256(b"# Constitution\n").hexdigest(), "size": 15, "mode": "644"}
+
+    def test_tar_xz_matches_zip(self, source, tmp_path):
+        archives = packaging.build_packages(source, "v1.0.0", tmp_path, ["claude"], ["sh"], jobs=1, universal=False, formats=packaging.ARCHIVE_FORMATS)
+        assert [p.name for p in archives] == ["spec-kit-template-claude-sh-v1.0.0.zip", "spec-kit-template-claude-sh-v1.0.0.tar.xz"]
+        assert packaging.read_archive(archives[0]) == packaging.read_archive(archives[1])
+        with tarfile.open(archives[1]) as archive:
+            infos = archive.getmembers()
+        assert {(i.mtime, i.uid, i.uname) for i in infos} == {(315532800, 0, "")}
+        assert {i.name: i.mode for i in infos}[".specify/scripts/bash/setup-plan.sh"] == 0o755
+
+    def test_tar_xz_is_reproducible(self, source, tmp_path):
+        first = packaging.build_packages(source, "v1.0.0", tmp_path / "a", ["claude"], ["sh"], universal=False, layered=False, formats=["tar.xz"])[0]
+        second = packaging.build_packages(source, "v1.0.0", tmp_path / "b", ["claude"], ["sh"], universal=False, layered=False, formats=["tar.xz"])[0]
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_diff_manifests(self):
+        old = {"members": {"a": {"sha256": "1"}, "b": {"sha256": "2"}, "c": {"sha256": "3"}}}
+        new = {"members": {"a": {"sha256": "1"}, "b": {"sha256": "9"}, "d": {"sha256": "4"}}}
+        assert packaging.diff_manifests(old, new) == (["b", "d"], ["c"])
+        assert packaging.diff_manifests(None, new) == (["a", "b", "d"], [])
+
+
+class TestUniversal:
+    """Test the universal asset."""
+
+    @pytest.fixture
+    def universal(self, source, tmp_path):
+        return packaging.build_universal(source, "v1.0.0", tmp_path)
+
+    def test_layout(self, universal):
+        with zipfile.ZipFile(universal) as archive:
+            names = archive.namelist()
+            rules = json.loads(archive.read("rules.json"))
+        assert "commands/plan.md" in names
+        assert "files/.specify/memory/constitution.md" in names
+        assert "scripts/sh/.specify/scripts/bash/setup-plan.sh" in names
+        assert "extras/templates/vscode-settings.json" in names
+        assert rules["agents"]["gemini"] == {"directory": ".gemini/commands", "extension": "toml", "arg_format": "{{args}}"}
+        assert rules["script_types"] == ["ps", "sh"]
+
+    @pytest.mark.parametrize("agent,script_type", [("claude", "sh"), ("copilot", "ps"), ("gemini", "sh")])
+    def test_renders_like_the_variant_archives(self, source, universal, agent, script_type):
+        loaded = packaging.load_universal(universal)
+        assert packaging.variant_files(loaded, agent, script_type) == packaging.variant_files(source, agent, script_type)
+
+    def test_rules_define_agents(self, source, tmp_path):
+        source.formats = {"newagent": packaging.AgentCommandFormat(".new/cmds", "md", "$ARGS")}
+        loaded = packaging.load_universal(packaging.build_universal(source, "v1.0.0", tmp_path))
+        files = packaging.variant_files(loaded, "newagent", "sh")
+        assert "with $ARGS" in files[".new/cmds/speckit.plan.md"].content.decode("utf-8")
+
+    def test_not_a_universal_asset(self, source, tmp_path):
+        variant = packaging.build_variant(source, "claude", "sh", "v1.0.0", tmp_path)
+        with pytest.raises(ValueError, match="not a universal template"):
+            packaging.load_universal(variant)
+
+
+class TestLayered:
+    """Test the base-plus-overlay layout."""
+
+    def test_base_plus_overlay_is_the_variant(self, source):
+        for agent, script_type in [("claude", "sh"), ("copilot", "ps"), ("gemini", "sh")]:
+            base = packaging.base_files(source, script_type)
+            overlay = packaging.overlay_files(source, agent, script_type)
+            assert not set(base) & set(overlay)
+            assert {**base, **overlay} == packaging.variant_files(source, agent, script_type)
+
+    def test_overlay_holds_only_agent_files(self, source):
+        assert sorted(packaging.overlay_files(source, "claude", "sh")) == [".claude/commands/speckit.plan.md"]
+
+    def test_parallel_build_order(self, source, tmp_path):
+        archives = packaging.build_packages(source, "v1.0.0", tmp_path, ["claude", "gemini"], ["sh"], jobs=2, universal=False, layered=True, formats=["zip"])
+        assert [p.name for p in archives] == [
+            "spec-kit-template-claude-sh-v1.0.0.zip",
+            "spec-kit-template-overlay-claude-sh-v1.0.0.zip",
+            "spec-kit-template-gemini-sh-v1.0.0.zip",
+            "spec-kit-template-overlay-gemini-sh-v1.0.0.zip",
+            "spec-kit-template-base-sh-v1.0.0.zip",
+        ]
@@ -0,0 +1,147 @@
+"""
+Tests for prerequisite checks.
+
+Tests the check-prerequisites.sh JSON contract, branch validation and the short-lived
+feature resolution cache behind ``specify prereqs``.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, feature_paths, prerequisites
+from specify_cli.prerequisites import PrerequisiteError
+
+
+def make_git_dir(path: Path, branch: str) -> Path:
+    (path / "objects").mkdir(parents=True)
+    (path / "refs" / "heads").mkdir(parents=True)
+    (path / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    return path
+
+
+def checkout(git_dir: Path, branch: str) -> None:
+    head = git_dir / "HEAD"
+    head.write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    st = os.stat(head)
+    os.utime(head, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("GIT_DIR", "GIT_WORK_TREE", "SPECIFY_FEATURE", prerequisites.CACHE_TTL_ENV_VAR):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    make_git_dir(tmp_path / ".git", "004-user-auth")
+    feature_dir = tmp_path / "specs" / "004-user-auth"
+    feature_dir.mkdir(parents=True)
+    (feature_dir / "plan.md").write_text("# Plan\n", encoding="utf-8")
+    (feature_dir / "research.md").write_text("# Research\n", encoding="utf-8")
+    (feature_dir / "contracts").mkdir()
+    return tmp_path
+
+
+class TestResolve:
+    """Test feature resolution and its cache."""
+
+    def test_resolves_branch_and_feature_dir(self, repo):
+        paths, warnings = prerequisites.resolve_feature_paths(repo)
+        assert warnings == []
+        assert paths.current_branch == "004-user-auth"
+        assert paths.has_git
+        assert paths.feature_dir == repo / "specs" / "004-user-auth"
+
+    def test_cache_is_reused_until_head_changes(self, repo, monkeypatch):
+        prerequisites.resolve_feature_paths(repo)
+        assert (repo / ".git" / prerequisites.CACHE_NAME).is_file()
+
+        monkeypatch.setattr(prerequisites, "get_current_branch", lambda root: pytest.fail("branch was re-resolved"))
+        assert prerequisites.resolve_feature_paths(repo)[0].current_branch == "004-user-auth"
+
+        monkeypatch.setattr(prerequisites, "get_current_branch", feature_paths.get_current_branch)
+        checkout(repo / ".git", "005-search")
+        assert prerequisites.resolve_feature_paths(repo)[0].current_branch == "005-search"
+
+    def test_cache_expires_and_can_be_disabled(self, repo, monkeypatch):
+        calls = []
+
+        def counting(root):
+            calls.append(root)
+            return "004-user-auth"
+
+        monkeypatch.setattr(prerequisites, "get_current_branch", counting)
+        monkeypatch.setenv(prerequisites.CACHE_TTL_ENV_VAR, "0")
+        prerequisites.resolve_feature_paths(repo)
+        prerequisites.resolve_feature_paths(repo)
+        assert len(calls) == 2
+        assert not (repo / ".git" / prerequisites.CACHE_NAME).exists()
+
+        monkeypatch.delenv(prerequisites.CACHE_TTL_ENV_VAR)
+        prerequisites.resolve_feature_paths(repo)
+        prerequisites.resolve_feature_paths(repo, use_cache=False)
+        assert len(calls) == 4
+
+    def test_shared_prefix_warns_like_common_sh(self, repo):
+        (repo / "specs" / "004-other").mkdir()
+        paths, warnings = prerequisites.resolve_feature_paths(repo)
+        assert "Multiple spec directories" in warnings[0]
+        assert paths.feature_dir == repo / "specs" / "004-user-auth"
+        assert not (repo / ".git" / prerequisites.CACHE_NAME).exists()
+
+
+class TestChecks:
+    """Test validation and the JSON payloads."""
+
+    def test_available_docs(self, repo):
+        paths, _ = prerequisites.resolve_feature_paths(repo)
+        result = prerequisites.check_prerequisites(paths, include_tasks=True)
+        # contracts/ is empty, tasks.md is missing
+        assert result == {"FEATURE_DIR": str(paths.feature_dir), "AVAILABLE_DOCS": ["research.md"]}
+
+        (paths.contracts_dir / "api.yaml").write_text("openapi: 3.0.0\n", encoding="utf-8")
+        paths.tasks.write_text("- [ ] T001 do it\n", encoding="utf-8")
+        result = prerequisites.check_prerequisites(paths, require_tasks=True, include_tasks=True)
+        assert result["AVAILABLE_DOCS"] == ["research.md", "contracts/", "tasks.md"]
+
+    def test_missing_plan_and_tasks(self, repo):
+        paths, _ = prerequisites.resolve_feature_paths(repo)
+        with pytest.raises(PrerequisiteError, match="tasks.md not found"):
+            prerequisites.check_prerequisites(paths, require_tasks=True)
+        paths.impl_plan.unlink()
+        with pytest.raises(PrerequisiteError, match="plan.md not found") as excinfo:
+            prerequisites.check_prerequisites(paths)
+        assert excinfo.value.hint.startswith("Run /speckit.plan")
+
+    def test_branch_validation(self, repo):
+        checkout(repo / ".git", "main")
+        paths, _ = prerequisites.resolve_feature_paths(repo)
+        with pytest.raises(PrerequisiteError, match="Not on a feature branch"):
+            prerequisites.check_feature_branch(paths)
+
+    def test_paths_json_keys_match_the_script(self, repo):
+        paths, _ = prerequisites.resolve_feature_paths(repo)
+        assert list(prerequisites.paths_json(paths)) == ["REPO_ROOT", "BRANCH", "FEATURE_DIR", "FEATURE_SPEC", "IMPL_PLAN", "TASKS"]
+
+
+class TestCommand:
+    """Test ``specify prereqs``."""
+
+    def test_json_output(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        result = CliRunner().invoke(app, ["prereqs", "--json"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == {
+            "FEATURE_DIR": str(repo / "specs" / "004-user-auth"),
+            "AVAILABLE_DOCS": ["research.md"],
+        }
+
+    def test_missing_tasks_exits_nonzero(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+        result = CliRunner().invoke(app, ["prereqs", "--json", "--require-tasks"])
+        assert result.exit_code == 1
@@ -0,0 +1,99 @@
+"""
+Tests for the profiling hook.
+
+Tests SPECIFY_PROFILE parsing, phase marks, report/.prof generation and profiling a
+CLI command without touching its stdout.
+"""
+
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, profiling
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler(monkeypatch):
+    """Make sure every test starts without an active profiler."""
+    monkeypatch.setattr(profiling, "_profiler", None)
+    monkeypatch.setattr(profiling, "_phases", [])
+
+
+class TestEnvOutputDir:
+    """Test SPECIFY_PROFILE environment variable handling."""
+
+    def test_unset_disables_profiling(self, monkeypatch):
+        monkeypatch.delenv("SPECIFY_PROFILE", raising=False)
+        assert profiling.env_output_dir() is None
+
+    @pytest.mark.parametrize("value", ["0", "false", "off", ""])
+    def test_falsy_values_disable_profiling(self, monkeypatch, value):
+        monkeypatch.setenv("SPECIFY_PROFILE", value)
+        assert profiling.env_output_dir() is None
+
+    def test_truthy_value_uses_cwd(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("SPECIFY_PROFILE", "1")
+        assert profiling.env_output_dir() == tmp_path
+
+    def test_path_value_is_output_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SPECIFY_PROFILE", str(tmp_path / "profiles"))
+        assert profiling.env_output_dir() == tmp_path / "profiles"
+
+
+class TestReport:
+    """Test profile report generation."""
+
+    def test_stop_without_start_returns_none(self, tmp_path):
+        assert profiling.stop_and_write(tmp_path) is None
+
+    def test_writes_report_and_prof(self, tmp_path):
+        profiling.mark("imports")
+        profiling.start()
+        assert profiling.is_active()
+        sum(i * i for i in range(1000))
+        report_path, prof_path = profiling.stop_and_write(tmp_path / "out", command="check")
+
+        assert not profiling.is_active()
+        assert prof_path.suffix == ".prof" and prof_path.exists()
+        assert report_path.suffix == ".txt" and "check" in report_path.name
+        report = report_path.read_text(encoding="utf-8")
+        assert "Phases (wall time):" in report
+        assert "imports" in report
+        assert "Self time by category" in report
+        # The .prof file must be loadable by pstats/snakeviz
+        assert pstats.Stats(str(prof_path)).total_calls > 0
+
+    def test_categorize_attributes_known_modules(self):
+        class FakeStats:
+            stats = {
+                ("/site-packages/httpx/_client.py", 1, "send"): (1, 1, 0.5, 0.5, {}),
+                ("/lib/python3.11/zipfile.py", 1, "extractall"): (1, 1, 0.25, 0.25, {}),
+                ("/lib/python3.11/gettext.py", 1, "translation"): (1, 1, 0.125, 0.125, {}),
+                ("/app/main.py", 1, "run"): (1, 1, 1.0, 1.0, {}),
+            }
+
+        totals = profiling.categorize(FakeStats())
+        assert totals["network"] == 0.5
+        assert totals["filesystem"] == 0.25
+        assert totals["i18n"] == 0.125
+        assert totals["other"] == 1.0
+
+
+class TestCli:
+    """Test profiling a CLI command."""
+
+    def test_notice_keeps_json_output_clean(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".specify").mkdir()
+        (tmp_path / "specs" / "001-a").mkdir(parents=True)
+        monkeypatch.setenv("SPECIFY_FEATURE", "001-a")
+        monkeypatch.setenv("SPECIFY_PROFILE", str(tmp_path / "profiles"))
+        result = CliRunner().invoke(app, ["prereqs", "--json", "--paths-only"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)["BRANCH"] == "001-a"
+        assert "Profile report written" in result.stderr
+        assert list((tmp_path / "profiles").glob("*.prof"))
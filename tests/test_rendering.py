@@ -0,0 +1,94 @@
+"""
+Tests for command template rendering.
+
+Tests placeholder substitution, frontmatter script stripping, path rewrites and
+TOML output, matching the former create-release-packages.sh.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from specify_cli.rendering import (
+    AGENT_COMMAND_FORMATS,
+    command_filename,
+    command_path,
+    render_command,
+    rewrite_paths,
+)
+
+TEMPLATE = """---
+description: Plan the feature.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+agent_scripts:
+  sh: scripts/bash/update-agent-context.sh __AGENT__
+  ps: scripts/powershell/update-agent-context.ps1 -AgentType __AGENT__
+---
+
+## User Input
+
+{ARGS}
+
+Run `{SCRIPT}` then `{AGENT_SCRIPT}`.
+Read /memory/constitution.md and templates/plan-template.md with a \\ backslash.
+"""
+
+
+class TestRenderMarkdown:
+    """Test Markdown command rendering."""
+
+    def test_claude_sh(self):
+        rendered = render_command(TEMPLATE, "claude", "sh")
+
+        assert rendered.startswith("---\ndescription: Plan the feature.\n---\n")
+        assert "scripts:" not in rendered
+        assert "$ARGUMENTS" in rendered
+        assert "Run `.specify/scripts/bash/setup-plan.sh --json` then `.specify/scripts/bash/update-agent-context.sh claude`." in rendered
+        assert ".specify/memory/constitution.md" in rendered
+        assert ".specify/templates/plan-template.md" in rendered
+        assert rendered.endswith("backslash.\n")
+
+    def test_powershell_variant(self):
+        rendered = render_command(TEMPLATE, "cursor-agent", "ps")
+        assert ".specify/scripts/powershell/setup-plan.ps1 -Json" in rendered
+        assert "-AgentType cursor-agent" in rendered
+
+    def test_missing_script_command(self):
+        rendered = render_command("---\ndescription: x\n---\nRun {SCRIPT}\n", "claude", "sh")
+        assert "Run (Missing script command for sh)" in rendered
+
+    def test_crlf_is_normalized(self):
+        rendered = render_command(TEMPLATE.replace("\n", "\r\n"), "claude", "sh")
+        assert "\r" not in rendered
+
+
+class TestRenderToml:
+    """Test TOML command rendering for Gemini/Qwen."""
+
+    @pytest.mark.parametrize("agent", ["gemini", "qwen"])
+    def test_toml_wrapper(self, agent):
+        rendered = render_command(TEMPLATE, agent, "sh")
+
+        assert rendered.startswith('description = "Plan the feature."\n\nprompt = """\n---\n')
+        assert rendered.endswith('backslash.\n"""\n')
+        assert "{{args}}" in rendered
+        assert "\\\\ backslash" in rendered
+
+
+class TestAgentFormats:
+    """Test agent command locations."""
+
+    def test_every_agent_has_a_format(self):
+        from specify_cli import AGENT_CONFIG
+        assert set(AGENT_COMMAND_FORMATS) == set(AGENT_CONFIG)
+
+    def test_command_paths(self):
+        assert command_path("plan", "claude") == ".claude/commands/speckit.plan.md"
+        assert command_path("plan", "gemini") == ".gemini/commands/speckit.plan.toml"
+        assert command_filename("plan", "copilot") == "speckit.plan.agent.md"
+        assert command_path("plan", "unknown") is None
+
+    def test_rewrite_paths(self):
+        assert rewrite_paths("see memory/x and /scripts/y") == "see .specify/memory/x and .specify/scripts/y"
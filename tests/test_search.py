@@ -0,0 +1,149 @@
+"""
+Tests for spec search.
+
+Tests tokenization, Markdown sectioning, BM25 ranking and incremental re-indexing
+behind ``specify search``.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from specify_cli import search
+from specify_cli.search import SearchIndex
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+SPEC = """# Feature Specification: Login
+
+**Status**: Draft
+
+## Requirements
+
+- **FR-001**: System MUST allow login with email and password
+- **FR-002**: Sessions MUST time out after 30 minutes of inactivity
+
+```text
+# comment, not a heading
+```
+
+## Success Criteria
+
+- **SC-001**: Users complete login in under 10 seconds
+"""
+
+TASKS = """# Tasks: Login
+
+## Phase 1: Setup
+
+- [ ] T001 Create project structure
+- [ ] T002 [P] Configure session timeout middleware
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    write(tmp_path / "specs" / "001-login" / "spec.md", SPEC)
+    write(tmp_path / "specs" / "001-login" / "tasks.md", TASKS)
+    write(tmp_path / "specs" / "002-search" / "spec.md", "# Feature Specification: Search\n\nFull-text search over documents.\n")
+    return tmp_path
+
+
+class TestTokenize:
+    """Test term extraction."""
+
+    def test_ids_are_single_terms(self):
+        assert search.tokenize("**FR-001**: see T012 and SC-003.") == ["fr-001", "see", "t012", "and", "sc-003"]
+
+    def test_cjk_characters_are_separate_terms(self):
+        assert search.tokenize("用户登录 login") == ["用", "户", "登", "录", "login"]
+
+
+class TestSplitSections:
+    """Test Markdown sectioning."""
+
+    def test_headings_start_sections_outside_fences(self):
+        sections = search.split_sections(SPEC)
+        assert [(s.heading, s.line) for s in sections] == [
+            ("Feature Specification: Login", 1),
+            ("Requirements", 5),
+            ("Success Criteria", 14),
+        ]
+        assert "# comment, not a heading" in sections[1].body
+
+    def test_preamble_without_heading(self):
+        sections = search.split_sections("---\ndescription: x\n---\n\n# Title\nbody\n")
+        assert sections[0].heading == "" and sections[0].line == 1
+        assert sections[1].heading == "Title"
+
+
+class TestSearchIndex:
+    """Test ranking and incremental refresh."""
+
+    def test_requirement_id_finds_its_section(self, repo):
+        with SearchIndex(repo) as index:
+            index.refresh()
+            hits = index.search("FR-002")
+        assert len(hits) == 1
+        assert (hits[0].path, hits[0].heading, hits[0].line) == ("specs/001-login/spec.md", "Requirements", 5)
+        assert hits[0].snippet.startswith("- **FR-002**")
+
+    def test_ranking_prefers_denser_matches(self, repo):
+        with SearchIndex(repo) as index:
+            index.refresh()
+            hits = index.search("session timeout")
+        assert hits[0].path == "specs/001-login/tasks.md"
+        assert hits[0].heading == "Phase 1: Setup"
+        assert all(hit.score > 0 for hit in hits)
+        assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+
+    def test_path_prefix_filter(self, repo):
+        with SearchIndex(repo) as index:
+            index.refresh()
+            assert index.search("search", path_prefix="specs/001") == []
+            assert index.search("search", path_prefix="specs/002")[0].path == "specs/002-search/spec.md"
+
+    def test_feature_filter_stops_at_the_directory_boundary(self, repo):
+        write(repo / "specs" / "0010-search-v2" / "spec.md", "# Search again\n")
+        write(repo / "specs" / "002-search-v2" / "spec.md", "# Search again\n")
+        assert search.feature_path_prefix("1") == "specs/001-"
+        with SearchIndex(repo) as index:
+            index.refresh()
+            assert index.search("search", path_prefix=search.feature_path_prefix("1")) == []
+            assert [h.path for h in index.search("search", path_prefix=search.feature_path_prefix("0010"))] == ["specs/0010-search-v2/spec.md"]
+            assert [h.path for h in index.search("search", path_prefix=search.feature_path_prefix("002-search"))] == ["specs/002-search/spec.md"]
+
+    def test_only_changed_files_are_reindexed(self, repo):
+        with SearchIndex(repo) as index:
+            assert index.refresh().files_indexed == 3
+            assert index.refresh().files_unchanged == 3
+
+            tasks = write(repo / "specs" / "001-login" / "tasks.md", TASKS + "- [ ] T003 Add audit logging\n")
+            st = os.stat(tasks)
+            os.utime(tasks, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+            (repo / "specs" / "002-search" / "spec.md").unlink()
+
+            stats = index.refresh()
+            assert (stats.files_indexed, stats.files_removed, stats.files_unchanged) == (1, 1, 1)
+            assert index.search("T003")[0].path == "specs/001-login/tasks.md"
+            assert index.search("documents") == []
+
+    def test_touched_but_identical_file_is_not_retokenized(self, repo, monkeypatch):
+        with SearchIndex(repo) as index:
+            index.refresh()
+            spec = repo / "specs" / "001-login" / "spec.md"
+            st = os.stat(spec)
+            os.utime(spec, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+            monkeypatch.setattr(index, "_index_file", lambda *a: pytest.fail("file was re-tokenized"))
+            assert index.refresh().files_unchanged == 3
+
+    def test_empty_query_returns_nothing(self, repo):
+        with SearchIndex(repo) as index:
+            index.refresh()
+            assert index.search("  ...  ") == []
@@ -0,0 +1,258 @@
+"""
+Tests for the ``specify serve`` template server.
+
+Tests init and upgrade requests over local HTTP and a Unix socket, the release and
+render caches, request validation and checks against browser and unauthenticated
+requests, the concurrency limit and the metrics endpoint.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, cache_manager, packaging, template_sources
+from specify_cli import server as template_server
+from specify_cli.server import ReleaseCache, SpecifyServer
+from specify_cli.template_sources import DirectorySource, TemplateSourceError
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+---
+
+Run `{SCRIPT}` with {ARGS}.
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_env(tmp_path, monkeypatch):
+    monkeypatch.delenv(template_sources.SOURCE_ENV_VAR, raising=False)
+    monkeypatch.setenv(template_sources.CONFIG_ENV_VAR, str(tmp_path / "config.json"))
+    monkeypatch.setenv(cache_manager.CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def dist(tmp_path):
+    root = tmp_path / "spec-kit"
+    for rel, content in {
+        "templates/commands/plan.md": COMMAND,
+        "memory/constitution.md": "# Constitution\n",
+        "scripts/bash/setup-plan.sh": "#!/usr/bin/env bash\n",
+        "scripts/powershell/setup-plan.ps1": "# ps\n",
+    }.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content, encoding="utf-8")
+    dist = tmp_path / "dist"
+    packaging.build_packages(packaging.load_source(root), "v1.2.0", dist, ["claude"], ["sh"], jobs=1)
+    return dist
+
+
+class FlakySource(DirectorySource):
+    """A directory source whose release lookups fail once ``broken`` is set."""
+
+    broken = False
+
+    async def alatest_release(self, client):
+        if self.broken:
+            raise TemplateSourceError("unreachable")
+        return await super().alatest_release(client)
+
+
+TOKEN = "test-token"
+JSON = {"Content-Type": "application/json"}
+JSON_HEADERS = {"content-type": "application/json"}
+AUTHORIZED = {**JSON, "Authorization": f"Bearer {TOKEN}"}
+
+
+async def running(server, **kwargs):
+    listener = await server.start(port=0, **kwargs)
+    if "socket_path" in kwargs:
+        return listener, httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=str(kwargs["socket_path"])), base_url="http://specify")
+    host, port = listener.sockets[0].getsockname()[:2]
+    return listener, httpx.AsyncClient(base_url=f"http://{host}:{port}", headers={"Authorization": f"Bearer {TOKEN}"})
+
+
+class TestRequests:
+    """Test init/upgrade requests end to end."""
+
+    def test_concurrent_inits_share_the_caches(self, dist, tmp_path):
+        async def main():
+            server = SpecifyServer(DirectorySource(dist), token=TOKEN)
+            listener, client = await running(server)
+            async with listener, client:
+                responses = await asyncio.gather(*(
+                    client.post("/init", json={"project_path": str(tmp_path / f"p{i}"), "agent": "claude", "git": False})
+                    for i in range(4)
+                ))
+                health = await client.get("/health")
+                metrics = (await client.get("/metrics")).json()
+            await server.aclose()
+            return responses, health, metrics
+
+        responses, health, metrics = asyncio.run(main())
+        assert [r.status_code for r in responses] == [200] * 4
+        assert responses[0].json()["tag"] == "v1.2.0"
+        assert (tmp_path / "p3" / ".claude" / "commands" / "speckit.plan.md").is_file()
+        assert health.json() == {"status": "ok"}
+        assert metrics["requests"]["/init"] == {"200": 4}
+        assert (metrics["release"]["refreshes"], metrics["release"]["hits"]) == (1, 3)
+        assert (metrics["render_cache"]["misses"], metrics["render_cache"]["hits"]) == (1, 3)
+        assert metrics["latency_seconds"]["count"] == 5
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets")
+    def test_upgrade_over_a_unix_socket(self, dist, tmp_path):
+        socket_path = tmp_path / "specify.sock"
+        project = tmp_path / "project"
+        plan = project / ".claude" / "commands" / "speckit.plan.md"
+
+        async def main():
+            server = SpecifyServer(DirectorySource(dist))
+            listener, client = await running(server, socket_path=socket_path)
+            async with listener, client:
+                assert os.stat(socket_path).st_mode & 0o077 == 0
+                created = await client.post("/init", json={"project_path": str(project), "agent": "claude", "git": False})
+                plan.write_text("edited", encoding="utf-8")
+                (project / "specs").mkdir()
+                upgraded = await client.post("/upgrade", json={"project_path": str(project), "agent": "claude"})
+            await server.aclose()
+            return created, upgraded
+
+        created, upgraded = asyncio.run(main())
+        assert created.status_code == 200, created.text
+        assert upgraded.status_code == 200, upgraded.text
+        assert upgraded.json()["git"] == "skipped"
+        assert plan.read_text(encoding="utf-8") != "edited"
+        assert (project / "specs").is_dir()
+
+
+class TestErrors:
+    """Test rejected and failed requests."""
+
+    @pytest.mark.parametrize("method, path, body, status, message", [
+        ("GET", "/nope", None, 404, "No such endpoint"),
+        ("GET", "/init", None, 405, "expects POST"),
+        ("POST", "/init", b"{not json", 400, "Invalid JSON"),
+        ("POST", "/init", b'{"agent": "claude"}', 400, "Missing field: project_path"),
+        ("POST", "/init", b'{"project_path": "x", "agent": "claude", "force": true}', 400, "Unknown field(s): force"),
+        ("POST", "/init", b'{"project_path": "x", "agent": "claude", "git": "no"}', 400, "must be a boolean"),
+        ("POST", "/init", b'{"project_path": "x", "agent": "nope"}', 400, "Unknown agent"),
+        ("POST", "/upgrade", b'{"project_path": "missing", "agent": "claude"}', 409, "not a directory"),
+    ])
+    def test_rejected(self, dist, tmp_path, monkeypatch, method, path, body, status, message):
+        monkeypatch.chdir(tmp_path)
+        server = SpecifyServer(DirectorySource(dist))
+        code, payload = asyncio.run(server.dispatch(method, path, body, JSON_HEADERS))
+        asyncio.run(server.aclose())
+        assert code == status
+        assert message in payload["error"]
+
+    @pytest.mark.parametrize("headers, status, message", [
+        ({**AUTHORIZED, "Origin": "https://evil.example"}, 403, "Cross-origin"),
+        ({**AUTHORIZED, "Content-Type": "text/plain"}, 415, "application/json"),
+        ({**AUTHORIZED, "Host": "evil.example:8765"}, 403, "not a loopback name"),
+        (JSON, 401, "bearer token"),
+        ({**JSON, "Authorization": "Bearer wrong"}, 401, "bearer token"),
+    ])
+    def test_browser_and_unauthenticated_requests_write_nothing(self, dist, tmp_path, headers, status, message):
+        target = tmp_path / "victim"
+        target.mkdir()
+
+        async def main():
+            server = SpecifyServer(DirectorySource(dist), token=TOKEN)
+            listener = await server.start(port=0)
+            host, port = listener.sockets[0].getsockname()[:2]
+            async with listener, httpx.AsyncClient(base_url=f"http://{host}:{port}") as client:
+                response = await client.post("/upgrade", content=json.dumps({"project_path": str(target), "agent": "claude"}), headers=headers)
+            await server.aclose()
+            return response
+
+        response = asyncio.run(main())
+        assert response.status_code == status
+        assert message in response.json()["error"]
+        assert list(target.iterdir()) == []
+
+    def test_http_requires_a_token(self, dist):
+        server = SpecifyServer(DirectorySource(dist))
+        with pytest.raises(ValueError, match="token"):
+            asyncio.run(server.start(port=0))
+        asyncio.run(server.aclose())
+
+    def test_paths_are_confined_to_the_root(self, dist, tmp_path):
+        root = tmp_path / "projects"
+        root.mkdir()
+        server = SpecifyServer(DirectorySource(dist), root=root)
+
+        async def init(project_path):
+            return await server.dispatch("POST", "/init", json.dumps({"project_path": project_path, "agent": "claude", "git": False}).encode(), JSON_HEADERS)
+
+        code, payload = asyncio.run(init("../outside"))
+        assert code == 403
+        assert "outside" in payload["error"]
+        code, payload = asyncio.run(init("inside"))
+        asyncio.run(server.aclose())
+        assert code == 200, payload
+        assert payload["project_path"] == str(root.resolve() / "inside")
+
+    def test_token_file_is_private(self, tmp_path):
+        path = template_server.write_token_file("secret", tmp_path / "token")
+        assert path.read_text(encoding="utf-8") == "secret\n"
+        if os.name != "nt":
+            assert path.stat().st_mode & 0o077 == 0
+
+    def test_malformed_http(self, dist):
+        async def main():
+            server = SpecifyServer(DirectorySource(dist), token=TOKEN)
+            listener = await server.start(port=0)
+            host, port = listener.sockets[0].getsockname()[:2]
+            async with listener:
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b"garbage\r\n\r\n")
+                response = await reader.read()
+                writer.close()
+            await server.aclose()
+            return response
+
+        response = asyncio.run(main())
+        assert response.startswith(b"HTTP/1.1 400 Bad Request")
+        assert b"Malformed request line" in response
+
+    def test_busy_server_answers_503(self, dist, tmp_path):
+        async def main():
+            server = SpecifyServer(DirectorySource(dist), max_concurrency=1, max_queue=0)
+            await server._slots.acquire()
+            code, payload = await server.dispatch("POST", "/init", json.dumps({"project_path": str(tmp_path / "p"), "agent": "claude"}).encode(), JSON_HEADERS)
+            await server.aclose()
+            return code, payload, server.stats()
+
+        code, payload, stats = asyncio.run(main())
+        assert code == 503
+        assert "busy" in payload["error"]
+        assert stats["rejected"] == 1
+
+    def test_stale_release_is_reused_while_the_source_is_down(self, dist):
+        source = FlakySource(dist)
+
+        async def main():
+            cache = ReleaseCache(source, ttl=0)
+            async with httpx.AsyncClient() as client:
+                first = await cache.get(client)
+                source.broken = True
+                second = await cache.get(client)
+            return cache, first, second
+
+        cache, first, second = asyncio.run(main())
+        assert first == second
+        assert (cache.refreshes, cache.stale) == (1, 1)
+
+    def test_cli_rejects_a_bad_source(self):
+        result = CliRunner().invoke(app, ["serve", "--template-source", "ftp://example.test"])
+        assert result.exit_code == 1
+        assert "Error" in result.output
@@ -0,0 +1,174 @@
+"""
+Tests for the tasks.md DAG builder and scheduler.
+
+Tests parsing of task markers, dependency edges (phases, [P] runs, file conflicts,
+explicit deps), the critical path and N-worker schedules behind ``specify tasks plan``.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from specify_cli import task_graph
+from specify_cli.task_graph import TaskGraphError
+
+TASKS = """# Tasks: Login
+
+## Phase 1: Setup
+
+- [x] T001 Create project structure
+- [ ] T002 [P] Configure linting in pyproject.toml
+- [ ] T003 [P] Configure CI in .github/workflows/ci.yml
+
+## Phase 2: Foundational
+
+- [ ] T004 Setup database schema in src/db/schema.py
+
+## Phase 3: User Story 1 - Login (Priority: P1)
+
+- [ ] T005 [P] [US1] Create User model in src/models/user.py
+- [ ] T006 [P] [US1] Create Session model in src/models/session.py
+- [ ] T007 [US1] Implement AuthService in src/services/auth.py (depends on T005, T006)
+
+## Phase 4: User Story 2 - Profile (Priority: P2)
+
+- [ ] T008 [P] [US2] Add avatar field to src/models/user.py
+- [ ] T009 [US2] Implement ProfileService in src/services/profile.py
+
+## Phase 5: Polish
+
+- [ ] T010 [P] Documentation updates in docs/
+- [ ] T011 Security hardening after T004
+
+```bash
+- [ ] T999 Not a task, inside a code fence
+```
+"""
+
+
+@pytest.fixture
+def graph():
+    return task_graph.build_graph(task_graph.parse_tasks(TASKS))
+
+
+class TestParse:
+    """Test tasks.md parsing."""
+
+    def test_markers_phases_and_files(self):
+        phases = task_graph.parse_tasks(TASKS)
+        assert [p.title for p in phases][:2] == ["Phase 1: Setup", "Phase 2: Foundational"]
+        assert [p.story for p in phases] == [None, None, "US1", "US2", None]
+
+        tasks = {t.id: t for p in phases for t in p.tasks}
+        assert "T999" not in tasks
+        assert tasks["T001"].done and not tasks["T002"].done
+        assert tasks["T002"].parallel and not tasks["T004"].parallel
+        assert tasks["T005"].story == "US1"
+        assert tasks["T005"].description == "Create User model in src/models/user.py"
+        assert tasks["T005"].files == ["src/models/user.py"]
+        assert tasks["T007"].explicit_deps == ["T005", "T006"]
+        assert tasks["T010"].files == ["docs/"]
+
+    def test_duplicate_ids_are_rejected(self):
+        with pytest.raises(TaskGraphError):
+            task_graph.parse_tasks("- [ ] T001 a\n- [ ] T001 b\n")
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Implement authentication/authorization framework", []),
+        ("Edit src/app.py and src/app.py, then README.md", ["src/app.py"]),
+        ("Contract test in tests/contract/test_[name].py.", ["tests/contract/test_[name].py"]),
+    ])
+    def test_extract_files(self, text, expected):
+        assert task_graph.extract_files(text) == expected
+
+
+class TestGraph:
+    """Test dependency edges."""
+
+    def test_phase_and_parallel_edges(self, graph):
+        assert graph["T002"].depends_on == ["T001"]
+        assert graph["T003"].depends_on == ["T001"]
+        assert sorted(graph["T004"].depends_on) == ["T002", "T003"]
+        # Story phases wait for Foundational only, not for each other
+        assert graph["T005"].depends_on == ["T004"]
+        assert graph["T006"].depends_on == ["T004"]
+        assert sorted(graph["T007"].depends_on) == ["T005", "T006"]
+
+    def test_file_conflict_serializes_tasks(self, graph):
+        # T008 edits the file T005 creates
+        assert sorted(graph["T008"].depends_on) == ["T004", "T005"]
+
+    def test_file_conflict_follows_explicit_order(self):
+        text = (
+            "## Phase 1\n\n"
+            "- [ ] T001 [P] Extend src/models/user.py (after T002)\n"
+            "- [ ] T002 [P] Create src/models/user.py\n"
+        )
+        tasks = task_graph.build_graph(task_graph.parse_tasks(text))
+        assert tasks["T001"].depends_on == ["T002"]
+        assert tasks["T002"].depends_on == []
+
+    def test_later_shared_phase_waits_for_all_stories(self, graph):
+        assert sorted(graph["T010"].depends_on) == ["T007", "T009"]
+        assert sorted(graph["T011"].depends_on) == ["T004", "T010"]
+
+    def test_unknown_dependency(self):
+        with pytest.raises(TaskGraphError, match="unknown task T404"):
+            task_graph.build_graph(task_graph.parse_tasks("- [ ] T001 a (depends on T404)\n"))
+
+    def test_cycle_is_reported(self):
+        text = "## Phase 1\n\n- [ ] T001 [P] a (depends on T002)\n- [ ] T002 [P] b (depends on T001)\n"
+        with pytest.raises(TaskGraphError, match="cycle"):
+            task_graph.build_graph(task_graph.parse_tasks(text))
+
+
+class TestSchedule:
+    """Test the critical path and parallel schedules."""
+
+    def test_critical_path_skips_done_tasks(self, graph):
+        assert task_graph.critical_path(graph) == ["T002", "T004", "T005", "T008", "T009", "T010", "T011"]
+
+    def test_single_worker_runs_everything_in_order(self, graph):
+        plan = task_graph.schedule(graph, 1)
+        order = [batch[0] for batch in plan.steps]
+        assert plan.makespan == 10
+        assert order.index("T004") > order.index("T003")
+        assert "T001" not in order
+
+    def test_more_workers_reach_the_critical_path(self, graph):
+        plan = task_graph.schedule(graph, 3)
+        assert plan.makespan == len(task_graph.critical_path(graph))
+        assert plan.optimal
+        assert plan.steps[0] == ["T002", "T003"]
+        # Every task runs after all of its dependencies
+        step_of = {task_id: i for i, batch in enumerate(plan.steps) for task_id in batch}
+        for task_id, step in step_of.items():
+            assert all(step_of.get(dep, -1) < step for dep in graph[task_id].depends_on)
+        assert all(len(batch) <= 3 for batch in plan.steps)
+
+    def test_optimal_only_when_the_lower_bound_is_met(self):
+        # T001-T003 need two steps on two workers before the T004 -> T006 -> T007 chain,
+        # so the schedule exceeds the lower bound and is not claimed optimal
+        text = (
+            "## Phase 1\n\n"
+            "- [ ] T001 [P] a\n- [ ] T002 [P] b\n- [ ] T003 [P] c\n"
+            "- [ ] T004 [P] d (depends on T001, T002, T003)\n- [ ] T005 [P] e (depends on T003)\n"
+            "- [ ] T006 [P] f (depends on T001, T004)\n- [ ] T007 [P] g (depends on T006)\n"
+        )
+        plan = task_graph.schedule(task_graph.build_graph(task_graph.parse_tasks(text)), 2)
+        assert (plan.makespan, plan.lower_bound) == (5, 4)
+        assert not plan.optimal
+
+    def test_invalid_worker_count(self, graph):
+        with pytest.raises(ValueError):
+            task_graph.schedule(graph, 0)
+
+    def test_plan_tasks_is_json_serializable(self, tmp_path):
+        tasks_file = tmp_path / "tasks.md"
+        tasks_file.write_text(TASKS, encoding="utf-8")
+        plan = task_graph.plan_tasks(tasks_file, workers=2)
+        encoded = json.loads(json.dumps(plan))
+        assert encoded["critical_path_length"] == 7
+        assert {w["worker"] for w in encoded["schedule"]["workers"]} == {1, 2}
+        assert next(t for t in encoded["tasks"] if t["id"] == "T007")["depends_on"] == ["T005", "T006"]
@@ -0,0 +1,364 @@
+"""
+Tests for client-side template assets.
+
+Tests the template cache, universal and base-plus-overlay downloads, local rendering
+and streamed tar.xz extraction behind ``specify init`` (including ``--offline``), and
+filling the cache with ``specify prefetch``.
+"""
+
+import json
+import os
+import tarfile
+
+import httpx
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from specify_cli import app, download_and_extract_template, download_cached_template, packaging, select_template_asset, template_assets
+from specify_cli.template_sources import DirectorySource, TemplateSourceError
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+---
+
+Run `{SCRIPT}` with {ARGS}.
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(template_assets.CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "spec-kit"
+    for rel, content in {
+        "templates/commands/plan.md": COMMAND,
+        "templates/vscode-settings.json": '{"chat.promptFiles": true}\n',
+        "memory/constitution.md": "# Constitution\n",
+        "scripts/bash/setup-plan.sh": "#!/usr/bin/env bash\n",
+        "scripts/powershell/setup-plan.ps1": "# ps\n",
+    }.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content, encoding="utf-8")
+    return packaging.load_source(root)
+
+
+@pytest.fixture
+def universal(source, tmp_path):
+    return packaging.build_universal(source, "v1.0.0", tmp_path)
+
+
+def cache_copy(archive, tag: str = "v1.0.0"):
+    cached = template_assets.cached_asset_path(tag, archive.name)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    cached.write_bytes(archive.read_bytes())
+    return cached
+
+
+def release(tag: str, *names: str) -> dict:
+    return {
+        "tag_name": tag,
+        "assets": [{"name": n, "size": 3, "browser_download_url": f"https://example.test/{n}"} for n in names],
+    }
+
+
+class TestCache:
+    """Test cache locations and lookup."""
+
+    def test_cache_dir_override(self, cache):
+        assert template_assets.cached_universal_path("v1.0.0") == cache / "templates" / "v1.0.0" / "spec-kit-template-universal-v1.0.0.zip"
+
+    def test_find_universal_asset(self):
+        data = release("v1.0.0", "spec-kit-template-claude-sh-v1.0.0.zip", "spec-kit-template-universal-v1.0.0.zip")
+        assert template_assets.find_universal_asset(data)["name"] == "spec-kit-template-universal-v1.0.0.zip"
+        assert template_assets.find_universal_asset(release("v1.0.0", "spec-kit-template-claude-sh-v1.0.0.zip")) is None
+
+    def test_find_layered_assets(self):
+        data = release("v1.0.0", "spec-kit-template-base-sh-v1.0.0.zip", "spec-kit-template-overlay-claude-sh-v1.0.0.zip")
+        base, overlay = template_assets.find_layered_assets(data, "claude", "sh")
+        assert (base["name"], overlay["name"]) == ("spec-kit-template-base-sh-v1.0.0.zip", "spec-kit-template-overlay-claude-sh-v1.0.0.zip")
+        assert template_assets.find_layered_assets(data, "gemini", "sh") is None
+
+    def test_latest_cached_uses_version_order(self):
+        assert template_assets.latest_cached_template("claude", "sh") is None
+        for tag in ("v0.9.0", "v0.10.0", "v0.11.0"):
+            path = template_assets.cached_universal_path(tag)
+            path.parent.mkdir(parents=True)
+            if tag != "v0.11.0":
+                path.write_bytes(b"zip")
+        cached = template_assets.latest_cached_template("claude", "sh")
+        assert (cached.tag, cached.universal) == ("v0.10.0", template_assets.cached_universal_path("v0.10.0"))
+
+    def test_latest_cached_layers_need_base_and_overlay(self):
+        directory = template_assets.templates_dir() / "v1.0.0"
+        directory.mkdir(parents=True)
+        (directory / "spec-kit-template-overlay-claude-sh-v1.0.0.zip").write_bytes(b"zip")
+        assert template_assets.latest_cached_template("claude", "sh") is None
+        (directory / "spec-kit-template-base-sh-v1.0.0.zip").write_bytes(b"zip")
+        cached = template_assets.latest_cached_template("claude", "sh")
+        assert cached.overlay == directory / "spec-kit-template-overlay-claude-sh-v1.0.0.zip"
+        assert template_assets.latest_cached_template("claude", "ps") is None
+
+
+class TestDownload:
+    """Test downloading into the cache."""
+
+    def test_download_then_reuse(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"zip")
+
+        asset = release("v1.0.0", "spec-kit-template-universal-v1.0.0.zip")["assets"][0]
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            path, cached = template_assets.download_asset(asset, "v1.0.0", client)
+            assert (path.read_bytes(), cached) == (b"zip", False)
+            assert template_assets.download_asset(asset, "v1.0.0", client) == (path, True)
+        assert len(requests) == 1
+
+    def test_failed_download_leaves_nothing(self):
+        asset = release("v1.0.0", "spec-kit-template-universal-v1.0.0.zip")["assets"][0]
+        with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(404))) as client:
+            with pytest.raises(TemplateSourceError, match="HTTP 404"):
+                template_assets.download_asset(asset, "v1.0.0", client)
+        assert list(template_assets.cached_universal_path("v1.0.0").parent.iterdir()) == []
+
+
+class TestRender:
+    """Test rendering and writing project files."""
+
+    def test_render_and_write_with_overlay(self, universal, tmp_path):
+        files = template_assets.render_project_files(universal, "claude", "ps")
+        assert "Run `.specify/scripts/powershell/setup-plan.ps1 -Json` with $ARGUMENTS." in files[".claude/commands/speckit.plan.md"].decode("utf-8")
+        assert ".specify/scripts/bash/setup-plan.sh" not in files
+
+        overlay = {".claude/commands/speckit.plan.md": "localized".encode("utf-8")}
+        assert template_assets.write_project_files(files, tmp_path / "project", overlay) == (3, 1)
+        assert (tmp_path / "project" / ".claude" / "commands" / "speckit.plan.md").read_text(encoding="utf-8") == "localized"
+
+    def test_paths_outside_the_project_are_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="outside the project"):
+            template_assets.write_project_files({"../evil": b""}, tmp_path)
+
+    def test_merge_layers_matches_variant(self, source, tmp_path):
+        base = packaging.build_base(source, "sh", "v1.0.0", tmp_path)
+        overlay = packaging.build_overlay(source, "copilot", "sh", "v1.0.0", tmp_path)
+        merged = template_assets.CachedTemplate("v1.0.0", base=base, overlay=overlay).render("copilot", "sh")
+        assert merged == {path: entry.content for path, entry in packaging.variant_files(source, "copilot", "sh").items()}
+
+    def test_unknown_agent(self, universal):
+        with pytest.raises(ValueError):
+            template_assets.render_project_files(universal, "vim", "sh")
+
+
+class TestInit:
+    """Test ``specify init`` from the template cache."""
+
+    def test_offline_init(self, universal, tmp_path, monkeypatch):
+        cache_copy(universal)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "copilot", "--script", "sh", "--no-git", "--ignore-agent-tools", "--offline"])
+        assert result.exit_code == 0, result.output
+        project = tmp_path / "demo"
+        assert (project / ".github" / "agents" / "speckit.plan.agent.md").is_file()
+        assert json.loads((project / ".vscode" / "settings.json").read_text(encoding="utf-8")) == {"chat.promptFiles": True}
+
+    def test_offline_init_from_layers(self, source, tmp_path, monkeypatch):
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        cache_copy(packaging.build_base(source, "sh", "v1.0.0", dist))
+        cache_copy(packaging.build_overlay(source, "claude", "sh", "v1.0.0", dist))
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools", "--offline"])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").is_file()
+        assert (tmp_path / "demo" / ".specify" / "memory" / "constitution.md").is_file()
+
+    def test_base_is_downloaded_once(self, source, tmp_path):
+        dist = tmp_path / "dist"
+        packaging.build_packages(source, "v1.0.0", dist, ["claude", "copilot"], ["sh"], jobs=1, universal=False, layered=True)
+        data = {"tag_name": "v1.0.0", "assets": [
+            {"name": p.name, "size": p.stat().st_size, "browser_download_url": f"https://example.test/{p.name}"}
+            for p in sorted(dist.glob("*.zip"))
+        ]}
+        downloaded = []
+
+        def handler(request):
+            name = request.url.path.rsplit("/", 1)[-1]
+            downloaded.append(name)
+            return httpx.Response(200, content=(dist / name).read_bytes())
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            for agent in ("claude", "copilot"):
+                cached = download_cached_template(data, agent, "sh", client=client)
+                assert ".specify/scripts/bash/setup-plan.sh" in cached.render(agent, "sh")
+        assert downloaded == [
+            "spec-kit-template-base-sh-v1.0.0.zip",
+            "spec-kit-template-overlay-claude-sh-v1.0.0.zip",
+            "spec-kit-template-overlay-copilot-sh-v1.0.0.zip",
+        ]
+
+    def test_offline_without_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--offline"])
+        assert result.exit_code == 1
+        assert "No cached template" in result.output
+        assert not (tmp_path / "demo").exists()
+
+
+class TestStreaming:
+    """Test tar.xz assets extracted while downloading."""
+
+    @pytest.fixture
+    def dist(self, source, tmp_path):
+        dist = tmp_path / "dist"
+        packaging.build_packages(source, "v1.0.0", dist, ["claude"], ["sh"], jobs=1, universal=False, formats=packaging.ARCHIVE_FORMATS)
+        return dist
+
+    def release(self, dist, *formats):
+        return {"tag_name": "v1.0.0", "assets": [
+            {"name": p.name, "size": p.stat().st_size, "browser_download_url": f"https://example.test/{p.name}"}
+            for fmt in formats for p in sorted(dist.glob(f"*.{fmt}"))
+        ]}
+
+    def test_members_are_yielded_before_the_download_ends(self, tmp_path):
+        files = {f"file{i}": packaging.SourceFile(os.urandom(100_000)) for i in range(3)}
+        data = packaging.write_archive(files, tmp_path / "big.tar.xz").read_bytes()
+        chunks = [data[i:i + 4096] for i in range(0, len(data), 4096)]
+        consumed = []
+
+        def body():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        members = template_assets.iter_tar_xz(body())
+        name, content = next(members)
+        assert (name, content) == ("file0", files["file0"].content)
+        assert len(consumed) < len(chunks)
+        assert [name for name, _ in members] == ["file1", "file2"]
+
+    def test_truncated_stream_raises(self, tmp_path):
+        files = {f"file{i}": packaging.SourceFile(os.urandom(100_000)) for i in range(3)}
+        data = packaging.write_archive(files, tmp_path / "big.tar.xz").read_bytes()
+        for cut in (len(data) // 3, len(data) * 2 // 3, len(data) - 1):
+            with pytest.raises(tarfile.ReadError):
+                list(template_assets.iter_tar_xz([data[:cut]]))
+
+    def test_tar_xz_is_preferred(self, dist):
+        data = self.release(dist, "zip", "tar.xz")
+        assert select_template_asset(data, "claude", "sh")["name"] == "spec-kit-template-claude-sh-v1.0.0.tar.xz"
+        assert select_template_asset(self.release(dist, "zip"), "claude", "sh")["name"] == "spec-kit-template-claude-sh-v1.0.0.zip"
+
+    def test_download_and_extract_streams_tar_xz(self, dist, tmp_path):
+        requested = []
+
+        def handler(request):
+            name = request.url.path.rsplit("/", 1)[-1]
+            requested.append(name)
+            return httpx.Response(200, content=(dist / name).read_bytes())
+
+        project = tmp_path / "project"
+        overlay = {".claude/commands/speckit.plan.md": b"localized"}
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            download_and_extract_template(project, "claude", "sh", verbose=False, client=client, release_data=self.release(dist, "zip", "tar.xz"), overlay=overlay)
+        assert requested == ["spec-kit-template-claude-sh-v1.0.0.tar.xz"]
+        assert (project / ".claude" / "commands" / "speckit.plan.md").read_bytes() == b"localized"
+        assert (project / ".specify" / "scripts" / "bash" / "setup-plan.sh").is_file()
+
+    @pytest.mark.parametrize("fmt", ["zip", "tar.xz"])
+    def test_localized_commands_come_from_the_archive(self, source, tmp_path, fmt):
+        source.shared[".specify/templates/i18n/zh_CN/commands/plan.md"] = packaging.SourceFile(COMMAND.replace("Run", "发布版").encode("utf-8"))
+        dist = tmp_path / "dist"
+        packaging.build_packages(source, "v1.0.0", dist, ["claude"], ["sh"], jobs=1, universal=False, formats=[fmt])
+        project = tmp_path / "project"
+        with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=(dist / request.url.path.rsplit("/", 1)[-1]).read_bytes()))) as client:
+            download_and_extract_template(project, "claude", "sh", verbose=False, client=client, release_data=self.release(dist, fmt), locale="zh_CN")
+        plan = (project / ".claude" / "commands" / "speckit.plan.md").read_text(encoding="utf-8")
+        assert "发布版 `.specify/scripts/bash/setup-plan.sh --json`" in plan
+
+    def test_here_writes_nothing_when_the_stream_fails(self, tmp_path):
+        files = {f".specify/file{i}": packaging.SourceFile(os.urandom(100_000)) for i in range(3)}
+        archive = packaging.write_archive(files, tmp_path / "spec-kit-template-claude-sh-v1.0.0.tar.xz")
+        data = archive.read_bytes()
+        project = tmp_path / "existing"
+        project.mkdir()
+        (project / "README.md").write_text("mine", encoding="utf-8")
+
+        def handler(request):
+            # The download is cut off after the first members
+            return httpx.Response(200, content=data[: len(data) * 2 // 3])
+
+        release = {"tag_name": "v1.0.0", "assets": [{"name": archive.name, "size": len(data), "browser_download_url": f"https://example.test/{archive.name}"}]}
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(typer.Exit):
+                download_and_extract_template(project, "claude", "sh", True, verbose=False, client=client, release_data=release)
+        assert [p.name for p in project.iterdir()] == ["README.md"]
+
+
+class TestPrefetch:
+    """Test ``specify prefetch``."""
+
+    def dist(self, source, tmp_path, **options):
+        dist = tmp_path / "dist"
+        packaging.build_packages(source, "v1.0.0", dist, ["claude", "copilot"], ["sh"], jobs=1, **options)
+        return dist
+
+    def test_select_assets(self, source, tmp_path):
+        dist = self.dist(source, tmp_path, layered=True, formats=packaging.ARCHIVE_FORMATS)
+
+        def names(data, agents):
+            return [a["name"] for a in template_assets.select_prefetch_assets(data, agents, ["sh"])]
+
+        data = json.loads((dist / "index.json").read_text(encoding="utf-8"))
+        assert names(data, ["claude", "copilot"]) == ["spec-kit-template-universal-v1.0.0.zip"]
+        data["assets"] = [a for a in data["assets"] if "universal" not in a["name"]]
+        assert names(data, ["claude", "copilot"]) == [
+            "spec-kit-template-base-sh-v1.0.0.tar.xz",
+            "spec-kit-template-overlay-claude-sh-v1.0.0.tar.xz",
+            "spec-kit-template-overlay-copilot-sh-v1.0.0.tar.xz",
+        ]
+        data["assets"] = [a for a in data["assets"] if "-base-" not in a["name"] and "-overlay-" not in a["name"]]
+        assert names(data, ["claude", "gemini"]) == ["spec-kit-template-claude-sh-v1.0.0.tar.xz"]
+
+    def test_digests_are_verified(self, source, tmp_path):
+        dist = self.dist(source, tmp_path, universal=False)
+        data = DirectorySource(dist).latest_release(None)
+        asset = next(a for a in data["assets"] if a["name"] == "spec-kit-template-claude-sh-v1.0.0.zip")
+        with httpx.Client() as client:
+            [result] = template_assets.prefetch_assets(data, [asset], client)
+            assert (result.cached, result.verified, result.error) == (False, True, None)
+            # Without a digest field the asset's manifest is used
+            del asset["digest"]
+            [result] = template_assets.prefetch_assets(data, [asset], client)
+            assert (result.cached, result.verified) == (True, True)
+            result.path.write_bytes(result.path.read_bytes()[:-1] + b"!")
+            [result] = template_assets.prefetch_assets(data, [asset], client)
+        assert result.verified is False
+        assert "SHA-256 mismatch" in result.error
+        assert not result.path.exists()
+
+    def test_prefetch_then_offline_init(self, source, tmp_path, monkeypatch):
+        dist = self.dist(source, tmp_path, universal=False, formats=packaging.ARCHIVE_FORMATS)
+        result = CliRunner().invoke(app, ["prefetch", "--agents", "claude", "--scripts", "sh", "--locales", "zh_CN", "--template-source", str(dist)])
+        assert result.exit_code == 0, result.output
+        assert "verified" in result.output
+        assert template_assets.cached_asset_path("v1.0.0", "spec-kit-template-claude-sh-v1.0.0.tar.xz").is_file()
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools", "--offline"])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").is_file()
+
+    def test_requires_a_selection(self):
+        result = CliRunner().invoke(app, ["prefetch"])
+        assert result.exit_code == 1
+        assert "--all" in result.output
@@ -0,0 +1,329 @@
+"""
+Tests for template sources.
+
+Tests source selection (option, environment, config file) and the HTTP mirror, local
+directory and local archive backends, using a local HTTP server as the mirror, and
+racing several sources with ``MultiSource``.
+"""
+
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli import app, format_benchmark, packaging, template_sources
+from specify_cli.template_sources import (
+    DirectorySource,
+    FileSource,
+    GitHubSource,
+    MirrorSource,
+    MultiSource,
+    SourceStats,
+    TemplateSourceError,
+)
+
+COMMAND = """---
+description: Create a plan.
+scripts:
+  sh: scripts/bash/setup-plan.sh --json
+  ps: scripts/powershell/setup-plan.ps1 -Json
+---
+
+Run `{SCRIPT}` with {ARGS}.
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_env(tmp_path, monkeypatch):
+    monkeypatch.delenv(template_sources.SOURCE_ENV_VAR, raising=False)
+    monkeypatch.setenv(template_sources.CONFIG_ENV_VAR, str(tmp_path / "config.json"))
+    monkeypatch.setenv("SPECIFY_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def dist(tmp_path):
+    root = tmp_path / "spec-kit"
+    for rel, content in {
+        "templates/commands/plan.md": COMMAND,
+        "memory/constitution.md": "# Constitution\n",
+        "scripts/bash/setup-plan.sh": "#!/usr/bin/env bash\n",
+        "scripts/powershell/setup-plan.ps1": "# ps\n",
+    }.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content, encoding="utf-8")
+    dist = tmp_path / "dist"
+    packaging.build_packages(packaging.load_source(root), "v1.2.0", dist, ["claude"], ["sh"], jobs=1, universal=False, layered=False)
+    return dist
+
+
+class BrokenDirectorySource(DirectorySource):
+    """A directory whose asset streams fail after the first chunk."""
+
+    @contextmanager
+    def stream_asset(self, asset, client, chunk_size=template_sources.CHUNK_SIZE, offset=0):
+        with super().stream_asset(asset, client, 16, offset) as chunks:
+            def broken():
+                yield next(chunks)
+                raise OSError("connection reset")
+            yield broken()
+
+
+class TaggedDirectorySource(DirectorySource):
+    """A directory source answering with a fixed tag after a delay."""
+
+    def __init__(self, path, tag, delay=0.0):
+        super().__init__(path)
+        self.name = f"{path}@{tag}"
+        self.tag = tag
+        self.delay = delay
+
+    def latest_release(self, client):
+        time.sleep(self.delay)
+        return {**super().latest_release(client), "tag_name": self.tag}
+
+
+def read_asset(source, release, name):
+    asset = next(a for a in release["assets"] if a["name"] == name)
+    with httpx.Client() as client, source.stream_asset(asset, client) as chunks:
+        return b"".join(chunks)
+
+
+def wait_for_candidates(source, name, count):
+    """Wait until count sources have answered with asset name."""
+    deadline = time.monotonic() + 10
+    while len(source.candidates({"name": name})) < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestSelection:
+    """Test which source is configured."""
+
+    def test_precedence(self, tmp_path, monkeypatch):
+        assert template_sources.configured_source_spec() == "github"
+        (tmp_path / "config.json").write_text(json.dumps({"template_source": "https://config.example/"}), encoding="utf-8")
+        assert template_sources.configured_source_spec() == "https://config.example/"
+        monkeypatch.setenv(template_sources.SOURCE_ENV_VAR, "https://env.example/")
+        assert template_sources.configured_source_spec() == "https://env.example/"
+        assert template_sources.configured_source_spec("github:me/kit") == "github:me/kit"
+
+    def test_make_source(self, dist):
+        assert isinstance(template_sources.make_source("github"), GitHubSource)
+        assert template_sources.make_source("github:me/kit").repo == "me/kit"
+        assert isinstance(template_sources.make_source("http://mirror.local/kit"), MirrorSource)
+        assert isinstance(template_sources.make_source(str(dist)), DirectorySource)
+        assert isinstance(template_sources.make_source(dist.as_uri()), DirectorySource)
+        archive = dist / "spec-kit-template-claude-sh-v1.2.0.zip"
+        assert template_sources.make_source(archive.as_uri()).path == archive
+
+    def test_several_sources(self, dist, tmp_path, monkeypatch):
+        source = template_sources.make_source(f"http://mirror.local/kit, {dist}")
+        assert isinstance(source, MultiSource)
+        assert [type(s) for s in source.sources] == [MirrorSource, DirectorySource]
+        assert source.fallback
+        monkeypatch.setenv(template_sources.FALLBACK_ENV_VAR, "0")
+        assert not template_sources.make_source("github,github:me/kit").fallback
+        (tmp_path / "config.json").write_text(json.dumps({"template_source": ["https://a.example/", "github"]}), encoding="utf-8")
+        assert template_sources.configured_source_spec() == "https://a.example/,github"
+
+    def test_invalid_specs(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown template source"):
+            template_sources.make_source(str(tmp_path / "missing"))
+        with pytest.raises(ValueError, match="Invalid GitHub repository"):
+            template_sources.make_source("github:nope")
+
+
+class TestBackends:
+    """Test each backend's release JSON and asset streams."""
+
+    def test_mirror(self, dist):
+        with format_benchmark.serve_directory(dist) as base_url:
+            source = MirrorSource(f"{base_url}/")
+            with httpx.Client() as client:
+                release = source.latest_release(client)
+            assert release["tag_name"] == "v1.2.0"
+            asset = next(a for a in release["assets"] if a["name"] == "spec-kit-template-claude-sh-v1.2.0.zip")
+            assert asset["browser_download_url"] == f"{base_url}/spec-kit-template-claude-sh-v1.2.0.zip"
+            data = read_asset(source, release, asset["name"])
+        assert data == (dist / asset["name"]).read_bytes()
+
+    def test_mirror_errors(self, tmp_path):
+        with format_benchmark.serve_directory(tmp_path) as base_url:
+            with httpx.Client() as client, pytest.raises(TemplateSourceError) as excinfo:
+                MirrorSource(base_url).latest_release(client)
+        assert excinfo.value.status_code == 404
+
+    def test_directory_without_index_offers_newest_version(self, dist):
+        (dist / "index.json").unlink()
+        (dist / "spec-kit-template-claude-sh-v1.10.0.zip").write_bytes(b"newer")
+        (dist / "spec-kit-template-claude-sh-v1.9.0.zip").write_bytes(b"older")
+        source = DirectorySource(dist)
+        release = source.latest_release(None)
+        assert release == {"tag_name": "v1.10.0", "assets": [{
+            "name": "spec-kit-template-claude-sh-v1.10.0.zip",
+            "size": 5,
+            "browser_download_url": (dist / "spec-kit-template-claude-sh-v1.10.0.zip").as_uri(),
+        }]}
+        assert read_asset(source, release, "spec-kit-template-claude-sh-v1.10.0.zip") == b"newer"
+
+    def test_directory_with_index(self, dist):
+        release = DirectorySource(dist).latest_release(None)
+        assert {a["name"] for a in release["assets"]} >= {"spec-kit-template-claude-sh-v1.2.0.zip"}
+        assert all(a["browser_download_url"].startswith("file://") for a in release["assets"])
+
+    def test_resume_from_offset(self, dist):
+        name = "spec-kit-template-claude-sh-v1.2.0.zip"
+        data = (dist / name).read_bytes()
+        asset = {"name": name, "browser_download_url": (dist / name).as_uri()}
+        with httpx.Client() as client:
+            with template_sources.TemplateSource().stream_asset(asset, client, offset=100) as chunks:
+                assert b"".join(chunks) == data[100:]
+            # The test server ignores Range, so the skipped bytes are dropped client-side
+            with format_benchmark.serve_directory(dist) as base_url:
+                asset["browser_download_url"] = f"{base_url}/{name}"
+                with template_sources.TemplateSource().stream_asset(asset, client, chunk_size=64, offset=100) as chunks:
+                    assert b"".join(chunks) == data[100:]
+
+    def test_single_archive(self, dist, tmp_path):
+        archive = dist / "spec-kit-template-claude-sh-v1.2.0.zip"
+        source = FileSource(archive)
+        release = source.latest_release(None)
+        assert release["tag_name"] == "v1.2.0"
+        assert read_asset(source, release, archive.name) == archive.read_bytes()
+        with pytest.raises(TemplateSourceError, match="not found"):
+            FileSource(tmp_path / "gone.zip").latest_release(None)
+
+
+class TestMultiSource:
+    """Test racing several sources."""
+
+    NAME = "spec-kit-template-claude-sh-v1.2.0.zip"
+
+    def test_first_valid_answer_wins(self, dist, tmp_path):
+        stats = SourceStats(tmp_path / "stats.json")
+        (tmp_path / "empty").mkdir()
+        with format_benchmark.serve_directory(tmp_path / "empty") as empty_url:
+            source = MultiSource([MirrorSource(empty_url), DirectorySource(dist)], stats=stats)
+            with httpx.Client() as client:
+                release = source.latest_release(client)
+                assert release["tag_name"] == "v1.2.0"
+                assert source.answered_by is source.sources[1]
+                assert read_asset(source, release, self.NAME) == (dist / self.NAME).read_bytes()
+        assert source.downloaded_from is source.sources[1]
+        saved = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))["sources"]
+        assert saved[str(dist)]["successes"] == 2
+
+    def test_highest_tag_within_the_window_wins(self, dist):
+        def sources():
+            return [TaggedDirectorySource(dist, "v1.0.0"), TaggedDirectorySource(dist, "v1.2.0", delay=0.05), TaggedDirectorySource(dist, "v9.0.0", delay=1.5)]
+
+        source = MultiSource(sources(), stats=SourceStats(), release_window=0.5)
+        assert source.latest_release(None)["tag_name"] == "v1.2.0"
+        assert source.answered_by is source.sources[1]
+
+        async def fetch(source):
+            async with httpx.AsyncClient() as client:
+                release = await source.alatest_release(client)
+                for task in source._pending:
+                    task.cancel()
+                return release
+
+        source = MultiSource(sources(), stats=SourceStats(), release_window=0.5)
+        assert asyncio.run(fetch(source))["tag_name"] == "v1.2.0"
+        assert source.answered_by is source.sources[1]
+
+    def test_no_source_answers(self, tmp_path):
+        source = MultiSource([DirectorySource(tmp_path / "a"), DirectorySource(tmp_path / "b")], stats=SourceStats())
+        with pytest.raises(TemplateSourceError, match="No template source answered"):
+            source.latest_release(None)
+
+    def test_prefers_sources_with_better_stats(self, dist, tmp_path):
+        copy = tmp_path / "copy"
+        copy.mkdir()
+        for path in dist.iterdir():
+            (copy / path.name).write_bytes(path.read_bytes())
+        stats = SourceStats()
+        stats.record(str(dist), 5.0)
+        stats.record(str(copy), 0.01)
+        assert stats.score(str(copy)) < stats.score(str(dist))
+        assert stats.score("never-seen") == 0.0
+        source = MultiSource([DirectorySource(dist), DirectorySource(copy)], stats=stats, race_width=1)
+        release = source.latest_release(None)
+        # The slower source may answer first, but both must be candidates for the download
+        wait_for_candidates(source, self.NAME, 2)
+        assert [s.name for s, _ in source.candidates({"name": self.NAME})] == [str(copy), str(dist)]
+        read_asset(source, release, self.NAME)
+        assert source.downloaded_from.name == str(copy)
+
+    def test_falls_back_mid_stream(self, dist):
+        stats = SourceStats()
+        stats.record(str(dist), 5.0)
+        stats.record(str(dist) + "-broken", 0.01)
+        broken = BrokenDirectorySource(dist)
+        broken.name = str(dist) + "-broken"
+        source = MultiSource([broken, DirectorySource(dist)], stats=stats, race_width=1)
+        release = source.latest_release(None)
+        wait_for_candidates(source, self.NAME, 2)
+        assert read_asset(source, release, self.NAME) == (dist / self.NAME).read_bytes()
+        assert source.downloaded_from is source.sources[1]
+        assert stats.sources[broken.name]["consecutive_failures"] == 1
+
+        source.fallback = False
+        stats.record(broken.name, 0.001)
+        with pytest.raises(TemplateSourceError, match="connection reset"):
+            read_asset(source, release, self.NAME)
+
+    def test_async_release_and_stream(self, dist, tmp_path):
+        (tmp_path / "empty").mkdir()
+
+        async def fetch(source):
+            async with httpx.AsyncClient() as client:
+                release = await source.alatest_release(client)
+                asset = next(a for a in release["assets"] if a["name"] == self.NAME)
+                async with source.astream_asset(asset, client, offset=10) as chunks:
+                    return release, b"".join([chunk async for chunk in chunks])
+
+        with format_benchmark.serve_directory(tmp_path / "empty") as empty_url, format_benchmark.serve_directory(dist) as dist_url:
+            source = MultiSource([MirrorSource(empty_url), MirrorSource(dist_url)], stats=SourceStats())
+            release, data = asyncio.run(fetch(source))
+        assert release["tag_name"] == "v1.2.0"
+        assert source.answered_by is source.sources[1]
+        assert data == (dist / self.NAME).read_bytes()[10:]
+
+
+class TestInit:
+    """Test ``specify init --template-source``."""
+
+    @pytest.mark.parametrize("served", [False, True])
+    def test_init_from_local_source(self, dist, tmp_path, monkeypatch, served):
+        monkeypatch.chdir(tmp_path)
+        args = ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools"]
+        if served:
+            with format_benchmark.serve_directory(dist) as base_url:
+                monkeypatch.setenv(template_sources.SOURCE_ENV_VAR, base_url)
+                result = CliRunner().invoke(app, args)
+        else:
+            result = CliRunner().invoke(app, [*args, "--template-source", str(dist)])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").is_file()
+
+    def test_init_from_several_sources(self, dist, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, [
+            "init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools",
+            "--template-source", f"{tmp_path / 'missing'}/release.zip,{dist}",
+        ])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "demo" / ".claude" / "commands" / "speckit.plan.md").is_file()
+        stats = json.loads((tmp_path / "cache" / template_sources.STATS_NAME).read_text(encoding="utf-8"))["sources"]
+        assert stats[str(dist)]["successes"] >= 1
+
+    def test_bad_source(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--template-source", "ftp://nope"])
+        assert result.exit_code == 1
+        assert "Unknown template source" in result.output